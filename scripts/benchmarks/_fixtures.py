@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from erpermitsys.app.tracker_models import (  # noqa: E402
+    ContactRecord,
+    JurisdictionRecord,
+    PermitDocumentRecord,
+    PermitEventRecord,
+    PermitParty,
+    PermitRecord,
+    PropertyRecord,
+    TrackerDataBundleV3,
+    ensure_default_document_structure,
+)
+
+
+_EVENT_TYPES = ("submitted", "comment", "resubmitted", "approved", "inspection", "note")
+_STREETS = ("Main St", "Oak Ave", "Pine Rd", "Lake Dr", "Hill Ct", "Bay Blvd")
+
+
+def build_synthetic_bundle(
+    permit_count: int,
+    *,
+    events_per_permit: int = 6,
+    documents_per_permit: int = 3,
+    seed: int = 7,
+) -> TrackerDataBundleV3:
+    rng = random.Random(seed)
+    property_count = max(1, permit_count // 3)
+    contact_count = max(1, permit_count // 10)
+    jurisdiction_count = max(1, min(50, permit_count // 100))
+    base_day = date(2024, 1, 1)
+
+    contacts = [
+        ContactRecord(
+            contact_id=f"contact-{index:06d}",
+            name=f"Contact {index}",
+            emails=[f"contact{index}@example.com"],
+            numbers=[f"555-{index % 10_000:04d}"],
+        )
+        for index in range(contact_count)
+    ]
+    jurisdictions = [
+        JurisdictionRecord(
+            jurisdiction_id=f"jurisdiction-{index:04d}",
+            name=f"Jurisdiction {index}",
+            contact_ids=[contacts[index % contact_count].contact_id],
+        )
+        for index in range(jurisdiction_count)
+    ]
+    properties = [
+        PropertyRecord(
+            property_id=f"property-{index:06d}",
+            display_address=f"{100 + index} {_STREETS[index % len(_STREETS)]}",
+            parcel_id=f"PCL-{index:06d}",
+            jurisdiction_id=jurisdictions[index % jurisdiction_count].jurisdiction_id,
+            contact_ids=[contacts[rng.randrange(contact_count)].contact_id],
+            notes=f"Synthetic property {index}",
+        )
+        for index in range(property_count)
+    ]
+    permits: list[PermitRecord] = []
+    for index in range(permit_count):
+        permit_id = f"permit-{index:06d}"
+        request_day = base_day + timedelta(days=rng.randrange(0, 700))
+        events = [
+            PermitEventRecord(
+                event_id=f"{permit_id}-event-{event_index:03d}",
+                event_type=_EVENT_TYPES[event_index % len(_EVENT_TYPES)],
+                event_date=(request_day + timedelta(days=event_index * 9)).isoformat(),
+                summary=f"Event {event_index}",
+                detail=f"Synthetic detail for {permit_id} step {event_index}",
+            )
+            for event_index in range(events_per_permit)
+        ]
+        permit = PermitRecord(
+            permit_id=permit_id,
+            property_id=properties[index % property_count].property_id,
+            permit_number=f"BP-{index:07d}",
+            request_date=request_day.isoformat(),
+            next_action_due=(request_day + timedelta(days=rng.randrange(-30, 90))).isoformat(),
+            parties=[PermitParty(contact_id=contacts[index % contact_count].contact_id, role="client")],
+            events=events,
+        )
+        ensure_default_document_structure(permit)
+        folder_id = permit.document_folders[0].folder_id if permit.document_folders else ""
+        slot_id = permit.document_slots[0].slot_id if permit.document_slots else ""
+        permit.documents = [
+            PermitDocumentRecord(
+                document_id=f"{permit_id}-doc-{doc_index:03d}",
+                folder_id=folder_id,
+                slot_id=slot_id,
+                original_name=f"file-{doc_index}.pdf",
+                stored_name=f"{permit_id}-{doc_index}.pdf",
+                relative_path=f"{permit_id}/{permit_id}-{doc_index}.pdf",
+                byte_size=1024 * (doc_index + 1),
+            )
+            for doc_index in range(documents_per_permit)
+        ]
+        permits.append(permit)
+
+    return TrackerDataBundleV3(
+        contacts=contacts,
+        jurisdictions=jurisdictions,
+        properties=properties,
+        permits=permits,
+    )
+
+
+def time_call(fn: Callable[[], object], *, repeat: int = 5) -> dict[str, float]:
+    samples: list[float] = []
+    for _ in range(max(1, repeat)):
+        started_at = perf_counter()
+        fn()
+        samples.append((perf_counter() - started_at) * 1000.0)
+    return {
+        "min_ms": round(min(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def print_row(label: str, timings: dict[str, float]) -> None:
+    print(
+        f"{label:<44} min {timings['min_ms']:>9.2f} ms"
+        f"  median {timings['median_ms']:>9.2f} ms"
+        f"  max {timings['max_ms']:>9.2f} ms"
+    )
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from erpermitsys.app.data_store import (
+    _DEFAULT_SUPABASE_TABLE,
+    _SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE,
+    _SUPABASE_APPLY_CHANGES_RPC,
+    _SUPABASE_ENTITY_TABLES,
+    _SUPABASE_FETCH_CHANGES_RPC,
+    _SUPABASE_FETCH_SNAPSHOT_RPC,
+    SupabaseDataStore,
+    SupabaseDataStoreConfig,
+)
+
+
+_ROW_METADATA = ("app_id", "deleted_at", "revision")
+
+
+class SupabaseStandIn:
+    """Local PostgREST-like server over in-memory tables, with a fixed per-request latency.
+
+    Supports `select`, `order=<column>.asc`, `limit`, `offset`, `<column>=gt.<value>`,
+    `deleted_at=is.null` and `Prefer: count=exact`. A page also costs
+    `scan_seconds_per_row` for every row read to produce it: rows skipped by `offset`
+    count, rows skipped by a keyset filter on the ordered key do not, as with an index
+    range scan. Tables named in `missing_deleted_at` answer the
+    `deleted_at` filter with the "column does not exist" error of older schemas.
+    `apply_changes` and `prune_tombstones` write like the SQL functions of the same name,
+    stamping rows with revisions, and the snapshot, changes and apply-changes RPCs answer
+    POSTs unless named in `missing_rpcs`. Responses are gzip-encoded for clients that
+    accept it while `gzip_responses` is set; gzip request bodies are decoded while
+    `gzip_requests` is set and otherwise fail as invalid JSON, like a gateway that passes
+    them through. Bodies in either direction take `bytes_per_second` to transfer.
+    """
+
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        *,
+        latency_seconds: float = 0.0,
+        scan_seconds_per_row: float = 0.0,
+        bytes_per_second: float = 0.0,
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.scan_seconds_per_row = scan_seconds_per_row
+        self.bytes_per_second = bytes_per_second
+        self.gzip_responses = True
+        self.gzip_requests = True
+        self.request_encodings: list[str] = []
+        self.missing_deleted_at: set[str] = set()
+        self.missing_rpcs: set[str] = set()
+        self.tables: dict[str, list[dict[str, Any]]] = {}
+        self.revision = 0
+        self.delta_floor_revision = 0
+        self.requests = 0
+        self._lock = threading.RLock()
+        # Encoded responses by request; cleared whenever the tables are written.
+        self._responses: dict[tuple[str, str, str, bool, bool], tuple[int, dict[str, str], bytes, int]] = {}
+        for payload_key, table, _record_type, _key_column in _SUPABASE_ENTITY_TABLES:
+            self.tables[table] = [
+                {**row, "app_id": "erpermitsys", "deleted_at": None, "revision": 0}
+                for row in payload.get(payload_key, [])
+            ]
+        self.tables[_SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE] = [
+            {
+                "permit_type": permit_type,
+                "template_id": template_id,
+                "app_id": "erpermitsys",
+                "deleted_at": None,
+                "revision": 0,
+            }
+            for permit_type, template_id in payload.get("active_document_template_ids", {}).items()
+        ]
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def data_store(self, data_root: str) -> SupabaseDataStore:
+        return SupabaseDataStore(
+            data_root,
+            config=SupabaseDataStoreConfig(url=self.url, api_key="stand-in", timeout_seconds=30.0),
+        )
+
+    def __enter__(self) -> SupabaseStandIn:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def response(
+        self,
+        table: str,
+        query: str,
+        prefer: str,
+        *,
+        gzip_ok: bool = False,
+    ) -> tuple[int, dict[str, str], bytes, int]:
+        key = (table, query, prefer, table in self.missing_deleted_at, gzip_ok)
+        with self._lock:
+            self.requests += 1
+            cached = self._responses.get(key)
+        if cached is None:
+            status, headers, body, scanned_rows = self.select(table, query, prefer)
+            data, headers = self.encode(body, headers, gzip_ok=gzip_ok)
+            cached = (status, headers, data, scanned_rows)
+            with self._lock:
+                self._responses[key] = cached
+        return cached
+
+    def encode(self, body: Any, headers: dict[str, str], *, gzip_ok: bool) -> tuple[bytes, dict[str, str]]:
+        data = json.dumps(body).encode("utf-8")
+        if gzip_ok and self.gzip_responses:
+            return gzip.compress(data, compresslevel=6), {**headers, "Content-Encoding": "gzip"}
+        return data, headers
+
+    def apply_changes(self, changes: dict[str, Any]) -> int:
+        """Upsert and tombstone rows from a change set as one new revision."""
+        with self._lock:
+            revision = self.revision + 1
+            for payload_key, table, _record_type, key_column in _SUPABASE_ENTITY_TABLES:
+                self._write(table, key_column, changes, payload_key, revision)
+            self._write(_SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE, "permit_type", changes, "active_document_template_ids", revision)
+            self.revision = revision
+            self._responses.clear()
+        return revision
+
+    def prune_tombstones(self) -> None:
+        with self._lock:
+            for table, rows in self.tables.items():
+                for row in rows:
+                    if row["deleted_at"] is not None:
+                        self.delta_floor_revision = max(self.delta_floor_revision, row["revision"])
+                self.tables[table] = [row for row in rows if row["deleted_at"] is None]
+            self._responses.clear()
+
+    def _write(self, table: str, key_column: str, changes: dict[str, Any], prefix: str, revision: int) -> None:
+        rows = {row[key_column]: row for row in self.tables[table]}
+        for row in changes.get(f"{prefix}_upserts") or ():
+            rows[row[key_column]] = {**row, "app_id": "erpermitsys", "deleted_at": None, "revision": revision}
+        for record_id in changes.get(f"{prefix}_deletes") or ():
+            previous = rows.get(record_id, {key_column: record_id, "app_id": "erpermitsys"})
+            rows[record_id] = {**previous, "deleted_at": "2026-01-01T00:00:00+00:00", "revision": revision}
+        self.tables[table] = list(rows.values())
+
+    def rpc(self, name: str, arguments: dict[str, Any]) -> tuple[int, Any]:
+        with self._lock:
+            self.requests += 1
+            known = (_SUPABASE_FETCH_SNAPSHOT_RPC, _SUPABASE_FETCH_CHANGES_RPC, _SUPABASE_APPLY_CHANGES_RPC)
+            if name in self.missing_rpcs or name not in known:
+                return 404, {"code": "PGRST202", "message": f"Could not find the function public.{name}"}
+            if name == _SUPABASE_FETCH_SNAPSHOT_RPC:
+                return 200, {"revision": self.revision, "payload": self._rows_since(-1)[0]}
+            if name == _SUPABASE_APPLY_CHANGES_RPC:
+                if int(arguments.get("p_expected_revision") or 0) != self.revision:
+                    return 200, {"applied": False, "conflict": True, "revision": self.revision}
+                changes = {
+                    argument[2:]: value
+                    for argument, value in arguments.items()
+                    if argument.endswith(("_upserts", "_deletes"))
+                }
+                return 200, {"applied": True, "conflict": False, "revision": self.apply_changes(changes)}
+            since_revision = int(arguments.get("p_since_revision") or 0)
+            if since_revision < self.delta_floor_revision or since_revision > self.revision:
+                return 200, {"revision": self.revision, "full": True, "changes": {}}
+            return 200, {"revision": self.revision, "full": False, "changes": self._rows_since(since_revision)[1]}
+
+    def _rows_since(self, since_revision: int) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Live rows as a payload, and rows written after `since_revision` as a change set."""
+        payload: dict[str, Any] = {}
+        changes: dict[str, Any] = {}
+        tables = [(payload_key, table, key_column) for payload_key, table, _type, key_column in _SUPABASE_ENTITY_TABLES]
+        tables.append(("active_document_template_ids", _SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE, "permit_type"))
+        for payload_key, table, key_column in tables:
+            rows = sorted(
+                (row for row in self.tables[table] if row["revision"] > since_revision),
+                key=lambda row: row[key_column],
+            )
+            live = [
+                {name: value for name, value in row.items() if name not in _ROW_METADATA}
+                for row in rows
+                if row["deleted_at"] is None
+            ]
+            payload[payload_key] = live
+            changes[f"{payload_key}_upserts"] = live
+            changes[f"{payload_key}_deletes"] = [row[key_column] for row in rows if row["deleted_at"] is not None]
+        payload["active_document_template_ids"] = {
+            row["permit_type"]: row["template_id"] for row in payload["active_document_template_ids"]
+        }
+        return payload, changes
+
+    def select(self, table: str, query: str, prefer: str) -> tuple[int, dict[str, str], Any, int]:
+        rows = self.tables.get(table)
+        if table == _DEFAULT_SUPABASE_TABLE:
+            rows = [{"app_id": "erpermitsys", "revision": self.revision, "payload": None}]
+        if rows is None:
+            return 404, {}, {"message": f'relation "{table}" does not exist'}, 0
+        params = parse_qsl(query, keep_blank_values=True)
+        columns: list[str] | None = None
+        limit: int | None = None
+        offset = 0
+        for name, value in params:
+            if name == "select" and value != "*":
+                columns = value.split(",")
+            elif name == "order":
+                column = value.split(".")[0]
+                rows = sorted(rows, key=lambda row: str(row.get(column) or ""))
+            elif name == "limit":
+                limit = int(value)
+            elif name == "offset":
+                offset = int(value)
+            elif name == "deleted_at" and value == "is.null":
+                if table in self.missing_deleted_at:
+                    return 400, {}, {"message": f"column {table}.deleted_at does not exist"}, 0
+                rows = [row for row in rows if row.get("deleted_at") is None]
+            elif value.startswith("gt."):
+                rows = [row for row in rows if str(row.get(name) or "") > value[3:]]
+        total = len(rows)
+        page = rows[offset : offset + limit if limit is not None else None]
+        if columns is not None:
+            page = [{column: row.get(column) for column in columns} for row in page]
+        headers: dict[str, str] = {}
+        if "count=exact" in prefer:
+            end = offset + len(page) - 1
+            headers["Content-Range"] = f"{offset}-{end}/{total}" if page else f"*/{total}"
+        return 200, headers, page, offset + len(page)
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stand_in = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = 65_536
+
+            def log_message(self, *_args: object) -> None:
+                return None
+
+            def _gzip_accepted(self) -> bool:
+                return "gzip" in self.headers.get("Accept-Encoding", "")
+
+            def _transfer(self, byte_count: int) -> None:
+                if stand_in.bytes_per_second:
+                    time.sleep(byte_count / stand_in.bytes_per_second)
+
+            def _reply(self, status: int, headers: dict[str, str], data: bytes) -> None:
+                self._transfer(len(data))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                table = unquote(parts.path.rsplit("/", 1)[-1])
+                status, headers, data, scanned_rows = stand_in.response(
+                    table,
+                    parts.query,
+                    self.headers.get("Prefer", ""),
+                    gzip_ok=self._gzip_accepted(),
+                )
+                delay = stand_in.latency_seconds + scanned_rows * stand_in.scan_seconds_per_row
+                if delay:
+                    time.sleep(delay)
+                self._reply(status, headers, data)
+
+            def do_POST(self) -> None:
+                if stand_in.latency_seconds:
+                    time.sleep(stand_in.latency_seconds)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length)
+                self._transfer(len(raw))
+                encoding = self.headers.get("Content-Encoding", "")
+                stand_in.request_encodings.append(encoding or "identity")
+                if encoding == "gzip":
+                    if not stand_in.gzip_requests:
+                        data, headers = stand_in.encode(
+                            {"code": "PGRST102", "message": "Empty or invalid json"}, {}, gzip_ok=self._gzip_accepted()
+                        )
+                        self._reply(400, headers, data)
+                        return
+                    raw = gzip.decompress(raw)
+                arguments = json.loads(raw or b"{}")
+                name = unquote(urlsplit(self.path).path.rsplit("/", 1)[-1])
+                status, body = stand_in.rpc(name, arguments)
+                data, headers = stand_in.encode(body, {}, gzip_ok=self._gzip_accepted())
+                self._reply(status, headers, data)
+
+        return _Handler
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+def _clone_via_payload(bundle: TrackerDataBundleV3) -> TrackerDataBundleV3:
+    """Previous clone: serialize every record and parse it back through the normalizers."""
+    return TrackerDataBundleV3.from_payload(bundle.to_payload())
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    # Bundles held by the window have already been through the normalizers once.
+    payload = build_synthetic_bundle(permit_count).to_payload()
+    loaded = TrackerDataBundleV3.from_payload(payload)
+    summary_only = TrackerDataBundleV3.from_payload(loaded.to_payload(), lazy_permit_detail=True)
+    assert loaded.clone().to_payload() == _clone_via_payload(loaded).to_payload()
+
+    print(f"-- {permit_count} permits")
+    print_row("payload round trip (previous)", time_call(lambda: _clone_via_payload(loaded), repeat=repeat))
+    print_row("direct clone, detail loaded", time_call(loaded.clone, repeat=repeat))
+    print_row("direct clone, summary-only permits", time_call(summary_only.clone, repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="TrackerDataBundleV3.clone() cost: payload round trip versus direct record copies.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
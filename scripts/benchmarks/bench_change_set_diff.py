@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.data_store import (
+    LocalSqliteDataStore,
+    _build_bundle_change_set,
+    _build_records_change_set,
+    _RowHashCache,
+)
+from erpermitsys.app.tracker_models import PermitEventRecord, PermitParty, TrackerDataBundleV3
+
+
+def _check_party_reassignment() -> None:
+    # The permit form rebuilds `parties` on every save. Two rebuilds between full saves let
+    # the second list take the freed address of the one last hashed; the edit must still be written.
+    with tempfile.TemporaryDirectory() as root:
+        store = LocalSqliteDataStore(root)
+        store.save_bundle(build_synthetic_bundle(20))
+        live = store.load_bundle().bundle
+        permit = live.permits[0]
+        permit.load_detail()
+        store.save_bundle(live.clone())
+        for role in ("first edit", "second edit"):
+            permit.parties = [PermitParty(party.contact_id, role, party.note) for party in permit.parties]
+        store.save_bundle(live.clone())
+        store.close()
+
+        reloaded = LocalSqliteDataStore(root)
+        saved = reloaded.load_bundle().bundle.permits[0]
+        assert [party.role for party in saved.parties] == ["second edit"] * len(permit.parties)
+        reloaded.close()
+
+
+def _check_event_replacement() -> None:
+    # Removing one event and adding another keeps the list length; the full save after
+    # must still write the permit.
+    with tempfile.TemporaryDirectory() as root:
+        store = LocalSqliteDataStore(root)
+        store.save_bundle(build_synthetic_bundle(20))
+        live = store.load_bundle().bundle
+        permit = live.permits[0]
+        permit.load_detail()
+        store.save_bundle(live.clone())
+        old = permit.events[-1]
+        permit.remove_event(old.event_id)
+        permit.insert_event(
+            PermitEventRecord(
+                event_id="replacement-event",
+                event_type=old.event_type,
+                event_date=old.event_date,
+                summary="Replacement",
+            )
+        )
+        store.save_bundle(live.clone())
+        store.close()
+
+        reloaded = LocalSqliteDataStore(root)
+        saved = reloaded.load_bundle().bundle.permits[0]
+        assert [event.event_id for event in saved.events] == [event.event_id for event in permit.events]
+        reloaded.close()
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    live = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload())
+    known_payload = live.to_payload()
+    row_hashes = _RowHashCache()
+    # Warm the record and row hashes, as the first save after a load does.
+    _build_records_change_set(known_payload, live.clone(), row_hashes)
+
+    def _edit_one() -> TrackerDataBundleV3:
+        permit = live.permits[0]
+        permit.events[0].detail = f"{permit.events[0].detail}."
+        permit.mark_detail_changed()
+        return live.clone()
+
+    edited = _edit_one()
+    previous = _build_bundle_change_set(known_payload, edited.to_payload())
+    assert _build_records_change_set(known_payload, edited, row_hashes) == previous
+    assert len(previous["permits_upserts"]) == 1
+    _check_party_reassignment()
+    _check_event_replacement()
+
+    print(f"-- {permit_count} permits")
+    print_row(
+        "edit one permit, full payload diff (previous)",
+        time_call(lambda: _build_bundle_change_set(known_payload, _edit_one().to_payload()), repeat=repeat),
+    )
+    print_row(
+        "edit one permit, content-hash diff",
+        time_call(lambda: _build_records_change_set(known_payload, _edit_one(), row_hashes), repeat=repeat),
+    )
+    print_row(
+        "unchanged bundle, content-hash diff",
+        time_call(lambda: _build_records_change_set(known_payload, live.clone(), row_hashes), repeat=repeat),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Change-set diffing by deep row comparison versus cached content hashes.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
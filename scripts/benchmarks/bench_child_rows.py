@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from itertools import count
+
+from _fixtures import print_row, time_call
+
+from erpermitsys.app.local_sqlite_schema import (
+    PERMIT_EVENTS_TABLE,
+    _encode_values,
+    ensure_local_schema,
+    load_payload_from_tables,
+    write_bundle_change_set,
+)
+from erpermitsys.app.tracker_models import PermitEventRecord, PermitRecord
+
+
+def _permit(event_count: int) -> PermitRecord:
+    permit = PermitRecord(permit_id="permit-000001", property_id="property-000001")
+    permit.events = [
+        PermitEventRecord(
+            event_id=f"event-{index:06d}",
+            event_type="note",
+            event_date=f"{2000 + index // 365:04d}-{1 + index % 12:02d}-{1 + index % 28:02d}",
+            summary=f"Event {index}",
+        )
+        for index in range(event_count)
+    ]
+    permit.refresh_derived_state(normalize_structure=True)
+    return permit
+
+
+def _write(connection: sqlite3.Connection, permit: PermitRecord) -> dict[str, int]:
+    """Upsert `permit` and return the child rows written; the permits row itself is not counted."""
+    with connection:
+        stats = write_bundle_change_set(
+            connection,
+            change_set={"permits_upserts": [permit.to_mapping()]},
+            schema_version=3,
+            backend="local_sqlite",
+            saved_at_utc="2026-01-01T00:00:00+00:00",
+        )
+    stats["rows_upserted"] -= 1
+    return stats
+
+
+def _stored_events(connection: sqlite3.Connection) -> list[dict]:
+    payload = load_payload_from_tables(connection)
+    return payload["permits"][0]["events"]  # type: ignore[index]
+
+
+def _backdate(permit: PermitRecord, serial: int) -> None:
+    middle = permit.events[len(permit.events) // 2]
+    permit.insert_event(
+        PermitEventRecord(
+            event_id=f"backdated-{serial:06d}",
+            event_type="note",
+            event_date=middle.event_date,
+            summary="Backdated note",
+        )
+    )
+
+
+def _check_writes(event_count: int) -> None:
+    connection = sqlite3.connect(":memory:")
+    with connection:
+        ensure_local_schema(connection)
+    permit = _permit(event_count)
+    _write(connection, permit)
+    assert _stored_events(connection) == permit.to_mapping()["events"]
+
+    # A backdated event lands mid-list: one row, not every row after it.
+    _backdate(permit, 0)
+    assert _write(connection, permit) == {"rows_upserted": 1, "rows_deleted": 0}
+    # Moving an event rewrites that event; removing one deletes only it.
+    moved = permit.events[1]
+    moved.event_date = permit.events[-1].event_date
+    permit.reposition_event(moved)
+    assert _write(connection, permit) == {"rows_upserted": 1, "rows_deleted": 0}
+    permit.remove_event(permit.events[0].event_id)
+    assert _write(connection, permit) == {"rows_upserted": 0, "rows_deleted": 1}
+    # Repeated inserts at one spot eventually renumber, and still read back in order.
+    for serial in range(1, 20):
+        _backdate(permit, serial)
+        _write(connection, permit)
+    assert _stored_events(connection) == permit.to_mapping()["events"]
+    assert _write(connection, permit) == {"rows_upserted": 0, "rows_deleted": 0}
+
+
+def _check_layout1_migration() -> None:
+    # Layout 1 keyed event rows by (permit_id, position); rows must survive the rebuild,
+    # duplicated ids included, and read back without rewrites.
+    child = PERMIT_EVENTS_TABLE
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        f"create table {child.name} (permit_id text not null, position integer not null, "
+        + "".join(f"{column} text not null default '', " for column in child.text_columns)
+        + "".join(f"{column} integer not null default 0, " for column in child.integer_columns)
+        + "".join(f"{column} text not null default '[]', " for column in child.json_columns)
+        + "primary key (permit_id, position))"
+    )
+    permit = _permit(10)
+    permit.events[3].event_id = permit.events[2].event_id
+    mapping = permit.to_mapping()
+    connection.executemany(
+        f"insert into {child.name} (permit_id, position, {', '.join(child.value_columns)}) "
+        f"values (?, ?, {', '.join('?' for _ in child.value_columns)})",
+        [
+            (
+                permit.permit_id,
+                position,
+                *_encode_values(
+                    event,
+                    child.value_columns,
+                    integer_columns=child.integer_columns,
+                    json_columns=child.json_columns,
+                ),
+            )
+            for position, event in enumerate(mapping["events"])
+        ],
+    )
+    connection.commit()
+    with connection:
+        ensure_local_schema(connection)
+    # Every migrated event row is kept as is.
+    assert _write(connection, permit) == {"rows_upserted": 0, "rows_deleted": 0}
+    assert _stored_events(connection) == mapping["events"]
+
+
+def _bench(event_count: int, repeat: int) -> None:
+    _check_writes(min(event_count, 500))
+    _check_layout1_migration()
+    connection = sqlite3.connect(":memory:")
+    with connection:
+        ensure_local_schema(connection)
+    permit = _permit(event_count)
+    _write(connection, permit)
+    serials = count(100)
+
+    def _backdate_and_save() -> dict[str, int]:
+        _backdate(permit, next(serials))
+        return _write(connection, permit)
+
+    stats = _backdate_and_save()
+    print(f"-- one permit, {event_count} events; backdated insert wrote {stats['rows_upserted']} row(s)")
+    print_row("backdated event + save", time_call(_backdate_and_save, repeat=repeat))
+    print_row("unchanged save", time_call(lambda: _write(connection, permit), repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Rows written to the local SQLite child tables when an event is backdated into a long timeline.",
+    )
+    parser.add_argument("--sizes", default="1000,5000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for event_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(event_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime, timezone
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.permit_workspace_helpers import parse_iso_date, parse_iso_datetime
+from erpermitsys.app.timeline_rows import event_sort_key
+from erpermitsys.app.tracker_models import PermitRecord, TrackerDataBundleV3
+
+
+def _parsed_event_key(event, index: int) -> tuple[datetime, int]:
+    """Previous timeline key: parse the event date string on every comparison pass."""
+    return parse_iso_datetime(event.event_date) or datetime.min.replace(tzinfo=timezone.utc), index
+
+
+def _order_events(permits: list[PermitRecord], key) -> int:
+    total = 0
+    for permit in permits:
+        ordered = sorted(enumerate(permit.events), key=lambda pair: key(pair[1], pair[0]))
+        total += len(ordered)
+    return total
+
+
+def _overdue_parsed(permits: list[PermitRecord]) -> int:
+    today = date.today()
+    return sum(
+        1
+        for permit in permits
+        if (due := parse_iso_date(permit.next_action_due)) is not None and due < today
+    )
+
+
+def _overdue_ordinals(permits: list[PermitRecord]) -> int:
+    today = date.today().toordinal()
+    return sum(
+        1
+        for permit in permits
+        if (due := permit.date_ordinal("next_action_due")) is not None and due < today
+    )
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    permits = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload()).permits
+    for permit in permits:
+        parsed = [pair[0] for pair in sorted(enumerate(permit.events), key=lambda pair: _parsed_event_key(pair[1], pair[0]))]
+        cached = [pair[0] for pair in sorted(enumerate(permit.events), key=lambda pair: event_sort_key(pair[1], pair[0]))]
+        assert parsed == cached
+    assert _overdue_parsed(permits) == _overdue_ordinals(permits)
+
+    print(f"-- {permit_count} permits")
+    print_row("timeline ordering, parsed (previous)", time_call(lambda: _order_events(permits, _parsed_event_key), repeat=repeat))
+    print_row("timeline ordering, cached keys", time_call(lambda: _order_events(permits, event_sort_key), repeat=repeat))
+    print_row("overdue check, parsed (previous)", time_call(lambda: _overdue_parsed(permits), repeat=repeat))
+    print_row("overdue check, cached ordinals", time_call(lambda: _overdue_ordinals(permits), repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Event ordering and overdue checks on re-parsed date strings versus cached integer keys.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
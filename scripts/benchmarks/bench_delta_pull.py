@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from typing import Any
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+from _supabase_stand_in import SupabaseStandIn
+
+from erpermitsys.app.data_store import _SUPABASE_FETCH_CHANGES_RPC, SupabaseDataStore
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+def _full_payload(stand_in: SupabaseStandIn, root: str) -> dict[str, Any]:
+    store = stand_in.data_store(root)
+    return store.load_bundle().bundle.to_payload()
+
+
+def _assert_delta_matches_full(
+    stand_in: SupabaseStandIn,
+    store: SupabaseDataStore,
+    window_bundle: TrackerDataBundleV3,
+    root: str,
+) -> TrackerDataBundleV3:
+    delta = store.fetch_remote_changes()
+    assert delta is not None
+    expected = _full_payload(stand_in, root)
+    assert store._known_payload == expected
+    assert store.known_revision == stand_in.revision
+    # The window applies the returned records onto what it holds.
+    window_bundle = delta.apply_to_bundle(window_bundle)
+    assert TrackerDataBundleV3.from_payload(window_bundle.to_payload()).to_payload() == expected
+    return window_bundle
+
+
+def _check_equivalence(permit_count: int) -> None:
+    payload = build_synthetic_bundle(permit_count).to_payload()
+    with SupabaseStandIn(payload) as stand_in, tempfile.TemporaryDirectory() as root:
+        store = stand_in.data_store(root)
+        stale = stand_in.data_store(root)
+        window_bundle = store.load_bundle().bundle
+        stale.load_bundle()
+
+        contact = dict(payload["contacts"][0], name="Renamed remotely")
+        stand_in.apply_changes({"contacts_upserts": [contact]})
+        delta = store.fetch_remote_changes()
+        assert delta is not None and delta.record_count == 1
+        assert delta.rows["contacts"][contact["contact_id"]]["name"] == "Renamed remotely"
+        window_bundle = delta.apply_to_bundle(window_bundle)
+
+        removed_permit = payload["permits"][1]["permit_id"]
+        new_property = dict(payload["properties"][0], property_id="property-remote", display_address="1 Remote Way")
+        stand_in.apply_changes({"permits_deletes": [removed_permit], "properties_upserts": [new_property]})
+        window_bundle = _assert_delta_matches_full(stand_in, store, window_bundle, root)
+
+        stand_in.apply_changes(
+            {"active_document_template_ids_upserts": [{"permit_type": "building", "template_id": "template-a"}]}
+        )
+        window_bundle = _assert_delta_matches_full(stand_in, store, window_bundle, root)
+        stand_in.apply_changes({"active_document_template_ids_deletes": ["building"]})
+        window_bundle = _assert_delta_matches_full(stand_in, store, window_bundle, root)
+
+        # Nothing new: an empty delta at the same revision.
+        delta = store.fetch_remote_changes()
+        assert delta is not None and delta.record_count == 0
+
+        # Tombstones the stale store would need were pruned: it must reload fully.
+        stand_in.prune_tombstones()
+        assert stale.fetch_remote_changes() is None
+        assert store.fetch_remote_changes() is not None
+
+        # Older schemas without the changes RPC fall back to a full load as well.
+        stand_in.missing_rpcs = {_SUPABASE_FETCH_CHANGES_RPC}
+        assert store.fetch_remote_changes() is None
+        store.close()
+
+
+def _bench(permit_count: int, latency_ms: float, repeat: int) -> None:
+    _check_equivalence(min(permit_count, 300))
+    payload = build_synthetic_bundle(permit_count).to_payload()
+    contact = dict(payload["contacts"][0])
+    with SupabaseStandIn(payload, latency_seconds=latency_ms / 1000.0) as stand_in, tempfile.TemporaryDirectory() as root:
+        store = stand_in.data_store(root)
+        store.load_bundle()
+
+        def _remote_edit() -> None:
+            contact["name"] = f"Contact edited at revision {stand_in.revision + 1}"
+            stand_in.apply_changes({"contacts_upserts": [dict(contact)]})
+
+        def _full_reload() -> None:
+            _remote_edit()
+            store.load_bundle()
+
+        def _delta_pull() -> None:
+            _remote_edit()
+            assert store.fetch_remote_changes() is not None
+
+        print(f"-- {permit_count} permits, one remote contact edit per pull, {latency_ms:g} ms per request")
+        print_row("full snapshot reload (previous)", time_call(_full_reload, repeat=repeat))
+        print_row("changes since known revision", time_call(_delta_pull, repeat=repeat))
+        store.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Remote refresh through a local PostgREST stand-in: full snapshot versus revision delta pull.",
+    )
+    parser.add_argument("--sizes", default="1000,5000")
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.latency_ms, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import random
+from uuid import uuid4
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.timeline_rows import default_business_rows_for_permit, latest_note_event_id_for_permit
+from erpermitsys.app.tracker_models import (
+    PermitEventRecord,
+    PermitRecord,
+    TrackerDataBundleV3,
+    compute_permit_status,
+    normalize_event_type,
+)
+
+_EVENT_TYPES = ("note", "submitted", "review_comments", "issued", "inspection", "note", "finaled")
+
+
+def _previous_order(permit: PermitRecord) -> list[PermitEventRecord]:
+    ordered = list(enumerate(permit.events))
+    ordered.sort(key=lambda pair: (pair[1].date_key(), pair[0]))
+    return [event for _index, event in ordered]
+
+
+def _previous_latest_note_event_id(permit: PermitRecord) -> str:
+    latest_note_event_id = ""
+    latest_note_key: tuple[int, int] | None = None
+    for index, event in enumerate(permit.events):
+        if normalize_event_type(event.event_type) != "note":
+            continue
+        key = (event.date_key(), index)
+        if latest_note_key is None or key > latest_note_key:
+            latest_note_key = key
+            latest_note_event_id = str(event.event_id or "").strip()
+    return latest_note_event_id
+
+
+def _random_event(rng: random.Random) -> PermitEventRecord:
+    return PermitEventRecord(
+        event_id=uuid4().hex,
+        event_type=rng.choice(_EVENT_TYPES),
+        event_date=f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if rng.random() > 0.05 else "",
+        summary="Synthetic event",
+    )
+
+
+def _check_equivalence(bundle: TrackerDataBundleV3) -> None:
+    rng = random.Random(20)
+    for permit in bundle.permits[:200]:
+        # Loaded payloads written before events were kept in order may be shuffled.
+        rng.shuffle(permit.events)
+        permit.mark_detail_changed()
+        for _ in range(30):
+            operation = rng.random()
+            if operation < 0.5 or not permit.events:
+                permit.insert_event(_random_event(rng))
+            elif operation < 0.8:
+                event = rng.choice(permit.events)
+                event.event_date = _random_event(rng).event_date
+                event.event_type = rng.choice(_EVENT_TYPES)
+                permit.reposition_event(event)
+            else:
+                permit.remove_event(rng.choice(permit.events).event_id)
+            events = permit.ordered_events()
+            assert events == _previous_order(permit)
+            assert [event.date_key() for event in events] == sorted(event.date_key() for event in events)
+            assert latest_note_event_id_for_permit(permit) == _previous_latest_note_event_id(permit)
+            assert permit.status == compute_permit_status(events, fallback=permit.status)
+
+
+def _bench(permit_count: int, events_per_permit: int, repeat: int) -> None:
+    bundle = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload())
+    _check_equivalence(bundle)
+    rng = random.Random(permit_count)
+    permit = bundle.permits[0]
+    permit.events = [_random_event(rng) for _ in range(events_per_permit)]
+    permit.refresh_derived_state()
+    contacts = bundle.contacts
+
+    def _previous_add() -> None:
+        permit.events.append(_random_event(rng))
+        permit.status = compute_permit_status(permit.events, fallback=permit.status)
+        _previous_order(permit)
+        _previous_latest_note_event_id(permit)
+
+    def _ordered_add() -> None:
+        permit.insert_event(_random_event(rng))
+        permit.ordered_events()
+        permit.latest_note_event_id()
+
+    print(f"-- {permit_count} permits, {events_per_permit} events on the edited permit")
+    print_row("add event + order + latest note (previous)", time_call(_previous_add, repeat=repeat))
+    print_row("add event + order + latest note, bisect", time_call(_ordered_add, repeat=repeat))
+    print_row(
+        "timeline rows",
+        time_call(lambda: default_business_rows_for_permit(permit, contacts), repeat=repeat),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Event timeline upkeep by re-sorting on every read versus date-ordered insertion.",
+    )
+    parser.add_argument("--sizes", default="1000")
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.events, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from itertools import count
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+from _supabase_stand_in import SupabaseStandIn
+
+from erpermitsys.app.data_store import SupabaseDataStore, SupabaseDataStoreConfig
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+def _store(stand_in: SupabaseStandIn, root: str, *, compression: bool) -> SupabaseDataStore:
+    return SupabaseDataStore(
+        root,
+        config=SupabaseDataStoreConfig(
+            url=stand_in.url,
+            api_key="stand-in",
+            timeout_seconds=60.0,
+            compression=compression,
+        ),
+    )
+
+
+def _edit_permits(bundle: TrackerDataBundleV3, edited: int, label: str) -> None:
+    for permit in bundle.permits[:edited]:
+        permit.next_action_text = f"Follow up with the reviewer ({label})"
+
+
+def _check_behaviour(permit_count: int) -> None:
+    payload = build_synthetic_bundle(permit_count).to_payload()
+    with SupabaseStandIn(payload) as stand_in, tempfile.TemporaryDirectory() as root:
+        plain = _store(stand_in, root, compression=False)
+        compressed = _store(stand_in, root, compression=True)
+        assert compressed.load_bundle().bundle.to_payload() == plain.load_bundle().bundle.to_payload()
+        assert compressed._load_payload_from_tables() == plain._load_payload_from_tables()
+
+        # Error bodies are decoded too, so PostgREST messages still reach the caller.
+        try:
+            compressed._request_json(method="GET", path="/rest/v1/missing_table", expect_json=True)
+        except RuntimeError as exc:
+            assert "does not exist" in str(exc), exc
+        else:
+            raise AssertionError("expected a failed request")
+
+        # Large change sets go out compressed once the gateway accepts them.
+        bundle = compressed.load_bundle().bundle
+        _edit_permits(bundle, permit_count, "accepted")
+        compressed.save_bundle(bundle)
+        assert stand_in.request_encodings[-1] == "gzip" and compressed._gzip_requests is True
+        assert plain.load_bundle().bundle.to_payload() == bundle.to_payload()
+
+        # A gateway that passes gzip bodies through undecoded gets the same body in plain JSON,
+        # and is not sent compressed bodies again.
+        stand_in.gzip_requests = False
+        fallback = _store(stand_in, root, compression=True)
+        bundle = fallback.load_bundle().bundle
+        _edit_permits(bundle, permit_count, "rejected")
+        fallback.save_bundle(bundle)
+        assert stand_in.request_encodings[-2:] == ["gzip", "identity"], stand_in.request_encodings[-2:]
+        assert fallback._gzip_requests is False
+        _edit_permits(bundle, permit_count, "plain again")
+        fallback.save_bundle(bundle)
+        assert stand_in.request_encodings[-1] == "identity"
+        assert plain.load_bundle().bundle.to_payload() == bundle.to_payload()
+        for store in (plain, compressed, fallback):
+            store.close()
+
+
+def _bench(permit_count: int, latency_ms: float, mbit_per_second: float, repeat: int) -> None:
+    _check_behaviour(min(permit_count, 200))
+    payload = build_synthetic_bundle(permit_count).to_payload()
+    with SupabaseStandIn(
+        payload,
+        latency_seconds=latency_ms / 1000.0,
+        bytes_per_second=mbit_per_second * 1_000_000 / 8,
+    ) as stand_in, tempfile.TemporaryDirectory() as root:
+        plain = _store(stand_in, root, compression=False)
+        compressed = _store(stand_in, root, compression=True)
+        edits = count()
+
+        print(f"-- {permit_count} permits, {latency_ms:g} ms per request, {mbit_per_second:g} Mbit/s link")
+        print_row("snapshot load, identity (previous)", time_call(plain.load_bundle, repeat=repeat))
+        print_row("snapshot load, gzip", time_call(compressed.load_bundle, repeat=repeat))
+        print_row("table load, identity (previous)", time_call(plain._load_payload_from_tables, repeat=repeat))
+        print_row("table load, gzip", time_call(compressed._load_payload_from_tables, repeat=repeat))
+
+        def _timed_save(store: SupabaseDataStore) -> dict[str, float]:
+            bundles = []
+            for _ in range(max(1, repeat)):
+                bundle = store.load_bundle().bundle
+                _edit_permits(bundle, permit_count // 4, f"edit {next(edits)}")
+                bundles.append(bundle)
+            pending = iter(bundles)
+            return time_call(lambda: store.save_bundle(next(pending)), repeat=len(bundles))
+
+        print_row("save 1/4 of permits, identity (previous)", _timed_save(plain))
+        print_row("save 1/4 of permits, gzip", _timed_save(compressed))
+        plain.close()
+        compressed.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Supabase snapshot, table and save traffic through a throttled stand-in: identity versus gzip.",
+    )
+    parser.add_argument("--sizes", default="1000,3000")
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--mbit", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.latency_ms, args.mbit, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from _fixtures import print_row, time_call
+
+from erpermitsys.app.http_pool import HttpConnectionPool
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """PostgREST-like stand-in: JSON rows for GET, echo for POST, keep-alive by default."""
+
+    protocol_version = "HTTP/1.1"
+    # One write per response, so the client does not wait on delayed ACKs.
+    wbufsize = 65_536
+    # Idle keep-alive sockets are closed after this, like a server-side idle timeout.
+    timeout = 1.0
+    connections: set[tuple[str, int]] = set()
+    row_count = 50
+
+    def log_message(self, *_args: object) -> None:
+        return None
+
+    def _send(self, status: int, body: bytes) -> None:
+        type(self).connections.add(self.client_address)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/missing"):
+            self._send(404, b'{"message":"not found"}')
+            return
+        rows = [{"permit_id": f"{index:032x}", "revision": index} for index in range(self.row_count)]
+        self._send(200, json.dumps(rows).encode("utf-8"))
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        self._send(200, self.rfile.read(length))
+
+
+def _start_stand_in() -> tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _check_behaviour(base: str) -> None:
+    pool = HttpConnectionPool(max_connections_per_host=2, idle_timeout_seconds=30.0)
+    _StandInHandler.connections.clear()
+    for _ in range(20):
+        with pool.urlopen(Request(f"{base}/rest/v1/permits?select=*"), timeout=5.0) as response:
+            assert response.getcode() == 200
+            assert len(json.loads(response.read())) == _StandInHandler.row_count
+    assert len(_StandInHandler.connections) == 1, _StandInHandler.connections
+
+    echoed = pool.urlopen(
+        Request(f"{base}/rest/v1/rpc/save", data=b'{"a":1}', method="POST"),
+        timeout=5.0,
+    ).read()
+    assert echoed == b'{"a":1}'
+
+    try:
+        pool.urlopen(Request(f"{base}/missing"), timeout=5.0)
+    except HTTPError as exc:
+        assert exc.code == 404 and b"not found" in exc.read()
+    else:
+        raise AssertionError("expected HTTPError")
+
+    # The server dropped the idle socket; the pool reconnects transparently.
+    time.sleep(_StandInHandler.timeout + 0.3)
+    assert pool.urlopen(Request(f"{base}/rest/v1/permits"), timeout=5.0).getcode() == 200
+
+    def _worker() -> None:
+        for _ in range(25):
+            pool.urlopen(Request(f"{base}/rest/v1/permits"), timeout=5.0)
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert pool.stats()["open"] <= 2, pool.stats()
+    pool.close()
+    assert pool.stats()["open"] == 0
+
+
+def _bench(request_count: int, repeat: int) -> None:
+    server, base = _start_stand_in()
+    try:
+        _check_behaviour(base)
+        url = f"{base}/rest/v1/permits?select=*"
+        pool = HttpConnectionPool()
+
+        def _urllib() -> None:
+            for _ in range(request_count):
+                with urlopen(Request(url), timeout=5.0) as response:
+                    response.read()
+
+        def _pooled() -> None:
+            for _ in range(request_count):
+                with pool.urlopen(Request(url), timeout=5.0) as response:
+                    response.read()
+
+        print(f"-- {request_count} sequential GETs against a local stand-in (plain HTTP, no TLS)")
+        print_row("urllib urlopen, new connection each (previous)", time_call(_urllib, repeat=repeat))
+        print_row("keep-alive pool", time_call(_pooled, repeat=repeat))
+        pool.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Supabase-style requests through urllib versus the keep-alive connection pool.",
+    )
+    parser.add_argument("--sizes", default="100,500")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for request_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(request_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from typing import Any
+from urllib.parse import quote
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+from _supabase_stand_in import SupabaseStandIn
+
+from erpermitsys.app.data_store import (
+    _SUPABASE_PAGE_SIZE,
+    _SUPABASE_PERMITS_TABLE,
+    SupabaseDataStore,
+    SupabaseDataStoreConfig,
+    _SupabaseTableFetch,
+)
+from erpermitsys.app.record_codecs import field_codecs
+from erpermitsys.app.tracker_models import PermitRecord
+
+
+_PERMIT_SELECT = ",".join(name for name, _codec in field_codecs(PermitRecord))
+
+
+def _offset_pages(store: SupabaseDataStore) -> tuple[list[dict[str, Any]], list[int]]:
+    """Fixed 1000-row pages by offset: the permits read before this change."""
+    rows: list[dict[str, Any]] = []
+    page_bytes: list[int] = []
+    offset = 0
+    while True:
+        body = store._request_json(
+            method="GET",
+            path=f"/rest/v1/{quote(_SUPABASE_PERMITS_TABLE, safe='_')}",
+            query=f"?select={_PERMIT_SELECT}&app_id=eq.erpermitsys&order=permit_id.asc&deleted_at=is.null"
+            f"&limit={_SUPABASE_PAGE_SIZE}&offset={offset}",
+            payload=None,
+            prefer="",
+            expect_json=False,
+        )
+        page = json.loads(body)
+        page_bytes.append(len(body))
+        rows.extend(page)
+        if len(page) < _SUPABASE_PAGE_SIZE:
+            return rows, page_bytes
+        offset += _SUPABASE_PAGE_SIZE
+
+
+def _keyset_pages(store: SupabaseDataStore) -> _SupabaseTableFetch:
+    fetch = _SupabaseTableFetch(
+        table=_SUPABASE_PERMITS_TABLE,
+        select=_PERMIT_SELECT,
+        key_column="permit_id",
+        exclude_deleted=True,
+    )
+    store._fetch_tables_rows([fetch])
+    return fetch
+
+
+def _bench(permit_count: int, latency_ms: float, scan_us: float, target_kib: int, repeat: int) -> None:
+    payload = build_synthetic_bundle(permit_count).to_payload()
+    with SupabaseStandIn(
+        payload,
+        latency_seconds=latency_ms / 1000.0,
+        scan_seconds_per_row=scan_us / 1_000_000.0,
+    ) as stand_in, tempfile.TemporaryDirectory() as root:
+        store = SupabaseDataStore(
+            root,
+            config=SupabaseDataStoreConfig(
+                url=stand_in.url,
+                api_key="stand-in",
+                timeout_seconds=30.0,
+                page_target_bytes=target_kib * 1024,
+            ),
+        )
+        expected, offset_page_bytes = _offset_pages(store)
+        assert len(expected) == permit_count
+
+        # The first load starts at the row cap; later loads size pages from what they saw.
+        first = _keyset_pages(store)
+        assert first.rows() == expected
+        sized = _keyset_pages(store)
+        assert sized.rows() == expected
+        sized_page_bytes = sized.response_bytes / max(1, sized.requests)
+        assert sized.requests == 1 or sized_page_bytes <= target_kib * 1024 * 1.25, sized_page_bytes
+
+        print(
+            f"-- {permit_count} permits, {latency_ms:g} ms per request, {scan_us:g} us per scanned row, "
+            f"{target_kib} KiB page target"
+        )
+        print(
+            f"   offset: {len(offset_page_bytes)} pages, largest {max(offset_page_bytes) // 1024} KiB; "
+            f"keyset: {sized.requests} pages, about {int(sized_page_bytes) // 1024} KiB each"
+        )
+        print_row("1000-row offset pages (previous)", time_call(lambda: _offset_pages(store), repeat=repeat))
+        print_row("keyset pages sized by bytes", time_call(lambda: _keyset_pages(store), repeat=repeat))
+        store.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Permits table read through a local PostgREST stand-in: offset versus keyset pages.",
+    )
+    parser.add_argument("--sizes", default="5000,10000")
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--scan-us", type=float, default=20.0)
+    parser.add_argument("--page-target-kib", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.latency_ms, args.scan_us, args.page_target_kib, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.data_store import LocalSqliteDataStore
+from erpermitsys.app.tracker_models import PermitEventRecord
+
+
+class _OpenPerCallStore(LocalSqliteDataStore):
+    """Previous behaviour: a fresh rollback-journal connection and schema check per call."""
+
+    def __init__(self, data_root: Path) -> None:
+        super().__init__(data_root, journal_mode="delete")
+
+    @contextmanager
+    def _session(self) -> Iterator[sqlite3.Connection]:
+        self.data_root.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.storage_file_path), timeout=4.0)
+        try:
+            connection.execute("pragma journal_mode = delete")
+            with connection:
+                self._ensure_schema(connection)
+            yield connection
+        finally:
+            connection.close()
+
+
+def _bench_store(label: str, store: LocalSqliteDataStore, permit_count: int, repeat: int) -> None:
+    bundle = build_synthetic_bundle(permit_count)
+    store.save_bundle(bundle)
+    counter = {"value": 0}
+
+    def _edit_and_save() -> None:
+        counter["value"] += 1
+        permit = bundle.permits[counter["value"] % len(bundle.permits)]
+        permit.events.append(
+            PermitEventRecord(
+                event_id=f"bench-event-{counter['value']:06d}",
+                event_type="note",
+                event_date="2026-01-01",
+                summary="Benchmark note",
+            )
+        )
+        store.save_bundle(bundle)
+
+    print(f"-- {label} ({permit_count} permits)")
+    print_row("has_saved_data", time_call(store.has_saved_data, repeat=repeat))
+    print_row("load_bundle", time_call(store.load_bundle, repeat=repeat))
+    print_row("save_bundle (one event appended)", time_call(_edit_and_save, repeat=repeat))
+    store.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare the persistent connection (WAL and rollback journal) against open-per-call SQLite access.",
+    )
+    parser.add_argument("--permits", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="erpermitsys-bench-") as temp_dir:
+        root = Path(temp_dir)
+        _bench_store(
+            "open-per-call (journal_mode=delete)",
+            _OpenPerCallStore(root / "open_per_call"),
+            args.permits,
+            args.repeat,
+        )
+        # Rollback journal is what data folders on network shares get.
+        _bench_store(
+            "persistent connection (journal_mode=delete)",
+            LocalSqliteDataStore(root / "persistent_delete", journal_mode="delete"),
+            args.permits,
+            args.repeat,
+        )
+        _bench_store(
+            "persistent connection (journal_mode=wal)",
+            LocalSqliteDataStore(root / "persistent", journal_mode="wal"),
+            args.permits,
+            args.repeat,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
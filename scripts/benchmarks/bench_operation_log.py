@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.data_store import LocalSqliteDataStore
+from erpermitsys.app.tracker_changes import TrackerBundleDelta
+from erpermitsys.app.tracker_models import PermitEventRecord
+
+
+class _TablesPerSaveStore(LocalSqliteDataStore):
+    """Previous behaviour: every save also rewrites the affected entity rows."""
+
+    def save_bundle_delta(self, delta: TrackerBundleDelta) -> None:
+        super().save_bundle_delta(delta)
+        self.compact_operation_log(force=True)
+
+
+def _wal_pages(store: LocalSqliteDataStore) -> int:
+    # Pages appended to the WAL since the last checkpoint; the benchmark never checkpoints
+    # between edits, so this is the write volume.
+    with store._session() as connection:
+        row = connection.execute("pragma wal_checkpoint(passive)").fetchone()
+    return int(row[1]) if row else 0
+
+
+def _bench_store(label: str, store: LocalSqliteDataStore, permit_count: int, edits: int) -> None:
+    bundle = build_synthetic_bundle(permit_count)
+    store.save_bundle(bundle)
+    with store._session() as connection:
+        connection.execute("pragma wal_checkpoint(truncate)")
+        page_size = int(connection.execute("pragma page_size").fetchone()[0])
+    counter = {"value": 0}
+
+    def _edit_and_save() -> None:
+        counter["value"] += 1
+        permit = bundle.permits[counter["value"] % len(bundle.permits)]
+        permit.events.append(
+            PermitEventRecord(
+                event_id=f"bench-event-{counter['value']:06d}",
+                event_type="note",
+                event_date="2026-01-01",
+                summary="Benchmark note",
+            )
+        )
+        store.save_bundle_delta(
+            TrackerBundleDelta(
+                rows={"permits": {permit.permit_id: permit.to_mapping()}},
+                active_document_template_ids=dict(bundle.active_document_template_ids),
+            )
+        )
+
+    print(f"-- {label} ({permit_count} permits)")
+    print_row("save_bundle_delta (one event appended)", time_call(_edit_and_save, repeat=edits))
+    print(f"{'WAL bytes per edit':<44}{_wal_pages(store) * page_size / edits:>12.0f}")
+    reopened = LocalSqliteDataStore(store.data_root)
+    print_row("load_bundle (log tail replayed)", time_call(reopened.load_bundle, repeat=1))
+    reopened._log_pending_revisions = 0
+    reopened.close()
+    print_row("compact_operation_log", time_call(lambda: store.compact_operation_log(force=True), repeat=1))
+    store.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Per-edit cost of writing entity tables on every save versus appending to the operation log.",
+    )
+    parser.add_argument("--permits", type=int, default=2000)
+    parser.add_argument("--edits", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="erpermitsys-bench-") as temp_dir:
+        root = Path(temp_dir)
+        _bench_store("tables per save (previous)", _TablesPerSaveStore(root / "tables"), args.permits, args.edits)
+        _bench_store("operation log", LocalSqliteDataStore(root / "log"), args.permits, args.edits)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
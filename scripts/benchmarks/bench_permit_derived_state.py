@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.tracker_models import (
+    _MISSING_SLOT_STATUSES,
+    PermitRecord,
+    TrackerDataBundleV3,
+    compute_permit_status,
+    ensure_default_document_structure,
+    normalize_slot_status,
+    refresh_slot_status_from_documents,
+)
+
+
+def _list_pass_uncached(permits: list[PermitRecord]) -> int:
+    """Previous permit-list pass: re-derive status and missing documents for every permit."""
+    missing = 0
+    for permit in permits:
+        ensure_default_document_structure(permit)
+        refresh_slot_status_from_documents(permit)
+        permit.status = compute_permit_status(permit.events, fallback=permit.status)
+        ensure_default_document_structure(permit)
+        refresh_slot_status_from_documents(permit)
+        missing += sum(
+            1
+            for slot in permit.document_slots
+            if slot.required and normalize_slot_status(slot.status) in _MISSING_SLOT_STATUSES
+        )
+    return missing
+
+
+def _list_pass_cached(permits: list[PermitRecord]) -> int:
+    missing = 0
+    for permit in permits:
+        permit.refresh_derived_state(normalize_structure=True)
+        missing += permit.missing_required_document_count()
+    return missing
+
+
+def _check_list_reassignment(permit: PermitRecord) -> None:
+    # Editors replace lists instead of editing them. Two replacements between reads let the
+    # second new list take the freed address of the list last read, so the cache must not key on it.
+    for event_type in ("approved", "issued", "approved", "issued"):
+        for _ in range(2):
+            last = permit.events[-1].clone()
+            last.event_type = event_type
+            events = permit.events[:-1]
+            events.append(last)
+            permit.events = events
+        assert permit.ordered_events()[-1].event_type == event_type
+        assert permit.status == compute_permit_status(permit.events, fallback=permit.status) == event_type
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    bundle = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload())
+    permits = bundle.permits
+    assert _list_pass_uncached(permits) == _list_pass_cached(permits)
+    _check_list_reassignment(bundle.clone().permits[0])
+
+    def _edit_one_and_pass() -> int:
+        permits[0].events[0].event_date = "2026-02-01"
+        permits[0].mark_detail_changed()
+        return _list_pass_cached(permits)
+
+    print(f"-- {permit_count} permits")
+    print_row("list pass, recomputed (previous)", time_call(lambda: _list_pass_uncached(permits), repeat=repeat))
+    print_row("list pass, cached", time_call(lambda: _list_pass_cached(permits), repeat=repeat))
+    print_row("list pass after one edit, cached", time_call(_edit_one_and_pass, repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Permit list refresh cost with and without cached status and slot derivations.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
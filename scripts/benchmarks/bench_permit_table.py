@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.permit_table import COLUMN_JURISDICTION, build_permit_table
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+_CLOSED = {"closed", "canceled", "finaled"}
+
+
+def _portfolio_loop(bundle: TrackerDataBundleV3, today: int) -> tuple[dict[str, int], dict[str, float]]:
+    """Record-walking equivalent of the statistics panel queries."""
+    jurisdiction_by_property = {row.property_id: row.jurisdiction_id for row in bundle.properties}
+    overdue: dict[str, int] = {}
+    totals: dict[str, list[int]] = {}
+    for permit in bundle.permits:
+        jurisdiction_id = jurisdiction_by_property.get(permit.property_id, "")
+        due = permit.date_ordinal("next_action_due")
+        if due is not None and due < today and permit.status not in _CLOSED:
+            overdue[jurisdiction_id] = overdue.get(jurisdiction_id, 0) + 1
+        applied = permit.date_ordinal("application_date")
+        issued = permit.date_ordinal("issued_date")
+        if applied is not None and issued is not None and issued >= applied:
+            bucket = totals.setdefault(jurisdiction_id, [0, 0])
+            bucket[0] += issued - applied
+            bucket[1] += 1
+    return overdue, {key: total / count for key, (total, count) in totals.items()}
+
+
+def _portfolio_table(table, today: date) -> tuple[dict[str, int], dict[str, float]]:
+    overdue = table.count_by(COLUMN_JURISDICTION, table.overdue_mask(today=today))
+    mask, days = table.days_between("application_date", "issued_date")
+    return overdue, table.mean_by(COLUMN_JURISDICTION, days, mask & (days >= 0))
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    bundle = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload())
+    today = date.today()
+    table = build_permit_table(bundle.properties, bundle.permits)
+    looped = _portfolio_loop(bundle, today.toordinal())
+    tabled = _portfolio_table(table, today)
+    assert looped[0] == tabled[0]
+    assert looped[1].keys() == tabled[1].keys()
+    assert all(abs(looped[1][key] - tabled[1][key]) < 1e-9 for key in looped[1])
+
+    print(f"-- {permit_count} permits")
+    print_row("portfolio queries, record walk", time_call(lambda: _portfolio_loop(bundle, today.toordinal()), repeat=repeat))
+    print_row("build permit table", time_call(lambda: build_permit_table(bundle.properties, bundle.permits), repeat=repeat))
+    print_row("portfolio queries, permit table", time_call(lambda: _portfolio_table(table, today), repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Portfolio statistics over the record lists versus the columnar permit table.",
+    )
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
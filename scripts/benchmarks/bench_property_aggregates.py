@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.permit_workspace_helpers import parse_iso_date
+from erpermitsys.app.tracker_changes import ENTITY_PERMITS
+from erpermitsys.app.tracker_index import TrackerIndex
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+def _badges_recomputed(bundle: TrackerDataBundleV3, index: TrackerIndex) -> tuple[int, int]:
+    """Previous badges: walk every permit of every property on each redraw."""
+    today = date.today()
+    overdue = 0
+    missing = 0
+    for property_record in bundle.properties:
+        for permit in index.permits_for_property(property_record.property_id):
+            due_date = parse_iso_date(permit.next_action_due)
+            if due_date is not None and permit.status not in {"closed", "canceled", "finaled"} and due_date < today:
+                overdue += 1
+            missing += permit.missing_required_document_count()
+    return overdue, missing
+
+
+def _badges_maintained(bundle: TrackerDataBundleV3, index: TrackerIndex) -> tuple[int, int]:
+    overdue = 0
+    missing = 0
+    for property_record in bundle.properties:
+        overdue += index.property_overdue_count(property_record.property_id)
+        missing += index.property_missing_docs_count(property_record.property_id)
+    return overdue, missing
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    bundle = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload())
+    index = TrackerIndex(lambda: (bundle.contacts, bundle.jurisdictions, bundle.properties, bundle.permits))
+    index.rebuild()
+    assert _badges_recomputed(bundle, index) == _badges_maintained(bundle, index)
+    permit = bundle.permits[0]
+
+    def _edit_one_and_redraw() -> tuple[int, int]:
+        permit.next_action_due = "2020-01-01" if permit.next_action_due != "2020-01-01" else ""
+        index.refresh(ENTITY_PERMITS, permit.permit_id)
+        return _badges_maintained(bundle, index)
+
+    print(f"-- {permit_count} permits, {len(bundle.properties)} properties")
+    print_row("property badges, recomputed (previous)", time_call(lambda: _badges_recomputed(bundle, index), repeat=repeat))
+    print_row("property badges, maintained", time_call(lambda: _badges_maintained(bundle, index), repeat=repeat))
+    print_row("property badges after one edit", time_call(_edit_one_and_redraw, repeat=repeat))
+    assert _badges_recomputed(bundle, index) == _badges_maintained(bundle, index)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Property card overdue/missing-docs badge cost: per-redraw walk versus maintained counters.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
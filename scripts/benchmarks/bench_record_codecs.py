@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import argparse
+import random
+from typing import Any, Callable
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.local_sqlite_schema import (
+    CONTACTS_TABLE,
+    DOCUMENT_TEMPLATES_TABLE,
+    JURISDICTIONS_TABLE,
+    PERMIT_DOCUMENTS_TABLE,
+    PERMIT_EVENTS_TABLE,
+    PERMITS_TABLE,
+    PROPERTIES_TABLE,
+)
+from erpermitsys.app.record_codecs import field_codecs
+from erpermitsys.app.tracker_models import (
+    ContactMethodRecord,
+    ContactRecord,
+    DocumentChecklistTemplate,
+    JurisdictionRecord,
+    PermitDocumentFolder,
+    PermitDocumentRecord,
+    PermitDocumentSlot,
+    PermitEventRecord,
+    PermitParty,
+    PermitRecord,
+    PropertyRecord,
+    TrackerDataBundleV3,
+    _as_non_negative_int,
+    _as_positive_int,
+    _as_text,
+    _parse_text_list,
+    _safe_uuid,
+    normalize_document_review_status,
+    normalize_event_type,
+    normalize_list_color,
+    normalize_parcel_id,
+    normalize_permit_type,
+    normalize_slot_id,
+    normalize_slot_status,
+)
+
+
+# Hand-written encoders the generated codecs replaced, kept as the conformance reference.
+def _previous_folder(record: PermitDocumentFolder) -> dict[str, Any]:
+    return {
+        "folder_id": _as_text(record.folder_id),
+        "name": _as_text(record.name),
+        "parent_folder_id": _as_text(record.parent_folder_id),
+    }
+
+
+def _previous_document(record: PermitDocumentRecord) -> dict[str, Any]:
+    return {
+        "document_id": _as_text(record.document_id),
+        "folder_id": _as_text(record.folder_id),
+        "original_name": _as_text(record.original_name),
+        "stored_name": _as_text(record.stored_name),
+        "relative_path": _as_text(record.relative_path),
+        "slot_id": normalize_slot_id(record.slot_id) or _as_text(record.slot_id),
+        "cycle_index": _as_positive_int(record.cycle_index),
+        "revision_index": _as_positive_int(record.revision_index),
+        "review_status": normalize_document_review_status(record.review_status),
+        "reviewed_at": _as_text(record.reviewed_at),
+        "review_note": _as_text(record.review_note),
+        "imported_at": _as_text(record.imported_at),
+        "byte_size": _as_non_negative_int(record.byte_size),
+        "sha256": _as_text(record.sha256),
+    }
+
+
+def _previous_party(record: PermitParty) -> dict[str, Any]:
+    return {
+        "contact_id": _as_text(record.contact_id),
+        "role": _as_text(record.role),
+        "note": _as_text(record.note),
+    }
+
+
+def _previous_event(record: PermitEventRecord) -> dict[str, Any]:
+    return {
+        "event_id": _safe_uuid(record.event_id),
+        "event_type": normalize_event_type(record.event_type),
+        "event_date": _as_text(record.event_date),
+        "summary": _as_text(record.summary),
+        "detail": _as_text(record.detail),
+        "actor_contact_id": _as_text(record.actor_contact_id),
+        "attachments": _parse_text_list(record.attachments),
+    }
+
+
+def _previous_slot(record: PermitDocumentSlot) -> dict[str, Any]:
+    slot_id = normalize_slot_id(record.slot_id) or _as_text(record.slot_id)
+    folder_id = normalize_slot_id(record.folder_id) or _as_text(record.folder_id) or slot_id
+    return {
+        "slot_id": slot_id,
+        "label": _as_text(record.label),
+        "required": bool(record.required),
+        "status": normalize_slot_status(record.status),
+        "folder_id": folder_id,
+        "active_cycle": _as_positive_int(record.active_cycle),
+        "notes": _as_text(record.notes),
+    }
+
+
+def _previous_contact_method(record: ContactMethodRecord) -> dict[str, Any]:
+    return {
+        "label": _as_text(record.label),
+        "emails": _parse_text_list(record.emails),
+        "numbers": _parse_text_list(record.numbers),
+        "note": _as_text(record.note),
+    }
+
+
+def _previous_jurisdiction(record: JurisdictionRecord) -> dict[str, Any]:
+    return {
+        "jurisdiction_id": _safe_uuid(record.jurisdiction_id),
+        "name": _as_text(record.name),
+        "jurisdiction_type": "city" if _as_text(record.jurisdiction_type).casefold() == "city" else "county",
+        "parent_county": _as_text(record.parent_county),
+        "portal_urls": _parse_text_list(record.portal_urls),
+        "contact_ids": _parse_text_list(record.contact_ids),
+        "portal_vendor": _as_text(record.portal_vendor),
+        "notes": _as_text(record.notes),
+        "list_color": normalize_list_color(record.list_color),
+    }
+
+
+def _previous_property(record: PropertyRecord) -> dict[str, Any]:
+    parcel = _as_text(record.parcel_id)
+    return {
+        "property_id": _safe_uuid(record.property_id),
+        "display_address": _as_text(record.display_address),
+        "parcel_id": parcel,
+        "parcel_id_norm": _as_text(record.parcel_id_norm) or normalize_parcel_id(parcel),
+        "jurisdiction_id": _as_text(record.jurisdiction_id),
+        "contact_ids": _parse_text_list(record.contact_ids),
+        "list_color": normalize_list_color(record.list_color),
+        "tags": _parse_text_list(record.tags),
+        "notes": _as_text(record.notes),
+    }
+
+
+def _previous_permit_summary(record: PermitRecord) -> dict[str, Any]:
+    return {
+        "permit_id": _safe_uuid(record.permit_id),
+        "property_id": _as_text(record.property_id),
+        "permit_type": normalize_permit_type(record.permit_type),
+        "permit_number": _as_text(record.permit_number),
+        "status": normalize_event_type(record.status),
+        "next_action_text": _as_text(record.next_action_text),
+        "next_action_due": _as_text(record.next_action_due),
+        "request_date": _as_text(record.request_date),
+        "application_date": _as_text(record.application_date),
+        "issued_date": _as_text(record.issued_date),
+        "final_date": _as_text(record.final_date),
+        "completion_date": _as_text(record.completion_date),
+    }
+
+
+_PREVIOUS_ENCODERS: tuple[tuple[type, Callable[[Any], dict[str, Any]]], ...] = (
+    (PermitDocumentFolder, _previous_folder),
+    (PermitDocumentRecord, _previous_document),
+    (PermitParty, _previous_party),
+    (PermitEventRecord, _previous_event),
+    (PermitDocumentSlot, _previous_slot),
+    (ContactMethodRecord, _previous_contact_method),
+    (JurisdictionRecord, _previous_jurisdiction),
+    (PropertyRecord, _previous_property),
+)
+
+# Column lists the SQLite tables and Supabase selects used before they were derived.
+_PREVIOUS_COLUMNS: dict[str, tuple[str, ...]] = {
+    "contacts": ("contact_id", "name", "numbers", "emails", "roles", "contact_methods", "list_color"),
+    "jurisdictions": (
+        "jurisdiction_id", "name", "jurisdiction_type", "parent_county", "portal_urls", "contact_ids",
+        "portal_vendor", "notes", "list_color",
+    ),
+    "properties": (
+        "property_id", "display_address", "parcel_id", "parcel_id_norm", "jurisdiction_id", "contact_ids",
+        "list_color", "tags", "notes",
+    ),
+    "permits": (
+        "permit_id", "property_id", "permit_type", "permit_number", "status", "next_action_text",
+        "next_action_due", "request_date", "application_date", "issued_date", "final_date", "completion_date",
+        "parties", "events", "document_slots", "document_folders", "documents",
+    ),
+    "document_templates": ("template_id", "name", "permit_type", "slots", "notes"),
+}
+
+_MESSY_VALUES: tuple[Any, ...] = (
+    "",
+    "  padded  ",
+    "Plan Review Started",
+    "city",
+    "#abc",
+    "Cycle-2 Drawings",
+    None,
+    0,
+    -3,
+    "7",
+    4.5,
+    True,
+    ["  a ", "", "b", None],
+    ("x", " y "),
+)
+
+
+def _messy_record(record_type: type, rng: random.Random) -> Any:
+    record = object.__new__(record_type)
+    for name, _codec in field_codecs(record_type):
+        setattr(record, name, rng.choice(_MESSY_VALUES))
+    for slot in record_type.__slots__:  # type: ignore[attr-defined]
+        if slot.startswith("_"):
+            setattr(record, slot, None)
+    return record
+
+
+def _check_conformance(bundle: TrackerDataBundleV3, *, samples: int = 2_000) -> None:
+    rng = random.Random(19)
+    for record_type, previous in _PREVIOUS_ENCODERS:
+        for _ in range(samples):
+            record = _messy_record(record_type, rng)
+            generated = record_type.to_mapping(record)
+            expected = previous(record)
+            if "event_id" in expected:
+                # Both sides mint a fresh id for an empty one.
+                generated["event_id"] = expected["event_id"] = ""
+            if "jurisdiction_id" in expected and "name" in expected:
+                generated["jurisdiction_id"] = expected["jurisdiction_id"] = ""
+            if "property_id" in expected:
+                generated["property_id"] = expected["property_id"] = ""
+            assert generated == expected, (record_type.__name__, record, generated, expected)
+
+    for permit in bundle.permits:
+        assert permit._summary_mapping() == _previous_permit_summary(permit)
+
+    payload = TrackerDataBundleV3.from_payload(bundle.to_payload()).to_payload()
+    assert TrackerDataBundleV3.from_payload(payload, trusted=True).to_payload() == payload
+    assert TrackerDataBundleV3.from_payload(payload, trusted=True, lazy_permit_detail=True).to_payload() == payload
+
+    tables = {
+        "contacts": CONTACTS_TABLE,
+        "jurisdictions": JURISDICTIONS_TABLE,
+        "properties": PROPERTIES_TABLE,
+        "permits": PERMITS_TABLE,
+        "document_templates": DOCUMENT_TEMPLATES_TABLE,
+    }
+    record_types = {
+        "contacts": ContactRecord,
+        "jurisdictions": JurisdictionRecord,
+        "properties": PropertyRecord,
+        "permits": PermitRecord,
+        "document_templates": DocumentChecklistTemplate,
+    }
+    for entity, columns in _PREVIOUS_COLUMNS.items():
+        assert tuple(name for name, _codec in field_codecs(record_types[entity])) == columns, entity
+        table = tables[entity]
+        stored_columns = {table.key_column, *table.value_columns}
+        if entity == "permits":
+            stored_columns |= {PERMIT_EVENTS_TABLE.parent_key, PERMIT_DOCUMENTS_TABLE.parent_key}
+        assert stored_columns == set(columns), entity
+        for row in payload[entity][:1]:
+            assert set(row) == set(columns), entity
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    bundle = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload())
+    _check_conformance(bundle)
+    events = [event for permit in bundle.permits for event in permit.events]
+    documents = [document for permit in bundle.permits for document in permit.documents]
+    payload = bundle.to_payload()
+
+    print(f"-- {permit_count} permits ({len(events)} events, {len(documents)} documents)")
+    print_row(
+        "encode events + docs, hand-written (previous)",
+        time_call(lambda: ([_previous_event(e) for e in events], [_previous_document(d) for d in documents]), repeat=repeat),
+    )
+    print_row(
+        "encode events + docs, generated",
+        time_call(lambda: ([e.to_mapping() for e in events], [d.to_mapping() for d in documents]), repeat=repeat),
+    )
+    print_row("bundle to_payload", time_call(bundle.to_payload, repeat=repeat))
+    print_row(
+        "bundle from_payload, trusted",
+        time_call(lambda: TrackerDataBundleV3.from_payload(payload, trusted=True), repeat=repeat),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Conformance and speed of the generated record codecs against the hand-written ones.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
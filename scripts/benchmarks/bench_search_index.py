@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.data_store import LocalSqliteDataStore
+from erpermitsys.app.search_index import (
+    SEARCH_KIND_PERMIT,
+    SEARCH_KIND_PROPERTY,
+    InMemorySearchIndex,
+    search_documents_for_payload,
+)
+
+
+_QUERIES = (
+    ("address prefix", "12 mai", (SEARCH_KIND_PROPERTY,)),
+    ("parcel id", "pcl-0042", (SEARCH_KIND_PROPERTY,)),
+    ("permit number", "bp-00077", (SEARCH_KIND_PERMIT,)),
+    ("event detail", "permit-000123 step 2", (SEARCH_KIND_PERMIT,)),
+    ("contact email, all kinds", "contact17@example", None),
+)
+
+
+def _substring_scan(payload: dict, query: str) -> int:
+    needle = query.casefold()
+    matches = 0
+    for row in payload["properties"]:
+        haystack = " ".join((row["display_address"], row["parcel_id"], row["parcel_id_norm"], row["notes"])).casefold()
+        if needle in haystack:
+            matches += 1
+    return matches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Search latency for the FTS5 and in-memory indexes.")
+    parser.add_argument("--permits", type=int, default=60_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bundle = build_synthetic_bundle(args.permits, events_per_permit=4, documents_per_permit=0)
+    payload = bundle.to_payload()
+    documents = search_documents_for_payload(payload)
+    print(f"{len(documents)} searchable records")
+
+    memory_index = InMemorySearchIndex()
+    print_row("in-memory index build", time_call(lambda: memory_index.rebuild(documents), repeat=1))
+
+    with tempfile.TemporaryDirectory(prefix="erpermitsys-bench-") as temp_dir:
+        store = LocalSqliteDataStore(Path(temp_dir))
+        print_row("sqlite save incl. FTS5 build", time_call(lambda: store.save_bundle(bundle), repeat=1))
+        for label, query, kinds in _QUERIES:
+            print_row(
+                f"fts5: {label}",
+                time_call(lambda: store.search_records(query, kinds=kinds, limit=None), repeat=args.repeat),
+            )
+            print_row(
+                f"memory: {label}",
+                time_call(lambda: memory_index.search(query, kinds=kinds, limit=None), repeat=args.repeat),
+            )
+        store.close()
+
+    print_row(
+        "baseline substring scan (properties)",
+        time_call(lambda: _substring_scan(payload, "12 mai"), repeat=args.repeat),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
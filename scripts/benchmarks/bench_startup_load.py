@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.data_store import LocalSqliteDataStore
+from erpermitsys.app.local_sqlite_schema import load_payload_from_tables
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+def _load_eager(store: LocalSqliteDataStore) -> TrackerDataBundleV3:
+    """Previous startup path: parse every permit's detail, then re-serialize it."""
+    with sqlite3.connect(str(store.storage_file_path)) as connection:
+        payload = load_payload_from_tables(connection)
+    bundle = TrackerDataBundleV3.from_payload(payload)
+    bundle.to_payload()
+    return bundle.clone()
+
+
+def _load_summary_first(store: LocalSqliteDataStore) -> TrackerDataBundleV3:
+    store._known_payload = None
+    bundle = store.load_bundle().bundle
+    return bundle.clone()
+
+
+def _first_paint(bundle: TrackerDataBundleV3) -> int:
+    # What the property list needs before the first paint: missing-document badges.
+    return sum(permit.missing_required_document_count() for permit in bundle.permits)
+
+
+def _hydrate_all(bundle: TrackerDataBundleV3) -> None:
+    for permit in bundle.permits:
+        permit.load_detail()
+
+
+def _bench(root: Path, permit_count: int, repeat: int) -> None:
+    store = LocalSqliteDataStore(root / f"permits_{permit_count}")
+    store.save_bundle(build_synthetic_bundle(permit_count))
+
+    print(f"-- {permit_count} permits")
+    print_row("eager load + clone (previous)", time_call(lambda: _load_eager(store), repeat=repeat))
+    print_row(
+        "eager load + first paint",
+        time_call(lambda: _first_paint(_load_eager(store)), repeat=repeat),
+    )
+    print_row("summary-first load + clone", time_call(lambda: _load_summary_first(store), repeat=repeat))
+    print_row(
+        "summary-first load + first paint",
+        time_call(lambda: _first_paint(_load_summary_first(store)), repeat=repeat),
+    )
+    print_row(
+        "background hydration of all permits",
+        time_call(lambda: _hydrate_all(_load_summary_first(store)), repeat=repeat),
+    )
+    store.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Startup cost of eager bundle parsing versus summary-first permit loading.",
+    )
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [int(value) for value in args.sizes.split(",") if value.strip()]
+    with tempfile.TemporaryDirectory(prefix="erpermitsys-bench-") as temp_dir:
+        for permit_count in sizes:
+            _bench(Path(temp_dir), permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
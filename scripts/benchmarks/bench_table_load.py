@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from typing import Any
+from urllib.parse import quote
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+from _supabase_stand_in import SupabaseStandIn
+
+from erpermitsys.app.data_store import (
+    _SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE,
+    _SUPABASE_ENTITY_TABLES,
+    _SUPABASE_PAGE_SIZE,
+    _SUPABASE_PERMITS_TABLE,
+    SupabaseDataStore,
+)
+from erpermitsys.app.record_codecs import field_codecs
+
+
+def _previous_fetch_table_rows(store: SupabaseDataStore, table: str, select: str, order: str) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    offset = 0
+    while True:
+        page = store._request_json(
+            method="GET",
+            path=f"/rest/v1/{quote(table, safe='_')}",
+            query=f"?select={select}&app_id=eq.erpermitsys&order={order}&deleted_at=is.null"
+            f"&limit={_SUPABASE_PAGE_SIZE}&offset={offset}",
+            payload=None,
+            prefer="",
+            expect_json=True,
+        )
+        if not isinstance(page, list) or not page:
+            break
+        rows.extend(row for row in page if isinstance(row, dict))
+        if len(page) < _SUPABASE_PAGE_SIZE:
+            break
+        offset += _SUPABASE_PAGE_SIZE
+    return rows
+
+
+def _previous_load(store: SupabaseDataStore) -> dict[str, Any]:
+    """Tables one after another, each paging sequentially: the loader before this change."""
+    payload: dict[str, Any] = {}
+    for payload_key, table, record_type, key_column in _SUPABASE_ENTITY_TABLES:
+        columns = field_codecs(record_type)
+        rows = _previous_fetch_table_rows(
+            store, table, ",".join(name for name, _codec in columns), f"{key_column}.asc"
+        )
+        payload[payload_key] = [
+            {name: store._row_value(row, name, codec.column) for name, codec in columns}
+            for row in rows
+            if store._row_text(row, key_column)
+        ]
+    template_rows = _previous_fetch_table_rows(
+        store, _SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE, "permit_type,template_id", "permit_type.asc"
+    )
+    payload["active_document_template_ids"] = {
+        store._row_text(row, "permit_type"): store._row_text(row, "template_id")
+        for row in template_rows
+        if store._row_text(row, "permit_type") and store._row_text(row, "template_id")
+    }
+    return payload
+
+
+def _bench(permit_count: int, latency_ms: float, repeat: int) -> None:
+    payload = build_synthetic_bundle(permit_count).to_payload()
+    with SupabaseStandIn(payload, latency_seconds=latency_ms / 1000.0) as stand_in, tempfile.TemporaryDirectory() as root:
+        store = stand_in.data_store(root)
+        expected = _previous_load(store)
+        assert len(expected["permits"]) == permit_count
+        assert store._load_payload_from_tables() == expected
+
+        # Older schemas without `deleted_at` fall back to an unfiltered read.
+        stand_in.missing_deleted_at = {_SUPABASE_PERMITS_TABLE}
+        assert store._load_payload_from_tables() == expected
+        stand_in.missing_deleted_at = set()
+
+        print(f"-- {permit_count} permits, {latency_ms:g} ms per request")
+        print_row("tables and pages in sequence (previous)", time_call(lambda: _previous_load(store), repeat=repeat))
+        print_row("concurrent tables, keyset pages", time_call(store._load_payload_from_tables, repeat=repeat))
+        store.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Cold table load through a local PostgREST stand-in: sequential versus concurrent fetches.",
+    )
+    parser.add_argument("--sizes", default="1000,5000")
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.latency_ms, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
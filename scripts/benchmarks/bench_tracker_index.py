@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.tracker_changes import ENTITY_PERMITS
+from erpermitsys.app.tracker_index import TrackerIndex
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+def _property_rows_scanned(bundle: TrackerDataBundleV3) -> int:
+    """Previous lookups: a linear scan of the record lists for every property row."""
+    total = 0
+    for property_record in bundle.properties:
+        jurisdiction = next(
+            (row for row in bundle.jurisdictions if row.jurisdiction_id == property_record.jurisdiction_id),
+            None,
+        )
+        permits = [row for row in bundle.permits if row.property_id == property_record.property_id]
+        total += len(permits) + (1 if jurisdiction is not None else 0)
+    return total
+
+
+def _property_rows_indexed(bundle: TrackerDataBundleV3, index: TrackerIndex) -> int:
+    total = 0
+    for property_record in bundle.properties:
+        jurisdiction = index.jurisdiction_by_id(property_record.jurisdiction_id)
+        permits = index.permits_for_property(property_record.property_id)
+        total += len(permits) + (1 if jurisdiction is not None else 0)
+    return total
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    bundle = build_synthetic_bundle(permit_count)
+    index = TrackerIndex(lambda: (bundle.contacts, bundle.jurisdictions, bundle.properties, bundle.permits))
+    index.rebuild()
+    assert _property_rows_scanned(bundle) == _property_rows_indexed(bundle, index)
+    permit = bundle.permits[0]
+
+    def _move_permit() -> None:
+        permit.property_id = bundle.properties[-1].property_id
+        index.refresh(ENTITY_PERMITS, permit.permit_id)
+
+    print(f"-- {permit_count} permits, {len(bundle.properties)} properties")
+    print_row("property list lookups, scanned (previous)", time_call(lambda: _property_rows_scanned(bundle), repeat=repeat))
+    print_row("property list lookups, indexed", time_call(lambda: _property_rows_indexed(bundle, index), repeat=repeat))
+    print_row("index rebuild", time_call(index.rebuild, repeat=repeat))
+    print_row("index refresh after one edit", time_call(_move_permit, repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Property list lookup cost with linear scans versus the tracker index.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
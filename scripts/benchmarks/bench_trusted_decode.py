@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+
+from _fixtures import build_synthetic_bundle, print_row, time_call
+
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+def _hydrate_all(payload: dict, *, trusted: bool) -> None:
+    bundle = TrackerDataBundleV3.from_payload(payload, lazy_permit_detail=True, trusted=trusted)
+    for permit in bundle.permits:
+        permit.load_detail()
+
+
+def _bench(permit_count: int, repeat: int) -> None:
+    # What the stores hold on disk: a bundle that has been normalized and written once.
+    payload = TrackerDataBundleV3.from_payload(build_synthetic_bundle(permit_count).to_payload()).to_payload()
+    assert TrackerDataBundleV3.from_payload(payload, trusted=True).to_payload() == payload
+
+    print(f"-- {permit_count} permits")
+    print_row(
+        "eager decode, tolerant (imports)",
+        time_call(lambda: TrackerDataBundleV3.from_payload(payload), repeat=repeat),
+    )
+    print_row(
+        "eager decode, trusted envelope",
+        time_call(lambda: TrackerDataBundleV3.from_payload(payload, trusted=True), repeat=repeat),
+    )
+    print_row(
+        "summary load + hydrate all, tolerant",
+        time_call(lambda: _hydrate_all(payload, trusted=False), repeat=repeat),
+    )
+    print_row(
+        "summary load + hydrate all, trusted",
+        time_call(lambda: _hydrate_all(payload, trusted=True), repeat=repeat),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Decode cost of the tolerant import path versus the trusted path for our own payloads.",
+    )
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for permit_count in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        _bench(permit_count, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
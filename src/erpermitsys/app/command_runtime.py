@@ -50,6 +50,7 @@ class AppCommandContext:
     open_admin_templates: Callable[[], None] | None = None
     open_add_property: Callable[[], None] | None = None
     open_add_permit: Callable[[], None] | None = None
+    open_permit_statistics: Callable[[], None] | None = None
     upload_documents: Callable[[], None] | None = None
     focus_property_search: Callable[[], None] | None = None
     focus_permit_search: Callable[[], None] | None = None
@@ -163,6 +164,15 @@ def _open_add_permit(context: AppCommandContext, _request: CommandRequest) -> Co
     )
 
 
+def _open_permit_statistics(context: AppCommandContext, _request: CommandRequest) -> CommandResult:
+    return _call_optional_action(
+        context,
+        "open_permit_statistics",
+        success_message="Opened permit statistics.",
+        unavailable_message="Permit statistics are not available.",
+    )
+
+
 def _upload_documents(context: AppCommandContext, _request: CommandRequest) -> CommandResult:
     return _call_optional_action(
         context,
@@ -346,6 +356,18 @@ def register_default_commands(registry: CommandRegistry) -> None:
                 handler=_open_add_permit,
                 is_enabled=_supports_attribute("open_add_permit"),
             ),
+            CommandDefinition(
+                info=CommandInfo(
+                    command_id="view.statistics",
+                    title="Open Permit Statistics",
+                    description="Show overdue, turnaround and status counts across all permits.",
+                    category="View",
+                    aliases=("statistics", "stats", "analytics"),
+                    keywords=("overdue", "jurisdiction", "turnaround"),
+                ),
+                handler=_open_permit_statistics,
+                is_enabled=_supports_attribute("open_permit_statistics"),
+            ),
             CommandDefinition(
                 info=CommandInfo(
                     command_id="documents.upload",
@@ -1,23 +1,85 @@
 from __future__ import annotations
 
+import gzip
 import json
 import os
 import shutil
 import sqlite3
 import threading
 import tempfile
-from dataclasses import dataclass
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from time import perf_counter
-from typing import Any, Protocol
+from time import monotonic, perf_counter
+from typing import Any, Callable, Iterator, Protocol, Sequence
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
+from urllib.request import Request
 from uuid import uuid4
 
 from erpermitsys.app.db_debug import db_debug
-from erpermitsys.app.tracker_models import TrackerDataBundleV3
+from erpermitsys.app.http_pool import HttpConnectionPool, shared_http_pool
+from erpermitsys.app.local_sqlite_schema import (
+    clear_table_data,
+    ensure_local_schema,
+    has_table_data,
+    load_payload_from_tables,
+    table_schema_version,
+    write_bundle_change_set,
+)
+from erpermitsys.app.record_codecs import COLUMN_INTEGER, COLUMN_JSON, FieldCodec, field_codecs
+from erpermitsys.app.revision_journal import (
+    ACTIVE_TEMPLATES_ENTITY,
+    RevisionDiff,
+    RevisionEntry,
+    append_revision,
+    applied_revision,
+    describe_change_set,
+    ensure_revision_schema,
+    latest_revision,
+    list_revisions,
+    load_changes_after,
+    load_revision_chain,
+    promote_checkpoint,
+    revision_content_hash,
+    set_applied_revision,
+)
+from erpermitsys.app.payload_compression import (
+    PAYLOAD_COMPRESSION_NONE,
+    PAYLOAD_COMPRESSION_ZLIB,
+    EncodedPayload,
+    compression_for_path,
+    decode_payload,
+    encode_payload,
+    normalize_payload_compression,
+    payload_content_hash,
+    read_envelope_content_hash,
+)
+from erpermitsys.app.search_index import (
+    DEFAULT_SEARCH_LIMIT,
+    PayloadSearchIndex,
+    SearchHit,
+    ensure_search_schema,
+    rebuild_search_rows,
+    search_changes_for_change_set,
+    search_documents_for_payload,
+    search_sqlite,
+    search_table_is_empty,
+    sync_search_rows,
+)
+from erpermitsys.app.storage_location import is_local_disk_path
+from erpermitsys.app.tracker_changes import TRACKER_ENTITY_ID_KEYS, TrackerBundleDelta
+from erpermitsys.app.tracker_models import (
+    ContactRecord,
+    DocumentChecklistTemplate,
+    JurisdictionRecord,
+    PermitRecord,
+    PropertyRecord,
+    TrackerDataBundleV3,
+)
 
 
 BACKEND_LOCAL_SQLITE = "local_sqlite"
@@ -30,8 +92,17 @@ _APP_ID = "erpermitsys"
 _DEFAULT_SUPABASE_SCHEMA = "public"
 _DEFAULT_SUPABASE_TABLE = "erpermitsys_state"
 _DEFAULT_SUPABASE_TIMEOUT_SECONDS = 8.0
+# Table loads size their pages to about this many response bytes.
+_DEFAULT_SUPABASE_PAGE_TARGET_BYTES = 1_048_576
+_MIN_SUPABASE_PAGE_TARGET_BYTES = 65_536
+# Request bodies at least this large are sent gzip-compressed when compression is on.
+_SUPABASE_GZIP_MIN_REQUEST_BYTES = 16_384
+_SUPABASE_GZIP_LEVEL = 6
+# How PostgREST answers a compressed body the gateway passed through undecoded.
+_SUPABASE_GZIP_REJECTED_STATUSES = frozenset((400, 415))
 _SUPABASE_FETCH_SNAPSHOT_RPC = "erpermitsys_fetch_snapshot"
 _SUPABASE_APPLY_CHANGES_RPC = "erpermitsys_apply_changes"
+_SUPABASE_FETCH_CHANGES_RPC = "erpermitsys_fetch_changes"
 _SUPABASE_SNAPSHOT_RPC = "erpermitsys_save_snapshot"
 _SUPABASE_CONTACTS_TABLE = "erpermitsys_contacts"
 _SUPABASE_JURISDICTIONS_TABLE = "erpermitsys_jurisdictions"
@@ -39,8 +110,31 @@ _SUPABASE_PROPERTIES_TABLE = "erpermitsys_properties"
 _SUPABASE_PERMITS_TABLE = "erpermitsys_permits"
 _SUPABASE_DOCUMENT_TEMPLATES_TABLE = "erpermitsys_document_templates"
 _SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE = "erpermitsys_active_document_templates"
+# (payload key, table, record type, key column) of the table-backed entities.
+_SUPABASE_ENTITY_TABLES: tuple[tuple[str, str, type, str], ...] = (
+    ("contacts", _SUPABASE_CONTACTS_TABLE, ContactRecord, "contact_id"),
+    ("jurisdictions", _SUPABASE_JURISDICTIONS_TABLE, JurisdictionRecord, "jurisdiction_id"),
+    ("properties", _SUPABASE_PROPERTIES_TABLE, PropertyRecord, "property_id"),
+    ("permits", _SUPABASE_PERMITS_TABLE, PermitRecord, "permit_id"),
+    ("document_templates", _SUPABASE_DOCUMENT_TEMPLATES_TABLE, DocumentChecklistTemplate, "template_id"),
+)
+# Row bounds of a table page; PostgREST on Supabase returns at most 1000 rows by default.
 _SUPABASE_PAGE_SIZE = 1_000
+_SUPABASE_MIN_PAGE_SIZE = 50
+# Concurrent table reads of a table load; matches the HTTP pool's per-host limit.
+_SUPABASE_FETCH_WORKERS = 4
 _LOCAL_SQLITE_TABLE = "app_state"
+# "auto" uses WAL when the data folder is on a local disk and a rollback journal otherwise:
+# WAL shares its index through memory-mapped `-shm` files, which only works on one host,
+# while rollback-journal locking also holds between instances on a network share.
+_LOCAL_SQLITE_JOURNAL_MODE = "auto"
+_LOCAL_SQLITE_CACHE_SIZE_KIB = -16_384
+_LOCAL_SQLITE_CACHED_STATEMENTS = 256
+_LOCAL_SQLITE_PAYLOAD_COMPRESSION = PAYLOAD_COMPRESSION_ZLIB
+# Saves only append to the revision journal; the entity tables catch up once this
+# many saves are pending or the oldest pending save is this old.
+_OPERATION_LOG_COMPACT_REVISIONS = 64
+_OPERATION_LOG_COMPACT_AGE_SECONDS = 30.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,8 +144,10 @@ class DataLoadResult:
     warning: str = ""
 
 
-class SupabaseRevisionConflictError(RuntimeError):
-    """Raised when a conflict-safe Supabase save loses a revision race."""
+class DataStoreRevisionConflictError(RuntimeError):
+    """Raised when a conflict-safe save loses a revision race."""
+
+    default_message = "Stored data changed in another app instance."
 
     def __init__(
         self,
@@ -59,11 +155,35 @@ class SupabaseRevisionConflictError(RuntimeError):
         expected_revision: int,
         message: str = "",
     ) -> None:
-        detail = message.strip() if message.strip() else "Supabase state changed on another client."
+        detail = message.strip() if message.strip() else self.default_message
         super().__init__(detail)
         self.expected_revision = max(0, int(expected_revision))
 
 
+class SupabaseRevisionConflictError(DataStoreRevisionConflictError):
+    """Raised when a conflict-safe Supabase save loses a revision race."""
+
+    default_message = "Supabase state changed on another client."
+
+
+class LocalRevisionConflictError(DataStoreRevisionConflictError):
+    """Raised when another app instance saved the same records to the SQLite file first."""
+
+    default_message = "The data file was changed by another app instance."
+
+    def __init__(
+        self,
+        *,
+        expected_revision: int,
+        current_revision: int,
+        records: Sequence[tuple[str, str]] = (),
+        message: str = "",
+    ) -> None:
+        super().__init__(expected_revision=expected_revision, message=message)
+        self.current_revision = max(0, int(current_revision))
+        self.records = tuple(records)
+
+
 @dataclass(frozen=True, slots=True)
 class SupabaseDataStoreConfig:
     url: str = ""
@@ -71,6 +191,8 @@ class SupabaseDataStoreConfig:
     schema: str = _DEFAULT_SUPABASE_SCHEMA
     table: str = _DEFAULT_SUPABASE_TABLE
     timeout_seconds: float = _DEFAULT_SUPABASE_TIMEOUT_SECONDS
+    page_target_bytes: int = _DEFAULT_SUPABASE_PAGE_TARGET_BYTES
+    compression: bool = True
 
     @property
     def configured(self) -> bool:
@@ -89,12 +211,20 @@ class SupabaseDataStoreConfig:
         except Exception:
             timeout_seconds = _DEFAULT_SUPABASE_TIMEOUT_SECONDS
         timeout_seconds = max(1.0, timeout_seconds)
+        page_target_raw = raw.get("page_target_bytes", _DEFAULT_SUPABASE_PAGE_TARGET_BYTES)
+        try:
+            page_target_bytes = int(page_target_raw)
+        except Exception:
+            page_target_bytes = _DEFAULT_SUPABASE_PAGE_TARGET_BYTES
+        page_target_bytes = max(_MIN_SUPABASE_PAGE_TARGET_BYTES, page_target_bytes)
         return cls(
             url=url,
             api_key=api_key,
             schema=schema,
             table=table,
             timeout_seconds=timeout_seconds,
+            page_target_bytes=page_target_bytes,
+            compression=bool(raw.get("compression", True)),
         )
 
 
@@ -124,9 +254,17 @@ class LocalJsonDataStore:
         data_root: Path | str,
         *,
         data_file_name: str = DEFAULT_DATA_FILE_NAME,
+        compression: str | None = None,
+        trusted_decode: bool = True,
     ) -> None:
         self.data_root = _normalize_path(Path(data_root))
         self._data_file_name = data_file_name
+        # Files in our own envelope skip the import normalizers unless this is off.
+        self._trusted_decode = bool(trusted_decode)
+        # Defaults to the file suffix: *.zz is zlib, *.xz is lzma, anything else plain JSON.
+        self._compression = normalize_payload_compression(
+            compression_for_path(data_file_name) if compression is None else compression
+        )
 
     @property
     def storage_file_path(self) -> Path:
@@ -171,15 +309,46 @@ class LocalJsonDataStore:
             return DataLoadResult(bundle=TrackerDataBundleV3(), source="empty", warning=warning)
 
     def save_bundle(self, bundle: TrackerDataBundleV3) -> None:
+        started_at = perf_counter()
+        data = bundle.to_payload()
+        content_hash = payload_content_hash(data)
+        if read_envelope_content_hash(self.storage_file_path) == content_hash:
+            db_debug(
+                "json.save.noop",
+                path=str(self.storage_file_path),
+                duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+            )
+            return
         self.data_root.mkdir(parents=True, exist_ok=True)
-        payload = _build_storage_payload(bundle, backend=self.backend)
-        self._write_atomic_json(payload)
+        payload = _build_storage_payload(
+            bundle,
+            backend=self.backend,
+            data=data,
+            content_hash=content_hash,
+        )
+        encoded = self._write_atomic_json(payload)
+        db_debug(
+            "json.save",
+            path=str(self.storage_file_path),
+            compression=encoded.compression or "none",
+            raw_bytes=encoded.raw_bytes,
+            stored_bytes=encoded.stored_bytes,
+            compression_ratio=encoded.ratio,
+            encode_ms=encoded.duration_ms,
+            duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+        )
 
     def _read_bundle(self, path: Path) -> TrackerDataBundleV3:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-        return _bundle_from_storage_payload(raw)
-
-    def _write_atomic_json(self, payload: dict[str, object]) -> None:
+        raw = decode_payload(path.read_bytes())
+        return _bundle_from_storage_payload(raw, trusted=self._trusted_decode)
+
+    def _write_atomic_json(self, payload: dict[str, object]) -> EncodedPayload:
+        # Plain backups stay indented for people reading them; compressed ones are compact.
+        encoded = encode_payload(
+            payload,
+            compression=self._compression,
+            indent=2 if self._compression == PAYLOAD_COMPRESSION_NONE else None,
+        )
         target_path = self.storage_file_path
         backup_path = self.backup_file_path
 
@@ -195,9 +364,8 @@ class LocalJsonDataStore:
             dir=str(self.data_root),
         )
         try:
-            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as handle:
-                json.dump(payload, handle, indent=2, ensure_ascii=False)
-                handle.write("\n")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(encoded.data)
                 handle.flush()
                 os.fsync(handle.fileno())
             os.replace(temp_path, target_path)
@@ -207,9 +375,22 @@ class LocalJsonDataStore:
             except Exception:
                 pass
             raise
+        return encoded
 
 
 class LocalSqliteDataStore:
+    """Tracker data in a SQLite file under `data_root`.
+
+    Several app instances may share one data folder. Saves take the write lock with
+    BEGIN IMMEDIATE and merge what other instances committed first, and
+    `has_external_changes` polls PRAGMA data_version. Both rely on SQLite's file locking,
+    so the supported setups are instances on one machine, or a network share used with
+    the rollback journal, which the default "auto" journal mode selects there. The share
+    must honour byte-range locks (SMB does; NFS needs a working lock manager). Forcing WAL
+    on a share is unsafe: its index is shared through memory mapping, which only works
+    between processes on one host.
+    """
+
     backend = BACKEND_LOCAL_SQLITE
 
     def __init__(
@@ -218,6 +399,8 @@ class LocalSqliteDataStore:
         *,
         sqlite_file_name: str = DEFAULT_SQLITE_FILE_NAME,
         legacy_json_file_name: str = DEFAULT_DATA_FILE_NAME,
+        journal_mode: str = _LOCAL_SQLITE_JOURNAL_MODE,
+        payload_compression: str = _LOCAL_SQLITE_PAYLOAD_COMPRESSION,
     ) -> None:
         self.data_root = _normalize_path(Path(data_root))
         self._sqlite_file_name = str(sqlite_file_name or DEFAULT_SQLITE_FILE_NAME).strip()
@@ -227,34 +410,89 @@ class LocalSqliteDataStore:
             self.data_root,
             data_file_name=legacy_json_file_name,
         )
+        self._journal_mode = str(journal_mode or "").strip().lower() or _LOCAL_SQLITE_JOURNAL_MODE
+        self._payload_compression = normalize_payload_compression(payload_compression)
+        self._known_payload: dict[str, Any] | None = None
+        self._known_revision = -1
+        # Content hash of the known payload when it is known; empty otherwise.
+        self._known_hash = ""
+        self._row_hashes = _RowHashCache()
+        self._data_version: int | None = None
+        # Records other instances changed that were folded in while saving but not yet
+        # handed to the window through fetch_external_changes().
+        self._unreported_external: set[tuple[str, str]] = set()
+        self._log_pending_revisions = 0
+        self._log_pending_since: float | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._fts_enabled = False
+        self._memory_search = PayloadSearchIndex()
 
     @property
     def storage_file_path(self) -> Path:
         return self.data_root / self._sqlite_file_name
 
+    @property
+    def known_revision(self) -> int:
+        return max(-1, int(self._known_revision))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._log_pending_revisions:
+                try:
+                    self.compact_operation_log(force=True)
+                except Exception:
+                    pass
+            connection = self._connection
+            self._connection = None
+            self._data_version = None
+            if connection is None:
+                return
+            try:
+                connection.close()
+            except Exception:
+                pass
+            db_debug("sqlite.connection.closed", path=str(self.storage_file_path))
+
     @property
     def legacy_json_file_path(self) -> Path:
         return self._legacy_json_store.storage_file_path
 
     def has_saved_data(self) -> bool:
+        with self._lock:
+            return self._has_saved_data_unlocked()
+
+    def _has_saved_data_unlocked(self) -> bool:
         sqlite_path = self.storage_file_path
         if sqlite_path.exists() and sqlite_path.is_file():
             try:
-                row = self._fetch_payload_json()
-                if row is not None:
+                with self._session() as connection:
+                    if has_table_data(connection):
+                        return True
+                if self._fetch_payload_json() is not None:
                     return True
             except Exception:
                 return True
         return self._legacy_json_store.has_saved_data()
 
     def load_bundle(self) -> DataLoadResult:
+        with self._lock:
+            return self._load_bundle_unlocked()
+
+    def _load_bundle_unlocked(self) -> DataLoadResult:
         sqlite_path = self.storage_file_path
         fallback_warning = ""
         started_at = perf_counter()
 
         if sqlite_path.exists() and sqlite_path.is_file():
+            table_payload: dict[str, Any] | None = None
+            table_revision = 0
+            table_hash = ""
+            payload_json: str | None = None
             try:
-                payload_json = self._fetch_payload_json()
+                table_payload, table_revision, table_hash, table_trusted = self._fetch_table_payload()
+                if table_payload is None:
+                    payload_json = self._fetch_payload_json()
             except Exception as exc:
                 fallback_warning = f"SQLite data file could not be read: {exc}."
                 db_debug(
@@ -262,23 +500,19 @@ class LocalSqliteDataStore:
                     path=str(sqlite_path),
                     error=str(exc),
                 )
-                payload_json = None
-            if payload_json is not None:
+            if table_payload is not None:
                 try:
-                    payload = json.loads(payload_json)
-                    bundle = _bundle_from_storage_payload(payload)
-                    db_debug(
-                        "sqlite.load",
-                        path=str(sqlite_path),
-                        source="primary",
-                        duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+                    bundle = TrackerDataBundleV3.from_payload(
+                        table_payload,
+                        lazy_permit_detail=True,
+                        trusted=table_trusted,
                     )
-                    return DataLoadResult(bundle=bundle, source="primary")
                 except Exception as exc:
-                    warning = f"SQLite state payload is invalid: {exc}"
+                    warning = f"SQLite table data is invalid: {exc}"
                     db_debug(
                         "sqlite.load.payload_invalid",
                         path=str(sqlite_path),
+                        source="tables",
                         error=str(exc),
                     )
                     return DataLoadResult(
@@ -286,6 +520,29 @@ class LocalSqliteDataStore:
                         source="empty",
                         warning=warning,
                     )
+                # Table rows are written from normalized payloads, so they are the known state.
+                self._known_payload = table_payload
+                self._known_hash = table_hash
+                self._unreported_external.clear()
+                self._mark_synced_unlocked(table_revision)
+                db_debug(
+                    "sqlite.load",
+                    path=str(sqlite_path),
+                    source="tables",
+                    revision=table_revision,
+                    duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+                )
+                return DataLoadResult(bundle=bundle, source="primary")
+            if payload_json is not None:
+                result = self._load_from_payload_blob(payload_json)
+                db_debug(
+                    "sqlite.load",
+                    path=str(sqlite_path),
+                    source=result.source,
+                    warning=bool(result.warning),
+                    duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+                )
+                return result
 
         result = self._load_from_legacy_json(fallback_warning=fallback_warning)
         db_debug(
@@ -298,43 +555,521 @@ class LocalSqliteDataStore:
         return result
 
     def save_bundle(self, bundle: TrackerDataBundleV3) -> None:
+        with self._lock:
+            self._save_bundle_unlocked(bundle)
+
+    def save_bundle_delta(self, delta: TrackerBundleDelta) -> None:
+        with self._lock:
+            self._save_bundle_delta_unlocked(delta)
+
+    def _save_bundle_unlocked(self, bundle: TrackerDataBundleV3) -> None:
         started_at = perf_counter()
-        self.data_root.mkdir(parents=True, exist_ok=True)
-        payload = _build_storage_payload(bundle, backend=self.backend)
-        payload_json = json.dumps(payload, ensure_ascii=False)
-        saved_at_utc = str(payload.get("savedAtUtc", "") or "")
+        base_payload = self._known_payload
+        changes: dict[str, Any] | None = None
+        # Only records whose content hash moved are serialized, so an unchanged bundle
+        # is a no-op without taking the write lock.
+        if (
+            base_payload is not None
+            and self._connection is not None
+            and not self._has_external_changes_unlocked()
+        ):
+            changes = _build_records_change_set(base_payload, bundle, self._row_hashes)
+            if _bundle_change_set_is_empty(changes):
+                db_debug(
+                    "sqlite.save.noop",
+                    path=str(self.storage_file_path),
+                    mode="content_hash",
+                    duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+                )
+                return
+        self._write_changes_unlocked(
+            lambda payload: (
+                changes
+                if changes is not None and payload is base_payload
+                else _build_records_change_set(payload, bundle, self._row_hashes)
+            ),
+            mode="changes",
+        )
+
+    def _save_bundle_delta_unlocked(self, delta: TrackerBundleDelta) -> None:
+        self._write_changes_unlocked(
+            lambda base_payload: _build_delta_change_set(base_payload, delta),
+            mode="delta",
+        )
+
+    def _write_changes_unlocked(
+        self,
+        build_changes: Callable[[dict[str, Any]], dict[str, Any]],
+        *,
+        mode: str,
+        rebase: bool = True,
+        content_hash: str = "",
+    ) -> None:
+        started_at = perf_counter()
+        saved_at_utc = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        stats: dict[str, int] = {}
+        external: dict[tuple[str, str], Any] = {}
 
         try:
-            with self._connect() as connection:
-                self._ensure_schema(connection)
-                connection.execute(
-                    (
-                        f"insert into {_LOCAL_SQLITE_TABLE} "
-                        "(app_id, schema_version, backend, saved_at_utc, payload_json) "
-                        "values (?, ?, ?, ?, ?) "
-                        "on conflict(app_id) do update set "
-                        "schema_version = excluded.schema_version, "
-                        "backend = excluded.backend, "
-                        "saved_at_utc = excluded.saved_at_utc, "
-                        "payload_json = excluded.payload_json"
-                    ),
-                    (_APP_ID, _SCHEMA_VERSION, self.backend, saved_at_utc, payload_json),
+            with self._session() as connection, connection:
+                # Take the write lock before reading the revision, so no other instance
+                # can commit between the check and our write.
+                connection.execute("begin immediate")
+                current_revision = latest_revision(connection)
+                base_payload = self._known_payload
+                if base_payload is None:
+                    table_payload = self._load_current_payload_unlocked(connection)[0]
+                    if table_payload is None:
+                        mode = "full"
+                        clear_table_data(connection)
+                        base_payload = _empty_bundle_payload()
+                    else:
+                        base_payload = _normalize_bundle_payload(table_payload)
+                    changes = build_changes(base_payload)
+                elif current_revision != self._known_revision:
+                    latest_payload, external = self._read_external_changes_unlocked(
+                        connection,
+                        base_payload,
+                        current_revision,
+                    )
+                    if rebase:
+                        # Our edits were made against the known state; replay them on top of
+                        # the other instance's saves unless both touched the same record.
+                        changes = build_changes(base_payload)
+                        conflicts = sorted(
+                            key
+                            for key, row in _change_set_rows_by_key(changes).items()
+                            if key in external and external[key] != row
+                        )
+                        if conflicts:
+                            raise LocalRevisionConflictError(
+                                expected_revision=self._known_revision,
+                                current_revision=current_revision,
+                                records=conflicts,
+                                message=(
+                                    f"{len(conflicts)} record(s) were also changed by another "
+                                    "app instance using this data folder."
+                                ),
+                            )
+                    else:
+                        changes = build_changes(latest_payload)
+                    base_payload = latest_payload
+                else:
+                    changes = build_changes(base_payload)
+                if external and rebase:
+                    # The stored state now includes the other instance's saves too.
+                    content_hash = ""
+                if mode != "full" and _bundle_change_set_is_empty(changes):
+                    self._known_payload = base_payload
+                    self._known_hash = content_hash
+                    self._note_external_records_unlocked(external, rebase=rebase)
+                    self._mark_synced_unlocked(current_revision)
+                    db_debug(
+                        "sqlite.save.noop",
+                        path=str(self.storage_file_path),
+                        mode=mode,
+                        duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+                    )
+                    return
+                if mode == "full":
+                    stats = write_bundle_change_set(
+                        connection,
+                        change_set=changes,
+                        schema_version=_SCHEMA_VERSION,
+                        backend=self.backend,
+                        saved_at_utc=saved_at_utc,
+                    )
+                known_payload = _merge_bundle_change_set(base_payload, changes)
+                revision = self._journal_changes_unlocked(
+                    connection,
+                    base_payload=base_payload,
+                    changes=changes,
+                    payload=known_payload,
+                    saved_at_utc=saved_at_utc,
+                    mode=mode,
+                    content_hash=content_hash,
                 )
-                connection.commit()
+                if self._fts_enabled:
+                    if mode == "full" or search_table_is_empty(connection):
+                        rebuild_search_rows(connection, search_documents_for_payload(known_payload))
+                    else:
+                        upserts, deletes = search_changes_for_change_set(changes)
+                        sync_search_rows(connection, upserts=upserts, deletes=deletes)
+        except LocalRevisionConflictError as exc:
+            db_debug(
+                "sqlite.save.conflict",
+                path=str(self.storage_file_path),
+                mode=mode,
+                expected_revision=exc.expected_revision,
+                revision=exc.current_revision,
+                records=len(exc.records),
+            )
+            raise
         except Exception as exc:
             db_debug(
                 "sqlite.save.error",
                 path=str(self.storage_file_path),
-                bytes=len(payload_json.encode("utf-8")),
+                mode=mode,
                 error=str(exc),
             )
             raise
+        self._memory_search.advance(base_payload, changes, known_payload)
+        self._known_payload = known_payload
+        self._known_hash = content_hash
+        self._note_external_records_unlocked(external, rebase=rebase)
+        self._mark_synced_unlocked(revision.revision)
+        if mode == "full":
+            self._log_pending_revisions = 0
+            self._log_pending_since = None
+        else:
+            self._log_pending_revisions += 1
+            if self._log_pending_since is None:
+                self._log_pending_since = monotonic()
         db_debug(
             "sqlite.save",
             path=str(self.storage_file_path),
-            bytes=len(payload_json.encode("utf-8")),
+            mode=mode,
+            tables_written=mode == "full",
+            pending_log_revisions=self._log_pending_revisions,
+            revision=revision.revision,
+            revision_kind=revision.kind,
+            external_records=len(external),
+            compression=self._payload_compression or "none",
+            journal_raw_bytes=revision.raw_bytes,
+            journal_stored_bytes=revision.stored_bytes,
+            compression_ratio=round(revision.stored_bytes / revision.raw_bytes, 4) if revision.raw_bytes else 1.0,
+            encode_ms=revision.encode_ms,
+            rows_upserted=stats.get("rows_upserted", revision.rows_upserted),
+            rows_deleted=stats.get("rows_deleted", revision.rows_deleted),
+            duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+        )
+
+    def _load_current_payload_unlocked(self, connection: sqlite3.Connection) -> tuple[dict[str, Any] | None, int, int]:
+        """Entity tables plus the journal tail not yet compacted into them."""
+        payload = load_payload_from_tables(connection)
+        revision = latest_revision(connection)
+        applied = applied_revision(connection)
+        if payload is None or applied is None or applied >= revision:
+            return payload, revision, revision
+        journal_changes = load_changes_after(connection, applied)
+        if journal_changes is None:
+            raise RuntimeError(f"Revision journal no longer covers saves after revision {applied}.")
+        for change_set, snapshot in journal_changes:
+            payload = snapshot if snapshot is not None else _merge_bundle_change_set(payload, change_set)
+        return payload, revision, applied
+
+    def compact_operation_log(self, *, force: bool = False) -> bool:
+        """Fold saves that so far only live in the revision journal into the entity tables."""
+        with self._lock:
+            if self._connection is None or not self._log_pending_revisions:
+                return False
+            if not force and not self._operation_log_compaction_due_unlocked():
+                return False
+            started_at = perf_counter()
+            folded: dict[tuple[str, str], Any] = {}
+            stats: dict[str, int] = {}
+            checkpointed = False
+            try:
+                with self._session() as connection, connection:
+                    connection.execute("begin immediate")
+                    applied = applied_revision(connection)
+                    revision = latest_revision(connection)
+                    if applied is not None and applied < revision:
+                        journal_changes = load_changes_after(connection, applied)
+                        if journal_changes is None:
+                            raise RuntimeError(
+                                f"Revision journal no longer covers saves after revision {applied}."
+                            )
+                        # Full rewrites update the tables in the same transaction, so the
+                        # tail only ever holds change sets.
+                        for change_set, _snapshot in journal_changes:
+                            folded.update(_change_set_rows_by_key(change_set))
+                        stats = write_bundle_change_set(
+                            connection,
+                            change_set=_change_set_from_rows_by_key(folded),
+                            schema_version=_SCHEMA_VERSION,
+                            backend=self.backend,
+                            saved_at_utc=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                        )
+                        set_applied_revision(connection, revision)
+                        if revision == self._known_revision and self._known_payload is not None:
+                            checkpointed = promote_checkpoint(
+                                connection,
+                                revision,
+                                payload=self._known_payload,
+                                compression=self._payload_compression,
+                            )
+            except Exception as exc:
+                db_debug(
+                    "sqlite.log.compact_error",
+                    path=str(self.storage_file_path),
+                    error=str(exc),
+                )
+                raise
+            self._log_pending_revisions = 0
+            self._log_pending_since = None
+            db_debug(
+                "sqlite.log.compacted",
+                path=str(self.storage_file_path),
+                from_revision=applied,
+                revision=revision,
+                records=len(folded),
+                checkpoint=checkpointed,
+                rows_upserted=stats.get("rows_upserted", 0),
+                rows_deleted=stats.get("rows_deleted", 0),
+                duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+            )
+            return True
+
+    def _operation_log_compaction_due_unlocked(self) -> bool:
+        if self._log_pending_revisions >= _OPERATION_LOG_COMPACT_REVISIONS:
+            return True
+        since = self._log_pending_since
+        return since is not None and monotonic() - since >= _OPERATION_LOG_COMPACT_AGE_SECONDS
+
+    def _note_external_records_unlocked(self, external: dict[tuple[str, str], Any], *, rebase: bool) -> None:
+        if rebase:
+            self._unreported_external.update(external)
+        else:
+            # The write replaced the whole state; the window reloads it anyway.
+            self._unreported_external.clear()
+
+    def _mark_synced_unlocked(self, revision: int) -> None:
+        self._known_revision = int(revision)
+        connection = self._connection
+        self._data_version = _sqlite_data_version(connection) if connection is not None else None
+
+    def _read_external_changes_unlocked(
+        self,
+        connection: sqlite3.Connection,
+        base_payload: dict[str, Any],
+        revision: int,
+    ) -> tuple[dict[str, Any], dict[tuple[str, str], Any]]:
+        started_at = perf_counter()
+        keys: set[tuple[str, str]] = set()
+        payload = base_payload
+        journal_changes = load_changes_after(connection, self._known_revision)
+        if journal_changes is None or self._known_revision > revision:
+            source = "tables"
+            payload = _normalize_bundle_payload(self._load_current_payload_unlocked(connection)[0] or {})
+            keys.update(_change_set_rows_by_key(_diff_normalized_payloads(base_payload, payload)))
+        else:
+            source = "journal"
+            for change_set, snapshot in journal_changes:
+                if snapshot is not None:
+                    snapshot_payload = _normalize_bundle_payload(snapshot)
+                    keys.update(_change_set_rows_by_key(_diff_normalized_payloads(payload, snapshot_payload)))
+                    payload = snapshot_payload
+                else:
+                    keys.update(_change_set_rows_by_key(change_set))
+                    payload = _merge_bundle_change_set(payload, change_set)
+        external_changes = _change_set_for_keys(payload, keys)
+        self._memory_search.advance(base_payload, external_changes, payload)
+        db_debug(
+            "sqlite.external_changes",
+            path=str(self.storage_file_path),
+            source=source,
+            from_revision=self._known_revision,
+            revision=int(revision),
+            records=len(keys),
             duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
         )
+        return payload, _change_set_rows_by_key(external_changes)
+
+    def has_external_changes(self) -> bool:
+        """Cheap check for saves by other instances since the last load, save, or fetch."""
+        with self._lock:
+            return self._has_external_changes_unlocked()
+
+    def _has_external_changes_unlocked(self) -> bool:
+        if self._unreported_external:
+            return True
+        connection = self._connection
+        if connection is None or self._known_revision < 0:
+            return False
+        data_version = _sqlite_data_version(connection)
+        if data_version == self._data_version:
+            return False
+        if latest_revision(connection) == self._known_revision:
+            # Another connection wrote something other than a save, e.g. the search index.
+            self._data_version = data_version
+            return False
+        return True
+
+    def fetch_external_changes(self) -> TrackerBundleDelta | None:
+        """Fold saves made by other instances into the known state and return the records they touched."""
+        with self._lock:
+            if self._known_payload is None or self._known_revision < 0:
+                return None
+            payload = self._known_payload
+            keys = set(self._unreported_external)
+            with self._session() as connection:
+                connection.execute("begin")
+                try:
+                    revision = latest_revision(connection)
+                    content_hash = self._known_hash
+                    if revision != self._known_revision:
+                        payload, external = self._read_external_changes_unlocked(connection, payload, revision)
+                        keys.update(external)
+                        content_hash = revision_content_hash(connection, revision)
+                finally:
+                    connection.commit()
+            self._known_payload = payload
+            self._known_hash = content_hash
+            self._unreported_external.clear()
+            self._mark_synced_unlocked(revision)
+            if not keys:
+                return None
+            return _tracker_delta_for_keys(payload, keys)
+
+    def _journal_changes_unlocked(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        base_payload: dict[str, Any],
+        changes: dict[str, Any],
+        payload: dict[str, Any],
+        saved_at_utc: str,
+        mode: str,
+        content_hash: str,
+    ) -> RevisionEntry:
+        if mode == "full":
+            entry = append_revision(
+                connection,
+                change_set=changes,
+                payload=payload,
+                saved_at_utc=saved_at_utc,
+                source=mode,
+                content_hash=content_hash,
+                compression=self._payload_compression,
+                force_checkpoint=True,
+            )
+            set_applied_revision(connection, entry.revision)
+            return entry
+        current = latest_revision(connection)
+        if current == 0:
+            # Tables written before the journal existed: keep their state restorable.
+            baseline = append_revision(
+                connection,
+                change_set={},
+                payload=base_payload,
+                saved_at_utc=saved_at_utc,
+                source="baseline",
+                compression=self._payload_compression,
+                force_checkpoint=True,
+            )
+            set_applied_revision(connection, baseline.revision)
+        elif applied_revision(connection) is None:
+            # Journals from before the operation log always had current tables.
+            set_applied_revision(connection, current)
+        # Checkpoints are taken when the log is compacted, not on the save path.
+        return append_revision(
+            connection,
+            change_set=changes,
+            payload=payload,
+            saved_at_utc=saved_at_utc,
+            source=mode,
+            content_hash=content_hash,
+            compression=self._payload_compression,
+            checkpoint_interval=None,
+        )
+
+    def current_revision(self) -> int:
+        with self._session() as connection:
+            return latest_revision(connection)
+
+    def list_revisions(self, *, limit: int | None = None) -> list[RevisionEntry]:
+        with self._session() as connection:
+            return list_revisions(connection, limit=limit)
+
+    def load_revision(self, revision: int) -> TrackerDataBundleV3:
+        with self._session() as connection:
+            payload = self._payload_at_revision_unlocked(connection, revision)
+        return TrackerDataBundleV3.from_payload(payload, lazy_permit_detail=True)
+
+    def diff_revisions(self, from_revision: int, to_revision: int) -> RevisionDiff:
+        started_at = perf_counter()
+        with self._session() as connection:
+            previous = self._payload_at_revision_unlocked(connection, from_revision)
+            current = self._payload_at_revision_unlocked(connection, to_revision)
+        change_set = _diff_normalized_payloads(previous, current)
+        diff = RevisionDiff(
+            from_revision=int(from_revision),
+            to_revision=int(to_revision),
+            change_set=change_set,
+            records=describe_change_set(change_set, previous_payload=previous),
+        )
+        db_debug(
+            "sqlite.revision.diff",
+            from_revision=diff.from_revision,
+            to_revision=diff.to_revision,
+            records=len(diff.records),
+            duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+        )
+        return diff
+
+    def restore_revision(self, revision: int) -> TrackerDataBundleV3:
+        with self._lock:
+            started_at = perf_counter()
+            with self._session() as connection:
+                target_payload = self._payload_at_revision_unlocked(connection, revision)
+            self._write_changes_unlocked(
+                lambda base_payload: _diff_normalized_payloads(base_payload, target_payload),
+                mode="restore",
+                rebase=False,
+                content_hash=payload_content_hash(target_payload),
+            )
+            db_debug(
+                "sqlite.revision.restore",
+                revision=int(revision),
+                duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+            )
+            return TrackerDataBundleV3.from_payload(target_payload, lazy_permit_detail=True)
+
+    def _payload_at_revision_unlocked(self, connection: sqlite3.Connection, revision: int) -> dict[str, Any]:
+        try:
+            payload, change_sets = load_revision_chain(connection, revision)
+        except ValueError as exc:
+            raise RuntimeError(str(exc)) from exc
+        payload = _normalize_bundle_payload(payload)
+        for change_set in change_sets:
+            payload = _merge_bundle_change_set(payload, change_set)
+        return payload
+
+    def _load_from_payload_blob(self, payload_json: str) -> DataLoadResult:
+        try:
+            payload = json.loads(payload_json)
+            bundle = _bundle_from_storage_payload(payload, trusted=True)
+        except Exception as exc:
+            warning = f"SQLite state payload is invalid: {exc}"
+            db_debug(
+                "sqlite.load.payload_invalid",
+                path=str(self.storage_file_path),
+                source="payload_json",
+                error=str(exc),
+            )
+            return DataLoadResult(
+                bundle=TrackerDataBundleV3(),
+                source="empty",
+                warning=warning,
+            )
+
+        warning = ""
+        try:
+            self.save_bundle(bundle)
+        except Exception as exc:
+            warning = f"Could not migrate SQLite state payload to per-record tables: {exc}"
+            db_debug(
+                "sqlite.migrate_payload_json.error",
+                path=str(self.storage_file_path),
+                error=str(exc),
+            )
+        else:
+            db_debug(
+                "sqlite.migrate_payload_json",
+                path=str(self.storage_file_path),
+            )
+        return DataLoadResult(bundle=bundle, source="migrated_payload_json", warning=warning)
 
     def _load_from_legacy_json(self, *, fallback_warning: str = "") -> DataLoadResult:
         if not self._legacy_json_store.has_saved_data():
@@ -395,11 +1130,66 @@ class LocalSqliteDataStore:
             warning=warning,
         )
 
+    @contextmanager
+    def _session(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self._ensure_connection()
+
+    def _ensure_connection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+        started_at = perf_counter()
+        connection = self._connect()
+        try:
+            journal_mode = self._configure_connection(connection)
+            with connection:
+                self._ensure_schema(connection)
+                self._fts_enabled = ensure_search_schema(connection)
+        except Exception:
+            connection.close()
+            raise
+        self._connection = connection
+        db_debug(
+            "sqlite.connection.opened",
+            path=str(self.storage_file_path),
+            journal_mode=journal_mode,
+            fts5=self._fts_enabled,
+            duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+        )
+        return connection
+
     def _connect(self) -> sqlite3.Connection:
         self.data_root.mkdir(parents=True, exist_ok=True)
-        return sqlite3.connect(str(self.storage_file_path), timeout=4.0)
+        return sqlite3.connect(
+            str(self.storage_file_path),
+            timeout=4.0,
+            check_same_thread=False,
+            cached_statements=_LOCAL_SQLITE_CACHED_STATEMENTS,
+        )
+
+    def _configure_connection(self, connection: sqlite3.Connection) -> str:
+        requested = self._journal_mode
+        local_disk = is_local_disk_path(self.data_root)
+        if requested == "auto":
+            requested = "wal" if local_disk else "delete"
+        row = connection.execute(f"pragma journal_mode = {requested}").fetchone()
+        journal_mode = str(row[0] if row else "").strip().lower()
+        if journal_mode == "wal" and not local_disk:
+            # Forced, or another process still holds the file in WAL and the switch did not take.
+            db_debug(
+                "sqlite.journal_mode.wal_not_local",
+                path=str(self.storage_file_path),
+                requested=requested,
+            )
+        if journal_mode == "wal":
+            connection.execute("pragma synchronous = NORMAL")
+        connection.execute(f"pragma cache_size = {_LOCAL_SQLITE_CACHE_SIZE_KIB}")
+        connection.execute("pragma temp_store = MEMORY")
+        return journal_mode
 
     def _ensure_schema(self, connection: sqlite3.Connection) -> None:
+        ensure_local_schema(connection)
+        ensure_revision_schema(connection)
         connection.execute(
             f"""
             create table if not exists {_LOCAL_SQLITE_TABLE} (
@@ -412,9 +1202,53 @@ class LocalSqliteDataStore:
             """
         )
 
+    def search_records(
+        self,
+        query: str,
+        *,
+        kinds: Sequence[str] | None = None,
+        limit: int | None = DEFAULT_SEARCH_LIMIT,
+    ) -> list[SearchHit]:
+        with self._lock:
+            started_at = perf_counter()
+            with self._session() as connection:
+                if self._fts_enabled:
+                    hits = search_sqlite(connection, query, kinds=kinds, limit=limit)
+                    engine = "fts5"
+                else:
+                    if self._known_payload is None:
+                        table_payload = self._load_current_payload_unlocked(connection)[0]
+                        self._known_payload = _normalize_bundle_payload(table_payload or {})
+                    hits = self._memory_search.search(self._known_payload, query, kinds=kinds, limit=limit)
+                    engine = "memory"
+            db_debug(
+                "sqlite.search",
+                engine=engine,
+                hits=len(hits),
+                duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+            )
+            return hits
+
+    def _fetch_table_payload(self) -> tuple[dict[str, Any] | None, int, str, bool]:
+        with self._session() as connection:
+            # One read transaction, so the rows match the revision even if another
+            # instance is saving.
+            connection.execute("begin")
+            try:
+                payload, revision, applied = self._load_current_payload_unlocked(connection)
+                content_hash = revision_content_hash(connection, revision)
+                trusted = table_schema_version(connection) == _SCHEMA_VERSION
+            finally:
+                connection.commit()
+            self._log_pending_revisions = max(0, revision - applied)
+            self._log_pending_since = monotonic() if self._log_pending_revisions else None
+            if payload is not None and self._fts_enabled and search_table_is_empty(connection):
+                with connection:
+                    rebuild_search_rows(connection, search_documents_for_payload(payload))
+            return payload, revision, content_hash, trusted
+
     def _fetch_payload_json(self) -> str | None:
-        with self._connect() as connection:
-            self._ensure_schema(connection)
+        with self._session() as connection:
             row = connection.execute(
                 f"select payload_json from {_LOCAL_SQLITE_TABLE} where app_id = ? limit 1",
                 (_APP_ID,),
@@ -427,7 +1261,8 @@ class LocalSqliteDataStore:
 
 def load_bundle_from_json_file(path: Path | str) -> DataLoadResult:
     normalized = _normalize_path(Path(path))
-    store = LocalJsonDataStore(normalized.parent, data_file_name=normalized.name)
+    # Imports may come from older or hand-edited files, so always take the tolerant path.
+    store = LocalJsonDataStore(normalized.parent, data_file_name=normalized.name, trusted_decode=False)
     return store.load_bundle()
 
 
@@ -446,13 +1281,21 @@ class SupabaseDataStore:
         data_root: Path | str,
         *,
         config: SupabaseDataStoreConfig | None = None,
+        http_pool: HttpConnectionPool | None = None,
     ) -> None:
         self.data_root = _normalize_path(Path(data_root))
         self._config = config or SupabaseDataStoreConfig()
+        self._http = http_pool or shared_http_pool()
         self._known_revision = -1
         self._client_id = f"desktop-{uuid4().hex[:12]}"
         self._known_payload: dict[str, Any] | None = None
+        self._row_hashes = _RowHashCache()
         self._lock = threading.RLock()
+        self._memory_search = PayloadSearchIndex()
+        # Response bytes per row last seen for each table, to size the next load's pages.
+        self._page_row_bytes: dict[str, float] = {}
+        # Whether the gateway accepts gzip request bodies; None until a compressed body was sent.
+        self._gzip_requests: bool | None = None
 
     @property
     def storage_file_path(self) -> Path:
@@ -462,6 +1305,28 @@ class SupabaseDataStore:
     def known_revision(self) -> int:
         return max(-1, int(self._known_revision))
 
+    def close(self) -> None:
+        # Drop idle keep-alive sockets; the shared pool reconnects if it is used again.
+        self._http.close()
+
+    def search_records(
+        self,
+        query: str,
+        *,
+        kinds: Sequence[str] | None = None,
+        limit: int | None = DEFAULT_SEARCH_LIMIT,
+    ) -> list[SearchHit]:
+        with self._lock:
+            started_at = perf_counter()
+            hits = self._memory_search.search(self._known_payload, query, kinds=kinds, limit=limit)
+            db_debug(
+                "supabase.search",
+                engine="memory",
+                hits=len(hits),
+                duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+            )
+            return hits
+
     def fetch_remote_revision(self) -> int | None:
         with self._lock:
             return self._fetch_remote_revision_unlocked()
@@ -485,6 +1350,40 @@ class SupabaseDataStore:
             return None
         return _coerce_non_negative_int(state_row.get("revision"), default=0)
 
+    def fetch_remote_changes(self) -> TrackerBundleDelta | None:
+        """Fold remote saves since the known revision into the known state and return the records they touched.
+
+        Returns None when the server cannot answer incrementally: nothing is loaded yet, the
+        changes RPC is missing, or tombstones the known revision would need were pruned. The
+        caller then loads the full bundle instead.
+        """
+        with self._lock:
+            if self._known_payload is None or self._known_revision < 0:
+                return None
+            started_at = perf_counter()
+            from_revision = self._known_revision
+            remote = self._fetch_changes_via_rpc(from_revision)
+            if remote is None:
+                return None
+            revision, changes = remote
+            keys = set(_change_set_rows_by_key(changes))
+            base_payload = self._known_payload
+            payload = base_payload
+            if keys:
+                payload = _merge_bundle_change_set(base_payload, changes)
+                self._memory_search.advance(base_payload, changes, payload)
+            self._known_payload = payload
+            self._known_revision = revision
+            db_debug(
+                "supabase.remote_changes",
+                table=self._config.table,
+                from_revision=from_revision,
+                revision=revision,
+                records=len(keys),
+                duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+            )
+            return _tracker_delta_for_keys(payload, keys)
+
     @property
     def client_id(self) -> str:
         return self._client_id
@@ -502,7 +1401,7 @@ class SupabaseDataStore:
         if snapshot is not None:
             payload, revision = snapshot
             try:
-                bundle = TrackerDataBundleV3.from_payload(payload)
+                bundle = TrackerDataBundleV3.from_payload(payload, lazy_permit_detail=True)
             except Exception as exc:
                 warning = f"Supabase snapshot payload is invalid: {exc}"
                 db_debug(
@@ -540,7 +1439,7 @@ class SupabaseDataStore:
         self._known_revision = _coerce_non_negative_int(state_row.get("revision"), default=0)
         try:
             payload = self._load_payload_from_tables()
-            bundle = TrackerDataBundleV3.from_payload(payload)
+            bundle = TrackerDataBundleV3.from_payload(payload, lazy_permit_detail=True)
             legacy_payload = state_row.get("payload")
             if _bundle_has_content(bundle) is False and isinstance(legacy_payload, dict):
                 legacy_bundle = TrackerDataBundleV3.from_payload(legacy_payload)
@@ -610,39 +1509,73 @@ class SupabaseDataStore:
         with self._lock:
             self._save_bundle_unlocked(bundle)
 
-    def _save_bundle_unlocked(self, bundle: TrackerDataBundleV3) -> None:
-        config = self._require_config()
-        started_at = perf_counter()
-        target_payload = _normalize_bundle_payload(bundle.to_payload())
+    def save_bundle_delta(self, delta: TrackerBundleDelta) -> None:
+        with self._lock:
+            self._save_bundle_delta_unlocked(delta)
+
+    def _ensure_known_payload_unlocked(self) -> None:
         if self._known_payload is None or self._known_revision < 0:
             load_result = self.load_bundle()
             self._known_payload = load_result.bundle.to_payload()
             if self._known_revision < 0:
                 self._known_revision = 0
 
-        base_payload = _normalize_bundle_payload(self._known_payload or _empty_bundle_payload())
-        if base_payload == target_payload:
+    def _save_bundle_delta_unlocked(self, delta: TrackerBundleDelta) -> None:
+        config = self._require_config()
+        started_at = perf_counter()
+        self._ensure_known_payload_unlocked()
+        base_payload = self._known_payload or _empty_bundle_payload()
+        changes = _build_delta_change_set(base_payload, delta)
+        if _bundle_change_set_is_empty(changes):
             db_debug(
                 "supabase.save.noop",
                 table=config.table,
-                mode="unchanged",
+                mode="empty_delta",
                 revision=self._known_revision,
                 duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
             )
             return
+        self._push_change_set_unlocked(
+            base_payload=base_payload,
+            changes=changes,
+            target_payload=None,
+            started_at=started_at,
+        )
+
+    def _save_bundle_unlocked(self, bundle: TrackerDataBundleV3) -> None:
+        config = self._require_config()
+        started_at = perf_counter()
+        self._ensure_known_payload_unlocked()
 
-        changes = _build_bundle_change_set(base_payload, target_payload)
+        # The known payload is normalized whenever it is assigned, and records whose
+        # content hash matches their known row are not serialized again.
+        base_payload = self._known_payload or _empty_bundle_payload()
+        changes = _build_records_change_set(base_payload, bundle, self._row_hashes)
         if _bundle_change_set_is_empty(changes):
-            self._known_payload = target_payload
             db_debug(
                 "supabase.save.noop",
                 table=config.table,
-                mode="empty_change_set",
+                mode="unchanged",
                 revision=self._known_revision,
                 duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
             )
             return
+        self._push_change_set_unlocked(
+            base_payload=base_payload,
+            changes=changes,
+            target_payload=None,
+            started_at=started_at,
+        )
 
+    def _push_change_set_unlocked(
+        self,
+        *,
+        base_payload: dict[str, Any],
+        changes: dict[str, Any],
+        target_payload: dict[str, Any] | None,
+        started_at: float,
+    ) -> None:
+        config = self._require_config()
         expected_revision = max(0, int(self._known_revision))
         now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
         max_attempts = 5
@@ -654,7 +1587,9 @@ class SupabaseDataStore:
                     expected_revision=expected_revision,
                     saved_at_utc=now_iso,
                 ):
-                    self._known_payload = _apply_bundle_change_set(base_payload, changes)
+                    known_payload = _merge_bundle_change_set(base_payload, changes)
+                    self._memory_search.advance(self._known_payload, changes, known_payload)
+                    self._known_payload = known_payload
                     db_debug(
                         "supabase.save",
                         table=config.table,
@@ -666,6 +1601,8 @@ class SupabaseDataStore:
                     )
                     return
 
+                if target_payload is None:
+                    target_payload = _merge_bundle_change_set(base_payload, changes)
                 if self._save_bundle_via_rpc(
                     payload=target_payload,
                     expected_revision=expected_revision,
@@ -765,6 +1702,64 @@ class SupabaseDataStore:
             payload = _empty_bundle_payload()
         return _normalize_bundle_payload(payload), revision
 
+    def _fetch_changes_via_rpc(self, since_revision: int) -> tuple[int, dict[str, Any]] | None:
+        rpc_path = f"/rest/v1/rpc/{quote(_SUPABASE_FETCH_CHANGES_RPC, safe='_')}"
+        try:
+            raw = self._request_json(
+                method="POST",
+                path=rpc_path,
+                payload={"p_app_id": _APP_ID, "p_since_revision": int(since_revision)},
+                prefer="",
+                expect_json=True,
+            )
+        except RuntimeError as exc:
+            if _is_missing_rpc_function_error(exc):
+                db_debug(
+                    "supabase.remote_changes.rpc_missing",
+                    table=self._config.table,
+                    rpc=_SUPABASE_FETCH_CHANGES_RPC,
+                )
+                return None
+            raise
+
+        result = raw
+        if isinstance(raw, list):
+            if raw and isinstance(raw[0], dict):
+                result = raw[0]
+            else:
+                result = None
+        if not isinstance(result, dict):
+            raise RuntimeError(
+                f"Supabase fetch changes RPC returned an invalid response type: {type(raw).__name__}"
+            )
+        if bool(result.get("full")):
+            return None
+
+        revision = _coerce_non_negative_int(result.get("revision"), default=since_revision)
+        raw_changes = result.get("changes")
+        if not isinstance(raw_changes, dict):
+            raw_changes = {}
+        # Rows are decoded like table loads and normalized like the known payload, so
+        # they merge into it as-is.
+        changes: dict[str, Any] = {}
+        for payload_key, _table, record_type, key_column in _SUPABASE_ENTITY_TABLES:
+            columns = field_codecs(record_type)
+            changes[f"{payload_key}_upserts"] = [
+                record_type.from_mapping(self._decode_entity_row(row, columns)).to_mapping()
+                for row in raw_changes.get(f"{payload_key}_upserts") or ()
+                if isinstance(row, dict) and self._row_text(row, key_column)
+            ]
+            changes[f"{payload_key}_deletes"] = _change_set_delete_ids(raw_changes.get(f"{payload_key}_deletes"))
+        changes["active_document_template_ids_upserts"] = [
+            {"permit_type": self._row_text(row, "permit_type"), "template_id": self._row_text(row, "template_id")}
+            for row in raw_changes.get("active_document_template_ids_upserts") or ()
+            if isinstance(row, dict) and self._row_text(row, "permit_type") and self._row_text(row, "template_id")
+        ]
+        changes["active_document_template_ids_deletes"] = _change_set_delete_ids(
+            raw_changes.get("active_document_template_ids_deletes")
+        )
+        return revision, changes
+
     def _save_changes_via_rpc(
         self,
         *,
@@ -839,150 +1834,41 @@ class SupabaseDataStore:
         return True
 
     def _load_payload_from_tables(self) -> dict[str, Any]:
-        contacts_rows = self._fetch_table_rows(
-            table=_SUPABASE_CONTACTS_TABLE,
-            select="contact_id,name,numbers,emails,roles,contact_methods,list_color",
-            order="contact_id.asc",
-            exclude_deleted=True,
-        )
-        jurisdictions_rows = self._fetch_table_rows(
-            table=_SUPABASE_JURISDICTIONS_TABLE,
-            select=(
-                "jurisdiction_id,name,jurisdiction_type,parent_county,portal_urls,contact_ids,"
-                "portal_vendor,notes,list_color"
-            ),
-            order="jurisdiction_id.asc",
-            exclude_deleted=True,
-        )
-        properties_rows = self._fetch_table_rows(
-            table=_SUPABASE_PROPERTIES_TABLE,
-            select=(
-                "property_id,display_address,parcel_id,parcel_id_norm,jurisdiction_id,contact_ids,"
-                "list_color,tags,notes"
-            ),
-            order="property_id.asc",
-            exclude_deleted=True,
-        )
-        permits_rows = self._fetch_table_rows(
-            table=_SUPABASE_PERMITS_TABLE,
-            select=(
-                "permit_id,property_id,permit_type,permit_number,status,next_action_text,next_action_due,"
-                "request_date,application_date,issued_date,final_date,completion_date,parties,events,"
-                "document_slots,document_folders,documents"
-            ),
-            order="permit_id.asc",
-            exclude_deleted=True,
-        )
-        templates_rows = self._fetch_table_rows(
-            table=_SUPABASE_DOCUMENT_TEMPLATES_TABLE,
-            select="template_id,name,permit_type,slots,notes",
-            order="template_id.asc",
-            exclude_deleted=True,
-        )
-        template_map_rows = self._fetch_table_rows(
+        entity_fetches: list[tuple[str, str, tuple[tuple[str, FieldCodec], ...], _SupabaseTableFetch]] = []
+        for payload_key, table, record_type, key_column in _SUPABASE_ENTITY_TABLES:
+            # Columns follow the record's storage codecs, like the local SQLite tables.
+            columns = field_codecs(record_type)
+            fetch = _SupabaseTableFetch(
+                table=table,
+                select=",".join(name for name, _codec in columns),
+                key_column=key_column,
+                exclude_deleted=True,
+            )
+            entity_fetches.append((payload_key, key_column, columns, fetch))
+        template_map_fetch = _SupabaseTableFetch(
             table=_SUPABASE_ACTIVE_TEMPLATE_MAP_TABLE,
             select="permit_type,template_id",
-            order="permit_type.asc",
+            key_column="permit_type",
             exclude_deleted=True,
         )
+        fetches = [fetch for *_rest, fetch in entity_fetches] + [template_map_fetch]
+        started_at = perf_counter()
+        self._fetch_tables_rows(fetches)
+        db_debug(
+            "supabase.load.tables_fetched",
+            tables=len(fetches),
+            requests=sum(fetch.requests for fetch in fetches),
+            response_bytes=sum(fetch.response_bytes for fetch in fetches),
+            duration_ms=round((perf_counter() - started_at) * 1000.0, 3),
+        )
 
-        contacts: list[dict[str, Any]] = []
-        for row in contacts_rows:
-            contact_id = self._row_text(row, "contact_id")
-            if not contact_id:
-                continue
-            contacts.append(
-                {
-                    "contact_id": contact_id,
-                    "name": self._row_text(row, "name"),
-                    "numbers": self._row_json_array(row, "numbers"),
-                    "emails": self._row_json_array(row, "emails"),
-                    "roles": self._row_json_array(row, "roles"),
-                    "contact_methods": self._row_json_array(row, "contact_methods"),
-                    "list_color": self._row_text(row, "list_color"),
-                }
-            )
-
-        jurisdictions: list[dict[str, Any]] = []
-        for row in jurisdictions_rows:
-            jurisdiction_id = self._row_text(row, "jurisdiction_id")
-            if not jurisdiction_id:
-                continue
-            jurisdictions.append(
-                {
-                    "jurisdiction_id": jurisdiction_id,
-                    "name": self._row_text(row, "name"),
-                    "jurisdiction_type": self._row_text(row, "jurisdiction_type"),
-                    "parent_county": self._row_text(row, "parent_county"),
-                    "portal_urls": self._row_json_array(row, "portal_urls"),
-                    "contact_ids": self._row_json_array(row, "contact_ids"),
-                    "portal_vendor": self._row_text(row, "portal_vendor"),
-                    "notes": self._row_text(row, "notes"),
-                    "list_color": self._row_text(row, "list_color"),
-                }
-            )
-
-        properties: list[dict[str, Any]] = []
-        for row in properties_rows:
-            property_id = self._row_text(row, "property_id")
-            if not property_id:
-                continue
-            properties.append(
-                {
-                    "property_id": property_id,
-                    "display_address": self._row_text(row, "display_address"),
-                    "parcel_id": self._row_text(row, "parcel_id"),
-                    "parcel_id_norm": self._row_text(row, "parcel_id_norm"),
-                    "jurisdiction_id": self._row_text(row, "jurisdiction_id"),
-                    "contact_ids": self._row_json_array(row, "contact_ids"),
-                    "list_color": self._row_text(row, "list_color"),
-                    "tags": self._row_json_array(row, "tags"),
-                    "notes": self._row_text(row, "notes"),
-                }
-            )
-
-        permits: list[dict[str, Any]] = []
-        for row in permits_rows:
-            permit_id = self._row_text(row, "permit_id")
-            if not permit_id:
-                continue
-            permits.append(
-                {
-                    "permit_id": permit_id,
-                    "property_id": self._row_text(row, "property_id"),
-                    "permit_type": self._row_text(row, "permit_type"),
-                    "permit_number": self._row_text(row, "permit_number"),
-                    "status": self._row_text(row, "status"),
-                    "next_action_text": self._row_text(row, "next_action_text"),
-                    "next_action_due": self._row_text(row, "next_action_due"),
-                    "request_date": self._row_text(row, "request_date"),
-                    "application_date": self._row_text(row, "application_date"),
-                    "issued_date": self._row_text(row, "issued_date"),
-                    "final_date": self._row_text(row, "final_date"),
-                    "completion_date": self._row_text(row, "completion_date"),
-                    "parties": self._row_json_array(row, "parties"),
-                    "events": self._row_json_array(row, "events"),
-                    "document_slots": self._row_json_array(row, "document_slots"),
-                    "document_folders": self._row_json_array(row, "document_folders"),
-                    "documents": self._row_json_array(row, "documents"),
-                }
-            )
-
-        document_templates: list[dict[str, Any]] = []
-        for row in templates_rows:
-            template_id = self._row_text(row, "template_id")
-            if not template_id:
-                continue
-            document_templates.append(
-                {
-                    "template_id": template_id,
-                    "name": self._row_text(row, "name"),
-                    "permit_type": self._row_text(row, "permit_type"),
-                    "slots": self._row_json_array(row, "slots"),
-                    "notes": self._row_text(row, "notes"),
-                }
-            )
+        payload: dict[str, Any] = {}
+        for payload_key, key_column, columns, fetch in entity_fetches:
+            payload[payload_key] = [
+                self._decode_entity_row(row, columns) for row in fetch.rows() if self._row_text(row, key_column)
+            ]
 
+        template_map_rows = template_map_fetch.rows()
         active_document_template_ids: dict[str, str] = {}
         for row in template_map_rows:
             permit_type = self._row_text(row, "permit_type")
@@ -990,15 +1876,20 @@ class SupabaseDataStore:
             if not permit_type or not template_id:
                 continue
             active_document_template_ids[permit_type] = template_id
+        payload["active_document_template_ids"] = active_document_template_ids
+        return payload
 
-        return {
-            "contacts": contacts,
-            "jurisdictions": jurisdictions,
-            "properties": properties,
-            "permits": permits,
-            "document_templates": document_templates,
-            "active_document_template_ids": active_document_template_ids,
-        }
+    @classmethod
+    def _decode_entity_row(cls, row: dict[str, Any], columns: Sequence[tuple[str, FieldCodec]]) -> dict[str, Any]:
+        return {name: cls._row_value(row, name, codec.column) for name, codec in columns}
+
+    @classmethod
+    def _row_value(cls, row: dict[str, Any], key: str, column: str) -> Any:
+        if column == COLUMN_JSON:
+            return cls._row_json_array(row, key)
+        if column == COLUMN_INTEGER:
+            return _coerce_non_negative_int(row.get(key), default=0)
+        return cls._row_text(row, key)
 
     @staticmethod
     def _row_text(row: dict[str, Any], key: str) -> str:
@@ -1183,52 +2074,64 @@ class SupabaseDataStore:
             return first
         return None
 
-    def _fetch_table_rows(
-        self,
-        *,
-        table: str,
-        select: str,
-        order: str = "",
-        exclude_deleted: bool = False,
-    ) -> list[dict[str, Any]]:
-        safe_table = quote(table, safe="_")
-        app_id = quote(_APP_ID, safe="_-")
-        query = f"?select={select}&app_id=eq.{app_id}"
-        if order:
-            query = f"{query}&order={order}"
-        if exclude_deleted:
-            query = f"{query}&deleted_at=is.null"
-        normalized: list[dict[str, Any]] = []
-        offset = 0
-        while True:
-            paged_query = f"{query}&limit={_SUPABASE_PAGE_SIZE}&offset={offset}"
+    def _fetch_tables_rows(self, fetches: Sequence[_SupabaseTableFetch]) -> None:
+        """Read every table in `fetches` concurrently on a bounded worker pool.
+
+        Each table pages by keyset on its key column, so a page deep into the table costs
+        the same index range scan as the first one. Page sizes follow the response bytes
+        per row seen so far, keeping pages near the configured `page_target_bytes`.
+        """
+        target_bytes = self._require_config().page_target_bytes
+        with ThreadPoolExecutor(
+            max_workers=_SUPABASE_FETCH_WORKERS,
+            thread_name_prefix="supabase-fetch",
+        ) as executor:
+            pending: dict[Future[tuple[list[Any], int]], tuple[_SupabaseTableFetch, str | None, int]] = {}
+
+            def _submit(fetch: _SupabaseTableFetch, after: str | None) -> None:
+                row_bytes = self._page_row_bytes.get(fetch.table)
+                limit = _SUPABASE_PAGE_SIZE if row_bytes is None else _page_rows_for_bytes(target_bytes, row_bytes)
+                fetch.requests += 1
+                pending[executor.submit(self._fetch_table_page, fetch, after, limit)] = (fetch, after, limit)
+
             try:
-                rows = self._request_json(
-                    method="GET",
-                    path=f"/rest/v1/{safe_table}",
-                    query=paged_query,
-                    payload=None,
-                    prefer="",
-                    expect_json=True,
-                )
-            except RuntimeError as exc:
-                if exclude_deleted and _is_missing_deleted_at_column_error(exc):
-                    return self._fetch_table_rows(
-                        table=table,
-                        select=select,
-                        order=order,
-                        exclude_deleted=False,
-                    )
+                for fetch in fetches:
+                    _submit(fetch, None)
+                while pending:
+                    done, _running = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        fetch, after, limit = pending.pop(future)
+                        try:
+                            rows, body_bytes = future.result()
+                        except RuntimeError as exc:
+                            if after is None and fetch.exclude_deleted and _is_missing_deleted_at_column_error(exc):
+                                fetch.exclude_deleted = False
+                                _submit(fetch, None)
+                                continue
+                            raise
+                        fetch.fetched.extend(row for row in rows if isinstance(row, dict))
+                        fetch.response_bytes += body_bytes
+                        if rows:
+                            self._page_row_bytes[fetch.table] = body_bytes / len(rows)
+                        if len(rows) >= limit and isinstance(rows[-1], dict):
+                            _submit(fetch, str(rows[-1].get(fetch.key_column, "") or ""))
+            except BaseException:
+                for future in pending:
+                    future.cancel()
                 raise
-            if not isinstance(rows, list) or not rows:
-                break
-            for item in rows:
-                if isinstance(item, dict):
-                    normalized.append(item)
-            if len(rows) < _SUPABASE_PAGE_SIZE:
-                break
-            offset += _SUPABASE_PAGE_SIZE
-        return normalized
+
+    def _fetch_table_page(self, fetch: _SupabaseTableFetch, after: str | None, limit: int) -> tuple[list[Any], int]:
+        path = f"/rest/v1/{quote(fetch.table, safe='_')}"
+        body = self._request_json(
+            method="GET",
+            path=path,
+            query=fetch.query(after=after, limit=limit),
+            payload=None,
+            prefer="",
+            expect_json=False,
+        )
+        rows = self._parse_json_body(body, method="GET", path=path)
+        return (rows if isinstance(rows, list) else []), len(body)
 
     def _request_json(
         self,
@@ -1246,14 +2149,6 @@ class SupabaseDataStore:
         request_data: bytes | None = None
         if payload is not None:
             request_data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-        db_debug(
-            "supabase.request",
-            method=method.upper(),
-            path=path,
-            query_present=bool(query),
-            payload_bytes=len(request_data) if request_data is not None else 0,
-            expect_json=expect_json,
-        )
         headers = {
             "apikey": config.api_key,
             "Authorization": f"Bearer {config.api_key}",
@@ -1265,49 +2160,107 @@ class SupabaseDataStore:
             headers["Content-Type"] = "application/json"
         if prefer:
             headers["Prefer"] = prefer
-
-        request = Request(request_url, data=request_data, headers=headers, method=method.upper())
-
-        try:
-            with urlopen(request, timeout=config.timeout_seconds) as response:
-                status_code = int(response.getcode() or 0)
-                body = response.read()
+        if config.compression:
+            headers["Accept-Encoding"] = "gzip"
+
+        # Large bodies go compressed unless the gateway already turned that down; the
+        # first rejected one is sent again as is.
+        attempts = (False,)
+        if (
+            request_data is not None
+            and config.compression
+            and self._gzip_requests is not False
+            and len(request_data) >= _SUPABASE_GZIP_MIN_REQUEST_BYTES
+        ):
+            attempts = (True, False)
+        for gzip_request in attempts:
+            sent_data = request_data
+            request_headers = headers
+            if gzip_request and request_data is not None:
+                sent_data = gzip.compress(request_data, compresslevel=_SUPABASE_GZIP_LEVEL)
+                request_headers = {**headers, "Content-Encoding": "gzip"}
             db_debug(
-                "supabase.response",
+                "supabase.request",
                 method=method.upper(),
                 path=path,
-                status=status_code,
-                body_bytes=len(body),
+                query_present=bool(query),
+                payload_bytes=len(request_data) if request_data is not None else 0,
+                sent_bytes=len(sent_data) if sent_data is not None else 0,
+                content_encoding="gzip" if gzip_request else "identity",
                 expect_json=expect_json,
             )
-        except HTTPError as exc:
-            body = ""
+            request = Request(request_url, data=sent_data, headers=request_headers, method=method.upper())
+
             try:
-                body = exc.read().decode("utf-8", errors="replace").strip()
-            except Exception:
-                body = ""
-            detail = f"{exc.code} {exc.reason}"
-            if body:
-                detail = f"{detail}: {body}"
-            db_debug(
-                "supabase.request.error",
-                method=method.upper(),
-                path=path,
-                code=int(exc.code),
-                reason=str(exc.reason),
-            )
-            raise RuntimeError(f"Supabase request failed for {path}: {detail}") from exc
-        except URLError as exc:
-            db_debug(
-                "supabase.request.error",
-                method=method.upper(),
-                path=path,
-                error=str(exc),
-            )
-            raise RuntimeError(f"Supabase request failed for {path}: {exc}") from exc
+                with self._http.urlopen(request, timeout=config.timeout_seconds) as response:
+                    status_code = int(response.getcode() or 0)
+                    received = response.read()
+                    content_encoding = str(response.headers.get("Content-Encoding", "") or "")
+                try:
+                    body = _decode_content_encoding(received, content_encoding)
+                except (OSError, EOFError, zlib.error) as exc:
+                    raise RuntimeError(
+                        f"Supabase returned an undecodable {content_encoding} body for {path}: {exc}"
+                    ) from exc
+                db_debug(
+                    "supabase.response",
+                    method=method.upper(),
+                    path=path,
+                    status=status_code,
+                    body_bytes=len(body),
+                    received_bytes=len(received),
+                    content_encoding=content_encoding or "identity",
+                    expect_json=expect_json,
+                )
+            except HTTPError as exc:
+                if gzip_request and self._gzip_requests is None and exc.code in _SUPABASE_GZIP_REJECTED_STATUSES:
+                    db_debug(
+                        "supabase.request.gzip_rejected",
+                        method=method.upper(),
+                        path=path,
+                        code=int(exc.code),
+                    )
+                    continue
+                error_body = ""
+                try:
+                    error_body = (
+                        _decode_content_encoding(exc.read(), str(exc.headers.get("Content-Encoding", "") or ""))
+                        .decode("utf-8", errors="replace")
+                        .strip()
+                    )
+                except Exception:
+                    error_body = ""
+                detail = f"{exc.code} {exc.reason}"
+                if error_body:
+                    detail = f"{detail}: {error_body}"
+                db_debug(
+                    "supabase.request.error",
+                    method=method.upper(),
+                    path=path,
+                    code=int(exc.code),
+                    reason=str(exc.reason),
+                )
+                raise RuntimeError(f"Supabase request failed for {path}: {detail}") from exc
+            except URLError as exc:
+                db_debug(
+                    "supabase.request.error",
+                    method=method.upper(),
+                    path=path,
+                    error=str(exc),
+                )
+                raise RuntimeError(f"Supabase request failed for {path}: {exc}") from exc
+            if gzip_request:
+                self._gzip_requests = True
+            elif len(attempts) > 1:
+                self._gzip_requests = False
+            break
 
         if not expect_json:
             return body
+        return self._parse_json_body(body, method=method, path=path)
+
+    @staticmethod
+    def _parse_json_body(body: bytes, *, method: str, path: str) -> Any:
         if not body:
             return None
         try:
@@ -1325,27 +2278,51 @@ class SupabaseDataStore:
             ) from exc
 
 
-def _bundle_from_storage_payload(raw: object) -> TrackerDataBundleV3:
+def _decode_content_encoding(body: bytes, content_encoding: str) -> bytes:
+    if "gzip" in content_encoding.lower():
+        return gzip.decompress(body)
+    return body
+
+
+def _bundle_from_storage_payload(raw: object, *, trusted: bool = False) -> TrackerDataBundleV3:
     if not isinstance(raw, dict):
         raise ValueError("Storage payload must be a JSON object.")
     data_payload = raw.get("data")
     if isinstance(data_payload, dict):
-        return TrackerDataBundleV3.from_payload(data_payload)
+        return TrackerDataBundleV3.from_payload(
+            data_payload,
+            trusted=trusted and _is_own_storage_envelope(raw),
+        )
     return TrackerDataBundleV3.from_payload(raw)
 
 
+def _is_own_storage_envelope(raw: dict[str, Any]) -> bool:
+    # Written by `_build_storage_payload` at the current schema version.
+    return (
+        raw.get("app") == _APP_ID
+        and raw.get("schemaVersion") == _SCHEMA_VERSION
+        and raw.get("backend") in (BACKEND_LOCAL_SQLITE, BACKEND_LOCAL_JSON, BACKEND_SUPABASE)
+    )
+
+
 def _build_storage_payload(
     bundle: TrackerDataBundleV3,
     *,
     backend: str,
+    data: dict[str, Any] | None = None,
+    content_hash: str = "",
 ) -> dict[str, object]:
-    return {
+    payload: dict[str, object] = {
         "app": _APP_ID,
         "schemaVersion": _SCHEMA_VERSION,
         "backend": str(backend or "").strip(),
         "savedAtUtc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-        "data": bundle.to_payload(),
     }
+    if content_hash:
+        # Kept ahead of "data" so a save can compare it by reading only the file head.
+        payload["contentHash"] = content_hash
+    payload["data"] = bundle.to_payload() if data is None else data
+    return payload
 
 
 def _empty_bundle_payload() -> dict[str, Any]:
@@ -1377,7 +2354,8 @@ def _row_collection_by_id(rows: object, *, id_key: str) -> dict[str, dict[str, A
         row_id = str(row.get(id_key, "") or "").strip()
         if not row_id:
             continue
-        indexed[row_id] = dict(row)
+        # Payload rows are never edited in place, so they are shared rather than copied.
+        indexed[row_id] = row
     return indexed
 
 
@@ -1395,7 +2373,7 @@ def _diff_row_collection(
     for row_id in sorted(current):
         current_row = current[row_id]
         previous_row = previous.get(row_id)
-        if previous_row == current_row:
+        if previous_row is current_row or previous_row == current_row:
             continue
         upserts.append(current_row)
 
@@ -1437,9 +2415,16 @@ def _build_bundle_change_set(
     previous_payload: dict[str, Any],
     current_payload: dict[str, Any],
 ) -> dict[str, Any]:
-    previous = _normalize_bundle_payload(previous_payload)
-    current = _normalize_bundle_payload(current_payload)
+    return _diff_normalized_payloads(
+        _normalize_bundle_payload(previous_payload),
+        _normalize_bundle_payload(current_payload),
+    )
 
+
+def _diff_normalized_payloads(
+    previous: dict[str, Any],
+    current: dict[str, Any],
+) -> dict[str, Any]:
     contacts_upserts, contacts_deletes = _diff_row_collection(
         previous.get("contacts"),
         current.get("contacts"),
@@ -1485,6 +2470,165 @@ def _build_bundle_change_set(
     }
 
 
+def _build_delta_change_set(
+    base_payload: dict[str, Any],
+    delta: TrackerBundleDelta,
+) -> dict[str, Any]:
+    # base_payload must already be normalized; only the touched rows are normalized here.
+    partial_payload: dict[str, Any] = {
+        entity: [row for row in entity_rows.values() if row is not None]
+        for entity, entity_rows in delta.rows.items()
+    }
+    partial_payload["active_document_template_ids"] = dict(delta.active_document_template_ids)
+    normalized = TrackerDataBundleV3.from_payload(partial_payload).to_payload()
+
+    change_set: dict[str, Any] = {}
+    for entity, id_key in TRACKER_ENTITY_ID_KEYS.items():
+        upserts: list[dict[str, Any]] = []
+        deletes: list[str] = []
+        entity_rows = delta.rows.get(entity)
+        if entity_rows:
+            base_rows = {
+                str(row.get(id_key, "") or ""): row
+                for row in base_payload.get(entity, [])
+                if isinstance(row, dict)
+            }
+            current_rows = _row_collection_by_id(normalized.get(entity), id_key=id_key)
+            for row_id in sorted(current_rows):
+                if base_rows.get(row_id) != current_rows[row_id]:
+                    upserts.append(current_rows[row_id])
+            for row_id in sorted(entity_rows):
+                if row_id not in current_rows and row_id in base_rows:
+                    deletes.append(row_id)
+        change_set[f"{entity}_upserts"] = upserts
+        change_set[f"{entity}_deletes"] = deletes
+
+    active_upserts, active_deletes = _diff_active_template_map(
+        base_payload.get("active_document_template_ids"),
+        normalized.get("active_document_template_ids"),
+    )
+    change_set["active_document_template_ids_upserts"] = active_upserts
+    change_set["active_document_template_ids_deletes"] = active_deletes
+    return change_set
+
+
+def _build_records_change_set(
+    base_payload: dict[str, Any],
+    bundle: TrackerDataBundleV3,
+    row_hashes: "_RowHashCache",
+) -> dict[str, Any]:
+    # base_payload must already be normalized. Records whose cached content hash matches
+    # their known row are skipped without serializing; only the rest are normalized.
+    row_hashes.retain(base_payload)
+    moved_payload: dict[str, Any] = {}
+    present: dict[str, set[str]] = {}
+    base_by_entity: dict[str, dict[str, dict[str, Any]]] = {}
+    for entity, id_key in TRACKER_ENTITY_ID_KEYS.items():
+        base_rows = {
+            str(row.get(id_key, "") or ""): row
+            for row in base_payload.get(entity, [])
+            if isinstance(row, dict)
+        }
+        unchanged: set[str] = set()
+        moved: list[dict[str, Any]] = []
+        for record in getattr(bundle, entity):
+            base_row = base_rows.get(str(getattr(record, id_key, "") or "").strip())
+            if base_row is not None and row_hashes.row_hash(base_row) == record.content_hash():
+                unchanged.add(str(base_row.get(id_key, "") or ""))
+            else:
+                moved.append(record.to_mapping())
+        base_by_entity[entity] = base_rows
+        present[entity] = unchanged
+        moved_payload[entity] = moved
+    moved_payload["active_document_template_ids"] = dict(bundle.active_document_template_ids)
+    normalized = TrackerDataBundleV3.from_payload(moved_payload).to_payload()
+
+    change_set: dict[str, Any] = {}
+    for entity, id_key in TRACKER_ENTITY_ID_KEYS.items():
+        base_rows = base_by_entity[entity]
+        current_rows = _row_collection_by_id(normalized.get(entity), id_key=id_key)
+        upserts: list[dict[str, Any]] = []
+        for row_id in sorted(current_rows):
+            base_row = base_rows.get(row_id)
+            if base_row is None or row_hashes.row_hash(base_row) != payload_content_hash(current_rows[row_id]):
+                upserts.append(current_rows[row_id])
+        kept = present[entity] | current_rows.keys()
+        change_set[f"{entity}_upserts"] = upserts
+        change_set[f"{entity}_deletes"] = sorted(row_id for row_id in base_rows if row_id not in kept)
+
+    active_upserts, active_deletes = _diff_active_template_map(
+        base_payload.get("active_document_template_ids"),
+        normalized.get("active_document_template_ids"),
+    )
+    change_set["active_document_template_ids_upserts"] = active_upserts
+    change_set["active_document_template_ids_deletes"] = active_deletes
+    return change_set
+
+
+@dataclass(slots=True)
+class _SupabaseTableFetch:
+    """One table read of `_fetch_tables_rows`: query, fetched rows in key order, request counts."""
+
+    table: str
+    select: str
+    key_column: str
+    exclude_deleted: bool = False
+    fetched: list[dict[str, Any]] = field(default_factory=list)
+    requests: int = 0
+    response_bytes: int = 0
+
+    def query(self, *, after: str | None, limit: int) -> str:
+        query = f"?select={self.select}&app_id=eq.{quote(_APP_ID, safe='_-')}&order={self.key_column}.asc"
+        if after is not None:
+            query = f"{query}&{self.key_column}=gt.{quote(after, safe='')}"
+        if self.exclude_deleted:
+            query = f"{query}&deleted_at=is.null"
+        return f"{query}&limit={int(limit)}"
+
+    def rows(self) -> list[dict[str, Any]]:
+        return self.fetched
+
+
+def _page_rows_for_bytes(target_bytes: int, row_bytes: float) -> int:
+    rows = int(target_bytes / max(1.0, row_bytes))
+    return max(_SUPABASE_MIN_PAGE_SIZE, min(_SUPABASE_PAGE_SIZE, rows))
+
+
+class _RowHashCache:
+    """Content hashes of known payload rows, keyed by row identity.
+
+    Known payloads share unchanged rows from one save to the next and never edit them in
+    place, so a row is hashed once for as long as it stays in the known state.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[dict[str, Any], str]] = {}
+
+    def row_hash(self, row: dict[str, Any]) -> str:
+        entry = self._entries.get(id(row))
+        if entry is not None and entry[0] is row:
+            return entry[1]
+        value = payload_content_hash(row)
+        self._entries[id(row)] = (row, value)
+        return value
+
+    def retain(self, payload: dict[str, Any]) -> None:
+        """Forget rows that are no longer part of `payload`."""
+        entries = self._entries
+        if not entries:
+            return
+        kept: dict[int, tuple[dict[str, Any], str]] = {}
+        for entity in TRACKER_ENTITY_ID_KEYS:
+            for row in payload.get(entity) or ():
+                entry = entries.get(id(row))
+                if entry is not None and entry[0] is row:
+                    kept[id(row)] = entry
+        self._entries = kept
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 def _bundle_change_set_is_empty(change_set: dict[str, Any]) -> bool:
     keys = (
         "contacts_upserts",
@@ -1503,6 +2647,95 @@ def _bundle_change_set_is_empty(change_set: dict[str, Any]) -> bool:
     return all(not bool(change_set.get(key)) for key in keys)
 
 
+def _change_set_rows_by_key(change_set: dict[str, Any]) -> dict[tuple[str, str], Any]:
+    # (entity, record id) -> written row, or None for a delete.
+    rows: dict[tuple[str, str], Any] = {}
+    for entity, id_key in TRACKER_ENTITY_ID_KEYS.items():
+        for row in change_set.get(f"{entity}_upserts") or ():
+            if isinstance(row, dict):
+                rows[(entity, str(row.get(id_key, "") or ""))] = row
+        for record_id in change_set.get(f"{entity}_deletes") or ():
+            rows[(entity, str(record_id))] = None
+    for row in change_set.get(f"{ACTIVE_TEMPLATES_ENTITY}_upserts") or ():
+        if isinstance(row, dict):
+            rows[(ACTIVE_TEMPLATES_ENTITY, str(row.get("permit_type", "") or ""))] = str(
+                row.get("template_id", "") or ""
+            )
+    for permit_type in change_set.get(f"{ACTIVE_TEMPLATES_ENTITY}_deletes") or ():
+        rows[(ACTIVE_TEMPLATES_ENTITY, str(permit_type))] = None
+    return rows
+
+
+def _change_set_delete_ids(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [record_id for record_id in (str(item or "").strip() for item in value) if record_id]
+
+
+def _change_set_from_rows_by_key(rows: dict[tuple[str, str], Any]) -> dict[str, Any]:
+    change_set: dict[str, Any] = {}
+    for entity in (*TRACKER_ENTITY_ID_KEYS, ACTIVE_TEMPLATES_ENTITY):
+        change_set[f"{entity}_upserts"] = []
+        change_set[f"{entity}_deletes"] = []
+    for (entity, record_id), row in sorted(rows.items(), key=lambda item: item[0]):
+        if row is None:
+            change_set[f"{entity}_deletes"].append(record_id)
+        elif entity == ACTIVE_TEMPLATES_ENTITY:
+            change_set[f"{entity}_upserts"].append({"permit_type": record_id, "template_id": row})
+        else:
+            change_set[f"{entity}_upserts"].append(row)
+    return change_set
+
+
+def _change_set_for_keys(payload: dict[str, Any], keys: set[tuple[str, str]]) -> dict[str, Any]:
+    wanted: dict[str, set[str]] = {}
+    for entity, record_id in keys:
+        wanted.setdefault(entity, set()).add(record_id)
+    change_set: dict[str, Any] = {}
+    for entity, id_key in TRACKER_ENTITY_ID_KEYS.items():
+        record_ids = wanted.get(entity, set())
+        rows: dict[str, dict[str, Any]] = {}
+        if record_ids:
+            for row in payload.get(entity) or ():
+                row_id = str(row.get(id_key, "") or "")
+                if row_id in record_ids:
+                    rows[row_id] = row
+        change_set[f"{entity}_upserts"] = [rows[row_id] for row_id in sorted(rows)]
+        change_set[f"{entity}_deletes"] = sorted(record_ids - rows.keys())
+    active = payload.get(ACTIVE_TEMPLATES_ENTITY) or {}
+    permit_types = wanted.get(ACTIVE_TEMPLATES_ENTITY, set())
+    change_set[f"{ACTIVE_TEMPLATES_ENTITY}_upserts"] = [
+        {"permit_type": permit_type, "template_id": active[permit_type]}
+        for permit_type in sorted(permit_types)
+        if permit_type in active
+    ]
+    change_set[f"{ACTIVE_TEMPLATES_ENTITY}_deletes"] = sorted(
+        permit_type for permit_type in permit_types if permit_type not in active
+    )
+    return change_set
+
+
+def _tracker_delta_for_keys(payload: dict[str, Any], keys: set[tuple[str, str]]) -> TrackerBundleDelta:
+    change_set = _change_set_for_keys(payload, keys)
+    rows: dict[str, dict[str, dict[str, Any] | None]] = {}
+    for entity, id_key in TRACKER_ENTITY_ID_KEYS.items():
+        entity_rows: dict[str, dict[str, Any] | None] = {
+            str(row.get(id_key, "") or ""): row for row in change_set[f"{entity}_upserts"]
+        }
+        entity_rows.update((record_id, None) for record_id in change_set[f"{entity}_deletes"])
+        if entity_rows:
+            rows[entity] = entity_rows
+    return TrackerBundleDelta(
+        rows=rows,
+        active_document_template_ids=dict(payload.get(ACTIVE_TEMPLATES_ENTITY) or {}),
+    )
+
+
+def _sqlite_data_version(connection: sqlite3.Connection) -> int:
+    row = connection.execute("pragma data_version").fetchone()
+    return int(row[0]) if row else 0
+
+
 def _apply_row_collection_change_set(
     base_rows: object,
     *,
@@ -1518,7 +2751,7 @@ def _apply_row_collection_change_set(
             row_id = str(row.get(id_key, "") or "").strip()
             if not row_id:
                 continue
-            merged[row_id] = dict(row)
+            merged[row_id] = row
     delete_ids: list[str] = []
     if isinstance(deletes, list):
         for value in deletes:
@@ -1564,7 +2797,11 @@ def _apply_active_template_map_change_set(
 
 def _apply_bundle_change_set(base_payload: dict[str, Any], change_set: dict[str, Any]) -> dict[str, Any]:
     base = _normalize_bundle_payload(base_payload)
-    merged = {
+    return _normalize_bundle_payload(_merge_bundle_change_set(base, change_set))
+
+
+def _merge_bundle_change_set(base: dict[str, Any], change_set: dict[str, Any]) -> dict[str, Any]:
+    return {
         "contacts": _apply_row_collection_change_set(
             base.get("contacts"),
             id_key="contact_id",
@@ -1601,7 +2838,6 @@ def _apply_bundle_change_set(base_payload: dict[str, Any], change_set: dict[str,
             deletes=change_set.get("active_document_template_ids_deletes"),
         ),
     }
-    return _normalize_bundle_payload(merged)
 
 
 def _coerce_non_negative_int(value: object, *, default: int) -> int:
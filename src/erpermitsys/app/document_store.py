@@ -10,10 +10,11 @@ from pathlib import Path
 from typing import Any, Protocol
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
+from urllib.request import Request
 from uuid import uuid4
 
 from erpermitsys.app.data_store import BACKEND_LOCAL_SQLITE, BACKEND_SUPABASE
+from erpermitsys.app.http_pool import HttpConnectionPool, shared_http_pool
 from erpermitsys.app.tracker_models import (
     PermitDocumentFolder,
     PermitDocumentRecord,
@@ -254,9 +255,11 @@ class SupabasePermitDocumentStore:
         data_root: Path | str,
         *,
         config: SupabaseDocumentStoreConfig | None = None,
+        http_pool: HttpConnectionPool | None = None,
     ) -> None:
         self.data_root = _normalize_path(Path(data_root))
         self._config = config or SupabaseDocumentStoreConfig()
+        self._http = http_pool or shared_http_pool()
         self._cache_root = self.data_root / ".supabase-cache"
 
     def update_data_root(self, data_root: Path | str) -> None:
@@ -529,7 +532,7 @@ class SupabasePermitDocumentStore:
             method=method.upper(),
         )
         try:
-            with urlopen(request, timeout=config.timeout_seconds) as response:
+            with self._http.urlopen(request, timeout=config.timeout_seconds) as response:
                 return response.read()
         except HTTPError as exc:
             body = ""
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from io import BytesIO
+from time import monotonic
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+
+_DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+_DEFAULT_IDLE_TIMEOUT_SECONDS = 30.0
+_REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+# Raised on a kept-alive socket the server already closed; the request is retried once.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+_HostKey = tuple[str, str, int]
+
+
+@dataclass(slots=True)
+class PooledResponse:
+    """Fully read response; mirrors the parts of `urlopen`'s response the stores use."""
+
+    status: int
+    reason: str
+    headers: http.client.HTTPMessage
+    body: bytes
+
+    def getcode(self) -> int:
+        return self.status
+
+    def read(self) -> bytes:
+        return self.body
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+
+@dataclass(slots=True)
+class _HostPool:
+    idle: deque[tuple[http.client.HTTPConnection, float]] = field(default_factory=deque)
+    open_count: int = 0
+
+
+class HttpConnectionPool:
+    """Thread-safe keep-alive pool of `http.client` connections, per scheme, host and port.
+
+    `urlopen` is a drop-in for `urllib.request.urlopen` with a `Request`: it raises
+    `HTTPError` for error statuses and `URLError` for connection failures. At most
+    `max_connections_per_host` connections are open per host; callers beyond that wait.
+    Connections idle longer than `idle_timeout_seconds` are closed instead of reused.
+    Proxied hosts and redirects go through `urllib` unchanged.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = _DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        idle_timeout_seconds: float = _DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self._max_connections = max(1, int(max_connections_per_host))
+        self._idle_timeout = max(0.0, float(idle_timeout_seconds))
+        self._hosts: dict[_HostKey, _HostPool] = {}
+        self._condition = threading.Condition()
+        self._ssl_context: ssl.SSLContext | None = None
+        self._proxied: dict[tuple[str, str], bool] = {}
+
+    def urlopen(self, request: Request, *, timeout: float) -> PooledResponse:
+        url = request.full_url
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        if scheme not in ("http", "https") or not host or self._uses_proxy(scheme, host):
+            return _read_urllib_response(request, timeout)
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        method = request.get_method().upper()
+        headers = dict(request.header_items())
+        body = request.data
+        if body is not None and not any(name.lower() == "content-length" for name in headers):
+            headers["Content-Length"] = str(len(body))
+        key = (scheme, host, port)
+
+        for attempt in (0, 1):
+            connection, reused = self._acquire(key, timeout)
+            sent = False
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                sent = True
+                raw = connection.getresponse()
+                response = PooledResponse(
+                    status=int(raw.status),
+                    reason=str(raw.reason or ""),
+                    headers=raw.headers,
+                    body=raw.read(),
+                )
+            except _STALE_CONNECTION_ERRORS as exc:
+                self._discard(key, connection)
+                if attempt == 0 and reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    continue
+                raise URLError(exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                self._discard(key, connection)
+                raise URLError(exc) from exc
+            except BaseException:
+                self._discard(key, connection)
+                raise
+            if raw.will_close:
+                self._discard(key, connection)
+            else:
+                self._release(key, connection)
+            break
+
+        if response.status in _REDIRECT_STATUSES:
+            return _read_urllib_response(request, timeout)
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, BytesIO(response.body))
+        return response
+
+    def close(self) -> None:
+        """Close idle connections; the pool stays usable and reconnects on demand."""
+        with self._condition:
+            idle = [connection for pool in self._hosts.values() for connection, _used in pool.idle]
+            for pool in self._hosts.values():
+                pool.open_count -= len(pool.idle)
+                pool.idle.clear()
+            self._condition.notify_all()
+        for connection in idle:
+            connection.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "hosts": len(self._hosts),
+                "open": sum(pool.open_count for pool in self._hosts.values()),
+                "idle": sum(len(pool.idle) for pool in self._hosts.values()),
+            }
+
+    def _acquire(self, key: _HostKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        deadline = monotonic() + timeout
+        stale: list[http.client.HTTPConnection] = []
+        connection: http.client.HTTPConnection | None = None
+        reused = False
+        waiting = True
+        with self._condition:
+            pool = self._hosts.setdefault(key, _HostPool())
+            while True:
+                now = monotonic()
+                while pool.idle and now - pool.idle[0][1] > self._idle_timeout:
+                    stale.append(pool.idle.popleft()[0])
+                    pool.open_count -= 1
+                if pool.idle:
+                    connection = pool.idle.pop()[0]
+                    reused = True
+                    break
+                if pool.open_count < self._max_connections:
+                    pool.open_count += 1
+                    break
+                remaining = deadline - now
+                if remaining <= 0:
+                    waiting = False
+                    break
+                self._condition.wait(remaining)
+        for old in stale:
+            old.close()
+        if not waiting:
+            raise URLError(f"timed out waiting for a connection to {key[1]}:{key[2]}")
+        if connection is None:
+            connection = self._connect(key, timeout)
+        else:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+        return connection, reused
+
+    def _connect(self, key: _HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _release(self, key: _HostKey, connection: http.client.HTTPConnection) -> None:
+        with self._condition:
+            self._hosts[key].idle.append((connection, monotonic()))
+            self._condition.notify()
+
+    def _discard(self, key: _HostKey, connection: http.client.HTTPConnection) -> None:
+        connection.close()
+        with self._condition:
+            self._hosts[key].open_count -= 1
+            self._condition.notify()
+
+    def _uses_proxy(self, scheme: str, host: str) -> bool:
+        cache_key = (scheme, host)
+        cached = self._proxied.get(cache_key)
+        if cached is None:
+            cached = bool(getproxies().get(scheme)) and not proxy_bypass(host)
+            self._proxied[cache_key] = cached
+        return cached
+
+
+def _read_urllib_response(request: Request, timeout: float) -> PooledResponse:
+    with urlopen(request, timeout=timeout) as response:
+        return PooledResponse(
+            status=int(response.getcode() or 0),
+            reason=str(getattr(response, "reason", "") or ""),
+            headers=response.headers,
+            body=response.read(),
+        )
+
+
+_shared_pool: HttpConnectionPool | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_http_pool() -> HttpConnectionPool:
+    """Process-wide pool shared by the Supabase data and document stores."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = HttpConnectionPool()
+        return _shared_pool
+
+
+def close_shared_http_pool() -> None:
+    with _shared_pool_lock:
+        pool = _shared_pool
+    if pool is not None:
+        pool.close()
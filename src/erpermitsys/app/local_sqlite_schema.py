@@ -0,0 +1,523 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from erpermitsys.app.record_codecs import COLUMN_INTEGER, COLUMN_JSON, COLUMN_TEXT, record_columns
+from erpermitsys.app.tracker_models import (
+    ContactRecord,
+    DocumentChecklistTemplate,
+    JurisdictionRecord,
+    PermitDocumentRecord,
+    PermitEventRecord,
+    PermitRecord,
+    PropertyRecord,
+)
+
+
+LOCAL_SQLITE_LAYOUT_VERSION = 2
+LOCAL_SQLITE_META_TABLE = "store_meta"
+_META_KEY = "erpermitsys"
+# Spacing of child row positions, so a row inserted mid-list gets a position between its
+# neighbours instead of shifting every later row.
+_CHILD_POSITION_GAP = 1024
+# Joins a duplicated or empty child id with its occurrence number to form a unique row key.
+_ROW_KEY_SEPARATOR = "\x1f"
+
+
+@dataclass(frozen=True, slots=True)
+class LocalSqliteTable:
+    name: str
+    payload_key: str
+    key_column: str
+    text_columns: tuple[str, ...] = ()
+    integer_columns: tuple[str, ...] = ()
+    json_columns: tuple[str, ...] = ()
+
+    @property
+    def value_columns(self) -> tuple[str, ...]:
+        return (*self.text_columns, *self.integer_columns, *self.json_columns)
+
+
+@dataclass(frozen=True, slots=True)
+class LocalSqliteChildTable:
+    name: str
+    parent_key: str
+    key_column: str
+    text_columns: tuple[str, ...] = ()
+    integer_columns: tuple[str, ...] = ()
+    json_columns: tuple[str, ...] = ()
+
+    @property
+    def value_columns(self) -> tuple[str, ...]:
+        return (*self.text_columns, *self.integer_columns, *self.json_columns)
+
+
+def _entity_table(
+    name: str,
+    record_type: type,
+    key_column: str,
+    *,
+    child_columns: tuple[str, ...] = (),
+) -> LocalSqliteTable:
+    # Columns follow the record's storage codecs, so a new field reaches the table too.
+    exclude = (key_column, *child_columns)
+    return LocalSqliteTable(
+        name=name,
+        payload_key=name,
+        key_column=key_column,
+        text_columns=record_columns(record_type, COLUMN_TEXT, exclude=exclude),
+        integer_columns=record_columns(record_type, COLUMN_INTEGER, exclude=exclude),
+        json_columns=record_columns(record_type, COLUMN_JSON, exclude=exclude),
+    )
+
+
+def _child_table(name: str, parent_key: str, record_type: type, key_column: str) -> LocalSqliteChildTable:
+    return LocalSqliteChildTable(
+        name=name,
+        parent_key=parent_key,
+        key_column=key_column,
+        text_columns=record_columns(record_type, COLUMN_TEXT),
+        integer_columns=record_columns(record_type, COLUMN_INTEGER),
+        json_columns=record_columns(record_type, COLUMN_JSON),
+    )
+
+
+CONTACTS_TABLE = _entity_table("contacts", ContactRecord, "contact_id")
+JURISDICTIONS_TABLE = _entity_table("jurisdictions", JurisdictionRecord, "jurisdiction_id")
+PROPERTIES_TABLE = _entity_table("properties", PropertyRecord, "property_id")
+PERMITS_TABLE = _entity_table("permits", PermitRecord, "permit_id", child_columns=("events", "documents"))
+DOCUMENT_TEMPLATES_TABLE = _entity_table("document_templates", DocumentChecklistTemplate, "template_id")
+PERMIT_EVENTS_TABLE = _child_table("permit_events", "events", PermitEventRecord, "event_id")
+PERMIT_DOCUMENTS_TABLE = _child_table("permit_documents", "documents", PermitDocumentRecord, "document_id")
+ACTIVE_DOCUMENT_TEMPLATES_TABLE = "active_document_templates"
+
+ENTITY_TABLES: tuple[LocalSqliteTable, ...] = (
+    CONTACTS_TABLE,
+    JURISDICTIONS_TABLE,
+    PROPERTIES_TABLE,
+    PERMITS_TABLE,
+    DOCUMENT_TEMPLATES_TABLE,
+)
+PERMIT_CHILD_TABLES: tuple[LocalSqliteChildTable, ...] = (
+    PERMIT_EVENTS_TABLE,
+    PERMIT_DOCUMENTS_TABLE,
+)
+
+
+def ensure_local_schema(connection: sqlite3.Connection) -> None:
+    for table in ENTITY_TABLES:
+        connection.execute(_entity_table_ddl(table))
+    for child in PERMIT_CHILD_TABLES:
+        _migrate_position_keyed_child_table(connection, child)
+        connection.execute(_child_table_ddl(child))
+        connection.execute(
+            f"create index if not exists {child.name}_order on {child.name} (permit_id, position)"
+        )
+    connection.execute(
+        f"""
+        create table if not exists {ACTIVE_DOCUMENT_TEMPLATES_TABLE} (
+            permit_type text primary key,
+            template_id text not null
+        )
+        """
+    )
+    connection.execute(
+        f"""
+        create table if not exists {LOCAL_SQLITE_META_TABLE} (
+            meta_key text primary key,
+            layout_version integer not null,
+            schema_version integer not null,
+            backend text not null,
+            saved_at_utc text not null
+        )
+        """
+    )
+
+
+def has_table_data(connection: sqlite3.Connection) -> bool:
+    row = connection.execute(
+        f"select 1 from {LOCAL_SQLITE_META_TABLE} where meta_key = ? limit 1",
+        (_META_KEY,),
+    ).fetchone()
+    return row is not None
+
+
+def table_schema_version(connection: sqlite3.Connection) -> int | None:
+    row = connection.execute(
+        f"select schema_version from {LOCAL_SQLITE_META_TABLE} where meta_key = ? limit 1",
+        (_META_KEY,),
+    ).fetchone()
+    return int(row[0]) if row is not None else None
+
+
+def load_payload_from_tables(connection: sqlite3.Connection) -> dict[str, Any] | None:
+    if not has_table_data(connection):
+        return None
+
+    payload: dict[str, Any] = {}
+    for table in ENTITY_TABLES:
+        columns = (table.key_column, *table.value_columns)
+        cursor = connection.execute(
+            f"select {', '.join(columns)} from {table.name} order by {table.key_column}"
+        )
+        payload[table.payload_key] = [
+            _decode_row(columns, row, json_columns=table.json_columns) for row in cursor
+        ]
+
+    permits_by_id = {
+        str(row.get(PERMITS_TABLE.key_column, "")): row for row in payload[PERMITS_TABLE.payload_key]
+    }
+    for permit in permits_by_id.values():
+        for child in PERMIT_CHILD_TABLES:
+            permit[child.parent_key] = []
+    for child in PERMIT_CHILD_TABLES:
+        columns = child.value_columns
+        cursor = connection.execute(
+            f"select permit_id, {', '.join(columns)} from {child.name} order by permit_id, position"
+        )
+        for row in cursor:
+            permit = permits_by_id.get(str(row[0]))
+            if permit is None:
+                continue
+            permit[child.parent_key].append(_decode_row(columns, row[1:], json_columns=child.json_columns))
+
+    payload["active_document_template_ids"] = {
+        str(permit_type): str(template_id)
+        for permit_type, template_id in connection.execute(
+            f"select permit_type, template_id from {ACTIVE_DOCUMENT_TEMPLATES_TABLE} order by permit_type"
+        )
+    }
+    return payload
+
+
+def write_bundle_change_set(
+    connection: sqlite3.Connection,
+    *,
+    change_set: dict[str, Any],
+    schema_version: int,
+    backend: str,
+    saved_at_utc: str,
+) -> dict[str, int]:
+    stats = {"rows_upserted": 0, "rows_deleted": 0}
+    for table in ENTITY_TABLES:
+        upserts = change_set.get(f"{table.payload_key}_upserts") or []
+        deletes = change_set.get(f"{table.payload_key}_deletes") or []
+        if deletes:
+            _delete_entity_rows(connection, table, deletes, stats)
+        if upserts:
+            _upsert_entity_rows(connection, table, upserts, stats)
+
+    for permit in change_set.get("permits_upserts") or []:
+        permit_id = str(permit.get(PERMITS_TABLE.key_column, "") or "")
+        for child in PERMIT_CHILD_TABLES:
+            _sync_child_rows(
+                connection,
+                child,
+                permit_id=permit_id,
+                current_rows=permit.get(child.parent_key),
+                stats=stats,
+            )
+
+    active_upserts = change_set.get("active_document_template_ids_upserts") or []
+    active_deletes = change_set.get("active_document_template_ids_deletes") or []
+    if active_deletes:
+        connection.executemany(
+            f"delete from {ACTIVE_DOCUMENT_TEMPLATES_TABLE} where permit_type = ?",
+            [(str(permit_type),) for permit_type in active_deletes],
+        )
+        stats["rows_deleted"] += len(active_deletes)
+    if active_upserts:
+        connection.executemany(
+            (
+                f"insert into {ACTIVE_DOCUMENT_TEMPLATES_TABLE} (permit_type, template_id) values (?, ?) "
+                "on conflict(permit_type) do update set template_id = excluded.template_id"
+            ),
+            [(str(row.get("permit_type", "")), str(row.get("template_id", ""))) for row in active_upserts],
+        )
+        stats["rows_upserted"] += len(active_upserts)
+
+    connection.execute(
+        (
+            f"insert into {LOCAL_SQLITE_META_TABLE} "
+            "(meta_key, layout_version, schema_version, backend, saved_at_utc) "
+            "values (?, ?, ?, ?, ?) "
+            "on conflict(meta_key) do update set "
+            "layout_version = excluded.layout_version, "
+            "schema_version = excluded.schema_version, "
+            "backend = excluded.backend, "
+            "saved_at_utc = excluded.saved_at_utc"
+        ),
+        (_META_KEY, LOCAL_SQLITE_LAYOUT_VERSION, int(schema_version), backend, saved_at_utc),
+    )
+    return stats
+
+
+def clear_table_data(connection: sqlite3.Connection) -> None:
+    for table in ENTITY_TABLES:
+        connection.execute(f"delete from {table.name}")
+    for child in PERMIT_CHILD_TABLES:
+        connection.execute(f"delete from {child.name}")
+    connection.execute(f"delete from {ACTIVE_DOCUMENT_TEMPLATES_TABLE}")
+    connection.execute(f"delete from {LOCAL_SQLITE_META_TABLE}")
+
+
+def _entity_table_ddl(table: LocalSqliteTable) -> str:
+    columns = [f"{table.key_column} text primary key"]
+    columns.extend(f"{column} text not null default ''" for column in table.text_columns)
+    columns.extend(f"{column} integer not null default 0" for column in table.integer_columns)
+    columns.extend(f"{column} text not null default '[]'" for column in table.json_columns)
+    return f"create table if not exists {table.name} ({', '.join(columns)})"
+
+
+def _child_table_ddl(child: LocalSqliteChildTable) -> str:
+    columns = ["permit_id text not null", "row_key text not null", "position integer not null"]
+    columns.extend(f"{column} text not null default ''" for column in child.text_columns)
+    columns.extend(f"{column} integer not null default 0" for column in child.integer_columns)
+    columns.extend(f"{column} text not null default '[]'" for column in child.json_columns)
+    columns.append("primary key (permit_id, row_key)")
+    return f"create table if not exists {child.name} ({', '.join(columns)})"
+
+
+def _migrate_position_keyed_child_table(connection: sqlite3.Connection, child: LocalSqliteChildTable) -> None:
+    # Layout 1 keyed child rows by (permit_id, position); rebuild them keyed by record id.
+    existing = [str(row[1]) for row in connection.execute(f"pragma table_info({child.name})")]
+    if not existing or "row_key" in existing:
+        return
+    if not connection.in_transaction:
+        connection.execute("begin")
+    legacy = f"{child.name}_layout1"
+    connection.execute(f"alter table {child.name} rename to {legacy}")
+    connection.execute(_child_table_ddl(child))
+    columns = tuple(column for column in child.value_columns if column in existing)
+    key_index = columns.index(child.key_column) if child.key_column in columns else None
+    cursor = connection.execute(
+        f"select permit_id, {', '.join(columns)} from {legacy} order by permit_id, position"
+    )
+    rows: list[list[Any]] = []
+    permit_id = None
+    seen: dict[str, int] = {}
+    for row in cursor:
+        if row[0] != permit_id:
+            permit_id = row[0]
+            seen = {}
+        row_id = "" if key_index is None else str(row[1 + key_index] or "")
+        row_key = _row_key(row_id, seen)
+        rows.append([permit_id, row_key, sum(seen.values()) * _CHILD_POSITION_GAP, *row[1:]])
+    connection.executemany(
+        (
+            f"insert into {child.name} (permit_id, row_key, position, {', '.join(columns)}) "
+            f"values (?, ?, ?, {', '.join('?' for _ in columns)})"
+        ),
+        rows,
+    )
+    connection.execute(f"drop table {legacy}")
+
+
+def _decode_row(
+    columns: tuple[str, ...],
+    row: Iterable[Any],
+    *,
+    json_columns: tuple[str, ...],
+) -> dict[str, Any]:
+    decoded: dict[str, Any] = {}
+    for column, value in zip(columns, row):
+        if column in json_columns:
+            try:
+                parsed = json.loads(value) if value and value != "[]" else []
+            except Exception:
+                parsed = []
+            decoded[column] = parsed if isinstance(parsed, list) else []
+        else:
+            decoded[column] = value
+    return decoded
+
+
+def _encode_values(
+    row: dict[str, Any],
+    columns: tuple[str, ...],
+    *,
+    integer_columns: tuple[str, ...],
+    json_columns: tuple[str, ...],
+) -> list[Any]:
+    values: list[Any] = []
+    for column in columns:
+        value = row.get(column)
+        if column in json_columns:
+            values.append(json.dumps(value if isinstance(value, list) else [], ensure_ascii=False))
+        elif column in integer_columns:
+            try:
+                values.append(int(value))  # type: ignore[arg-type]
+            except Exception:
+                values.append(0)
+        else:
+            values.append("" if value is None else str(value))
+    return values
+
+
+def _upsert_entity_rows(
+    connection: sqlite3.Connection,
+    table: LocalSqliteTable,
+    rows: list[dict[str, Any]],
+    stats: dict[str, int],
+) -> None:
+    columns = (table.key_column, *table.value_columns)
+    assignments = ", ".join(f"{column} = excluded.{column}" for column in table.value_columns)
+    statement = (
+        f"insert into {table.name} ({', '.join(columns)}) "
+        f"values ({', '.join('?' for _ in columns)}) "
+        f"on conflict({table.key_column}) do update set {assignments}"
+    )
+    connection.executemany(
+        statement,
+        [
+            _encode_values(
+                row,
+                columns,
+                integer_columns=table.integer_columns,
+                json_columns=table.json_columns,
+            )
+            for row in rows
+        ],
+    )
+    stats["rows_upserted"] += len(rows)
+
+
+def _delete_entity_rows(
+    connection: sqlite3.Connection,
+    table: LocalSqliteTable,
+    row_ids: list[str],
+    stats: dict[str, int],
+) -> None:
+    params = [(str(row_id),) for row_id in row_ids]
+    connection.executemany(f"delete from {table.name} where {table.key_column} = ?", params)
+    stats["rows_deleted"] += len(params)
+    if table is PERMITS_TABLE:
+        for child in PERMIT_CHILD_TABLES:
+            connection.executemany(f"delete from {child.name} where permit_id = ?", params)
+
+
+def _sync_child_rows(
+    connection: sqlite3.Connection,
+    child: LocalSqliteChildTable,
+    *,
+    permit_id: str,
+    current_rows: object,
+    stats: dict[str, int],
+) -> None:
+    # Rows are diffed against what is stored, by record id: an event inserted mid-timeline
+    # writes that one row, and moved rows only get a new position.
+    current = [row for row in current_rows if isinstance(row, dict)] if isinstance(current_rows, list) else []
+    columns = child.value_columns
+    stored = {
+        str(row[0]): (int(row[1]), tuple(row[2:]))
+        for row in connection.execute(
+            f"select row_key, position, {', '.join(columns)} from {child.name} where permit_id = ?",
+            (permit_id,),
+        )
+    }
+    seen: dict[str, int] = {}
+    row_keys = [_row_key(str(row.get(child.key_column, "") or ""), seen) for row in current]
+    positions = _child_positions(row_keys, {key: entry[0] for key, entry in stored.items()})
+    changed: list[list[Any]] = []
+    for row_key, position, row in zip(row_keys, positions, current):
+        values = _encode_values(
+            row,
+            columns,
+            integer_columns=child.integer_columns,
+            json_columns=child.json_columns,
+        )
+        previous = stored.get(row_key)
+        if previous is not None and previous[0] == position and previous[1] == tuple(values):
+            continue
+        changed.append([permit_id, row_key, position, *values])
+    if changed:
+        assignments = ", ".join(f"{column} = excluded.{column}" for column in ("position", *columns))
+        connection.executemany(
+            (
+                f"insert into {child.name} (permit_id, row_key, position, {', '.join(columns)}) "
+                f"values (?, ?, ?, {', '.join('?' for _ in columns)}) "
+                f"on conflict(permit_id, row_key) do update set {assignments}"
+            ),
+            changed,
+        )
+        stats["rows_upserted"] += len(changed)
+    removed = stored.keys() - set(row_keys)
+    if removed:
+        connection.executemany(
+            f"delete from {child.name} where permit_id = ? and row_key = ?",
+            [(permit_id, row_key) for row_key in removed],
+        )
+        stats["rows_deleted"] += len(removed)
+
+
+def _row_key(row_id: str, seen: dict[str, int]) -> str:
+    # The record id, unless it is empty or repeats within the permit.
+    occurrence = seen.get(row_id, 0)
+    seen[row_id] = occurrence + 1
+    if row_id and not occurrence:
+        return row_id
+    return f"{row_id}{_ROW_KEY_SEPARATOR}{occurrence}"
+
+
+def _child_positions(row_keys: list[str], stored: dict[str, int]) -> list[int]:
+    """Positions for `row_keys` in list order, keeping as many stored positions as possible."""
+    count = len(row_keys)
+    positions: list[int | None] = [None] * count
+    for index in _increasing_run(row_keys, stored):
+        positions[index] = stored[row_keys[index]]
+    index = 0
+    while index < count:
+        if positions[index] is not None:
+            index += 1
+            continue
+        end = index
+        while end < count and positions[end] is None:
+            end += 1
+        missing = end - index
+        low = positions[index - 1] if index > 0 else None
+        high = positions[end] if end < count else None
+        if low is None and high is None:
+            values = [(offset + 1) * _CHILD_POSITION_GAP for offset in range(missing)]
+        elif high is None:
+            values = [low + (offset + 1) * _CHILD_POSITION_GAP for offset in range(missing)]  # type: ignore[operator]
+        elif low is None:
+            values = [high - (missing - offset) * _CHILD_POSITION_GAP for offset in range(missing)]
+        elif high - low > missing:
+            values = [low + (high - low) * (offset + 1) // (missing + 1) for offset in range(missing)]
+        else:
+            # No room left between the neighbours: renumber the whole list.
+            return [(offset + 1) * _CHILD_POSITION_GAP for offset in range(count)]
+        positions[index:end] = values
+        index = end
+    return positions  # type: ignore[return-value]
+
+
+def _increasing_run(row_keys: list[str], stored: dict[str, int]) -> list[int]:
+    # Indexes of the longest subsequence of stored rows whose positions still increase.
+    tails: list[int] = []
+    tail_indexes: list[int] = []
+    previous: dict[int, int] = {}
+    for index, row_key in enumerate(row_keys):
+        position = stored.get(row_key)
+        if position is None:
+            continue
+        slot = bisect_left(tails, position)
+        if slot:
+            previous[index] = tail_indexes[slot - 1]
+        if slot == len(tails):
+            tails.append(position)
+            tail_indexes.append(index)
+        else:
+            tails[slot] = position
+            tail_indexes[slot] = index
+    run: list[int] = []
+    index = tail_indexes[-1] if tail_indexes else None
+    while index is not None:
+        run.append(index)
+        index = previous.get(index)
+    run.reverse()
+    return run
@@ -44,6 +44,7 @@ from erpermitsys.app.window_storage_update_mixin import WindowStorageUpdateMixin
 from erpermitsys.app.window_timeline_mixin import WindowTimelineMixin
 from erpermitsys.app.window_workspace_state_mixin import WindowWorkspaceStateMixin
 from erpermitsys.app.window_workspace_list_mixin import WindowWorkspaceListMixin
+from erpermitsys.app.tracker_index import TrackerIndex
 from erpermitsys.app.tracker_models import (
     ContactRecord,
     DocumentChecklistTemplate,
@@ -146,6 +147,9 @@ class ErPermitSysWindow(
         self._properties: list[PropertyRecord] = []
         self._permits: list[PermitRecord] = []
         self._document_templates: list[DocumentChecklistTemplate] = []
+        self._tracker_index = TrackerIndex(
+            lambda: (self._contacts, self._jurisdictions, self._properties, self._permits)
+        )
         self._active_document_template_ids: dict[str, str] = {}
 
         self._workspace_state = WorkspaceState()
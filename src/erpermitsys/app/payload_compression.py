@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import lzma
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+
+PAYLOAD_COMPRESSION_NONE = ""
+PAYLOAD_COMPRESSION_ZLIB = "zlib"
+PAYLOAD_COMPRESSION_LZMA = "lzma"
+PAYLOAD_COMPRESSIONS = (
+    PAYLOAD_COMPRESSION_NONE,
+    PAYLOAD_COMPRESSION_ZLIB,
+    PAYLOAD_COMPRESSION_LZMA,
+)
+_ZLIB_LEVEL = 6
+_LZMA_PRESET = 6
+_LZMA_MAGIC = b"\xfd7zXZ\x00"
+_PATH_SUFFIX_COMPRESSION = {
+    ".zz": PAYLOAD_COMPRESSION_ZLIB,
+    ".zlib": PAYLOAD_COMPRESSION_ZLIB,
+    ".xz": PAYLOAD_COMPRESSION_LZMA,
+    ".lzma": PAYLOAD_COMPRESSION_LZMA,
+}
+_CONTENT_HASH_PATTERN = re.compile(rb'"contentHash"\s*:\s*"([0-9a-f]{64})"')
+_CONTENT_HASH_HEAD_BYTES = 4_096
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedPayload:
+    data: bytes
+    compression: str
+    raw_bytes: int
+    duration_ms: float
+
+    @property
+    def stored_bytes(self) -> int:
+        return len(self.data)
+
+    @property
+    def ratio(self) -> float:
+        if not self.raw_bytes:
+            return 1.0
+        return round(self.stored_bytes / self.raw_bytes, 4)
+
+
+def normalize_payload_compression(value: object) -> str:
+    text = str(value or "").strip().lower()
+    if text in PAYLOAD_COMPRESSIONS:
+        return text
+    raise ValueError(f"Unknown payload compression: {value!r}")
+
+
+def compression_for_path(path: Path | str) -> str:
+    return _PATH_SUFFIX_COMPRESSION.get(Path(path).suffix.lower(), PAYLOAD_COMPRESSION_NONE)
+
+
+def encode_payload(
+    value: Any,
+    *,
+    compression: str = PAYLOAD_COMPRESSION_NONE,
+    indent: int | None = None,
+) -> EncodedPayload:
+    started_at = perf_counter()
+    if indent is None:
+        text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(value, ensure_ascii=False, indent=indent) + "\n"
+    raw = text.encode("utf-8")
+    compression = normalize_payload_compression(compression)
+    if compression == PAYLOAD_COMPRESSION_ZLIB:
+        data = zlib.compress(raw, _ZLIB_LEVEL)
+    elif compression == PAYLOAD_COMPRESSION_LZMA:
+        data = lzma.compress(raw, preset=_LZMA_PRESET)
+    else:
+        data = raw
+    return EncodedPayload(
+        data=data,
+        compression=compression,
+        raw_bytes=len(raw),
+        duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+    )
+
+
+def detect_payload_compression(data: bytes) -> str:
+    if data.startswith(_LZMA_MAGIC):
+        return PAYLOAD_COMPRESSION_LZMA
+    # zlib streams start with a CMF/FLG pair whose 16-bit value is a multiple of 31;
+    # JSON text never starts with 0x78 ("x").
+    if len(data) >= 2 and data[0] == 0x78 and ((data[0] << 8) | data[1]) % 31 == 0:
+        return PAYLOAD_COMPRESSION_ZLIB
+    return PAYLOAD_COMPRESSION_NONE
+
+
+def decode_payload_bytes(data: bytes | str) -> bytes:
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    compression = detect_payload_compression(data)
+    if compression == PAYLOAD_COMPRESSION_LZMA:
+        return lzma.decompress(data)
+    if compression == PAYLOAD_COMPRESSION_ZLIB:
+        return zlib.decompress(data)
+    return bytes(data)
+
+
+def decode_payload(data: bytes | str) -> Any:
+    if isinstance(data, str):
+        return json.loads(data)
+    return json.loads(decode_payload_bytes(data))
+
+
+def payload_content_hash(value: Any) -> str:
+    canonical = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def read_envelope_content_hash(path: Path | str) -> str:
+    """Read ``contentHash`` from the head of a saved envelope without loading the rest."""
+    try:
+        with open(path, "rb") as handle:
+            head = handle.read(_CONTENT_HASH_HEAD_BYTES)
+    except OSError:
+        return ""
+    try:
+        compression = detect_payload_compression(head)
+        if compression == PAYLOAD_COMPRESSION_LZMA:
+            head = lzma.LZMADecompressor().decompress(head, max_length=_CONTENT_HASH_HEAD_BYTES)
+        elif compression == PAYLOAD_COMPRESSION_ZLIB:
+            head = zlib.decompressobj().decompress(head, _CONTENT_HASH_HEAD_BYTES)
+    except (lzma.LZMAError, zlib.error):
+        return ""
+    match = _CONTENT_HASH_PATTERN.search(head)
+    return match.group(1).decode("ascii") if match else ""
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Sequence
+
+from erpermitsys.app.tracker_models import (
+    PermitRecord,
+    PropertyRecord,
+    normalize_event_type,
+    normalize_permit_type,
+)
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional runtime dependency
+    np = None  # type: ignore[assignment]
+
+
+PERMIT_TABLE_AVAILABLE = np is not None
+PERMIT_TABLE_DATE_FIELDS: tuple[str, ...] = (
+    "next_action_due",
+    "request_date",
+    "application_date",
+    "issued_date",
+    "final_date",
+    "completion_date",
+)
+# Day ordinals start at 1, so 0 marks a missing or unparseable date.
+NO_DATE = 0
+CLOSED_PERMIT_STATUSES: tuple[str, ...] = ("closed", "canceled", "finaled")
+
+COLUMN_STATUS = "status"
+COLUMN_PERMIT_TYPE = "permit_type"
+COLUMN_JURISDICTION = "jurisdiction"
+
+
+@dataclass(slots=True)
+class PermitTable:
+    """Column snapshot of the permit list for whole-portfolio filters and statistics.
+
+    Categorical columns hold codes into their label tuples; the jurisdiction label of
+    an unassigned permit is "". Date columns hold day ordinals or `NO_DATE`.
+    """
+
+    permit_ids: tuple[str, ...]
+    labels: dict[str, tuple[str, ...]]
+    codes: dict[str, Any]
+    dates: dict[str, Any]
+    missing_documents: Any
+
+    def __len__(self) -> int:
+        return len(self.permit_ids)
+
+    def mask_in(self, column: str, *values: str) -> Any:
+        labels = self.labels[column]
+        wanted = [labels.index(value) for value in values if value in labels]
+        return np.isin(self.codes[column], wanted)
+
+    def open_mask(self) -> Any:
+        return ~self.mask_in(COLUMN_STATUS, *CLOSED_PERMIT_STATUSES)
+
+    def overdue_mask(self, *, today: date | None = None) -> Any:
+        due = self.dates["next_action_due"]
+        cutoff = (today or date.today()).toordinal()
+        return (due != NO_DATE) & (due < cutoff) & self.open_mask()
+
+    def older_than_mask(self, field: str, days: int, *, today: date | None = None) -> Any:
+        values = self.dates[field]
+        cutoff = (today or date.today()).toordinal() - int(days)
+        return (values != NO_DATE) & (values < cutoff)
+
+    def filter_mask(self, filter_mode: str, *, today: date | None = None) -> Any:
+        """Vectorized form of the permit list filter modes."""
+        if filter_mode == "open":
+            return self.open_mask()
+        if filter_mode == "closed":
+            return ~self.open_mask()
+        if filter_mode == "overdue":
+            return self.overdue_mask(today=today)
+        if filter_mode != "all":
+            return self.mask_in(COLUMN_STATUS, filter_mode)
+        return np.ones(len(self), dtype=bool)
+
+    def days_between(self, start_field: str, end_field: str) -> tuple[Any, Any]:
+        """Mask of permits with both dates set, and the day counts from start to end."""
+        start = self.dates[start_field]
+        end = self.dates[end_field]
+        return (start != NO_DATE) & (end != NO_DATE), end - start
+
+    def count_by(self, column: str, mask: Any = None) -> dict[str, int]:
+        labels = self.labels[column]
+        codes = self.codes[column] if mask is None else self.codes[column][mask]
+        counts = np.bincount(codes, minlength=len(labels))
+        return {label: int(count) for label, count in zip(labels, counts) if count}
+
+    def mean_by(self, column: str, values: Any, mask: Any = None) -> dict[str, float]:
+        labels = self.labels[column]
+        codes = self.codes[column]
+        if mask is not None:
+            codes = codes[mask]
+            values = values[mask]
+        totals = np.bincount(codes, weights=values, minlength=len(labels))
+        counts = np.bincount(codes, minlength=len(labels))
+        return {
+            label: float(total) / int(count)
+            for label, total, count in zip(labels, totals, counts)
+            if count
+        }
+
+    def permit_ids_where(self, mask: Any) -> list[str]:
+        return [self.permit_ids[index] for index in np.flatnonzero(mask)]
+
+
+def build_permit_table(
+    properties: Sequence[PropertyRecord],
+    permits: Sequence[PermitRecord],
+) -> PermitTable:
+    if np is None:
+        raise RuntimeError("NumPy is required for the permit table.")
+    jurisdiction_by_property = {
+        record.property_id: str(record.jurisdiction_id or "").strip() for record in properties
+    }
+    label_codes: dict[str, dict[str, int]] = {
+        COLUMN_STATUS: {},
+        COLUMN_PERMIT_TYPE: {},
+        COLUMN_JURISDICTION: {"": 0},
+    }
+    code_rows: dict[str, list[int]] = {column: [] for column in label_codes}
+    date_rows: dict[str, list[int]] = {field: [] for field in PERMIT_TABLE_DATE_FIELDS}
+    missing_documents: list[int] = []
+    permit_ids: list[str] = []
+
+    for permit in permits:
+        permit_ids.append(permit.permit_id)
+        row = (
+            (COLUMN_STATUS, normalize_event_type(permit.status)),
+            (COLUMN_PERMIT_TYPE, normalize_permit_type(permit.permit_type)),
+            (COLUMN_JURISDICTION, jurisdiction_by_property.get(permit.property_id, "")),
+        )
+        for column, value in row:
+            codes = label_codes[column]
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(codes)
+            code_rows[column].append(code)
+        for field in PERMIT_TABLE_DATE_FIELDS:
+            ordinal = permit.date_ordinal(field)
+            date_rows[field].append(NO_DATE if ordinal is None else ordinal)
+        missing_documents.append(permit.missing_required_document_count())
+
+    return PermitTable(
+        permit_ids=tuple(permit_ids),
+        labels={column: tuple(codes) for column, codes in label_codes.items()},
+        codes={column: _int_array(values) for column, values in code_rows.items()},
+        dates={field: _int_array(values) for field, values in date_rows.items()},
+        missing_documents=_int_array(missing_documents),
+    )
+
+
+def _int_array(values: list[int]) -> Any:
+    return np.array(values, dtype=np.int64)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, replace
+from time import perf_counter
+from typing import Any
+
+from PySide6.QtCore import QObject, Signal
+
+from erpermitsys.app.data_store import DataStoreRevisionConflictError
+from erpermitsys.app.db_debug import db_debug
+from erpermitsys.app.tracker_changes import TrackerBundleDelta, coalesce_persist_payloads
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+_PERSIST_QUEUE_LIMIT = 4
+# How often an idle worker asks the last store to fold its operation log.
+_IDLE_MAINTENANCE_SECONDS = 5.0
+
+
+def save_tracker_payload(data_store: Any, payload: TrackerDataBundleV3 | TrackerBundleDelta) -> None:
+    if isinstance(payload, TrackerBundleDelta):
+        data_store.save_bundle_delta(payload)
+    else:
+        data_store.save_bundle(payload)
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerPersistRequest:
+    ticket: int
+    data_store: Any
+    payload: TrackerDataBundleV3 | TrackerBundleDelta
+    show_error_dialog: bool = True
+    coalesced: int = 0
+
+
+class TrackerPersistenceWorker(QObject):
+    saved = Signal(object)
+    failed = Signal(object, str)
+    conflict = Signal(object, object)
+
+    def __init__(self, *, queue_limit: int = _PERSIST_QUEUE_LIMIT) -> None:
+        super().__init__()
+        self._queue_limit = max(1, int(queue_limit))
+        self._pending: deque[TrackerPersistRequest] = deque()
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._inflight: TrackerPersistRequest | None = None
+        self._paused = False
+        self._stopping = False
+
+    def submit(
+        self,
+        data_store: Any,
+        payload: TrackerDataBundleV3 | TrackerBundleDelta,
+        *,
+        show_error_dialog: bool = True,
+    ) -> int:
+        with self._condition:
+            self._next_ticket += 1
+            request = TrackerPersistRequest(
+                ticket=self._next_ticket,
+                data_store=data_store,
+                payload=payload,
+                show_error_dialog=bool(show_error_dialog),
+            )
+            if self._pending and self._pending[-1].data_store is data_store:
+                # Full snapshots supersede anything older; deltas fold into the
+                # previous pending payload so no touched record is lost.
+                previous = self._pending.pop()
+                request = replace(
+                    request,
+                    payload=coalesce_persist_payloads(previous.payload, payload),
+                    show_error_dialog=request.show_error_dialog or previous.show_error_dialog,
+                    coalesced=previous.coalesced + 1,
+                )
+            else:
+                # Snapshots for different stores cannot be merged; apply back-pressure
+                # instead of dropping one. A paused worker only drains again once the UI
+                # thread (this caller) resumes it, so enqueue past the limit then.
+                self._condition.wait_for(
+                    lambda: self._stopping or self._paused or len(self._pending) < self._queue_limit
+                )
+            self._pending.append(request)
+            self._condition.notify_all()
+            db_debug(
+                "persist.queue.submit",
+                ticket=request.ticket,
+                pending=len(self._pending),
+                coalesced=request.coalesced,
+                paused=self._paused,
+            )
+            return request.ticket
+
+    def has_pending_work(self) -> bool:
+        with self._condition:
+            return bool(self._pending) or self._inflight is not None or self._paused
+
+    def wait_until_idle(self, timeout_seconds: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: (not self._pending or self._paused) and self._inflight is None,
+                timeout=timeout_seconds,
+            )
+
+    def discard_pending(self) -> int:
+        with self._condition:
+            discarded = len(self._pending)
+            self._pending.clear()
+            self._condition.notify_all()
+            return discarded
+
+    def resume(self) -> None:
+        with self._condition:
+            self._paused = False
+            self._condition.notify_all()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+
+    def run(self) -> None:
+        last_store: Any = None
+        while True:
+            with self._condition:
+                ready = self._condition.wait_for(
+                    lambda: self._stopping or (self._pending and not self._paused),
+                    timeout=_IDLE_MAINTENANCE_SECONDS if last_store is not None else None,
+                )
+                if self._stopping and (not self._pending or self._paused):
+                    return
+                if not ready:
+                    request = None
+                else:
+                    request = self._pending.popleft()
+                    self._inflight = request
+            if request is None:
+                _compact_store(last_store)
+                continue
+            last_store = request.data_store
+
+            started_at = perf_counter()
+            outcome = "saved"
+            error: Exception | None = None
+            try:
+                save_tracker_payload(request.data_store, request.payload)
+            except DataStoreRevisionConflictError as exc:
+                outcome = "conflict"
+                error = exc
+            except Exception as exc:
+                outcome = "failed"
+                error = exc
+            with self._condition:
+                self._inflight = None
+                if outcome == "conflict":
+                    # Hold later snapshots until the UI thread has reconciled the
+                    # conflict; they were diffed against a stale remote revision.
+                    self._paused = True
+                self._condition.notify_all()
+            db_debug(
+                "persist.queue.done",
+                ticket=request.ticket,
+                outcome=outcome,
+                coalesced=request.coalesced,
+                duration_ms=round((perf_counter() - started_at) * 1000.0, 2),
+            )
+            if outcome == "conflict":
+                self.conflict.emit(request, error)
+            elif outcome == "failed":
+                self.failed.emit(request, str(error))
+            else:
+                self.saved.emit(request)
+                _compact_store(last_store)
+
+
+def _compact_store(data_store: Any) -> None:
+    compact = getattr(data_store, "compact_operation_log", None)
+    if not callable(compact):
+        return
+    try:
+        compact()
+    except Exception as exc:
+        db_debug("persist.queue.compact_error", error=str(exc))
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import MISSING, dataclass, field, fields, replace
+from typing import Any, Callable, Sequence
+
+
+CODEC_METADATA_KEY = "codec"
+
+COLUMN_TEXT = "text"
+COLUMN_INTEGER = "integer"
+COLUMN_JSON = "json"
+
+
+@dataclass(frozen=True, slots=True)
+class FieldCodec:
+    """How one record field is stored in payloads, SQLite rows and Supabase rows.
+
+    `normalize` runs on encode. `inline` optionally spells it as an expression, with
+    `{value}` for the field value and `{normalize}` for the function, so the generated
+    encoder skips the call for the common case. `item` is the record type of a list of
+    nested records; `fallback` names a field whose encoded value (passed through
+    `fallback_normalize`, if given) replaces an empty encoded value.
+    """
+
+    column: str
+    normalize: Callable[[Any], Any] | None = None
+    inline: str = ""
+    empty: Any = ""
+    is_list: bool = False
+    item: type | None = None
+    fallback: str = ""
+    fallback_normalize: Callable[[Any], Any] | None = None
+
+
+def stored(
+    codec: FieldCodec,
+    *,
+    default: Any = MISSING,
+    default_factory: Any = MISSING,
+    **changes: Any,
+) -> Any:
+    """Dataclass field carrying `codec` (with `changes` applied) as its storage metadata."""
+    if changes:
+        codec = replace(codec, **changes)
+    return field(default=default, default_factory=default_factory, metadata={CODEC_METADATA_KEY: codec})
+
+
+def field_codecs(record_type: type) -> tuple[tuple[str, FieldCodec], ...]:
+    """(name, codec) of every stored field of `record_type`, in declaration order."""
+    rows: list[tuple[str, FieldCodec]] = []
+    for entry in fields(record_type):
+        codec = entry.metadata.get(CODEC_METADATA_KEY)
+        if codec is None:
+            if not entry.name.startswith("_"):
+                raise TypeError(f"{record_type.__name__}.{entry.name} has no storage codec.")
+            continue
+        rows.append((entry.name, codec))
+    return tuple(rows)
+
+
+def record_columns(record_type: type, column: str, *, exclude: Sequence[str] = ()) -> tuple[str, ...]:
+    return tuple(
+        name for name, codec in field_codecs(record_type) if codec.column == column and name not in exclude
+    )
+
+
+def record_codec(record_type: type) -> type:
+    """Class decorator installing generated `to_mapping` and `from_trusted_mapping`.
+
+    Methods the class defines itself are kept; nested `item` types must already be
+    decorated.
+    """
+    if "to_mapping" not in record_type.__dict__:
+        record_type.to_mapping = build_encoder(record_type)  # type: ignore[attr-defined]
+    if "from_trusted_mapping" not in record_type.__dict__:
+        record_type.from_trusted_mapping = staticmethod(build_trusted_decoder(record_type))  # type: ignore[attr-defined]
+    return record_type
+
+
+def build_encoder(record_type: type, names: Sequence[str] | None = None) -> Callable[[Any], dict[str, Any]]:
+    """Generate `record -> mapping` for the stored fields (or just `names`) of `record_type`."""
+    codecs = dict(field_codecs(record_type))
+    selected = tuple(codecs) if names is None else tuple(names)
+    namespace: dict[str, Any] = {}
+    lines: list[str] = []
+    fallbacks: list[str] = []
+    for name in selected:
+        codec = codecs[name]
+        value = f"v_{name}"
+        lines.append(f"    {value} = record.{name}")
+        if codec.item is not None:
+            namespace[f"encode_{name}"] = codec.item.to_mapping  # type: ignore[attr-defined]
+            expression = f"[encode_{name}(entry) for entry in {value}]"
+        elif codec.normalize is None:
+            expression = value
+        else:
+            namespace[f"normalize_{name}"] = codec.normalize
+            template = codec.inline or "{normalize}({value})"
+            expression = template.format(value=value, normalize=f"normalize_{name}")
+        lines.append(f"    e_{name} = {expression}")
+        if codec.fallback:
+            fallback = f"e_{codec.fallback}"
+            if codec.fallback_normalize is not None:
+                namespace[f"fallback_{name}"] = codec.fallback_normalize
+                fallback = f"fallback_{name}({fallback})"
+            fallbacks.append(f"    e_{name} = e_{name} or {fallback}")
+    lines.extend(fallbacks)
+    body = ", ".join(f"{name!r}: e_{name}" for name in selected)
+    lines.append(f"    return {{{body}}}")
+    return _compile(record_type, "to_mapping", "record", lines, namespace)
+
+
+def build_trusted_decoder(record_type: type) -> Callable[[Mapping[str, Any]], Any]:
+    """Generate `mapping -> record` for mappings this app's encoder wrote: no normalizers."""
+    namespace: dict[str, Any] = {"record_type": record_type, "Mapping": Mapping, "new": object.__new__}
+    lines = ["    get = value.get", "    record = new(record_type)"]
+    for entry in fields(record_type):
+        name = entry.name
+        codec = entry.metadata.get(CODEC_METADATA_KEY)
+        if codec is None:
+            # Private caches start from their declared defaults.
+            if entry.default_factory is not MISSING:
+                namespace[f"factory_{name}"] = entry.default_factory
+                lines.append(f"    record.{name} = factory_{name}()")
+            else:
+                namespace[f"default_{name}"] = entry.default
+                lines.append(f"    record.{name} = default_{name}")
+            continue
+        if codec.item is not None:
+            namespace[f"decode_{name}"] = codec.item.from_trusted_mapping  # type: ignore[attr-defined]
+            lines.append(f"    rows = get({name!r})")
+            lines.append(
+                f"    record.{name} = [decode_{name}(row) for row in rows if isinstance(row, Mapping)]"
+                " if isinstance(rows, list) else []"
+            )
+        elif codec.is_list:
+            lines.append(f"    record.{name} = list(get({name!r}) or ())")
+        else:
+            namespace[f"default_{name}"] = codec.empty if entry.default is MISSING else entry.default
+            lines.append(f"    record.{name} = get({name!r}, default_{name})")
+    lines.append("    return record")
+    return _compile(record_type, "from_trusted_mapping", "value", lines, namespace)
+
+
+def _compile(
+    record_type: type,
+    function_name: str,
+    argument: str,
+    lines: list[str],
+    namespace: dict[str, Any],
+) -> Callable[..., Any]:
+    source = f"def {function_name}({argument}):\n" + "\n".join(lines) + "\n"
+    exec(compile(source, f"<{record_type.__name__}.{function_name}>", "exec"), namespace)
+    function = namespace[function_name]
+    function.__qualname__ = f"{record_type.__qualname__}.{function_name}"
+    function.__module__ = record_type.__module__
+    return function
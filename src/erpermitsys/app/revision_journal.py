@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from erpermitsys.app.payload_compression import (
+    PAYLOAD_COMPRESSION_NONE,
+    EncodedPayload,
+    decode_payload,
+    encode_payload,
+)
+from erpermitsys.app.tracker_changes import TRACKER_ENTITY_ID_KEYS
+
+
+REVISION_JOURNAL_TABLE = "revision_journal"
+REVISION_JOURNAL_STATE_TABLE = "revision_journal_state"
+REVISION_KIND_CHECKPOINT = "checkpoint"
+REVISION_KIND_CHANGES = "changes"
+# A restore replays at most CHECKPOINT_INTERVAL - 1 change sets on top of a checkpoint.
+REVISION_CHECKPOINT_INTERVAL = 32
+REVISION_CHECKPOINTS_RETAINED = 16
+REVISION_ACTION_ADDED = "added"
+REVISION_ACTION_UPDATED = "updated"
+REVISION_ACTION_REMOVED = "removed"
+ACTIVE_TEMPLATES_ENTITY = "active_document_template_ids"
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionEntry:
+    revision: int
+    saved_at_utc: str
+    kind: str
+    source: str
+    rows_upserted: int = 0
+    rows_deleted: int = 0
+    content_hash: str = ""
+    # Journal bytes written by this save, before and after compression.
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+    encode_ms: float = 0.0
+
+    @property
+    def is_checkpoint(self) -> bool:
+        return self.kind == REVISION_KIND_CHECKPOINT
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionRecordChange:
+    entity: str
+    record_id: str
+    action: str
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionDiff:
+    from_revision: int
+    to_revision: int
+    change_set: dict[str, Any]
+    records: tuple[RevisionRecordChange, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.records
+
+    def count(self, action: str, *, entity: str | None = None) -> int:
+        return sum(
+            1
+            for record in self.records
+            if record.action == action and (entity is None or record.entity == entity)
+        )
+
+
+def ensure_revision_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        f"""
+        create table if not exists {REVISION_JOURNAL_TABLE} (
+            revision integer primary key,
+            saved_at_utc text not null,
+            kind text not null,
+            source text not null default '',
+            rows_upserted integer not null default 0,
+            rows_deleted integer not null default 0,
+            change_set_json text not null default '{{}}',
+            snapshot_json text,
+            content_hash text not null default ''
+        )
+        """
+    )
+    columns = {str(row[1]) for row in conn.execute(f"pragma table_info({REVISION_JOURNAL_TABLE})")}
+    if "content_hash" not in columns:
+        conn.execute(f"alter table {REVISION_JOURNAL_TABLE} add column content_hash text not null default ''")
+    # applied_revision: the last revision folded into the entity tables. Later
+    # revisions live only in the journal until the log is compacted.
+    conn.execute(
+        f"""
+        create table if not exists {REVISION_JOURNAL_STATE_TABLE} (
+            state_key text primary key,
+            applied_revision integer not null default 0
+        )
+        """
+    )
+
+
+def latest_revision(conn: sqlite3.Connection) -> int:
+    row = conn.execute(f"select max(revision) from {REVISION_JOURNAL_TABLE}").fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def applied_revision(conn: sqlite3.Connection) -> int | None:
+    row = conn.execute(
+        f"select applied_revision from {REVISION_JOURNAL_STATE_TABLE} where state_key = 'tables'"
+    ).fetchone()
+    return int(row[0]) if row else None
+
+
+def set_applied_revision(conn: sqlite3.Connection, revision: int) -> None:
+    conn.execute(
+        f"""
+        insert into {REVISION_JOURNAL_STATE_TABLE} (state_key, applied_revision) values ('tables', ?)
+        on conflict(state_key) do update set applied_revision = excluded.applied_revision
+        """,
+        (int(revision),),
+    )
+
+
+def revision_content_hash(conn: sqlite3.Connection, revision: int) -> str:
+    row = conn.execute(
+        f"select content_hash from {REVISION_JOURNAL_TABLE} where revision = ?",
+        (int(revision),),
+    ).fetchone()
+    return str(row[0] or "") if row else ""
+
+
+def append_revision(
+    conn: sqlite3.Connection,
+    *,
+    change_set: Mapping[str, Any],
+    payload: Mapping[str, Any],
+    saved_at_utc: str,
+    source: str,
+    content_hash: str = "",
+    compression: str = PAYLOAD_COMPRESSION_NONE,
+    force_checkpoint: bool = False,
+    checkpoint_interval: int | None = REVISION_CHECKPOINT_INTERVAL,
+    checkpoints_retained: int = REVISION_CHECKPOINTS_RETAINED,
+) -> RevisionEntry:
+    latest, last_checkpoint = conn.execute(
+        f"""
+        select max(revision), max(case when kind = ? then revision end)
+        from {REVISION_JOURNAL_TABLE}
+        """,
+        (REVISION_KIND_CHECKPOINT,),
+    ).fetchone()
+    revision = int(latest or 0) + 1
+    checkpoint = (
+        force_checkpoint
+        or last_checkpoint is None
+        or (
+            checkpoint_interval is not None
+            and revision - int(last_checkpoint) >= max(1, int(checkpoint_interval))
+        )
+    )
+    rows_upserted, rows_deleted = _change_set_counts(change_set)
+    change_set_encoded = encode_payload(change_set, compression=compression)
+    snapshot_encoded = encode_payload(payload, compression=compression) if checkpoint else None
+    entry = RevisionEntry(
+        revision=revision,
+        saved_at_utc=saved_at_utc,
+        kind=REVISION_KIND_CHECKPOINT if checkpoint else REVISION_KIND_CHANGES,
+        source=str(source or ""),
+        rows_upserted=rows_upserted,
+        rows_deleted=rows_deleted,
+        content_hash=str(content_hash or ""),
+        raw_bytes=change_set_encoded.raw_bytes + (snapshot_encoded.raw_bytes if snapshot_encoded else 0),
+        stored_bytes=change_set_encoded.stored_bytes + (snapshot_encoded.stored_bytes if snapshot_encoded else 0),
+        encode_ms=round(
+            change_set_encoded.duration_ms + (snapshot_encoded.duration_ms if snapshot_encoded else 0.0),
+            2,
+        ),
+    )
+    conn.execute(
+        f"""
+        insert into {REVISION_JOURNAL_TABLE}
+            (revision, saved_at_utc, kind, source, rows_upserted, rows_deleted,
+             change_set_json, snapshot_json, content_hash)
+        values (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            entry.revision,
+            entry.saved_at_utc,
+            entry.kind,
+            entry.source,
+            entry.rows_upserted,
+            entry.rows_deleted,
+            _stored_value(change_set_encoded),
+            _stored_value(snapshot_encoded) if snapshot_encoded else None,
+            entry.content_hash,
+        ),
+    )
+    if checkpoint:
+        prune_revisions(conn, checkpoints_retained=checkpoints_retained)
+    return entry
+
+
+def promote_checkpoint(
+    conn: sqlite3.Connection,
+    revision: int,
+    *,
+    payload: Mapping[str, Any],
+    compression: str = PAYLOAD_COMPRESSION_NONE,
+    checkpoint_interval: int = REVISION_CHECKPOINT_INTERVAL,
+    checkpoints_retained: int = REVISION_CHECKPOINTS_RETAINED,
+) -> bool:
+    """Store ``payload`` as the snapshot of an existing revision once enough saves piled up."""
+    target = int(revision)
+    row = conn.execute(
+        f"select max(revision) from {REVISION_JOURNAL_TABLE} where kind = ?",
+        (REVISION_KIND_CHECKPOINT,),
+    ).fetchone()
+    last_checkpoint = int(row[0]) if row and row[0] is not None else None
+    if last_checkpoint is not None and target - last_checkpoint < max(1, int(checkpoint_interval)):
+        return False
+    cursor = conn.execute(
+        f"update {REVISION_JOURNAL_TABLE} set kind = ?, snapshot_json = ? where revision = ?",
+        (
+            REVISION_KIND_CHECKPOINT,
+            _stored_value(encode_payload(payload, compression=compression)),
+            target,
+        ),
+    )
+    if not cursor.rowcount:
+        return False
+    prune_revisions(conn, checkpoints_retained=checkpoints_retained)
+    return True
+
+
+def prune_revisions(conn: sqlite3.Connection, *, checkpoints_retained: int) -> int:
+    row = conn.execute(
+        f"""
+        select revision from {REVISION_JOURNAL_TABLE}
+        where kind = ?
+        order by revision desc
+        limit 1 offset ?
+        """,
+        (REVISION_KIND_CHECKPOINT, max(1, int(checkpoints_retained)) - 1),
+    ).fetchone()
+    if row is None:
+        return 0
+    cursor = conn.execute(f"delete from {REVISION_JOURNAL_TABLE} where revision < ?", (int(row[0]),))
+    return max(0, int(cursor.rowcount or 0))
+
+
+def list_revisions(conn: sqlite3.Connection, *, limit: int | None = None) -> list[RevisionEntry]:
+    sql = (
+        f"select revision, saved_at_utc, kind, source, rows_upserted, rows_deleted "
+        f"from {REVISION_JOURNAL_TABLE} order by revision desc"
+    )
+    params: list[Any] = []
+    if limit is not None:
+        sql += " limit ?"
+        params.append(max(1, int(limit)))
+    return [
+        RevisionEntry(
+            revision=int(revision),
+            saved_at_utc=str(saved_at_utc),
+            kind=str(kind),
+            source=str(source),
+            rows_upserted=int(rows_upserted),
+            rows_deleted=int(rows_deleted),
+        )
+        for revision, saved_at_utc, kind, source, rows_upserted, rows_deleted in conn.execute(sql, params)
+    ]
+
+
+def load_revision_chain(
+    conn: sqlite3.Connection,
+    revision: int,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    target = int(revision)
+    row = conn.execute(
+        f"""
+        select revision, snapshot_json from {REVISION_JOURNAL_TABLE}
+        where kind = ? and revision <= ?
+        order by revision desc
+        limit 1
+        """,
+        (REVISION_KIND_CHECKPOINT, target),
+    ).fetchone()
+    if row is None or latest_revision(conn) < target:
+        raise ValueError(f"Revision {target} is not in the local history.")
+    checkpoint_revision, snapshot_json = int(row[0]), row[1]
+    snapshot = decode_payload(snapshot_json) if snapshot_json else {}
+    change_sets = [
+        decode_payload(change_set_json) if change_set_json else {}
+        for (change_set_json,) in conn.execute(
+            f"""
+            select change_set_json from {REVISION_JOURNAL_TABLE}
+            where revision > ? and revision <= ?
+            order by revision
+            """,
+            (checkpoint_revision, target),
+        )
+    ]
+    return snapshot if isinstance(snapshot, dict) else {}, change_sets
+
+
+def load_changes_after(
+    conn: sqlite3.Connection,
+    revision: int,
+) -> list[tuple[dict[str, Any], dict[str, Any] | None]] | None:
+    """Change sets saved after ``revision``, oldest first.
+
+    Full rewrites carry their snapshot, since their change set has no deletes.
+    Returns None when pruning removed part of the range.
+    """
+    after = int(revision)
+    rows = conn.execute(
+        f"""
+        select revision, kind, source, change_set_json, snapshot_json
+        from {REVISION_JOURNAL_TABLE}
+        where revision > ?
+        order by revision
+        """,
+        (after,),
+    ).fetchall()
+    if rows and int(rows[0][0]) != after + 1:
+        return None
+    changes: list[tuple[dict[str, Any], dict[str, Any] | None]] = []
+    for _revision, kind, source, change_set_json, snapshot_json in rows:
+        change_set = decode_payload(change_set_json) if change_set_json else {}
+        snapshot = None
+        if kind == REVISION_KIND_CHECKPOINT and source == "full" and snapshot_json:
+            snapshot = decode_payload(snapshot_json)
+        changes.append(
+            (
+                change_set if isinstance(change_set, dict) else {},
+                snapshot if isinstance(snapshot, dict) else None,
+            )
+        )
+    return changes
+
+
+def describe_change_set(
+    change_set: Mapping[str, Any],
+    *,
+    previous_payload: Mapping[str, Any],
+) -> tuple[RevisionRecordChange, ...]:
+    records: list[RevisionRecordChange] = []
+    for entity, id_key in TRACKER_ENTITY_ID_KEYS.items():
+        previous_ids = {
+            str(row.get(id_key, "") or "")
+            for row in previous_payload.get(entity) or ()
+            if isinstance(row, dict)
+        }
+        for row in change_set.get(f"{entity}_upserts") or ():
+            record_id = str(row.get(id_key, "") or "")
+            action = REVISION_ACTION_UPDATED if record_id in previous_ids else REVISION_ACTION_ADDED
+            records.append(RevisionRecordChange(entity=entity, record_id=record_id, action=action))
+        for record_id in change_set.get(f"{entity}_deletes") or ():
+            records.append(
+                RevisionRecordChange(entity=entity, record_id=str(record_id), action=REVISION_ACTION_REMOVED)
+            )
+
+    previous_active = previous_payload.get(ACTIVE_TEMPLATES_ENTITY) or {}
+    for row in change_set.get(f"{ACTIVE_TEMPLATES_ENTITY}_upserts") or ():
+        permit_type = str(row.get("permit_type", "") or "")
+        action = REVISION_ACTION_UPDATED if permit_type in previous_active else REVISION_ACTION_ADDED
+        records.append(RevisionRecordChange(entity=ACTIVE_TEMPLATES_ENTITY, record_id=permit_type, action=action))
+    for permit_type in change_set.get(f"{ACTIVE_TEMPLATES_ENTITY}_deletes") or ():
+        records.append(
+            RevisionRecordChange(
+                entity=ACTIVE_TEMPLATES_ENTITY,
+                record_id=str(permit_type),
+                action=REVISION_ACTION_REMOVED,
+            )
+        )
+    return tuple(records)
+
+
+def _change_set_counts(change_set: Mapping[str, Any]) -> tuple[int, int]:
+    upserted = 0
+    deleted = 0
+    for key, value in change_set.items():
+        if not isinstance(value, list):
+            continue
+        if key.endswith("_upserts"):
+            upserted += len(value)
+        elif key.endswith("_deletes"):
+            deleted += len(value)
+    return upserted, deleted
+
+
+def _stored_value(encoded: EncodedPayload) -> str | bytes:
+    # Uncompressed entries stay text; compressed ones are stored as blobs and told
+    # apart by their header when read back.
+    if encoded.compression == PAYLOAD_COMPRESSION_NONE:
+        return encoded.data.decode("utf-8")
+    return encoded.data
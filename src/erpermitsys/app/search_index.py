@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import sqlite3
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Sequence
+
+
+SEARCH_KIND_CONTACT = "contact"
+SEARCH_KIND_JURISDICTION = "jurisdiction"
+SEARCH_KIND_PROPERTY = "property"
+SEARCH_KIND_PERMIT = "permit"
+SEARCH_KIND_TEMPLATE = "template"
+
+SEARCH_FTS_TABLE = "search_fts"
+DEFAULT_SEARCH_LIMIT = 500
+
+_ENTITY_SEARCH_KINDS: dict[str, tuple[str, str]] = {
+    "contacts": (SEARCH_KIND_CONTACT, "contact_id"),
+    "jurisdictions": (SEARCH_KIND_JURISDICTION, "jurisdiction_id"),
+    "properties": (SEARCH_KIND_PROPERTY, "property_id"),
+    "permits": (SEARCH_KIND_PERMIT, "permit_id"),
+    "document_templates": (SEARCH_KIND_TEMPLATE, "template_id"),
+}
+_TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+_TITLE_WEIGHT = 3.0
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+@dataclass(frozen=True, slots=True)
+class SearchDocument:
+    kind: str
+    record_id: str
+    title: str
+    body: str
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    kind: str
+    record_id: str
+    score: float
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(str(text or "").casefold())
+
+
+def _join(values: Iterable[Any]) -> str:
+    return " ".join(str(value or "").strip() for value in values if str(value or "").strip())
+
+
+def _texts(value: Any) -> list[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(item or "") for item in value]
+    return [str(value or "")]
+
+
+def search_document_for_row(entity: str, row: Mapping[str, Any]) -> SearchDocument | None:
+    spec = _ENTITY_SEARCH_KINDS.get(entity)
+    if spec is None or not isinstance(row, Mapping):
+        return None
+    kind, id_key = spec
+    record_id = str(row.get(id_key, "") or "").strip()
+    if not record_id:
+        return None
+
+    if kind == SEARCH_KIND_PROPERTY:
+        title = _join((row.get("display_address"), row.get("parcel_id"), row.get("parcel_id_norm")))
+        body = _join((row.get("notes"), *_texts(row.get("tags"))))
+    elif kind == SEARCH_KIND_PERMIT:
+        title = _join((row.get("permit_number"),))
+        parts: list[Any] = [
+            row.get("permit_type"),
+            row.get("status"),
+            row.get("next_action_text"),
+            row.get("next_action_due"),
+            row.get("request_date"),
+        ]
+        for event in row.get("events") or []:
+            if isinstance(event, Mapping):
+                parts.extend((event.get("summary"), event.get("detail")))
+        for party in row.get("parties") or []:
+            if isinstance(party, Mapping):
+                parts.extend((party.get("role"), party.get("note")))
+        body = _join(parts)
+    elif kind == SEARCH_KIND_CONTACT:
+        title = _join((row.get("name"),))
+        parts = [*_texts(row.get("roles")), *_texts(row.get("emails")), *_texts(row.get("numbers"))]
+        for method in row.get("contact_methods") or []:
+            if isinstance(method, Mapping):
+                parts.extend((method.get("label"), method.get("note")))
+                parts.extend(_texts(method.get("emails")))
+                parts.extend(_texts(method.get("numbers")))
+        body = _join(parts)
+    elif kind == SEARCH_KIND_JURISDICTION:
+        title = _join((row.get("name"),))
+        body = _join(
+            (
+                row.get("jurisdiction_type"),
+                row.get("parent_county"),
+                row.get("portal_vendor"),
+                row.get("notes"),
+                *_texts(row.get("portal_urls")),
+            )
+        )
+    else:
+        title = _join((row.get("name"),))
+        body = _join((row.get("permit_type"), row.get("notes")))
+    return SearchDocument(kind=kind, record_id=record_id, title=title, body=body)
+
+
+def search_documents_for_payload(payload: Mapping[str, Any]) -> list[SearchDocument]:
+    documents: list[SearchDocument] = []
+    for entity in _ENTITY_SEARCH_KINDS:
+        for row in payload.get(entity) or []:
+            document = search_document_for_row(entity, row)
+            if document is not None:
+                documents.append(document)
+    return documents
+
+
+def search_changes_for_change_set(
+    change_set: Mapping[str, Any],
+) -> tuple[list[SearchDocument], list[tuple[str, str]]]:
+    upserts: list[SearchDocument] = []
+    deletes: list[tuple[str, str]] = []
+    for entity, (kind, _id_key) in _ENTITY_SEARCH_KINDS.items():
+        for row in change_set.get(f"{entity}_upserts") or []:
+            document = search_document_for_row(entity, row)
+            if document is not None:
+                upserts.append(document)
+        for record_id in change_set.get(f"{entity}_deletes") or []:
+            normalized = str(record_id or "").strip()
+            if normalized:
+                deletes.append((kind, normalized))
+    return upserts, deletes
+
+
+def _hit_order(item: tuple[tuple[str, str], float]) -> tuple[float, str]:
+    return -item[1], item[0][1]
+
+
+class InMemorySearchIndex:
+    """Prefix-matching inverted index ranked with BM25, used where FTS5 is unavailable."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[tuple[str, str], float]] = {}
+        self._vocabulary: list[str] = []
+        self._documents: dict[tuple[str, str], tuple[dict[str, float], float]] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def rebuild(self, documents: Iterable[SearchDocument]) -> None:
+        self._postings.clear()
+        self._documents.clear()
+        self._total_length = 0.0
+        for document in documents:
+            self._add(document)
+        self._vocabulary = sorted(self._postings)
+
+    def upsert(self, document: SearchDocument) -> None:
+        self.remove(document.kind, document.record_id)
+        for token in self._add(document):
+            index = bisect_left(self._vocabulary, token)
+            if index >= len(self._vocabulary) or self._vocabulary[index] != token:
+                insort(self._vocabulary, token)
+
+    def remove(self, kind: str, record_id: str) -> None:
+        key = (kind, record_id)
+        existing = self._documents.pop(key, None)
+        if existing is None:
+            return
+        weights, length = existing
+        self._total_length -= length
+        for token in weights:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[token]
+                index = bisect_left(self._vocabulary, token)
+                if index < len(self._vocabulary) and self._vocabulary[index] == token:
+                    del self._vocabulary[index]
+
+    def search(
+        self,
+        query: str,
+        *,
+        kinds: Sequence[str] | None = None,
+        limit: int | None = DEFAULT_SEARCH_LIMIT,
+    ) -> list[SearchHit]:
+        terms = tokenize(query)
+        if not terms or not self._documents:
+            return []
+        allowed = set(kinds) if kinds else None
+        document_count = len(self._documents)
+        average_length = max(1.0, self._total_length / document_count)
+
+        expansions: list[tuple[int, str, list[str]]] = []
+        for term in dict.fromkeys(terms):
+            tokens = self._prefix_tokens(term)
+            if not tokens:
+                return []
+            expansions.append((sum(len(self._postings[token]) for token in tokens), term, tokens))
+        # Most selective term first, so broad prefixes only re-score the survivors.
+        expansions.sort()
+
+        def _token_score(token: str, key: tuple[str, str], frequency: float) -> float:
+            posting_count = len(self._postings[token])
+            idf = math.log(1.0 + (document_count - posting_count + 0.5) / (posting_count + 0.5))
+            length = self._documents[key][1]
+            norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * length / average_length)
+            return idf * frequency * (_BM25_K1 + 1.0) / (frequency + norm)
+
+        scores: dict[tuple[str, str], float] | None = None
+        for posting_total, term, tokens in expansions:
+            term_scores: dict[tuple[str, str], float] = {}
+            if scores is None or posting_total <= len(scores):
+                for token in tokens:
+                    for key, frequency in self._postings[token].items():
+                        if allowed is not None and key[0] not in allowed:
+                            continue
+                        if scores is not None and key not in scores:
+                            continue
+                        score = _token_score(token, key, frequency)
+                        if score > term_scores.get(key, 0.0):
+                            term_scores[key] = score
+            else:
+                for key in scores:
+                    weights = self._documents[key][0]
+                    for token, frequency in weights.items():
+                        if not token.startswith(term):
+                            continue
+                        score = _token_score(token, key, frequency)
+                        if score > term_scores.get(key, 0.0):
+                            term_scores[key] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {key: scores[key] + value for key, value in term_scores.items()}
+            if not scores:
+                return []
+        if limit is None:
+            ranked = sorted((scores or {}).items(), key=_hit_order)
+        else:
+            ranked = heapq.nsmallest(max(1, int(limit)), (scores or {}).items(), key=_hit_order)
+        return [SearchHit(kind=key[0], record_id=key[1], score=round(score, 6)) for key, score in ranked]
+
+    def _prefix_tokens(self, term: str) -> list[str]:
+        start = bisect_left(self._vocabulary, term)
+        end = bisect_left(self._vocabulary, term + "\U0010ffff", start)
+        return self._vocabulary[start:end]
+
+    def _add(self, document: SearchDocument) -> Iterable[str]:
+        key = (document.kind, document.record_id)
+        weights: dict[str, float] = {}
+        for token in _TOKEN_PATTERN.findall(document.title.casefold()):
+            weights[token] = weights.get(token, 0.0) + _TITLE_WEIGHT
+        for token in _TOKEN_PATTERN.findall(document.body.casefold()):
+            weights[token] = weights.get(token, 0.0) + 1.0
+        length = float(sum(weights.values()))
+        self._documents[key] = (weights, length)
+        self._total_length += length
+        for token, weight in weights.items():
+            self._postings.setdefault(token, {})[key] = weight
+        return weights.keys()
+
+
+class PayloadSearchIndex:
+    """In-memory index kept in step with a store's known payload."""
+
+    def __init__(self) -> None:
+        self._index = InMemorySearchIndex()
+        self._payload: object | None = None
+
+    def search(
+        self,
+        payload: Mapping[str, Any] | None,
+        query: str,
+        *,
+        kinds: Sequence[str] | None = None,
+        limit: int | None = DEFAULT_SEARCH_LIMIT,
+    ) -> list[SearchHit]:
+        if payload is not self._payload:
+            self._index.rebuild(search_documents_for_payload(payload or {}))
+            self._payload = payload
+        return self._index.search(query, kinds=kinds, limit=limit)
+
+    def advance(
+        self,
+        base_payload: Mapping[str, Any] | None,
+        change_set: Mapping[str, Any],
+        payload: Mapping[str, Any] | None,
+    ) -> None:
+        # Only follow incrementally when the index reflects the base; otherwise the
+        # next search rebuilds it from scratch.
+        if base_payload is None or base_payload is not self._payload:
+            return
+        upserts, deletes = search_changes_for_change_set(change_set)
+        for kind, record_id in deletes:
+            self._index.remove(kind, record_id)
+        for document in upserts:
+            self._index.upsert(document)
+        self._payload = payload
+
+
+def ensure_search_schema(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute(
+            f"""
+            create virtual table if not exists {SEARCH_FTS_TABLE} using fts5(
+                kind unindexed,
+                record_id unindexed,
+                title,
+                body,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+            """
+        )
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def search_table_is_empty(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(f"select 1 from {SEARCH_FTS_TABLE} limit 1").fetchone()
+    return row is None
+
+
+def rebuild_search_rows(conn: sqlite3.Connection, documents: Iterable[SearchDocument]) -> int:
+    conn.execute(f"delete from {SEARCH_FTS_TABLE}")
+    rows = [(document.kind, document.record_id, document.title, document.body) for document in documents]
+    conn.executemany(
+        f"insert into {SEARCH_FTS_TABLE} (kind, record_id, title, body) values (?, ?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def sync_search_rows(
+    conn: sqlite3.Connection,
+    *,
+    upserts: Sequence[SearchDocument],
+    deletes: Sequence[tuple[str, str]],
+) -> None:
+    stale = [(document.kind, document.record_id) for document in upserts]
+    stale.extend(deletes)
+    if stale:
+        conn.executemany(
+            f"delete from {SEARCH_FTS_TABLE} where kind = ? and record_id = ?",
+            stale,
+        )
+    if upserts:
+        conn.executemany(
+            f"insert into {SEARCH_FTS_TABLE} (kind, record_id, title, body) values (?, ?, ?, ?)",
+            [(document.kind, document.record_id, document.title, document.body) for document in upserts],
+        )
+
+
+def search_sqlite(
+    conn: sqlite3.Connection,
+    query: str,
+    *,
+    kinds: Sequence[str] | None = None,
+    limit: int | None = DEFAULT_SEARCH_LIMIT,
+) -> list[SearchHit]:
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return []
+    match = " ".join(f'"{term}"*' for term in terms)
+    sql = (
+        f"select kind, record_id, bm25({SEARCH_FTS_TABLE}, 0.0, 0.0, {_TITLE_WEIGHT}, 1.0) as rank "
+        f"from {SEARCH_FTS_TABLE} where {SEARCH_FTS_TABLE} match ?"
+    )
+    params: list[Any] = [match]
+    if kinds:
+        sql += f" and kind in ({', '.join('?' for _ in kinds)})"
+        params.extend(kinds)
+    sql += " order by rank, record_id"
+    if limit is not None:
+        sql += " limit ?"
+        params.append(max(1, int(limit)))
+    return [
+        SearchHit(kind=str(kind), record_id=str(record_id), score=round(-float(rank), 6))
+        for kind, record_id, rank in conn.execute(sql, params)
+    ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+# GetDriveTypeW results for removable, fixed and RAM disks.
+_WINDOWS_LOCAL_DRIVE_TYPES = frozenset((2, 3, 6))
+_NETWORK_FILESYSTEM_TYPES = frozenset(
+    (
+        "nfs",
+        "nfs4",
+        "cifs",
+        "smb3",
+        "smbfs",
+        "9p",
+        "afs",
+        "ceph",
+        "glusterfs",
+        "lustre",
+        "davfs",
+        "fuse.sshfs",
+        "fuse.glusterfs",
+        "fuse.rclone",
+        "fuse.s3fs",
+    )
+)
+
+
+def is_local_disk_path(path: Path | str) -> bool:
+    """True when `path` is on a disk of this machine.
+
+    Network shares and anything that cannot be identified count as not local, so callers
+    only opt into single-host features (such as SQLite WAL) when that is known to be safe.
+    """
+    try:
+        resolved = Path(os.path.abspath(os.fspath(path)))
+    except (OSError, TypeError, ValueError):
+        return False
+    if sys.platform.startswith("win"):
+        return _windows_path_is_local(resolved)
+    if sys.platform.startswith("linux"):
+        return _linux_path_is_local(resolved)
+    return False
+
+
+def _windows_path_is_local(path: Path) -> bool:
+    drive = path.drive
+    if not drive or drive.startswith("\\\\"):
+        # UNC share (\\server\share) or a device path this check does not classify.
+        return False
+    try:
+        import ctypes
+
+        drive_type = int(ctypes.windll.kernel32.GetDriveTypeW(f"{drive}\\"))
+    except Exception:
+        return False
+    return drive_type in _WINDOWS_LOCAL_DRIVE_TYPES
+
+
+def _linux_path_is_local(path: Path) -> bool:
+    try:
+        with open("/proc/self/mounts", "r", encoding="utf-8", errors="replace") as handle:
+            lines = handle.readlines()
+    except OSError:
+        return False
+    target = str(path)
+    best_mount = ""
+    best_type = ""
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 3:
+            continue
+        mount_point = _unescape_mount_field(parts[1])
+        if not _is_within(target, mount_point) or len(mount_point) < len(best_mount):
+            continue
+        best_mount = mount_point
+        best_type = parts[2].lower()
+    if not best_mount:
+        return False
+    return best_type not in _NETWORK_FILESYSTEM_TYPES
+
+
+def _is_within(target: str, mount_point: str) -> bool:
+    if mount_point == "/":
+        return True
+    return target == mount_point or target.startswith(mount_point.rstrip("/") + "/")
+
+
+def _unescape_mount_field(value: str) -> str:
+    # /proc/self/mounts writes spaces, tabs, newlines and backslashes as octal escapes.
+    if "\\" not in value:
+        return value
+    return (
+        value.replace("\\040", " ")
+        .replace("\\011", "\t")
+        .replace("\\012", "\n")
+        .replace("\\134", "\\")
+    )
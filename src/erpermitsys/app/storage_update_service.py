@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 import tempfile
 from pathlib import Path
+from time import perf_counter
 from typing import Any
 
 from PySide6.QtCore import QObject, QThread, QTimer, Qt, QUrl, Signal
@@ -13,11 +14,19 @@ from erpermitsys.app.data_store import (
     BACKEND_LOCAL_SQLITE,
     BACKEND_SUPABASE,
     DataLoadResult,
+    DataStoreRevisionConflictError,
+    LocalRevisionConflictError,
     SupabaseDataStore,
     SupabaseRevisionConflictError,
     load_bundle_from_json_file,
     save_bundle_as_json_file,
 )
+from erpermitsys.app.db_debug import db_debug
+from erpermitsys.app.persistence_worker import (
+    TrackerPersistRequest,
+    TrackerPersistenceWorker,
+    save_tracker_payload,
+)
 from erpermitsys.app.settings_store import (
     SupabaseSettings,
     normalize_data_storage_backend,
@@ -33,6 +42,17 @@ from erpermitsys.app.supabase_realtime import (
     SupabaseRealtimeSubscription,
 )
 from erpermitsys.app.storage_runtime import StorageRuntimeSelection, build_storage_runtime
+from erpermitsys.app.tracker_changes import (
+    ENTITY_CONTACTS,
+    ENTITY_DOCUMENT_TEMPLATES,
+    ENTITY_JURISDICTIONS,
+    ENTITY_PERMITS,
+    ENTITY_PROPERTIES,
+    TRACKER_ENTITY_ID_KEYS,
+    TrackerBundleDelta,
+    TrackerChangeTracker,
+    build_tracker_delta,
+)
 from erpermitsys.app.tracker_models import (
     ContactRecord,
     DocumentChecklistTemplate,
@@ -41,10 +61,7 @@ from erpermitsys.app.tracker_models import (
     PropertyRecord,
     TrackerDataBundleV3,
     build_document_slots_from_template,
-    compute_permit_status,
-    ensure_default_document_structure,
     normalize_parcel_id,
-    refresh_slot_status_from_documents,
 )
 from erpermitsys.app.updater import (
     GitHubUpdateCheckResult,
@@ -55,9 +72,13 @@ from erpermitsys.app.updater import (
     launch_windows_zip_updater,
 )
 from erpermitsys.app.window_bound_service import WindowBoundService
+from erpermitsys.ui.dialogs import RevisionHistoryDialog
 
 
 _SUPABASE_REVISION_POLL_INTERVAL_MS = 2_000
+_LOCAL_CHANGE_POLL_INTERVAL_MS = 1_500
+# Keep each idle-time hydration slice short enough not to delay input handling.
+_PERMIT_DETAIL_HYDRATION_SLICE_SECONDS = 0.008
 
 
 class _SupabaseRevisionPollWorker(QObject):
@@ -78,14 +99,19 @@ class _SupabaseRevisionPollWorker(QObject):
 class _SupabaseLoadBundleWorker(QObject):
     finished = Signal(object)
 
-    def __init__(self, data_store: SupabaseDataStore, backend: str) -> None:
+    def __init__(self, data_store: SupabaseDataStore, backend: str, *, incremental: bool = True) -> None:
         super().__init__()
         self._data_store = data_store
         self._backend = str(backend or "").strip() or BACKEND_SUPABASE
+        self._incremental = bool(incremental)
 
     def run(self) -> None:
         try:
-            result = self._data_store.load_bundle()
+            # Pull only the records changed since the known revision when the server can
+            # answer that; otherwise reload the full bundle.
+            result = self._data_store.fetch_remote_changes() if self._incremental else None
+            if result is None:
+                result = self._data_store.load_bundle()
         except Exception as exc:
             result = DataLoadResult(
                 bundle=TrackerDataBundleV3(),
@@ -169,9 +195,13 @@ class WindowStorageUpdateService(WindowBoundService):
         *,
         persist_settings: bool,
     ) -> None:
+        self._wait_for_tracker_persistence()
+        previous_store = getattr(self, "_data_store", None)
         self._data_storage_backend = selection.backend
         self._data_storage_folder = selection.data_root
         self._data_store = selection.data_store
+        if previous_store is not None and previous_store is not selection.data_store:
+            self._close_data_store(previous_store)
         self._document_store = selection.document_store
         self._supabase_settings = selection.supabase_settings
         if hasattr(self, "_storage_state"):
@@ -182,6 +212,16 @@ class WindowStorageUpdateService(WindowBoundService):
             save_data_storage_backend(self._data_storage_backend)
             save_data_storage_folder(self._data_storage_folder)
 
+    def _close_data_store(self, data_store=None) -> None:
+        store = data_store if data_store is not None else getattr(self, "_data_store", None)
+        close = getattr(store, "close", None)
+        if not callable(close):
+            return
+        try:
+            close()
+        except Exception:
+            pass
+
     def _safe_load_bundle(self, data_store) -> DataLoadResult:
         try:
             return data_store.load_bundle()
@@ -223,7 +263,9 @@ class WindowStorageUpdateService(WindowBoundService):
         if backend != BACKEND_SUPABASE or not isinstance(self._data_store, SupabaseDataStore):
             self._shutdown_supabase_realtime_subscription()
             self._set_supabase_connection_status("local", "Using local SQLite storage.")
+            self._start_local_change_polling()
             return
+        self._stop_local_change_polling()
         settings = self._supabase_settings
         if not settings.configured:
             self._shutdown_supabase_realtime_subscription()
@@ -256,6 +298,7 @@ class WindowStorageUpdateService(WindowBoundService):
         self._supabase_realtime_pending_refresh = False
         self._supabase_realtime_pending_notice_shown = False
         self._supabase_realtime_apply_running = False
+        self._supabase_refresh_needs_full_load = False
 
     def _on_supabase_realtime_status(self, level: str, message: str) -> None:
         text = str(message or "").strip()
@@ -319,8 +362,97 @@ class WindowStorageUpdateService(WindowBoundService):
                     "Finish the current edit (save or cancel) and the latest data will be pulled in.",
                 )
             return
+        if self._tracker_persistence_pending():
+            self._supabase_realtime_pending_refresh = True
+            return
         self._apply_remote_supabase_refresh(trigger="realtime")
 
+    def _start_local_change_polling(self) -> None:
+        timer = getattr(self, "_local_change_poll_timer", None)
+        if not isinstance(timer, QTimer):
+            timer = QTimer(self.window)
+            timer.setInterval(_LOCAL_CHANGE_POLL_INTERVAL_MS)
+            timer.timeout.connect(self._on_local_change_poll_tick)
+            self._local_change_poll_timer = timer
+        if not timer.isActive():
+            timer.start()
+
+    def _stop_local_change_polling(self) -> None:
+        timer = getattr(self, "_local_change_poll_timer", None)
+        if isinstance(timer, QTimer):
+            timer.stop()
+
+    def _on_local_change_poll_tick(self) -> None:
+        data_store = self._data_store
+        if not callable(getattr(data_store, "fetch_external_changes", None)):
+            return
+        # A background save holds the store lock; the next tick picks the changes up.
+        if self._tracker_persistence_pending():
+            return
+        if self._has_local_editor_in_progress():
+            return
+        try:
+            if not data_store.has_external_changes():
+                return
+            changes = data_store.fetch_external_changes()
+        except Exception as exc:
+            db_debug("sqlite.external_changes.error", error=str(exc))
+            return
+        if changes is None:
+            return
+        self._apply_external_tracker_changes(changes)
+        self._state_streamer.record(
+            "data.external_changes_applied",
+            source="main_window",
+            payload={
+                "backend": self._data_storage_backend,
+                "folder": str(self._data_storage_folder),
+                "records": changes.record_count,
+            },
+        )
+
+    def _apply_external_tracker_changes(self, changes: TrackerBundleDelta) -> None:
+        record_lists = (
+            (ENTITY_CONTACTS, "_contacts", ContactRecord),
+            (ENTITY_JURISDICTIONS, "_jurisdictions", JurisdictionRecord),
+            (ENTITY_PROPERTIES, "_properties", PropertyRecord),
+            (ENTITY_PERMITS, "_permits", PermitRecord),
+            (ENTITY_DOCUMENT_TEMPLATES, "_document_templates", DocumentChecklistTemplate),
+        )
+        for entity, attr, record_type in record_lists:
+            entity_rows = changes.rows.get(entity)
+            if not entity_rows:
+                continue
+            id_attr = TRACKER_ENTITY_ID_KEYS[entity]
+            records: list[Any] = []
+            seen: set[str] = set()
+            for record in getattr(self, attr):
+                record_id = str(getattr(record, id_attr, "") or "").strip()
+                if record_id not in entity_rows:
+                    records.append(record)
+                    continue
+                seen.add(record_id)
+                row = entity_rows[record_id]
+                if row is not None:
+                    records.append(record_type.from_mapping(row))
+            records.extend(
+                record_type.from_mapping(row)
+                for record_id, row in entity_rows.items()
+                if row is not None and record_id not in seen
+            )
+            setattr(self, attr, records)
+        self._tracker_index.rebuild()
+        self._active_document_template_ids = dict(changes.active_document_template_ids)
+        self._prune_active_document_template_ids()
+
+        property_ids = {record.property_id for record in self._properties}
+        permit_ids = {record.permit_id for record in self._permits}
+        if (self._selected_property_id and self._selected_property_id not in property_ids) or (
+            self._selected_permit_id and self._selected_permit_id not in permit_ids
+        ):
+            self._close_to_home_view()
+        self._refresh_all_views()
+
     def _ensure_supabase_revision_poll_timer(self) -> QTimer:
         timer = getattr(self, "_supabase_revision_poll_timer", None)
         if isinstance(timer, QTimer):
@@ -397,6 +529,9 @@ class WindowStorageUpdateService(WindowBoundService):
                     "Finish the current edit (save or cancel) and the latest data will be pulled in.",
                 )
             return
+        if self._tracker_persistence_pending():
+            self._supabase_realtime_pending_refresh = True
+            return
         self._apply_remote_supabase_refresh(trigger="poll")
 
     def _on_supabase_revision_poll_thread_finished(self) -> None:
@@ -438,6 +573,8 @@ class WindowStorageUpdateService(WindowBoundService):
             return
         if self._has_local_editor_in_progress():
             return
+        if self._tracker_persistence_pending():
+            return
         QTimer.singleShot(
             0,
             lambda: self._apply_remote_supabase_refresh(trigger="pending"),
@@ -461,7 +598,11 @@ class WindowStorageUpdateService(WindowBoundService):
         self._supabase_realtime_pending_notice_shown = False
         self._supabase_refresh_trigger = str(trigger or "").strip() or "refresh"
         self._set_supabase_connection_status("syncing", "Syncing latest Supabase data...")
-        worker = _SupabaseLoadBundleWorker(self._data_store, self._data_storage_backend)
+        worker = _SupabaseLoadBundleWorker(
+            self._data_store,
+            self._data_storage_backend,
+            incremental=not bool(getattr(self, "_supabase_refresh_needs_full_load", False)),
+        )
         thread = QThread(self.window)
         worker.moveToThread(thread)
         thread.started.connect(worker.run)
@@ -477,8 +618,12 @@ class WindowStorageUpdateService(WindowBoundService):
 
     def _on_supabase_refresh_loaded(self, raw_result: object) -> None:
         trigger = str(getattr(self, "_supabase_refresh_trigger", "") or "refresh")
+        remote_changes: TrackerBundleDelta | None = None
         load_result: DataLoadResult
-        if isinstance(raw_result, DataLoadResult):
+        if isinstance(raw_result, TrackerBundleDelta):
+            remote_changes = raw_result
+            load_result = DataLoadResult(bundle=TrackerDataBundleV3(), source="changes")
+        elif isinstance(raw_result, DataLoadResult):
             load_result = raw_result
         else:
             load_result = DataLoadResult(
@@ -491,6 +636,33 @@ class WindowStorageUpdateService(WindowBoundService):
                 return
             if not isinstance(self._data_store, SupabaseDataStore):
                 return
+            if self._tracker_persistence_pending():
+                # A local save is still queued; applying the remote bundle now would
+                # overwrite it in memory. Pull again once the save has landed.
+                self._supabase_realtime_pending_refresh = True
+                if remote_changes is not None:
+                    # The store already folded these changes in; only a full load
+                    # brings them to the window now.
+                    self._supabase_refresh_needs_full_load = True
+                return
+            if remote_changes is not None:
+                if (
+                    remote_changes.record_count
+                    or remote_changes.active_document_template_ids != self._active_document_template_ids
+                ):
+                    self._apply_external_tracker_changes(remote_changes)
+                if self._supabase_connection_state != "connected":
+                    self._set_supabase_connection_status("polling", "Polling Supabase every 2 seconds.")
+                self._state_streamer.record(
+                    "data.supabase_realtime_refreshed",
+                    source="main_window",
+                    payload={
+                        "trigger": trigger,
+                        "source": load_result.source,
+                        "records": remote_changes.record_count,
+                    },
+                )
+                return
             if load_result.source == "empty" and load_result.warning:
                 self._state_streamer.record(
                     "data.supabase_realtime_refresh_failed",
@@ -504,6 +676,7 @@ class WindowStorageUpdateService(WindowBoundService):
                 return
 
             migrated = self._apply_tracker_bundle(load_result.bundle, refresh_ui=True)
+            self._supabase_refresh_needs_full_load = False
             if migrated:
                 self._persist_tracker_data(show_error_dialog=False)
             if self._supabase_connection_state != "connected":
@@ -549,14 +722,11 @@ class WindowStorageUpdateService(WindowBoundService):
 
     def _snapshot_tracker_bundle(self) -> TrackerDataBundleV3:
         return TrackerDataBundleV3(
-            contacts=[ContactRecord.from_mapping(record.to_mapping()) for record in self._contacts],
-            jurisdictions=[JurisdictionRecord.from_mapping(record.to_mapping()) for record in self._jurisdictions],
-            properties=[PropertyRecord.from_mapping(record.to_mapping()) for record in self._properties],
-            permits=[PermitRecord.from_mapping(record.to_mapping()) for record in self._permits],
-            document_templates=[
-                DocumentChecklistTemplate.from_mapping(record.to_mapping())
-                for record in self._document_templates
-            ],
+            contacts=[record.clone() for record in self._contacts],
+            jurisdictions=[record.clone() for record in self._jurisdictions],
+            properties=[record.clone() for record in self._properties],
+            permits=[record.clone() for record in self._permits],
+            document_templates=[record.clone() for record in self._document_templates],
             active_document_template_ids=dict(self._active_document_template_ids),
         )
 
@@ -734,6 +904,7 @@ class WindowStorageUpdateService(WindowBoundService):
         self._properties = list(cloned_bundle.properties)
         self._permits = list(cloned_bundle.permits)
         self._document_templates = list(cloned_bundle.document_templates)
+        self._tracker_index.rebuild()
         self._active_document_template_ids = dict(cloned_bundle.active_document_template_ids)
         before_active_templates = dict(self._active_document_template_ids)
         self._prune_active_document_template_ids()
@@ -749,11 +920,10 @@ class WindowStorageUpdateService(WindowBoundService):
                 migrated = True
 
         for permit in self._permits:
-            before_status = permit.status
-            changed = ensure_default_document_structure(permit)
-            changed = refresh_slot_status_from_documents(permit) or changed
-            permit.status = compute_permit_status(permit.events, fallback=permit.status)
-            if changed or permit.status != before_status:
+            if not permit.detail_loaded:
+                # Normalized when its detail is parsed, on selection or by the hydration pass.
+                continue
+            if permit.refresh_derived_state(normalize_structure=True):
                 migrated = True
 
         for template in self._document_templates:
@@ -765,73 +935,318 @@ class WindowStorageUpdateService(WindowBoundService):
                 template.slots = normalized_slots
                 migrated = True
 
+        if migrated:
+            self._tracker_change_tracker().mark_all()
+
         if refresh_ui:
             self._refresh_all_views()
 
+        self._schedule_permit_detail_hydration()
         return migrated
 
-    def _persist_tracker_data(self, *, show_error_dialog: bool = True) -> bool:
-        bundle = self._snapshot_tracker_bundle()
-        saved_bundle = bundle
-        save_mode = "direct"
+    def _schedule_permit_detail_hydration(self) -> None:
+        timer = getattr(self, "_permit_detail_hydration_timer", None)
+        if not isinstance(timer, QTimer):
+            timer = QTimer(self.window)
+            timer.setInterval(0)
+            timer.timeout.connect(self._hydrate_permit_detail_batch)
+            self._permit_detail_hydration_timer = timer
+        self._permit_detail_hydration_cursor = 0
+        self._permit_detail_hydration_started_at = perf_counter()
+        if any(not permit.detail_loaded for permit in self._permits):
+            timer.start()
+        else:
+            timer.stop()
+
+    def _hydrate_permit_detail_batch(self) -> None:
+        permits = self._permits
+        cursor = int(getattr(self, "_permit_detail_hydration_cursor", 0))
+        deadline = perf_counter() + _PERMIT_DETAIL_HYDRATION_SLICE_SECONDS
+        while cursor < len(permits) and perf_counter() < deadline:
+            permits[cursor].load_detail()
+            cursor += 1
+        self._permit_detail_hydration_cursor = cursor
+        if cursor < len(permits):
+            return
+        self._permit_detail_hydration_timer.stop()
+        db_debug(
+            "tracker.permit_detail.hydrated",
+            permits=len(permits),
+            duration_ms=round((perf_counter() - self._permit_detail_hydration_started_at) * 1000.0, 2),
+        )
+
+    def _persist_tracker_data(
+        self,
+        *,
+        show_error_dialog: bool = True,
+        blocking: bool = False,
+    ) -> bool:
+        payload = self._snapshot_tracker_persist_payload()
+        if blocking:
+            self._wait_for_tracker_persistence()
+            return self._save_tracker_payload_now(payload, show_error_dialog=show_error_dialog)
+        worker = self._ensure_tracker_persistence_worker()
+        worker.submit(self._data_store, payload, show_error_dialog=show_error_dialog)
+        return True
+
+    def _tracker_change_tracker(self) -> TrackerChangeTracker:
+        tracker = getattr(self, "_tracker_changes", None)
+        if not isinstance(tracker, TrackerChangeTracker):
+            tracker = TrackerChangeTracker()
+            self._tracker_changes = tracker
+        return tracker
+
+    def _mark_tracker_dirty(self, entity: str, *record_ids: str) -> None:
+        self._tracker_change_tracker().mark(entity, *record_ids)
+        self._tracker_index.refresh(entity, *record_ids)
+
+    def _mark_tracker_active_templates_dirty(self) -> None:
+        self._tracker_change_tracker().mark_active_document_template_ids()
+
+    def _snapshot_tracker_persist_payload(self) -> TrackerDataBundleV3 | TrackerBundleDelta:
+        dirty = self._tracker_change_tracker().take()
+        # Nothing marked means the caller did not report what it touched; fall back to
+        # the full snapshot so the store diffs everything.
+        if dirty.full or dirty.is_empty or not callable(getattr(self._data_store, "save_bundle_delta", None)):
+            return self._snapshot_tracker_bundle()
+        return build_tracker_delta(
+            dirty,
+            records={
+                ENTITY_CONTACTS: self._contacts,
+                ENTITY_JURISDICTIONS: self._jurisdictions,
+                ENTITY_PROPERTIES: self._properties,
+                ENTITY_PERMITS: self._permits,
+                ENTITY_DOCUMENT_TEMPLATES: self._document_templates,
+            },
+            active_document_template_ids=self._active_document_template_ids,
+        )
+
+    def _save_tracker_payload_now(
+        self,
+        payload: TrackerDataBundleV3 | TrackerBundleDelta,
+        *,
+        show_error_dialog: bool,
+    ) -> bool:
         try:
-            self._data_store.save_bundle(bundle)
-        except SupabaseRevisionConflictError as exc:
-            resolved_bundle = self._resolve_supabase_revision_conflict(
-                local_bundle=bundle,
-                conflict_error=exc,
+            save_tracker_payload(self._data_store, payload)
+        except DataStoreRevisionConflictError as exc:
+            return self._handle_tracker_save_conflict(
+                self._snapshot_tracker_bundle(),
+                exc,
+                show_error_dialog=show_error_dialog,
             )
-            if resolved_bundle is None:
-                if show_error_dialog:
-                    self._show_warning_dialog("Storage Error", f"Could not save tracker data.\n\n{exc}")
-                self._state_streamer.record(
-                    "data.save_failed",
-                    source="main_window",
-                    payload={
-                        "backend": self._data_storage_backend,
-                        "folder": str(self._data_storage_folder),
-                        "error": str(exc),
-                        "kind": "revision_conflict",
-                    },
-                )
-                return False
-            saved_bundle = resolved_bundle
-            save_mode = "conflict_resolved"
         except Exception as exc:
-            if show_error_dialog:
-                self._show_warning_dialog("Storage Error", f"Could not save tracker data.\n\n{exc}")
+            self._tracker_change_tracker().mark_all()
+            self._record_tracker_save_failure(str(exc), show_error_dialog=show_error_dialog)
+            return False
+        self._record_tracker_saved(mode="direct")
+        return True
+
+    def _handle_tracker_save_conflict(
+        self,
+        bundle: TrackerDataBundleV3,
+        conflict_error: DataStoreRevisionConflictError,
+        *,
+        show_error_dialog: bool,
+    ) -> bool:
+        if isinstance(conflict_error, LocalRevisionConflictError):
+            return self._handle_local_save_conflict(conflict_error, show_error_dialog=show_error_dialog)
+        if not isinstance(conflict_error, SupabaseRevisionConflictError):
+            return False
+        resolved_bundle = self._resolve_supabase_revision_conflict(
+            local_bundle=bundle,
+            conflict_error=conflict_error,
+        )
+        if resolved_bundle is None:
+            self._record_tracker_save_failure(
+                str(conflict_error),
+                show_error_dialog=show_error_dialog,
+                kind="revision_conflict",
+            )
+            return False
+        if resolved_bundle.to_payload() != bundle.to_payload():
+            self._apply_tracker_bundle(resolved_bundle, refresh_ui=True)
+        self._record_tracker_saved(mode="conflict_resolved")
+        return True
+
+    def _handle_local_save_conflict(
+        self,
+        conflict_error: LocalRevisionConflictError,
+        *,
+        show_error_dialog: bool,
+    ) -> bool:
+        data_store = self._data_store
+        records = set(conflict_error.records)
+        max_attempts = 3
+        for attempt in range(1, max_attempts + 1):
+            try:
+                changes = data_store.fetch_external_changes()
+                if changes is not None:
+                    # The other instance saved first, so its version of shared records wins;
+                    # re-saving the snapshot then writes only the edits it did not touch.
+                    self._apply_external_tracker_changes(changes)
+                data_store.save_bundle(self._snapshot_tracker_bundle())
+            except LocalRevisionConflictError as retry_conflict:
+                records.update(retry_conflict.records)
+                continue
+            except Exception as exc:
+                self._tracker_change_tracker().mark_all()
+                self._record_tracker_save_failure(str(exc), show_error_dialog=show_error_dialog)
+                return False
             self._state_streamer.record(
-                "data.save_failed",
+                "data.local_conflict_resolved",
                 source="main_window",
                 payload={
-                    "backend": self._data_storage_backend,
-                    "folder": str(self._data_storage_folder),
-                    "error": str(exc),
+                    "strategy": "external_preserved",
+                    "expected_revision": conflict_error.expected_revision,
+                    "attempt": attempt,
+                    "records": len(records),
                 },
             )
+            if show_error_dialog:
+                self._show_info_dialog(
+                    "Data Changed Elsewhere",
+                    f"{len(records)} record(s) you edited were also changed by another app instance "
+                    "using this data folder.\n\nTheir version was kept; your other changes were saved.",
+                )
+            self._record_tracker_saved(mode="conflict_resolved")
+            return True
+        self._tracker_change_tracker().mark_all()
+        self._record_tracker_save_failure(
+            str(conflict_error),
+            show_error_dialog=show_error_dialog,
+            kind="revision_conflict",
+        )
+        return False
+
+    def _record_tracker_save_failure(
+        self,
+        message: str,
+        *,
+        show_error_dialog: bool,
+        kind: str = "",
+    ) -> None:
+        if show_error_dialog:
+            self._show_warning_dialog("Storage Error", f"Could not save tracker data.\n\n{message}")
+        payload: dict[str, Any] = {
+            "backend": self._data_storage_backend,
+            "folder": str(self._data_storage_folder),
+            "error": message,
+        }
+        if kind:
+            payload["kind"] = kind
+        self._state_streamer.record("data.save_failed", source="main_window", payload=payload)
+
+    def _record_tracker_saved(self, *, mode: str, coalesced: int = 0) -> None:
+        payload: dict[str, Any] = {
+            "backend": self._data_storage_backend,
+            "folder": str(self._data_storage_folder),
+            "path": str(self._data_store.storage_file_path),
+            "mode": mode,
+            "contacts": len(self._contacts),
+            "jurisdictions": len(self._jurisdictions),
+            "properties": len(self._properties),
+            "permits": len(self._permits),
+            "document_templates": len(self._document_templates),
+        }
+        if coalesced:
+            payload["coalesced"] = coalesced
+        self._state_streamer.record("data.saved", source="main_window", payload=payload)
+        self._flush_pending_supabase_refresh_if_ready()
+
+    def _ensure_tracker_persistence_worker(self) -> TrackerPersistenceWorker:
+        worker = getattr(self, "_tracker_persistence_worker", None)
+        thread = getattr(self, "_tracker_persistence_thread", None)
+        if isinstance(worker, TrackerPersistenceWorker) and isinstance(thread, QThread):
+            return worker
+        worker = TrackerPersistenceWorker()
+        thread = QThread(self.window)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.saved.connect(self._on_tracker_persist_saved)
+        worker.failed.connect(self._on_tracker_persist_failed)
+        worker.conflict.connect(self._on_tracker_persist_conflict)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._tracker_persistence_worker = worker
+        self._tracker_persistence_thread = thread
+        thread.start()
+        return worker
+
+    def _tracker_persistence_pending(self) -> bool:
+        worker = getattr(self, "_tracker_persistence_worker", None)
+        if not isinstance(worker, TrackerPersistenceWorker):
             return False
+        return worker.has_pending_work()
+
+    def _wait_for_tracker_persistence(self) -> None:
+        worker = getattr(self, "_tracker_persistence_worker", None)
+        if isinstance(worker, TrackerPersistenceWorker):
+            worker.wait_until_idle()
+
+    def _shutdown_tracker_persistence(self) -> None:
+        worker = getattr(self, "_tracker_persistence_worker", None)
+        thread = getattr(self, "_tracker_persistence_thread", None)
+        if isinstance(worker, TrackerPersistenceWorker):
+            worker.wait_until_idle()
+            worker.stop()
+        if isinstance(thread, QThread):
+            try:
+                thread.quit()
+                thread.wait()
+            except Exception:
+                pass
+        self._tracker_persistence_worker = None
+        self._tracker_persistence_thread = None
 
-        if save_mode == "conflict_resolved":
-            if saved_bundle.to_payload() != bundle.to_payload():
-                self._apply_tracker_bundle(saved_bundle, refresh_ui=True)
+    def _on_tracker_persist_saved(self, raw_request: object) -> None:
+        if not isinstance(raw_request, TrackerPersistRequest):
+            return
+        if raw_request.data_store is not self._data_store:
+            return
+        self._record_tracker_saved(mode="background", coalesced=raw_request.coalesced)
+        self._refresh_search_filtered_lists()
+
+    def _refresh_search_filtered_lists(self) -> None:
+        # Store-backed search indexes catch up once the save lands; re-run any
+        # active searches so just-edited records show up.
+        if self._current_search(getattr(self, "_property_search_input", None)):
+            self._refresh_property_list()
+        if self._current_search(getattr(self, "_permit_search_input", None)):
+            self._refresh_permit_list(keep_selected_visible=True)
+        if self._current_search(getattr(self, "_admin_contacts_search_input", None)):
+            self._refresh_admin_contacts_list(select_id=self._admin_selected_contact_id)
+
+    def _on_tracker_persist_failed(self, raw_request: object, message: str) -> None:
+        if not isinstance(raw_request, TrackerPersistRequest):
+            return
+        if raw_request.data_store is not self._data_store:
+            return
+        # The failed change set is gone; make the next save diff the whole bundle.
+        self._tracker_change_tracker().mark_all()
+        self._record_tracker_save_failure(message, show_error_dialog=raw_request.show_error_dialog)
 
-        self._state_streamer.record(
-            "data.saved",
-            source="main_window",
-            payload={
-                "backend": self._data_storage_backend,
-                "folder": str(self._data_storage_folder),
-                "path": str(self._data_store.storage_file_path),
-                "mode": save_mode,
-                "contacts": len(self._contacts),
-                "jurisdictions": len(self._jurisdictions),
-                "properties": len(self._properties),
-                "permits": len(self._permits),
-                "document_templates": len(self._document_templates),
-            },
-        )
-        self._flush_pending_supabase_refresh_if_ready()
-        return True
+    def _on_tracker_persist_conflict(self, raw_request: object, raw_error: object) -> None:
+        worker = getattr(self, "_tracker_persistence_worker", None)
+        try:
+            if not isinstance(raw_request, TrackerPersistRequest):
+                return
+            if not isinstance(raw_error, DataStoreRevisionConflictError):
+                return
+            if raw_request.data_store is not self._data_store:
+                return
+            # Reconcile with the current in-memory state so edits queued behind the
+            # conflicting snapshot are merged too; those queued snapshots are then stale.
+            if isinstance(worker, TrackerPersistenceWorker):
+                worker.discard_pending()
+            self._handle_tracker_save_conflict(
+                self._snapshot_tracker_bundle(),
+                raw_error,
+                show_error_dialog=raw_request.show_error_dialog,
+            )
+        finally:
+            if isinstance(worker, TrackerPersistenceWorker):
+                worker.resume()
 
     def _resolve_supabase_revision_conflict(
         self,
@@ -985,7 +1400,7 @@ class WindowStorageUpdateService(WindowBoundService):
 
         self._close_to_home_view()
         _ = self._apply_tracker_bundle(load_result.bundle, refresh_ui=True)
-        if not self._persist_tracker_data(show_error_dialog=True):
+        if not self._persist_tracker_data(show_error_dialog=True, blocking=True):
             return False
 
         if load_result.warning.strip():
@@ -1008,6 +1423,71 @@ class WindowStorageUpdateService(WindowBoundService):
         )
         return True
 
+    def _on_revision_history_requested(self) -> None:
+        data_store = self._data_store
+        if not callable(getattr(data_store, "list_revisions", None)):
+            self._show_info_dialog(
+                "History / Restore",
+                "Revision history is kept by the local SQLite backend only.",
+            )
+            return
+        # Journal any edits still in memory so the newest revision is the current data.
+        if not self._persist_tracker_data(show_error_dialog=True, blocking=True):
+            return
+        dialog = RevisionHistoryDialog(
+            load_revisions=data_store.list_revisions,
+            diff_against_current=lambda revision: data_store.diff_revisions(
+                revision,
+                data_store.current_revision(),
+            ),
+            restore_revision=self._restore_tracker_revision,
+            parent=self.window,
+            theme_mode=self._dialog_theme_mode(),
+        )
+        dialog.exec()
+
+    def _restore_tracker_revision(self, revision: int) -> bool:
+        data_store = self._data_store
+        if not callable(getattr(data_store, "restore_revision", None)):
+            return False
+        if not self._confirm_discard_inline_form_changes(action_label="Restore Revision"):
+            return False
+        if not self._confirm_discard_admin_view_changes(action_label="Restore Revision"):
+            return False
+        if not self._confirm_discard_template_changes(action_label="Restore Revision"):
+            return False
+
+        confirm = self._confirm_dialog(
+            "Restore Revision",
+            f"Replace current tracker data with revision #{int(revision)}?\n\n"
+            "The current data stays in history and can be restored later.",
+            confirm_text="Restore",
+            cancel_text="Cancel",
+        )
+        if not confirm:
+            return False
+
+        self._wait_for_tracker_persistence()
+        bundle = data_store.restore_revision(int(revision))
+        self._tracker_change_tracker().clear()
+        self._close_to_home_view()
+        if self._apply_tracker_bundle(bundle, refresh_ui=True):
+            self._persist_tracker_data(show_error_dialog=True)
+        self._state_streamer.record(
+            "data.revision_restored",
+            source="main_window",
+            payload={
+                "backend": self._data_storage_backend,
+                "revision": int(revision),
+                "contacts": len(self._contacts),
+                "jurisdictions": len(self._jurisdictions),
+                "properties": len(self._properties),
+                "permits": len(self._permits),
+                "document_templates": len(self._document_templates),
+            },
+        )
+        return True
+
     def _on_data_storage_folder_changed(self, requested_folder: str) -> str:
         target_folder = normalize_data_storage_folder(requested_folder)
         if target_folder == self._data_storage_folder:
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Sequence
 
-from erpermitsys.app.permit_workspace_helpers import parse_iso_datetime
 from erpermitsys.app.tracker_models import (
     ContactRecord,
     PermitEventRecord,
@@ -14,23 +12,17 @@ from erpermitsys.app.tracker_models import (
 TimelineRenderRow = tuple[str, str, str, tuple[str, ...], str]
 
 
-def event_sort_key(event: PermitEventRecord, index: int) -> tuple[datetime, int]:
-    parsed = parse_iso_datetime(event.event_date)
-    if parsed is None:
-        parsed = datetime.min.replace(tzinfo=timezone.utc)
-    return parsed, index
+def event_sort_key(event: PermitEventRecord, index: int) -> tuple[int, int]:
+    return event.date_key(), index
 
 
 def default_business_rows_for_permit(
     permit: PermitRecord,
     contacts: Sequence[ContactRecord],
 ) -> list[TimelineRenderRow]:
-    ordered_events = list(enumerate(permit.events))
-    ordered_events.sort(key=lambda pair: event_sort_key(pair[1], pair[0]))
-
     contacts_by_id = {row.contact_id: row for row in contacts}
     timeline_rows: list[TimelineRenderRow] = []
-    for _index, event in ordered_events:
+    for event in permit.ordered_events():
         event_type = normalize_event_type(event.event_type)
         if event_type == "note":
             continue
@@ -70,12 +62,9 @@ def next_action_rows_for_permit(
     permit: PermitRecord,
     contacts: Sequence[ContactRecord],
 ) -> list[TimelineRenderRow]:
-    ordered_events = list(enumerate(permit.events))
-    ordered_events.sort(key=lambda pair: event_sort_key(pair[1], pair[0]))
-
     contacts_by_id = {row.contact_id: row for row in contacts}
     timeline_rows: list[TimelineRenderRow] = []
-    for _index, event in ordered_events:
+    for event in permit.ordered_events():
         event_type = normalize_event_type(event.event_type)
         if event_type != "note":
             continue
@@ -113,14 +102,4 @@ def next_action_rows_for_permit(
 
 
 def latest_note_event_id_for_permit(permit: PermitRecord) -> str:
-    latest_note_event_id = ""
-    latest_note_key: tuple[datetime, int] | None = None
-    for index, event in enumerate(permit.events):
-        if normalize_event_type(event.event_type) != "note":
-            continue
-        key = event_sort_key(event, index)
-        if latest_note_key is None or key > latest_note_key:
-            latest_note_key = key
-            latest_note_event_id = str(event.event_id or "").strip()
-    return latest_note_event_id
-
+    return permit.latest_note_event_id()
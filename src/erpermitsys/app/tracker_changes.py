@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Sequence
+
+from erpermitsys.app.tracker_models import TrackerDataBundleV3
+
+
+ENTITY_CONTACTS = "contacts"
+ENTITY_JURISDICTIONS = "jurisdictions"
+ENTITY_PROPERTIES = "properties"
+ENTITY_PERMITS = "permits"
+ENTITY_DOCUMENT_TEMPLATES = "document_templates"
+
+TRACKER_ENTITY_ID_KEYS: dict[str, str] = {
+    ENTITY_CONTACTS: "contact_id",
+    ENTITY_JURISDICTIONS: "jurisdiction_id",
+    ENTITY_PROPERTIES: "property_id",
+    ENTITY_PERMITS: "permit_id",
+    ENTITY_DOCUMENT_TEMPLATES: "template_id",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerDirtyState:
+    full: bool = False
+    ids: dict[str, frozenset[str]] = field(default_factory=dict)
+    active_document_template_ids: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.full and not self.active_document_template_ids and not any(self.ids.values())
+
+
+class TrackerChangeTracker:
+    def __init__(self) -> None:
+        self._ids: dict[str, set[str]] = {}
+        self._full = False
+        self._active_document_template_ids = False
+
+    def mark(self, entity: str, *record_ids: str) -> None:
+        if entity not in TRACKER_ENTITY_ID_KEYS:
+            raise ValueError(f"Unknown tracker entity: {entity!r}")
+        bucket = self._ids.setdefault(entity, set())
+        for record_id in record_ids:
+            normalized = str(record_id or "").strip()
+            if normalized:
+                bucket.add(normalized)
+
+    def mark_active_document_template_ids(self) -> None:
+        self._active_document_template_ids = True
+
+    def mark_all(self) -> None:
+        self._full = True
+        self._ids.clear()
+
+    def clear(self) -> None:
+        self._full = False
+        self._active_document_template_ids = False
+        self._ids.clear()
+
+    def take(self) -> TrackerDirtyState:
+        state = TrackerDirtyState(
+            full=self._full,
+            ids={entity: frozenset(ids) for entity, ids in self._ids.items() if ids},
+            active_document_template_ids=self._active_document_template_ids,
+        )
+        self.clear()
+        return state
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerBundleDelta:
+    # entity -> record id -> mapping; None marks a deleted record.
+    rows: dict[str, dict[str, dict[str, Any] | None]] = field(default_factory=dict)
+    active_document_template_ids: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def record_count(self) -> int:
+        return sum(len(rows) for rows in self.rows.values())
+
+    def merged_with(self, newer: "TrackerBundleDelta") -> "TrackerBundleDelta":
+        rows = {entity: dict(entity_rows) for entity, entity_rows in self.rows.items()}
+        for entity, entity_rows in newer.rows.items():
+            rows.setdefault(entity, {}).update(entity_rows)
+        return TrackerBundleDelta(
+            rows=rows,
+            active_document_template_ids=dict(newer.active_document_template_ids),
+        )
+
+    def apply_to_bundle(self, bundle: TrackerDataBundleV3) -> TrackerDataBundleV3:
+        payload = bundle.to_payload()
+        for entity, entity_rows in self.rows.items():
+            id_key = TRACKER_ENTITY_ID_KEYS[entity]
+            merged = {
+                str(row.get(id_key, "") or ""): row
+                for row in payload.get(entity, [])
+                if isinstance(row, dict)
+            }
+            for record_id, row in entity_rows.items():
+                if row is None:
+                    merged.pop(record_id, None)
+                else:
+                    merged[record_id] = row
+            payload[entity] = list(merged.values())
+        payload["active_document_template_ids"] = dict(self.active_document_template_ids)
+        return TrackerDataBundleV3.from_payload(payload, lazy_permit_detail=True)
+
+
+def build_tracker_delta(
+    dirty: TrackerDirtyState,
+    *,
+    records: Mapping[str, Sequence[Any]],
+    active_document_template_ids: Mapping[str, str],
+) -> TrackerBundleDelta:
+    rows: dict[str, dict[str, dict[str, Any] | None]] = {}
+    for entity, record_ids in dirty.ids.items():
+        id_attr = TRACKER_ENTITY_ID_KEYS[entity]
+        wanted = set(record_ids)
+        entity_rows: dict[str, dict[str, Any] | None] = {record_id: None for record_id in wanted}
+        for record in records.get(entity, ()):
+            record_id = str(getattr(record, id_attr, "") or "").strip()
+            if record_id in wanted:
+                entity_rows[record_id] = record.to_mapping()
+        rows[entity] = entity_rows
+    return TrackerBundleDelta(
+        rows=rows,
+        active_document_template_ids=dict(active_document_template_ids),
+    )
+
+
+def coalesce_persist_payloads(
+    older: TrackerDataBundleV3 | TrackerBundleDelta,
+    newer: TrackerDataBundleV3 | TrackerBundleDelta,
+) -> TrackerDataBundleV3 | TrackerBundleDelta:
+    if isinstance(newer, TrackerDataBundleV3):
+        return newer
+    if isinstance(older, TrackerBundleDelta):
+        return older.merged_with(newer)
+    return newer.apply_to_bundle(older)
+
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Callable, Sequence
+
+from erpermitsys.app.permit_table import PermitTable, build_permit_table
+from erpermitsys.app.tracker_changes import (
+    ENTITY_CONTACTS,
+    ENTITY_JURISDICTIONS,
+    ENTITY_PERMITS,
+    ENTITY_PROPERTIES,
+    TRACKER_ENTITY_ID_KEYS,
+)
+from erpermitsys.app.tracker_models import ContactRecord, JurisdictionRecord, PermitRecord, PropertyRecord
+
+
+_INDEXED_ENTITIES: tuple[str, ...] = (
+    ENTITY_CONTACTS,
+    ENTITY_JURISDICTIONS,
+    ENTITY_PROPERTIES,
+    ENTITY_PERMITS,
+)
+_CLOSED_PERMIT_STATUSES = frozenset({"closed", "canceled", "finaled"})
+# Record lists in `_INDEXED_ENTITIES` order.
+TrackerIndexSource = Callable[[], tuple[Sequence[Any], Sequence[Any], Sequence[Any], Sequence[Any]]]
+
+
+class TrackerIndex:
+    """Id lookups and reverse links over the window's record lists.
+
+    Callers `rebuild` after replacing the lists wholesale, `upsert`/`remove` after
+    adding, replacing or deleting a record, and `refresh` after editing one in place.
+    A list that was reassigned or resized without any of those is re-indexed on the
+    next lookup.
+    """
+
+    def __init__(self, source: TrackerIndexSource) -> None:
+        self._source = source
+        self._signature: tuple[tuple[Sequence[Any], int], ...] = ()
+        self._records: dict[str, dict[str, Any]] = {entity: {} for entity in _INDEXED_ENTITIES}
+        self._permits_by_property: dict[str, dict[str, PermitRecord]] = {}
+        self._properties_by_jurisdiction: dict[str, dict[str, PropertyRecord]] = {}
+        # contact id -> (entity, record id) of every record that references it.
+        self._contact_references: dict[str, dict[tuple[str, str], None]] = {}
+        # (entity, record id) -> (parent id, contact ids) it is currently linked under.
+        self._links: dict[tuple[str, str], tuple[str, tuple[str, ...]]] = {}
+        # permit id -> (property id, due ordinal while open, missing required documents).
+        self._permit_aggregates: dict[str, tuple[str, int | None, int]] = {}
+        self._stale_aggregates: dict[str, None] = {}
+        self._property_overdue: dict[str, int] = {}
+        self._property_missing_docs: dict[str, int] = {}
+        self._aggregate_day = 0
+        self._permit_table: PermitTable | None = None
+        self.rebuild_count = 0
+
+    def rebuild(self) -> None:
+        lists = self._source()
+        for records in self._records.values():
+            records.clear()
+        self._permits_by_property.clear()
+        self._properties_by_jurisdiction.clear()
+        self._contact_references.clear()
+        self._links.clear()
+        self._permit_aggregates.clear()
+        self._stale_aggregates.clear()
+        self._property_overdue.clear()
+        self._property_missing_docs.clear()
+        self._permit_table = None
+        for entity, records in zip(_INDEXED_ENTITIES, lists):
+            id_key = TRACKER_ENTITY_ID_KEYS[entity]
+            indexed = self._records[entity]
+            for record in records:
+                record_id = getattr(record, id_key)
+                if record_id in indexed:
+                    continue
+                indexed[record_id] = record
+                self._link(entity, record_id, record)
+        self._signature = _signature(lists)
+        self.rebuild_count += 1
+
+    def upsert(self, entity: str, record: Any) -> None:
+        self._sync()
+        record_id = getattr(record, TRACKER_ENTITY_ID_KEYS[entity])
+        self._unlink(entity, record_id)
+        self._records[entity][record_id] = record
+        self._link(entity, record_id, record)
+        self._signature = _signature(self._source())
+
+    def remove(self, entity: str, *record_ids: str) -> None:
+        self._sync()
+        indexed = self._records[entity]
+        for record_id in record_ids:
+            self._unlink(entity, record_id)
+            indexed.pop(record_id, None)
+        self._signature = _signature(self._source())
+
+    def refresh(self, entity: str, *record_ids: str) -> None:
+        if entity not in self._records or not self._sync():
+            return
+        indexed = self._records[entity]
+        for record_id in record_ids:
+            record = indexed.get(record_id)
+            if record is None:
+                continue
+            self._unlink(entity, record_id)
+            self._link(entity, record_id, record)
+
+    def contact_by_id(self, contact_id: str) -> ContactRecord | None:
+        return self._lookup(ENTITY_CONTACTS, contact_id)
+
+    def jurisdiction_by_id(self, jurisdiction_id: str) -> JurisdictionRecord | None:
+        return self._lookup(ENTITY_JURISDICTIONS, jurisdiction_id)
+
+    def property_by_id(self, property_id: str) -> PropertyRecord | None:
+        return self._lookup(ENTITY_PROPERTIES, property_id)
+
+    def permit_by_id(self, permit_id: str) -> PermitRecord | None:
+        return self._lookup(ENTITY_PERMITS, permit_id)
+
+    def permits_for_property(self, property_id: str) -> list[PermitRecord]:
+        target = str(property_id or "").strip()
+        if not target:
+            return []
+        self._sync()
+        return list(self._permits_by_property.get(target, {}).values())
+
+    def properties_for_jurisdiction(self, jurisdiction_id: str) -> list[PropertyRecord]:
+        target = str(jurisdiction_id or "").strip()
+        if not target:
+            return []
+        self._sync()
+        return list(self._properties_by_jurisdiction.get(target, {}).values())
+
+    def contact_references(self, contact_id: str, *, entity: str) -> list[Any]:
+        target = str(contact_id or "").strip()
+        if not target:
+            return []
+        self._sync()
+        indexed = self._records[entity]
+        return [
+            indexed[record_id]
+            for reference_entity, record_id in self._contact_references.get(target, {})
+            if reference_entity == entity and record_id in indexed
+        ]
+
+    def property_overdue_count(self, property_id: str) -> int:
+        """Open permits on the property whose next action was due before today."""
+        target = str(property_id or "").strip()
+        if not target:
+            return 0
+        self._sync()
+        self._refresh_aggregates()
+        return self._property_overdue.get(target, 0)
+
+    def property_missing_docs_count(self, property_id: str) -> int:
+        target = str(property_id or "").strip()
+        if not target:
+            return 0
+        self._sync()
+        self._refresh_aggregates()
+        return self._property_missing_docs.get(target, 0)
+
+    def permit_table(self) -> PermitTable:
+        """Column snapshot of the permits, rebuilt after any permit or property changed."""
+        self._sync()
+        table = self._permit_table
+        if table is None:
+            lists = self._source()
+            table = self._permit_table = build_permit_table(lists[2], lists[3])
+        return table
+
+    def _refresh_aggregates(self) -> None:
+        today = date.today().toordinal()
+        if today != self._aggregate_day:
+            # Due dates do not change at midnight but "before today" does.
+            self._aggregate_day = today
+            self._property_overdue.clear()
+            for property_id, due, _missing in self._permit_aggregates.values():
+                if due is not None and due < today:
+                    self._property_overdue[property_id] = self._property_overdue.get(property_id, 0) + 1
+        if not self._stale_aggregates:
+            return
+        stale = list(self._stale_aggregates)
+        self._stale_aggregates.clear()
+        permits = self._records[ENTITY_PERMITS]
+        for permit_id in stale:
+            permit = permits.get(permit_id)
+            if permit is None:
+                continue
+            property_id = str(permit.property_id or "").strip()
+            if not property_id:
+                continue
+            if permit.detail_loaded:
+                permit.refresh_derived_state()
+            due: int | None = None
+            if permit.status not in _CLOSED_PERMIT_STATUSES:
+                due = permit.date_ordinal("next_action_due")
+            missing = permit.missing_required_document_count()
+            self._permit_aggregates[permit_id] = (property_id, due, missing)
+            self._add_aggregate(property_id, due, missing, 1)
+
+    def _drop_aggregate(self, permit_id: str) -> None:
+        self._stale_aggregates.pop(permit_id, None)
+        aggregate = self._permit_aggregates.pop(permit_id, None)
+        if aggregate is not None:
+            self._add_aggregate(*aggregate, -1)
+
+    def _add_aggregate(self, property_id: str, due: int | None, missing: int, sign: int) -> None:
+        if due is not None and due < self._aggregate_day:
+            self._property_overdue[property_id] = self._property_overdue.get(property_id, 0) + sign
+        if missing:
+            self._property_missing_docs[property_id] = self._property_missing_docs.get(property_id, 0) + sign * missing
+
+    def _lookup(self, entity: str, record_id: str) -> Any:
+        target = str(record_id or "").strip()
+        if not target:
+            return None
+        self._sync()
+        return self._records[entity].get(target)
+
+    def _sync(self) -> bool:
+        # False when this call had to rebuild, so the links are already current.
+        if _same_signature(_signature(self._source()), self._signature):
+            return True
+        self.rebuild()
+        return False
+
+    def _link(self, entity: str, record_id: str, record: Any) -> None:
+        parent_id = ""
+        contact_ids: tuple[str, ...] = ()
+        if entity == ENTITY_PERMITS:
+            parent_id = str(record.property_id or "").strip()
+            contact_ids = tuple(record.party_contact_ids())
+            if parent_id:
+                self._permits_by_property.setdefault(parent_id, {})[record_id] = record
+            self._stale_aggregates[record_id] = None
+        elif entity == ENTITY_PROPERTIES:
+            parent_id = str(record.jurisdiction_id or "").strip()
+            contact_ids = tuple(record.contact_ids)
+            if parent_id:
+                self._properties_by_jurisdiction.setdefault(parent_id, {})[record_id] = record
+        elif entity == ENTITY_JURISDICTIONS:
+            contact_ids = tuple(record.contact_ids)
+        if entity in (ENTITY_PERMITS, ENTITY_PROPERTIES):
+            self._permit_table = None
+        for contact_id in contact_ids:
+            if contact_id:
+                self._contact_references.setdefault(contact_id, {})[(entity, record_id)] = None
+        self._links[(entity, record_id)] = (parent_id, contact_ids)
+
+    def _unlink(self, entity: str, record_id: str) -> None:
+        link = self._links.pop((entity, record_id), None)
+        if link is None:
+            return
+        parent_id, contact_ids = link
+        if entity == ENTITY_PERMITS:
+            self._drop_aggregate(record_id)
+        if entity in (ENTITY_PERMITS, ENTITY_PROPERTIES):
+            self._permit_table = None
+        if parent_id:
+            parents = (
+                self._permits_by_property
+                if entity == ENTITY_PERMITS
+                else self._properties_by_jurisdiction
+            )
+            children = parents.get(parent_id)
+            if children is not None:
+                children.pop(record_id, None)
+                if not children:
+                    del parents[parent_id]
+        for contact_id in contact_ids:
+            references = self._contact_references.get(contact_id)
+            if references is not None:
+                references.pop((entity, record_id), None)
+                if not references:
+                    del self._contact_references[contact_id]
+
+
+def _signature(lists: Sequence[Sequence[Any]]) -> tuple[tuple[Sequence[Any], int], ...]:
+    # The lists themselves, not their ids: a freed list's address is reused by the next one.
+    return tuple((records, len(records)) for records in lists)
+
+
+def _same_signature(
+    current: tuple[tuple[Sequence[Any], int], ...],
+    indexed: tuple[tuple[Sequence[Any], int], ...],
+) -> bool:
+    return len(current) == len(indexed) and all(
+        records is seen and size == seen_size
+        for (records, size), (seen, seen_size) in zip(current, indexed)
+    )
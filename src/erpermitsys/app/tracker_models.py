@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from collections.abc import Mapping
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime, timedelta, timezone
+from itertools import count
+from operator import attrgetter
+from typing import Any, TypeVar
 from uuid import uuid4
 
+from erpermitsys.app.payload_compression import payload_content_hash
+from erpermitsys.app.record_codecs import (
+    COLUMN_INTEGER,
+    COLUMN_JSON,
+    COLUMN_TEXT,
+    FieldCodec,
+    build_encoder,
+    record_codec,
+    stored,
+)
+
 
 _PERMIT_TYPES: tuple[str, ...] = ("building", "demolition", "remodeling")
 _PERMIT_TYPE_ALIASES: dict[str, str] = {
@@ -50,6 +64,7 @@ _SLOT_STATUSES: tuple[str, ...] = (
     "rejected",
     "superseded",
 )
+_MISSING_SLOT_STATUSES = frozenset({"missing", "rejected", "superseded"})
 _DOCUMENT_REVIEW_STATUSES: tuple[str, ...] = (
     "uploaded",
     "accepted",
@@ -231,19 +246,48 @@ def _parse_iso_datetime(value: Any) -> datetime | None:
     return parsed.astimezone(timezone.utc)
 
 
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+# Sort key of a missing or unparseable event date: `datetime.min`, so it orders first.
+EVENT_DATE_KEY_MIN = (datetime.min.replace(tzinfo=timezone.utc) - _EPOCH_UTC) // _ONE_MICROSECOND
+
+
+def _event_date_key(value: Any) -> int:
+    parsed = _parse_iso_datetime(value)
+    if parsed is None:
+        return EVENT_DATE_KEY_MIN
+    return (parsed - _EPOCH_UTC) // _ONE_MICROSECOND
+
+
+def _parse_iso_date_ordinal(value: Any) -> int | None:
+    text = _as_text(value)
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).toordinal()
+    except Exception:
+        pass
+    try:
+        return date.fromisoformat(text[:10]).toordinal()
+    except Exception:
+        return None
+
+
 def compute_permit_status(events: list["PermitEventRecord"], *, fallback: str = "") -> str:
     latest_event: PermitEventRecord | None = None
-    latest_key: tuple[datetime, int] | None = None
+    latest_key: tuple[int, int] | None = None
     for index, event in enumerate(events):
         event_type = normalize_event_type(event.event_type)
         if event_type not in _MAJOR_EVENT_TYPES:
             continue
-        parsed_date = _parse_iso_datetime(event.event_date) or datetime.min.replace(tzinfo=timezone.utc)
-        candidate_key = (parsed_date, index)
+        candidate_key = (event.date_key(), index)
         if latest_key is None or candidate_key > latest_key:
             latest_key = candidate_key
             latest_event = event
+    return _status_from_latest_major(latest_event, fallback)
 
+
+def _status_from_latest_major(latest_event: "PermitEventRecord | None", fallback: str) -> str:
     if latest_event is not None:
         return normalize_event_type(latest_event.event_type)
 
@@ -258,12 +302,87 @@ def event_affects_status(event_type: Any) -> bool:
     return normalize_event_type(event_type) in _MAJOR_EVENT_TYPES
 
 
+def _normalize_jurisdiction_type(value: Any) -> str:
+    return "city" if _as_text(value).casefold() == "city" else "county"
+
+
+def _normalize_stored_slot_id(value: Any) -> str:
+    return normalize_slot_id(value) or _as_text(value)
+
+
+# Storage codecs for record fields; see `record_codecs`.
+_TEXT = FieldCodec(
+    COLUMN_TEXT,
+    normalize=_as_text,
+    inline="({value}.strip() if {value}.__class__ is str else {normalize}({value}))",
+)
+_ID = FieldCodec(COLUMN_TEXT, normalize=_safe_uuid)
+_TEXT_LIST = FieldCodec(COLUMN_JSON, normalize=_parse_text_list, is_list=True)
+_LIST_COLOR = FieldCodec(COLUMN_TEXT, normalize=normalize_list_color)
+_PERMIT_TYPE = FieldCodec(COLUMN_TEXT, normalize=normalize_permit_type, empty="building")
+_EVENT_TYPE = FieldCodec(COLUMN_TEXT, normalize=normalize_event_type, empty="note")
+_SLOT_ID = FieldCodec(COLUMN_TEXT, normalize=_normalize_stored_slot_id)
+_SLOT_STATUS = FieldCodec(COLUMN_TEXT, normalize=normalize_slot_status, empty="missing")
+_REVIEW_STATUS = FieldCodec(COLUMN_TEXT, normalize=normalize_document_review_status, empty="uploaded")
+_JURISDICTION_TYPE = FieldCodec(COLUMN_TEXT, normalize=_normalize_jurisdiction_type, empty="county")
+_POSITIVE_INT = FieldCodec(COLUMN_INTEGER, normalize=_as_positive_int, empty=1)
+_NON_NEGATIVE_INT = FieldCodec(COLUMN_INTEGER, normalize=_as_non_negative_int, empty=0)
+_BOOL = FieldCodec(COLUMN_INTEGER, normalize=bool, empty=False)
+
+
+def _records(item: type) -> FieldCodec:
+    return FieldCodec(COLUMN_JSON, is_list=True, item=item)
+
+
+_RecordT = TypeVar("_RecordT")
+
+
+def _copy_record(record: _RecordT) -> _RecordT:
+    # Field-by-field copy of a slots record without re-running its normalizers;
+    # callers replace list fields with their own copies.
+    copied = object.__new__(type(record))
+    for name in type(record).__slots__:  # type: ignore[attr-defined]
+        setattr(copied, name, getattr(record, name))
+    return copied
+
+
+class _ContentHash:
+    # Holder for a record's (state key, content hash). Shared between a record and its
+    # `_copy_record` copies; the pair is replaced as a whole so another thread never
+    # reads a key with the wrong hash.
+    __slots__ = ("entry",)
+
+    def __init__(self) -> None:
+        self.entry: tuple[Any, str] | None = None
+
+
+def _record_content_hash(record: Any, key: Any) -> str:
+    holder: _ContentHash = record._content_hash
+    entry = holder.entry
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    value = payload_content_hash(record.to_mapping())
+    holder.entry = (key, value)
+    return value
+
+
+def _state_key(value: Any) -> Any:
+    # Value snapshot of a record's fields, nested lists and records included.
+    if isinstance(value, list):
+        return tuple(_state_key(entry) for entry in value)
+    names = _STATE_KEY_FIELDS.get(type(value))
+    if names is None:
+        return value
+    return tuple(_state_key(getattr(value, name)) for name in names)
+
+
+@record_codec
 @dataclass(slots=True)
 class ContactMethodRecord:
-    label: str = ""
-    emails: list[str] = field(default_factory=list)
-    numbers: list[str] = field(default_factory=list)
-    note: str = ""
+    label: str = stored(_TEXT, default="")
+    emails: list[str] = stored(_TEXT_LIST, default_factory=list)
+    numbers: list[str] = stored(_TEXT_LIST, default_factory=list)
+    note: str = stored(_TEXT, default="")
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "ContactMethodRecord":
@@ -276,13 +395,11 @@ class ContactMethodRecord:
             note=_as_text(value.get("note") or value.get("details")),
         )
 
-    def to_mapping(self) -> dict[str, str | list[str]]:
-        return {
-            "label": _as_text(self.label),
-            "emails": _parse_text_list(self.emails),
-            "numbers": _parse_text_list(self.numbers),
-            "note": _as_text(self.note),
-        }
+    def clone(self) -> "ContactMethodRecord":
+        record = _copy_record(self)
+        record.emails = list(self.emails)
+        record.numbers = list(self.numbers)
+        return record
 
 
 def _normalize_contact_methods(methods: list[ContactMethodRecord]) -> list[ContactMethodRecord]:
@@ -339,15 +456,17 @@ def _parse_contact_methods(value: Any) -> list[ContactMethodRecord]:
     return _normalize_contact_methods(rows)
 
 
+@record_codec
 @dataclass(slots=True)
 class ContactRecord:
-    contact_id: str
-    name: str
-    numbers: list[str] = field(default_factory=list)
-    emails: list[str] = field(default_factory=list)
-    roles: list[str] = field(default_factory=list)
-    contact_methods: list[ContactMethodRecord] = field(default_factory=list)
-    list_color: str = ""
+    contact_id: str = stored(_ID)
+    name: str = stored(_TEXT)
+    numbers: list[str] = stored(_TEXT_LIST, default_factory=list)
+    emails: list[str] = stored(_TEXT_LIST, default_factory=list)
+    roles: list[str] = stored(_TEXT_LIST, default_factory=list)
+    contact_methods: list[ContactMethodRecord] = stored(_records(ContactMethodRecord), default_factory=list)
+    list_color: str = stored(_LIST_COLOR, default="")
+    _content_hash: _ContentHash = field(default_factory=_ContentHash, init=False, repr=False, compare=False)
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "ContactRecord":
@@ -407,18 +526,32 @@ class ContactRecord:
             "list_color": normalize_list_color(self.list_color),
         }
 
+    def content_hash(self) -> str:
+        """Hash of `to_mapping()`, recomputed only after a field changed."""
+        return _record_content_hash(self, _state_key(self))
+
+    def clone(self) -> "ContactRecord":
+        record = _copy_record(self)
+        record.numbers = list(self.numbers)
+        record.emails = list(self.emails)
+        record.roles = list(self.roles)
+        record.contact_methods = [method.clone() for method in self.contact_methods]
+        return record
+
 
+@record_codec
 @dataclass(slots=True)
 class JurisdictionRecord:
-    jurisdiction_id: str
-    name: str
-    jurisdiction_type: str = "county"
-    parent_county: str = ""
-    portal_urls: list[str] = field(default_factory=list)
-    contact_ids: list[str] = field(default_factory=list)
-    portal_vendor: str = ""
-    notes: str = ""
-    list_color: str = ""
+    jurisdiction_id: str = stored(_ID)
+    name: str = stored(_TEXT)
+    jurisdiction_type: str = stored(_JURISDICTION_TYPE, default="county")
+    parent_county: str = stored(_TEXT, default="")
+    portal_urls: list[str] = stored(_TEXT_LIST, default_factory=list)
+    contact_ids: list[str] = stored(_TEXT_LIST, default_factory=list)
+    portal_vendor: str = stored(_TEXT, default="")
+    notes: str = stored(_TEXT, default="")
+    list_color: str = stored(_LIST_COLOR, default="")
+    _content_hash: _ContentHash = field(default_factory=_ContentHash, init=False, repr=False, compare=False)
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "JurisdictionRecord":
@@ -447,31 +580,35 @@ class JurisdictionRecord:
             ),
         )
 
-    def to_mapping(self) -> dict[str, str | list[str]]:
-        return {
-            "jurisdiction_id": _safe_uuid(self.jurisdiction_id),
-            "name": _as_text(self.name),
-            "jurisdiction_type": "city" if _as_text(self.jurisdiction_type).casefold() == "city" else "county",
-            "parent_county": _as_text(self.parent_county),
-            "portal_urls": _parse_text_list(self.portal_urls),
-            "contact_ids": _parse_text_list(self.contact_ids),
-            "portal_vendor": _as_text(self.portal_vendor),
-            "notes": _as_text(self.notes),
-            "list_color": normalize_list_color(self.list_color),
-        }
+    def content_hash(self) -> str:
+        """Hash of `to_mapping()`, recomputed only after a field changed."""
+        return _record_content_hash(self, _state_key(self))
+
+    def clone(self) -> "JurisdictionRecord":
+        record = _copy_record(self)
+        record.portal_urls = list(self.portal_urls)
+        record.contact_ids = list(self.contact_ids)
+        return record
 
 
+@record_codec
 @dataclass(slots=True)
 class PropertyRecord:
-    property_id: str
-    display_address: str
-    parcel_id: str
-    parcel_id_norm: str = ""
-    jurisdiction_id: str = ""
-    contact_ids: list[str] = field(default_factory=list)
-    list_color: str = ""
-    tags: list[str] = field(default_factory=list)
-    notes: str = ""
+    property_id: str = stored(_ID)
+    display_address: str = stored(_TEXT)
+    parcel_id: str = stored(_TEXT)
+    parcel_id_norm: str = stored(
+        _TEXT,
+        default="",
+        fallback="parcel_id",
+        fallback_normalize=normalize_parcel_id,
+    )
+    jurisdiction_id: str = stored(_TEXT, default="")
+    contact_ids: list[str] = stored(_TEXT_LIST, default_factory=list)
+    list_color: str = stored(_LIST_COLOR, default="")
+    tags: list[str] = stored(_TEXT_LIST, default_factory=list)
+    notes: str = stored(_TEXT, default="")
+    _content_hash: _ContentHash = field(default_factory=_ContentHash, init=False, repr=False, compare=False)
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "PropertyRecord":
@@ -497,27 +634,23 @@ class PropertyRecord:
             notes=_as_text(value.get("notes")),
         )
 
-    def to_mapping(self) -> dict[str, str | list[str]]:
-        parcel = _as_text(self.parcel_id)
-        normalized = _as_text(self.parcel_id_norm) or normalize_parcel_id(parcel)
-        return {
-            "property_id": _safe_uuid(self.property_id),
-            "display_address": _as_text(self.display_address),
-            "parcel_id": parcel,
-            "parcel_id_norm": normalized,
-            "jurisdiction_id": _as_text(self.jurisdiction_id),
-            "contact_ids": _parse_text_list(self.contact_ids),
-            "list_color": normalize_list_color(self.list_color),
-            "tags": _parse_text_list(self.tags),
-            "notes": _as_text(self.notes),
-        }
+    def content_hash(self) -> str:
+        """Hash of `to_mapping()`, recomputed only after a field changed."""
+        return _record_content_hash(self, _state_key(self))
 
+    def clone(self) -> "PropertyRecord":
+        record = _copy_record(self)
+        record.contact_ids = list(self.contact_ids)
+        record.tags = list(self.tags)
+        return record
 
+
+@record_codec
 @dataclass(slots=True)
 class PermitDocumentFolder:
-    folder_id: str
-    name: str
-    parent_folder_id: str = ""
+    folder_id: str = stored(_TEXT)
+    name: str = stored(_TEXT)
+    parent_folder_id: str = stored(_TEXT, default="")
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "PermitDocumentFolder":
@@ -529,30 +662,27 @@ class PermitDocumentFolder:
             parent_folder_id=_as_text(value.get("parent_folder_id")),
         )
 
-    def to_mapping(self) -> dict[str, str]:
-        return {
-            "folder_id": _as_text(self.folder_id),
-            "name": _as_text(self.name),
-            "parent_folder_id": _as_text(self.parent_folder_id),
-        }
+    def clone(self) -> "PermitDocumentFolder":
+        return _copy_record(self)
 
 
+@record_codec
 @dataclass(slots=True)
 class PermitDocumentRecord:
-    document_id: str
-    folder_id: str
-    original_name: str
-    stored_name: str
-    relative_path: str
-    slot_id: str = ""
-    cycle_index: int = 1
-    revision_index: int = 1
-    review_status: str = "uploaded"
-    reviewed_at: str = ""
-    review_note: str = ""
-    imported_at: str = ""
-    byte_size: int = 0
-    sha256: str = ""
+    document_id: str = stored(_TEXT)
+    folder_id: str = stored(_TEXT)
+    original_name: str = stored(_TEXT)
+    stored_name: str = stored(_TEXT)
+    relative_path: str = stored(_TEXT)
+    slot_id: str = stored(_SLOT_ID, default="")
+    cycle_index: int = stored(_POSITIVE_INT, default=1)
+    revision_index: int = stored(_POSITIVE_INT, default=1)
+    review_status: str = stored(_REVIEW_STATUS, default="uploaded")
+    reviewed_at: str = stored(_TEXT, default="")
+    review_note: str = stored(_TEXT, default="")
+    imported_at: str = stored(_TEXT, default="")
+    byte_size: int = stored(_NON_NEGATIVE_INT, default=0)
+    sha256: str = stored(_TEXT, default="")
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "PermitDocumentRecord":
@@ -583,30 +713,16 @@ class PermitDocumentRecord:
             sha256=_as_text(value.get("sha256")),
         )
 
-    def to_mapping(self) -> dict[str, str | int]:
-        return {
-            "document_id": _as_text(self.document_id),
-            "folder_id": _as_text(self.folder_id),
-            "original_name": _as_text(self.original_name),
-            "stored_name": _as_text(self.stored_name),
-            "relative_path": _as_text(self.relative_path),
-            "slot_id": normalize_slot_id(self.slot_id) or _as_text(self.slot_id),
-            "cycle_index": _as_positive_int(self.cycle_index),
-            "revision_index": _as_positive_int(self.revision_index),
-            "review_status": normalize_document_review_status(self.review_status),
-            "reviewed_at": _as_text(self.reviewed_at),
-            "review_note": _as_text(self.review_note),
-            "imported_at": _as_text(self.imported_at),
-            "byte_size": _as_non_negative_int(self.byte_size),
-            "sha256": _as_text(self.sha256),
-        }
+    def clone(self) -> "PermitDocumentRecord":
+        return _copy_record(self)
 
 
+@record_codec
 @dataclass(slots=True)
 class PermitParty:
-    contact_id: str
-    role: str
-    note: str = ""
+    contact_id: str = stored(_TEXT)
+    role: str = stored(_TEXT)
+    note: str = stored(_TEXT, default="")
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "PermitParty":
@@ -618,23 +734,22 @@ class PermitParty:
             note=_as_text(value.get("note")),
         )
 
-    def to_mapping(self) -> dict[str, str]:
-        return {
-            "contact_id": _as_text(self.contact_id),
-            "role": _as_text(self.role),
-            "note": _as_text(self.note),
-        }
+    def clone(self) -> "PermitParty":
+        return _copy_record(self)
 
 
+@record_codec
 @dataclass(slots=True)
 class PermitEventRecord:
-    event_id: str
-    event_type: str
-    event_date: str
-    summary: str = ""
-    detail: str = ""
-    actor_contact_id: str = ""
-    attachments: list[str] = field(default_factory=list)
+    event_id: str = stored(_ID)
+    event_type: str = stored(_EVENT_TYPE)
+    event_date: str = stored(_TEXT)
+    summary: str = stored(_TEXT, default="")
+    detail: str = stored(_TEXT, default="")
+    actor_contact_id: str = stored(_TEXT, default="")
+    attachments: list[str] = stored(_TEXT_LIST, default_factory=list)
+    # (event_date, key) for the value `date_key` last parsed.
+    _date_key: tuple[str, int] | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "PermitEventRecord":
@@ -650,27 +765,64 @@ class PermitEventRecord:
             attachments=_parse_text_list(value.get("attachments")),
         )
 
-    def to_mapping(self) -> dict[str, str | list[str]]:
-        return {
-            "event_id": _safe_uuid(self.event_id),
-            "event_type": normalize_event_type(self.event_type),
-            "event_date": _as_text(self.event_date),
-            "summary": _as_text(self.summary),
-            "detail": _as_text(self.detail),
-            "actor_contact_id": _as_text(self.actor_contact_id),
-            "attachments": _parse_text_list(self.attachments),
-        }
+    def clone(self) -> "PermitEventRecord":
+        record = _copy_record(self)
+        record.attachments = list(self.attachments)
+        return record
+
+    def date_key(self) -> int:
+        """`event_date` as UTC microseconds since the epoch, parsed once per value."""
+        cached = self._date_key
+        if cached is not None and cached[0] == self.event_date:
+            return cached[1]
+        key = _event_date_key(self.event_date)
+        self._date_key = (self.event_date, key)
+        return key
+
+
+def _sort_events_by_date(events: list[PermitEventRecord]) -> bool:
+    """Stable-sort `events` by date in place, keeping insertion order for equal dates.
+
+    Returns False without sorting when the list is already in order.
+    """
+    previous = EVENT_DATE_KEY_MIN
+    for event in events:
+        key = event.date_key()
+        if key < previous:
+            events.sort(key=PermitEventRecord.date_key)
+            return True
+        previous = key
+    return False
+
+
+def _latest_events(
+    events: list[PermitEventRecord],
+) -> tuple[PermitEventRecord | None, PermitEventRecord | None]:
+    """(latest major event, latest note) of date-ordered `events`, scanning from the end."""
+    latest_major: PermitEventRecord | None = None
+    latest_note: PermitEventRecord | None = None
+    for event in reversed(events):
+        event_type = normalize_event_type(event.event_type)
+        if event_type in _MAJOR_EVENT_TYPES:
+            if latest_major is None:
+                latest_major = event
+        elif event_type == "note" and latest_note is None:
+            latest_note = event
+        if latest_major is not None and latest_note is not None:
+            break
+    return latest_major, latest_note
 
 
+@record_codec
 @dataclass(slots=True)
 class PermitDocumentSlot:
-    slot_id: str
-    label: str
-    required: bool
-    status: str = "missing"
-    folder_id: str = ""
-    active_cycle: int = 1
-    notes: str = ""
+    slot_id: str = stored(_SLOT_ID)
+    label: str = stored(_TEXT)
+    required: bool = stored(_BOOL)
+    status: str = stored(_SLOT_STATUS, default="missing")
+    folder_id: str = stored(_SLOT_ID, default="", fallback="slot_id")
+    active_cycle: int = stored(_POSITIVE_INT, default=1)
+    notes: str = stored(_TEXT, default="")
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "PermitDocumentSlot":
@@ -690,27 +842,19 @@ class PermitDocumentSlot:
             notes=_as_text(value.get("notes")),
         )
 
-    def to_mapping(self) -> dict[str, str | bool]:
-        slot_id = normalize_slot_id(self.slot_id) or _as_text(self.slot_id)
-        folder_id = normalize_slot_id(self.folder_id) or _as_text(self.folder_id) or slot_id
-        return {
-            "slot_id": slot_id,
-            "label": _as_text(self.label),
-            "required": bool(self.required),
-            "status": normalize_slot_status(self.status),
-            "folder_id": folder_id,
-            "active_cycle": _as_positive_int(self.active_cycle),
-            "notes": _as_text(self.notes),
-        }
+    def clone(self) -> "PermitDocumentSlot":
+        return _copy_record(self)
 
 
+@record_codec
 @dataclass(slots=True)
 class DocumentChecklistTemplate:
-    template_id: str
-    name: str
-    permit_type: str = "building"
-    slots: list[PermitDocumentSlot] = field(default_factory=list)
-    notes: str = ""
+    template_id: str = stored(_ID)
+    name: str = stored(_TEXT)
+    permit_type: str = stored(_PERMIT_TYPE, default="building")
+    slots: list[PermitDocumentSlot] = stored(_records(PermitDocumentSlot), default_factory=list)
+    notes: str = stored(_TEXT, default="")
+    _content_hash: _ContentHash = field(default_factory=_ContentHash, init=False, repr=False, compare=False)
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "DocumentChecklistTemplate":
@@ -747,26 +891,407 @@ class DocumentChecklistTemplate:
             "notes": _as_text(self.notes),
         }
 
+    def content_hash(self) -> str:
+        """Hash of `to_mapping()`, recomputed only after a field changed."""
+        return _record_content_hash(self, _state_key(self))
+
+    def clone(self) -> "DocumentChecklistTemplate":
+        record = _copy_record(self)
+        record.slots = [slot.clone() for slot in self.slots]
+        return record
+
+
+_STATE_KEY_FIELDS: dict[type, tuple[str, ...]] = {
+    record_type: tuple(entry.name for entry in fields(record_type) if not entry.name.startswith("_"))
+    for record_type in (
+        ContactMethodRecord,
+        ContactRecord,
+        JurisdictionRecord,
+        PropertyRecord,
+        PermitDocumentSlot,
+        PermitDocumentFolder,
+        PermitDocumentRecord,
+        PermitEventRecord,
+        PermitParty,
+        DocumentChecklistTemplate,
+    )
+}
+# `_state_key` of the permit detail records whose fields are all scalars.
+_PARTY_STATE = attrgetter(*_STATE_KEY_FIELDS[PermitParty])
+_FOLDER_STATE = attrgetter(*_STATE_KEY_FIELDS[PermitDocumentFolder])
+_SLOT_STATE = attrgetter(*_STATE_KEY_FIELDS[PermitDocumentSlot])
+_DOCUMENT_STATE = attrgetter(*_STATE_KEY_FIELDS[PermitDocumentRecord])
+_EVENT_SCALAR_STATE = attrgetter(*(name for name in _STATE_KEY_FIELDS[PermitEventRecord] if name != "attachments"))
+
+
+def _event_state(event: PermitEventRecord) -> tuple[Any, ...]:
+    # Attachments is the one list field; snapshot it so in-place edits change the key.
+    return (_EVENT_SCALAR_STATE(event), tuple(event.attachments))
+
 
+@dataclass(slots=True)
+class _PermitDerivedState:
+    key: tuple[int, ...]
+    status: str
+    file_counts: dict[str, int] | None = None
+    missing_required: int | None = None
+    # Last major event and last note of the date-ordered events, once `latest_known`.
+    latest_major: PermitEventRecord | None = None
+    latest_note: PermitEventRecord | None = None
+    latest_known: bool = False
+
+
+@record_codec
 @dataclass(slots=True)
 class PermitRecord:
-    permit_id: str
-    property_id: str
-    permit_type: str = "building"
-    permit_number: str = ""
-    status: str = "requested"
-    next_action_text: str = ""
-    next_action_due: str = ""
-    request_date: str = ""
-    application_date: str = ""
-    issued_date: str = ""
-    final_date: str = ""
-    completion_date: str = ""
-    parties: list[PermitParty] = field(default_factory=list)
-    events: list[PermitEventRecord] = field(default_factory=list)
-    document_slots: list[PermitDocumentSlot] = field(default_factory=list)
-    document_folders: list[PermitDocumentFolder] = field(default_factory=list)
-    documents: list[PermitDocumentRecord] = field(default_factory=list)
+    permit_id: str = stored(_ID)
+    property_id: str = stored(_TEXT)
+    permit_type: str = stored(_PERMIT_TYPE, default="building")
+    permit_number: str = stored(_TEXT, default="")
+    status: str = stored(_EVENT_TYPE, default="requested")
+    next_action_text: str = stored(_TEXT, default="")
+    next_action_due: str = stored(_TEXT, default="")
+    request_date: str = stored(_TEXT, default="")
+    application_date: str = stored(_TEXT, default="")
+    issued_date: str = stored(_TEXT, default="")
+    final_date: str = stored(_TEXT, default="")
+    completion_date: str = stored(_TEXT, default="")
+    parties: list[PermitParty] = stored(_records(PermitParty), default_factory=list)
+    events: list[PermitEventRecord] = stored(_records(PermitEventRecord), default_factory=list)
+    document_slots: list[PermitDocumentSlot] = stored(_records(PermitDocumentSlot), default_factory=list)
+    document_folders: list[PermitDocumentFolder] = stored(_records(PermitDocumentFolder), default_factory=list)
+    documents: list[PermitDocumentRecord] = stored(_records(PermitDocumentRecord), default_factory=list)
+    # Stored mapping whose detail lists have not been parsed yet (summary-first load).
+    _detail_source: Mapping[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    # The detail source was written by `to_mapping` and can skip the normalizers.
+    _detail_trusted: bool = field(default=False, init=False, repr=False, compare=False)
+    # Renewed by `mark_detail_changed` for in-place edits of events, documents or slots,
+    # and whenever one of those lists is assigned; resized lists are picked up without it.
+    _detail_version: int = field(default=0, init=False, repr=False, compare=False)
+    _derived: _PermitDerivedState | None = field(default=None, init=False, repr=False, compare=False)
+    # field name -> (value, ordinal) for the values `date_ordinal` last parsed.
+    _date_ordinals: dict[str, tuple[str, int | None]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _content_hash: _ContentHash = field(default_factory=_ContentHash, init=False, repr=False, compare=False)
+    # (holder, state key) of the record this one was cloned from, while both are unchanged.
+    _content_origin: tuple[_ContentHash, Any, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _PERMIT_DERIVED_LISTS:
+            # Drawn from a shared counter: `__init__` assigns the lists before the version.
+            object.__setattr__(self, "_detail_version", next(_DETAIL_VERSIONS))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots: detail fields of a summary-loaded permit.
+        if name in _PERMIT_DETAIL_FIELDS and self.load_detail():
+            return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @classmethod
+    def from_summary_mapping(cls, value: Mapping[str, Any], *, trusted: bool = False) -> "PermitRecord":
+        """Parse only list-card fields; `value` must be a mapping written by `to_mapping`."""
+        if trusted:
+            record = cls.__new__(cls)
+            for name in _PERMIT_SUMMARY_FIELDS:
+                setattr(record, name, value.get(name, ""))
+            record._detail_source = value
+            record._detail_trusted = True
+            record._detail_version = 0
+            record._derived = None
+            record._date_ordinals = None
+            record._content_hash = _ContentHash()
+            record._content_origin = None
+            return record
+        record = cls.__new__(cls)
+        record.permit_id = _safe_uuid(value.get("permit_id") or value.get("id"))
+        record.property_id = _as_text(value.get("property_id"))
+        record.permit_type = normalize_permit_type(value.get("permit_type") or value.get("category"))
+        record.permit_number = _as_text(value.get("permit_number"))
+        record.status = normalize_event_type(value.get("status") or "requested")
+        record.next_action_text = _as_text(value.get("next_action_text"))
+        record.next_action_due = _as_text(value.get("next_action_due"))
+        record.request_date = _as_text(value.get("request_date"))
+        record.application_date = _as_text(value.get("application_date"))
+        record.issued_date = _as_text(value.get("issued_date"))
+        record.final_date = _as_text(value.get("final_date"))
+        record.completion_date = _as_text(value.get("completion_date"))
+        record._detail_source = value
+        record._detail_trusted = False
+        record._detail_version = 0
+        record._derived = None
+        record._date_ordinals = None
+        record._content_hash = _ContentHash()
+        record._content_origin = None
+        return record
+
+    @property
+    def detail_loaded(self) -> bool:
+        return self._detail_source is None
+
+    def load_detail(self) -> bool:
+        source = self._detail_source
+        if source is None:
+            return False
+        self._detail_source = None
+        trusted = self._detail_trusted
+        self._detail_trusted = False
+        assigned = False
+        for name, parse in _PERMIT_TRUSTED_DETAIL_PARSERS if trusted else _PERMIT_DETAIL_PARSERS:
+            # Keep lists assigned while the record was still summary-only.
+            if _slot_is_set(self, name):
+                assigned = True
+            else:
+                setattr(self, name, parse(source.get(name)))
+        if trusted and not assigned and not _sort_events_by_date(self.events):
+            # Written by `to_mapping`, which already refreshed slot and permit status.
+            self._derived = _PermitDerivedState(key=self._derived_key(), status=self.status)
+            return True
+        self.refresh_derived_state(normalize_structure=True)
+        return True
+
+    def clone(self) -> "PermitRecord":
+        if self._pending_detail_untouched():
+            record = PermitRecord.__new__(PermitRecord)
+            for name in _PERMIT_SUMMARY_FIELDS:
+                setattr(record, name, getattr(self, name))
+            record._detail_source = self._detail_source
+            record._detail_trusted = self._detail_trusted
+            record._detail_version = 0
+            record._derived = None
+            record._date_ordinals = None
+            self._link_content_hash(record)
+            return record
+        self.load_detail()
+        record = _copy_record(self)
+        record._derived = None
+        record._date_ordinals = None
+        record.parties = [entry.clone() for entry in self.parties]
+        record.events = [entry.clone() for entry in self.events]
+        record.document_slots = [entry.clone() for entry in self.document_slots]
+        record.document_folders = [entry.clone() for entry in self.document_folders]
+        record.documents = [entry.clone() for entry in self.documents]
+        self._link_content_hash(record)
+        return record
+
+    def content_hash(self) -> str:
+        """Hash of `to_mapping()`, recomputed only after the permit changed.
+
+        The key is the permit's value, so any edit is picked up; in-place edits of events,
+        documents or slots still need `mark_detail_changed` to refresh the derived status.
+        """
+        if not self._pending_detail_untouched():
+            # `to_mapping` refreshes first too; key the state it will encode.
+            self.refresh_derived_state()
+        key = self._content_key()
+        entry = self._content_hash.entry
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        origin = self._content_origin
+        if origin is not None:
+            source, source_key, clone_key = origin
+            source_entry = source.entry
+            if key != clone_key:
+                origin = self._content_origin = None
+            elif source_entry is not None and source_entry[0] == source_key:
+                self._content_hash.entry = (key, source_entry[1])
+                return source_entry[1]
+        value = payload_content_hash(self.to_mapping())
+        self._content_hash.entry = (self._content_key(), value)
+        if origin is not None:
+            # A clone saved in the background hashes on behalf of the live record.
+            origin[0].entry = (origin[1], value)
+        return value
+
+    def _link_content_hash(self, record: "PermitRecord") -> None:
+        record._content_hash = _ContentHash()
+        # A fresh clone holds the same values, so both records share one key.
+        key = self._content_key()
+        record._content_origin = (self._content_hash, key, key)
+
+    def _content_key(self) -> tuple[Any, ...]:
+        summary = tuple(getattr(self, name) for name in _PERMIT_SUMMARY_FIELDS)
+        if self._pending_detail_untouched():
+            # Held, not its id: the key must not match a later mapping at a reused address.
+            return (summary, self._detail_source)
+        # By value, not by list identity or length: a mutator that keeps the lengths and
+        # skips `mark_detail_changed` must still change the key.
+        return (
+            summary,
+            tuple(map(_PARTY_STATE, self.parties)),
+            tuple(map(_event_state, self.events)),
+            tuple(map(_SLOT_STATE, self.document_slots)),
+            tuple(map(_FOLDER_STATE, self.document_folders)),
+            tuple(map(_DOCUMENT_STATE, self.documents)),
+        )
+
+    def date_ordinal(self, name: str) -> int | None:
+        """Day ordinal of a date field such as `next_action_due`, parsed once per value."""
+        value = getattr(self, name)
+        ordinals = self._date_ordinals
+        if ordinals is None:
+            ordinals = self._date_ordinals = {}
+        cached = ordinals.get(name)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        ordinal = _parse_iso_date_ordinal(value)
+        ordinals[name] = (value, ordinal)
+        return ordinal
+
+    def party_contact_ids(self) -> list[str]:
+        if self._pending_detail_untouched():
+            rows = self._detail_source.get("parties")  # type: ignore[union-attr]
+            return [
+                _as_text(row.get("contact_id"))
+                for row in (rows if isinstance(rows, list) else ())
+                if isinstance(row, Mapping)
+            ]
+        return [_as_text(party.contact_id) for party in self.parties]
+
+    def mark_detail_changed(self) -> None:
+        """Call after editing an event, document or slot in place."""
+        self._detail_version = next(_DETAIL_VERSIONS)
+
+    def refresh_derived_state(self, *, normalize_structure: bool = False) -> bool:
+        """Refresh slot statuses and permit status unless nothing they read has changed."""
+        derived = self._derived
+        if derived is not None and derived.key == self._derived_key() and derived.status == self.status:
+            return False
+        changed = ensure_default_document_structure(self) if normalize_structure else False
+        changed = refresh_slot_status_from_documents(self) or changed
+        changed = _sort_events_by_date(self.events) or changed
+        latest_major, latest_note = _latest_events(self.events)
+        status = _status_from_latest_major(latest_major, self.status)
+        if status != self.status:
+            self.status = status
+            changed = True
+        self._derived = _PermitDerivedState(
+            key=self._derived_key(),
+            status=status,
+            latest_major=latest_major,
+            latest_note=latest_note,
+            latest_known=True,
+        )
+        return changed
+
+    def ordered_events(self) -> list[PermitEventRecord]:
+        """`events`, which are kept oldest first; events of the same date keep insertion order."""
+        self.refresh_derived_state()
+        return self.events
+
+    def latest_note_event_id(self) -> str:
+        latest_note = self._latest_event_state().latest_note
+        return _as_text(latest_note.event_id) if latest_note is not None else ""
+
+    def insert_event(self, event: PermitEventRecord) -> None:
+        """Add `event` at its date position, after events of the same date, and update the status."""
+        derived = self._latest_event_state()
+        events = self.events
+        key = event.date_key()
+        events.insert(bisect_right(events, key, key=PermitEventRecord.date_key), event)
+        event_type = normalize_event_type(event.event_type)
+        if event_type in _MAJOR_EVENT_TYPES:
+            latest_major = derived.latest_major
+            if latest_major is None or key >= latest_major.date_key():
+                derived.latest_major = event
+                self.status = derived.status = event_type
+        elif event_type == "note":
+            latest_note = derived.latest_note
+            if latest_note is None or key >= latest_note.date_key():
+                derived.latest_note = event
+        self._detail_version = next(_DETAIL_VERSIONS)
+        derived.key = self._derived_key()
+
+    def reposition_event(self, event: PermitEventRecord) -> None:
+        """Call after editing `event` in place: moves it to its date position and updates the status."""
+        self.refresh_derived_state()
+        events = self.events
+        index = next((position for position, row in enumerate(events) if row is event), None)
+        if index is None:
+            return
+        key = event.date_key()
+        if (index > 0 and events[index - 1].date_key() > key) or (
+            index + 1 < len(events) and events[index + 1].date_key() < key
+        ):
+            del events[index]
+            events.insert(bisect_right(events, key, key=PermitEventRecord.date_key), event)
+        self._detail_version = next(_DETAIL_VERSIONS)
+        self._refresh_latest_events()
+
+    def remove_event(self, event_id: str) -> bool:
+        """Remove the event with `event_id` and update the status; False when there is none."""
+        derived = self._latest_event_state()
+        events = self.events
+        index = next(
+            (position for position, row in enumerate(events) if _as_text(row.event_id) == event_id),
+            None,
+        )
+        if index is None:
+            return False
+        event = events.pop(index)
+        self._detail_version = next(_DETAIL_VERSIONS)
+        if event is derived.latest_major or event is derived.latest_note:
+            self._refresh_latest_events()
+        else:
+            derived.key = self._derived_key()
+        return True
+
+    def _latest_event_state(self) -> _PermitDerivedState:
+        self.refresh_derived_state()
+        derived: _PermitDerivedState = self._derived  # type: ignore[assignment]
+        if not derived.latest_known:
+            derived.latest_major, derived.latest_note = _latest_events(self.events)
+            derived.latest_known = True
+        return derived
+
+    def _refresh_latest_events(self) -> None:
+        derived: _PermitDerivedState = self._derived  # type: ignore[assignment]
+        derived.latest_major, derived.latest_note = _latest_events(self.events)
+        derived.latest_known = True
+        self.status = derived.status = _status_from_latest_major(derived.latest_major, self.status)
+        derived.key = self._derived_key()
+
+    def document_file_counts(self) -> dict[str, int]:
+        self.refresh_derived_state()
+        derived = self._derived
+        if derived.file_counts is None:  # type: ignore[union-attr]
+            derived.file_counts = _count_documents_by_slot(self)  # type: ignore[union-attr]
+        return dict(derived.file_counts)  # type: ignore[union-attr]
+
+    def _derived_key(self) -> tuple[int, ...]:
+        events = self.events
+        documents = self.documents
+        slots = self.document_slots
+        return (self._detail_version, len(events), len(documents), len(slots))
+
+    def missing_required_document_count(self) -> int:
+        if self._pending_detail_untouched():
+            # Stored slot statuses were refreshed from documents when they were written.
+            slots = self._detail_source.get("document_slots")  # type: ignore[union-attr]
+            return sum(
+                1
+                for slot in (slots if isinstance(slots, list) else ())
+                if isinstance(slot, Mapping)
+                and _as_bool(slot.get("required"))
+                and normalize_slot_status(slot.get("status")) in _MISSING_SLOT_STATUSES
+            )
+        self.refresh_derived_state(normalize_structure=True)
+        derived = self._derived
+        if derived.missing_required is None:  # type: ignore[union-attr]
+            derived.missing_required = sum(  # type: ignore[union-attr]
+                1
+                for slot in self.document_slots
+                if slot.required and normalize_slot_status(slot.status) in _MISSING_SLOT_STATUSES
+            )
+        return derived.missing_required  # type: ignore[union-attr]
+
+    def _pending_detail_untouched(self) -> bool:
+        return self._detail_source is not None and not any(
+            _slot_is_set(self, name) for name in _PERMIT_DETAIL_FIELDS
+        )
 
     @classmethod
     def from_mapping(cls, value: Mapping[str, Any] | None) -> "PermitRecord":
@@ -796,33 +1321,61 @@ class PermitRecord:
             document_folders=_parse_permit_document_folders(value.get("document_folders")),
             documents=_parse_permit_documents(value.get("documents")),
         )
-        ensure_default_document_structure(record)
-        refresh_slot_status_from_documents(record)
-        record.status = compute_permit_status(record.events, fallback=record.status)
+        record.refresh_derived_state(normalize_structure=True)
         return record
 
     def to_mapping(self) -> dict[str, Any]:
-        refresh_slot_status_from_documents(self)
-        self.status = compute_permit_status(self.events, fallback=self.status)
-        return {
-            "permit_id": _safe_uuid(self.permit_id),
-            "property_id": _as_text(self.property_id),
-            "permit_type": normalize_permit_type(self.permit_type),
-            "permit_number": _as_text(self.permit_number),
-            "status": normalize_event_type(self.status),
-            "next_action_text": _as_text(self.next_action_text),
-            "next_action_due": _as_text(self.next_action_due),
-            "request_date": _as_text(self.request_date),
-            "application_date": _as_text(self.application_date),
-            "issued_date": _as_text(self.issued_date),
-            "final_date": _as_text(self.final_date),
-            "completion_date": _as_text(self.completion_date),
-            "parties": [entry.to_mapping() for entry in self.parties],
-            "events": [entry.to_mapping() for entry in self.events],
-            "document_slots": [entry.to_mapping() for entry in self.document_slots],
-            "document_folders": [entry.to_mapping() for entry in self.document_folders],
-            "documents": [entry.to_mapping() for entry in self.documents],
-        }
+        if self._pending_detail_untouched():
+            source = self._detail_source
+            mapping = self._summary_mapping()
+            for name in _PERMIT_DETAIL_FIELDS:
+                rows = source.get(name)  # type: ignore[union-attr]
+                mapping[name] = [dict(row) for row in rows if isinstance(row, Mapping)] if isinstance(rows, list) else []
+            return mapping
+        self.refresh_derived_state()
+        mapping = self._summary_mapping()
+        mapping.update(
+            {
+                "parties": [entry.to_mapping() for entry in self.parties],
+                "events": [entry.to_mapping() for entry in self.events],
+                "document_slots": [entry.to_mapping() for entry in self.document_slots],
+                "document_folders": [entry.to_mapping() for entry in self.document_folders],
+                "documents": [entry.to_mapping() for entry in self.documents],
+            }
+        )
+        return mapping
+
+
+_PERMIT_SUMMARY_FIELDS: tuple[str, ...] = (
+    "permit_id",
+    "property_id",
+    "permit_type",
+    "permit_number",
+    "status",
+    "next_action_text",
+    "next_action_due",
+    "request_date",
+    "application_date",
+    "issued_date",
+    "final_date",
+    "completion_date",
+)
+_PERMIT_DETAIL_FIELDS: frozenset[str] = frozenset(
+    ("parties", "events", "document_slots", "document_folders", "documents")
+)
+# Detail lists the derived status, slot statuses and file counts are computed from.
+_PERMIT_DERIVED_LISTS: frozenset[str] = frozenset(("events", "document_slots", "documents"))
+_DETAIL_VERSIONS = count(1)
+# Generated encoder for the list-card fields; `to_mapping` adds the detail lists.
+PermitRecord._summary_mapping = build_encoder(PermitRecord, _PERMIT_SUMMARY_FIELDS)  # type: ignore[attr-defined]
+
+
+def _slot_is_set(record: object, name: str) -> bool:
+    try:
+        object.__getattribute__(record, name)
+    except AttributeError:
+        return False
+    return True
 
 
 _DOCUMENT_SLOT_TEMPLATE_BUILDING: tuple[tuple[str, str, bool], ...] = (
@@ -1198,6 +1751,10 @@ def refresh_slot_status_from_documents(permit: PermitRecord) -> bool:
 
 
 def document_file_count_by_slot(permit: PermitRecord) -> dict[str, int]:
+    return permit.document_file_counts()
+
+
+def _count_documents_by_slot(permit: PermitRecord) -> dict[str, int]:
     counts: dict[str, int] = {}
     folder_meta: dict[str, tuple[str, int]] = {}
     for slot in permit.document_slots:
@@ -1227,14 +1784,31 @@ class TrackerDataBundleV3:
     active_document_template_ids: dict[str, str] = field(default_factory=dict)
 
     @classmethod
-    def from_payload(cls, payload: Mapping[str, Any] | None) -> "TrackerDataBundleV3":
+    def from_payload(
+        cls,
+        payload: Mapping[str, Any] | None,
+        *,
+        lazy_permit_detail: bool = False,
+        trusted: bool = False,
+    ) -> "TrackerDataBundleV3":
+        # lazy_permit_detail is only safe for payloads this app wrote itself: permit
+        # detail is parsed on first access instead of up front. trusted additionally
+        # skips the alias lookups and normalizers for permits written by `to_mapping`.
+        # The other entities keep the tolerant parsers: older own-envelope files can
+        # lack newer keys (contact_methods, ...) and they are a small share of load time.
         if not isinstance(payload, Mapping):
             return cls()
+        if lazy_permit_detail:
+            permits = _parse_permit_summaries(payload.get("permits"), trusted=trusted)
+        elif trusted:
+            permits = _parse_trusted_rows(PermitRecord, payload.get("permits"))
+        else:
+            permits = _parse_permits(payload.get("permits"))
         return cls(
             contacts=_parse_contacts(payload.get("contacts")),
             jurisdictions=_parse_jurisdictions(payload.get("jurisdictions")),
             properties=_parse_properties(payload.get("properties")),
-            permits=_parse_permits(payload.get("permits")),
+            permits=permits,
             document_templates=_parse_document_templates(
                 payload.get("document_templates") or payload.get("checklist_templates")
             ),
@@ -1254,7 +1828,14 @@ class TrackerDataBundleV3:
         }
 
     def clone(self) -> "TrackerDataBundleV3":
-        return TrackerDataBundleV3.from_payload(self.to_payload())
+        return TrackerDataBundleV3(
+            contacts=[record.clone() for record in self.contacts],
+            jurisdictions=[record.clone() for record in self.jurisdictions],
+            properties=[record.clone() for record in self.properties],
+            permits=[record.clone() for record in self.permits],
+            document_templates=[record.clone() for record in self.document_templates],
+            active_document_template_ids=dict(self.active_document_template_ids),
+        )
 
 
 TrackerDataBundle = TrackerDataBundleV3
@@ -1448,3 +2029,38 @@ def _parse_permits(value: Any) -> list[PermitRecord]:
             continue
         rows.append(record)
     return rows
+
+
+def _parse_permit_summaries(value: Any, *, trusted: bool = False) -> list[PermitRecord]:
+    if not isinstance(value, list):
+        return []
+    return [
+        PermitRecord.from_summary_mapping(item, trusted=trusted)
+        for item in value
+        if isinstance(item, Mapping)
+    ]
+
+
+def _parse_trusted_rows(record_type: Any, value: Any) -> list[Any]:
+    if not isinstance(value, list):
+        return []
+    return [record_type.from_trusted_mapping(item) for item in value if isinstance(item, Mapping)]
+
+
+_PERMIT_DETAIL_PARSERS = (
+    ("parties", _parse_permit_parties),
+    ("events", _parse_permit_events),
+    ("document_slots", _parse_permit_document_slots),
+    ("document_folders", _parse_permit_document_folders),
+    ("documents", _parse_permit_documents),
+)
+_PERMIT_TRUSTED_DETAIL_PARSERS = tuple(
+    (name, lambda value, record_type=record_type: _parse_trusted_rows(record_type, value))
+    for name, record_type in (
+        ("parties", PermitParty),
+        ("events", PermitEventRecord),
+        ("document_slots", PermitDocumentSlot),
+        ("document_folders", PermitDocumentFolder),
+        ("documents", PermitDocumentRecord),
+    )
+)
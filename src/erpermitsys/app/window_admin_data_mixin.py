@@ -10,6 +10,13 @@ from erpermitsys.app.permit_workspace_helpers import (
     join_multi_values as _join_multi_values,
     parse_multi_values as _parse_multi_values,
 )
+from erpermitsys.app.search_index import SEARCH_KIND_CONTACT
+from erpermitsys.app.tracker_changes import (
+    ENTITY_CONTACTS,
+    ENTITY_JURISDICTIONS,
+    ENTITY_PERMITS,
+    ENTITY_PROPERTIES,
+)
 from erpermitsys.app.tracker_models import (
     ContactMethodRecord,
     ContactRecord,
@@ -371,12 +378,16 @@ class WindowAdminDataMixin:
         widget.blockSignals(True)
         widget.clear()
         shown_contacts = 0
+        ranked_ids = self._search_ranked_ids(SEARCH_KIND_CONTACT, search)
         for contact in sorted(self._contacts, key=lambda row: (row.name.casefold(), row.contact_id)):
             method_rows = self._contact_methods_from_record(contact)
-            search_parts = [contact.name, _join_multi_values(contact.roles)]
-            for row in method_rows:
-                search_parts.extend((row.note, _join_multi_values(row.emails), _join_multi_values(row.numbers)))
-            if search:
+            if search and ranked_ids is not None:
+                if contact.contact_id not in ranked_ids:
+                    continue
+            elif search:
+                search_parts = [contact.name, _join_multi_values(contact.roles)]
+                for row in method_rows:
+                    search_parts.extend((row.note, _join_multi_values(row.emails), _join_multi_values(row.numbers)))
                 haystack = " | ".join(str(part or "").casefold() for part in search_parts)
                 if search not in haystack:
                     continue
@@ -913,6 +924,7 @@ class WindowAdminDataMixin:
                 list_color=list_color,
             )
             self._contacts.append(record)
+            self._tracker_index.upsert(ENTITY_CONTACTS, record)
         else:
             existing.name = name
             existing.numbers = numbers
@@ -922,6 +934,7 @@ class WindowAdminDataMixin:
             existing.list_color = list_color
             record = existing
 
+        self._mark_tracker_dirty(ENTITY_CONTACTS, record.contact_id)
         self._admin_selected_contact_id = record.contact_id
         self._admin_contact_editing_bundle_index = -1
         self._admin_contact_method_rows = [
@@ -961,20 +974,33 @@ class WindowAdminDataMixin:
         if not confirmed:
             return
         self._contacts = [row for row in self._contacts if row.contact_id != contact.contact_id]
-        for jurisdiction in self._jurisdictions:
+        self._tracker_index.remove(ENTITY_CONTACTS, contact.contact_id)
+        self._mark_tracker_dirty(ENTITY_CONTACTS, contact.contact_id)
+        index = self._tracker_index
+        for jurisdiction in index.contact_references(contact.contact_id, entity=ENTITY_JURISDICTIONS):
+            if contact.contact_id not in jurisdiction.contact_ids:
+                continue
             jurisdiction.contact_ids = [
                 contact_id for contact_id in jurisdiction.contact_ids if contact_id != contact.contact_id
             ]
-        for property_record in self._properties:
+            self._mark_tracker_dirty(ENTITY_JURISDICTIONS, jurisdiction.jurisdiction_id)
+        for property_record in index.contact_references(contact.contact_id, entity=ENTITY_PROPERTIES):
+            if contact.contact_id not in property_record.contact_ids:
+                continue
             property_record.contact_ids = [
                 contact_id for contact_id in property_record.contact_ids if contact_id != contact.contact_id
             ]
-        for permit in self._permits:
-            permit.parties = [
+            self._mark_tracker_dirty(ENTITY_PROPERTIES, property_record.property_id)
+        for permit in index.contact_references(contact.contact_id, entity=ENTITY_PERMITS):
+            remaining_parties = [
                 party
                 for party in permit.parties
                 if str(party.contact_id or "").strip() != contact.contact_id
             ]
+            if len(remaining_parties) == len(permit.parties):
+                continue
+            permit.parties = remaining_parties
+            self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._admin_jurisdiction_attached_contact_ids = [
             contact_id
             for contact_id in self._admin_jurisdiction_attached_contact_ids
@@ -1190,6 +1216,7 @@ class WindowAdminDataMixin:
                 list_color=list_color,
             )
             self._jurisdictions.append(record)
+            self._tracker_index.upsert(ENTITY_JURISDICTIONS, record)
         else:
             existing.name = name
             existing.jurisdiction_type = jurisdiction_type
@@ -1202,6 +1229,7 @@ class WindowAdminDataMixin:
             record = existing
 
         self._admin_selected_jurisdiction_id = record.jurisdiction_id
+        self._mark_tracker_dirty(ENTITY_JURISDICTIONS, record.jurisdiction_id)
         self._persist_tracker_data()
         self._refresh_admin_jurisdiction_contacts_picker(selected_ids=contact_ids)
         self._refresh_admin_jurisdictions_list(select_id=record.jurisdiction_id)
@@ -1230,9 +1258,12 @@ class WindowAdminDataMixin:
         self._jurisdictions = [
             row for row in self._jurisdictions if row.jurisdiction_id != jurisdiction.jurisdiction_id
         ]
-        for property_record in self._properties:
+        self._tracker_index.remove(ENTITY_JURISDICTIONS, jurisdiction.jurisdiction_id)
+        self._mark_tracker_dirty(ENTITY_JURISDICTIONS, jurisdiction.jurisdiction_id)
+        for property_record in self._tracker_index.properties_for_jurisdiction(jurisdiction.jurisdiction_id):
             if property_record.jurisdiction_id == jurisdiction.jurisdiction_id:
                 property_record.jurisdiction_id = ""
+                self._mark_tracker_dirty(ENTITY_PROPERTIES, property_record.property_id)
         self._admin_new_jurisdiction(require_confirm=False)
         self._persist_tracker_data()
         self._refresh_admin_jurisdictions_list()
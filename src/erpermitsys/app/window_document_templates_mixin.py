@@ -24,6 +24,7 @@ from erpermitsys.app.document_template_constants import (
     TEMPLATE_BUILTIN_DEMOLITION_ID,
     TEMPLATE_DEFAULT_SENTINEL,
 )
+from erpermitsys.app.tracker_changes import ENTITY_DOCUMENT_TEMPLATES, ENTITY_PERMITS
 from erpermitsys.app.tracker_models import (
     DocumentChecklistTemplate,
     PermitDocumentFolder,
@@ -1064,6 +1065,7 @@ class WindowDocumentTemplatesMixin:
 
         self._template_selected_id = record.template_id
         self._prune_active_document_template_ids()
+        self._mark_tracker_dirty(ENTITY_DOCUMENT_TEMPLATES, record.template_id)
         self._persist_tracker_data()
         self._refresh_templates_list(select_id=record.template_id)
         self._apply_template_to_form(record)
@@ -1092,6 +1094,7 @@ class WindowDocumentTemplatesMixin:
             row for row in self._document_templates if row.template_id != record.template_id
         ]
         self._prune_active_document_template_ids()
+        self._mark_tracker_dirty(ENTITY_DOCUMENT_TEMPLATES, record.template_id)
         self._persist_tracker_data()
         self._template_new(require_confirm=False)
         self._refresh_add_permit_template_options()
@@ -1112,6 +1115,7 @@ class WindowDocumentTemplatesMixin:
             return
         self._active_document_template_ids[target_permit_type] = record.template_id
         self._prune_active_document_template_ids()
+        self._mark_tracker_active_templates_dirty()
         self._persist_tracker_data()
         self._refresh_templates_list(select_id=record.template_id)
         self._update_template_default_label()
@@ -1367,6 +1371,7 @@ class WindowDocumentTemplatesMixin:
 
         self._selected_property_id = permit.property_id
         self._selected_permit_id = permit.permit_id
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_selected_permit_view()
         self._refresh_document_template_apply_options(selected_template_id=selected_id)
@@ -16,6 +16,7 @@ from PySide6.QtWidgets import (
 )
 
 from erpermitsys.app.permit_workspace_helpers import today_iso as _today_iso
+from erpermitsys.app.tracker_changes import ENTITY_PERMITS
 from erpermitsys.app.tracker_models import (
     PermitDocumentFolder,
     PermitDocumentRecord,
@@ -23,7 +24,6 @@ from erpermitsys.app.tracker_models import (
     PermitEventRecord,
     PermitRecord,
     document_file_count_by_slot,
-    ensure_default_document_structure,
     normalize_document_review_status,
     normalize_slot_id,
     normalize_slot_status,
@@ -198,9 +198,9 @@ class WindowDocumentsMixin:
             self._sync_document_action_buttons(enabled=False)
             return
 
-        changed = ensure_default_document_structure(permit)
-        changed = refresh_slot_status_from_documents(permit) or changed
+        changed = permit.refresh_derived_state(normalize_structure=True)
         if changed:
+            self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
             self._persist_tracker_data(show_error_dialog=False)
 
         file_counts = document_file_count_by_slot(permit)
@@ -514,7 +514,9 @@ class WindowDocumentsMixin:
             imported_count += 1
             self._selected_document_id = document.document_id
 
+        permit.mark_detail_changed()
         refresh_slot_status_from_documents(permit)
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_selected_permit_view()
 
@@ -579,7 +581,7 @@ class WindowDocumentsMixin:
 
         slot.active_cycle = next_cycle
         slot.status = "missing"
-        permit.events.append(
+        permit.insert_event(
             PermitEventRecord(
                 event_id=uuid4().hex,
                 event_type="note",
@@ -588,8 +590,10 @@ class WindowDocumentsMixin:
                 detail="Document resubmission cycle advanced.",
             )
         )
+        permit.mark_detail_changed()
         refresh_slot_status_from_documents(permit)
         self._selected_document_id = ""
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_selected_permit_view()
 
@@ -638,7 +642,9 @@ class WindowDocumentsMixin:
 
         self._document_store.delete_document_file(document)
         permit.documents = [row for row in permit.documents if row.document_id != document.document_id]
+        permit.mark_detail_changed()
         refresh_slot_status_from_documents(permit)
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_selected_permit_view()
 
@@ -719,7 +725,9 @@ class WindowDocumentsMixin:
                         record.review_status = "superseded"
                         record.reviewed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
+        permit.mark_detail_changed()
         refresh_slot_status_from_documents(permit)
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_selected_permit_view()
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtCore import QUrl
 
+from erpermitsys.app.tracker_changes import ENTITY_PERMITS, ENTITY_PROPERTIES
 from erpermitsys.app.tracker_models import PropertyRecord
 
 
@@ -43,9 +44,7 @@ class WindowEntityActionsMixin:
         property_record = self._property_by_id(property_id)
         if property_record is None:
             return
-        permits_for_property = [
-            permit for permit in self._permits if permit.property_id == property_record.property_id
-        ]
+        permits_for_property = self._permits_for_property(property_record.property_id)
         delete_message = f"Delete address '{property_record.display_address or '(no address)'}'?"
         if permits_for_property:
             delete_message = (
@@ -68,6 +67,10 @@ class WindowEntityActionsMixin:
                 pass
         self._properties = [row for row in self._properties if row.property_id != property_record.property_id]
         self._permits = [row for row in self._permits if row.property_id != property_record.property_id]
+        self._tracker_index.remove(ENTITY_PROPERTIES, property_record.property_id)
+        self._tracker_index.remove(ENTITY_PERMITS, *(permit.permit_id for permit in permits_for_property))
+        self._mark_tracker_dirty(ENTITY_PROPERTIES, property_record.property_id)
+        self._mark_tracker_dirty(ENTITY_PERMITS, *(permit.permit_id for permit in permits_for_property))
         if self._selected_property_id == property_record.property_id:
             self._selected_property_id = ""
         if self._selected_permit_id and self._permit_by_id(self._selected_permit_id) is None:
@@ -111,6 +114,8 @@ class WindowEntityActionsMixin:
         except Exception:
             pass
         self._permits = [row for row in self._permits if row.permit_id != permit.permit_id]
+        self._tracker_index.remove(ENTITY_PERMITS, permit.permit_id)
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         if self._selected_permit_id == permit.permit_id:
             self._selected_permit_id = ""
         self._selected_document_slot_id = ""
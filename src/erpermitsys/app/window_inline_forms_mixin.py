@@ -24,6 +24,7 @@ from erpermitsys.app.permit_workspace_helpers import (
     prefill_permit_events_from_milestones as _prefill_permit_events_from_milestones,
 )
 from erpermitsys.app.document_template_constants import TEMPLATE_DEFAULT_SENTINEL
+from erpermitsys.app.tracker_changes import ENTITY_PERMITS, ENTITY_PROPERTIES
 from erpermitsys.app.tracker_models import (
     ContactRecord,
     PermitParty,
@@ -1266,10 +1267,12 @@ class WindowInlineFormsMixin:
                     continue
                 self._properties[index] = property_record
                 break
+        self._tracker_index.upsert(ENTITY_PROPERTIES, property_record)
         self._selected_property_id = property_record.property_id
         self._close_inline_form_view(require_confirm=False)
         if created_new:
             self._set_left_column_expanded_panel("permit")
+        self._mark_tracker_dirty(ENTITY_PROPERTIES, property_record.property_id)
         self._persist_tracker_data()
         self._refresh_all_views()
 
@@ -1376,6 +1379,7 @@ class WindowInlineFormsMixin:
             )
             permit.document_folders = build_document_folders_from_slots(permit.document_slots)
             self._permits.append(permit)
+            self._tracker_index.upsert(ENTITY_PERMITS, permit)
         else:
             permit = existing
             permit.property_id = property_record.property_id
@@ -1418,5 +1422,6 @@ class WindowInlineFormsMixin:
         self._selected_permit_id = permit.permit_id
         self._active_permit_type_filter = normalize_permit_type(permit.permit_type)
         self._close_inline_form_view(require_confirm=False)
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_all_views()
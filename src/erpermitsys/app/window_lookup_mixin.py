@@ -11,6 +11,16 @@ class WindowLookupMixin:
             return ""
         return widget.text().strip().casefold()
 
+    def _search_ranked_ids(self, kind: str, search: str) -> dict[str, int] | None:
+        search_records = getattr(self._data_store, "search_records", None)
+        if not search or not callable(search_records):
+            return None
+        try:
+            hits = search_records(search, kinds=(kind,), limit=None)
+        except Exception:
+            return None
+        return {hit.record_id: rank for rank, hit in enumerate(hits)}
+
     def _current_filter_value(self, combo: QComboBox | None) -> str:
         if combo is None:
             return "all"
@@ -18,40 +28,16 @@ class WindowLookupMixin:
         return value or "all"
 
     def _contact_by_id(self, contact_id: str) -> ContactRecord | None:
-        target = str(contact_id or "").strip()
-        if not target:
-            return None
-        for record in self._contacts:
-            if record.contact_id == target:
-                return record
-        return None
+        return self._tracker_index.contact_by_id(contact_id)
 
     def _property_by_id(self, property_id: str) -> PropertyRecord | None:
-        target = str(property_id or "").strip()
-        if not target:
-            return None
-        for record in self._properties:
-            if record.property_id == target:
-                return record
-        return None
+        return self._tracker_index.property_by_id(property_id)
 
     def _jurisdiction_by_id(self, jurisdiction_id: str) -> JurisdictionRecord | None:
-        target = str(jurisdiction_id or "").strip()
-        if not target:
-            return None
-        for record in self._jurisdictions:
-            if record.jurisdiction_id == target:
-                return record
-        return None
+        return self._tracker_index.jurisdiction_by_id(jurisdiction_id)
 
     def _permit_by_id(self, permit_id: str) -> PermitRecord | None:
-        target = str(permit_id or "").strip()
-        if not target:
-            return None
-        for record in self._permits:
-            if record.permit_id == target:
-                return record
-        return None
+        return self._tracker_index.permit_by_id(permit_id)
 
     def _selected_property(self) -> PropertyRecord | None:
         return self._property_by_id(self._selected_property_id)
@@ -60,8 +46,5 @@ class WindowLookupMixin:
         return self._permit_by_id(self._selected_permit_id)
 
     def _permits_for_property(self, property_id: str) -> list[PermitRecord]:
-        target = str(property_id or "").strip()
-        if not target:
-            return []
-        return [record for record in self._permits if record.property_id == target]
+        return self._tracker_index.permits_for_property(property_id)
 
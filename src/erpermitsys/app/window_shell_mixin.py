@@ -43,6 +43,7 @@ class WindowShellMixin:
             open_admin_templates=self._open_document_templates_view,
             open_add_property=self._open_add_property_view,
             open_add_permit=self._open_add_permit_view,
+            open_permit_statistics=self._open_permit_statistics_dialog,
             upload_documents=self._upload_documents_to_slot,
             focus_property_search=self._focus_property_search_input,
             focus_permit_search=self._focus_permit_search_input,
@@ -67,6 +68,7 @@ class WindowShellMixin:
                 on_data_storage_backend_changed=self._on_data_storage_backend_changed,
                 on_export_json_backup_requested=self._on_export_json_backup_requested,
                 on_import_json_backup_requested=self._on_import_json_backup_requested,
+                on_revision_history_requested=self._on_revision_history_requested,
                 supabase_settings=self._supabase_settings.to_mapping(redact_api_key=False),
                 on_supabase_settings_changed=self._on_supabase_settings_changed,
                 supabase_merge_on_switch=self._supabase_merge_on_switch,
@@ -173,7 +175,10 @@ class WindowShellMixin:
                 event.ignore()
                 return
         self._shutdown_supabase_realtime_subscription()
-        self._persist_tracker_data(show_error_dialog=False)
+        self._stop_local_change_polling()
+        self._persist_tracker_data(show_error_dialog=False, blocking=True)
+        self._shutdown_tracker_persistence()
+        self._close_data_store()
         dialog = self._settings_dialog
         if dialog is not None:
             dialog.close()
@@ -57,8 +57,20 @@ class WindowStorageUpdateMixin:
     def _apply_tracker_bundle(self, bundle: TrackerDataBundleV3, *, refresh_ui: bool) -> bool:
         return self._storage_update_service()._apply_tracker_bundle(bundle, refresh_ui=refresh_ui)
 
-    def _persist_tracker_data(self, *, show_error_dialog: bool = True) -> bool:
-        return self._storage_update_service()._persist_tracker_data(show_error_dialog=show_error_dialog)
+    def _persist_tracker_data(self, *, show_error_dialog: bool = True, blocking: bool = False) -> bool:
+        return self._storage_update_service()._persist_tracker_data(
+            show_error_dialog=show_error_dialog,
+            blocking=blocking,
+        )
+
+    def _mark_tracker_dirty(self, entity: str, *record_ids: str) -> None:
+        self._storage_update_service()._mark_tracker_dirty(entity, *record_ids)
+
+    def _mark_tracker_active_templates_dirty(self) -> None:
+        self._storage_update_service()._mark_tracker_active_templates_dirty()
+
+    def _shutdown_tracker_persistence(self) -> None:
+        self._storage_update_service()._shutdown_tracker_persistence()
 
     def _on_data_storage_folder_changed(self, requested_folder: str) -> str:
         return self._storage_update_service()._on_data_storage_folder_changed(requested_folder)
@@ -80,6 +92,9 @@ class WindowStorageUpdateMixin:
     def _on_import_json_backup_requested(self, requested_path: str) -> bool:
         return self._storage_update_service()._on_import_json_backup_requested(requested_path)
 
+    def _on_revision_history_requested(self) -> None:
+        self._storage_update_service()._on_revision_history_requested()
+
     def _on_supabase_settings_changed(self, settings_value: dict[str, object]) -> dict[str, str]:
         return self._storage_update_service()._on_supabase_settings_changed(settings_value)
 
@@ -92,6 +107,12 @@ class WindowStorageUpdateMixin:
     def _shutdown_supabase_realtime_subscription(self) -> None:
         self._storage_update_service()._shutdown_supabase_realtime_subscription()
 
+    def _stop_local_change_polling(self) -> None:
+        self._storage_update_service()._stop_local_change_polling()
+
+    def _close_data_store(self, data_store=None) -> None:
+        self._storage_update_service()._close_data_store(data_store)
+
     def _show_data_storage_warning(self, message: str) -> None:
         self._storage_update_service()._show_data_storage_warning(message)
 
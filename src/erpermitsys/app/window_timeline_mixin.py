@@ -22,12 +22,11 @@ from erpermitsys.app.timeline_rows import (
     latest_note_event_id_for_permit as _latest_note_event_id_for_permit_logic,
     next_action_rows_for_permit as _timeline_next_action_rows_for_permit_logic,
 )
+from erpermitsys.app.tracker_changes import ENTITY_PERMITS
 from erpermitsys.app.tracker_models import (
     PERMIT_EVENT_TYPES,
     PermitEventRecord,
     PermitRecord,
-    compute_permit_status,
-    event_affects_status,
     event_type_label,
     normalize_event_type,
 )
@@ -123,7 +122,7 @@ class WindowTimelineMixin:
             rows=rows,
         )
 
-    def _event_sort_key(self, event: PermitEventRecord, index: int) -> tuple[datetime, int]:
+    def _event_sort_key(self, event: PermitEventRecord, index: int) -> tuple[int, int]:
         return _event_sort_key_logic(event, index)
 
     def _timeline_default_business_rows_for_permit(self, permit: PermitRecord) -> list[_TimelineRenderRow]:
@@ -506,7 +505,7 @@ class WindowTimelineMixin:
             and (action_text != previous_text or action_due != previous_due)
         ):
             note_event_date = action_due if _parse_iso_date(action_due) is not None else _today_iso()
-            permit.events.append(
+            permit.insert_event(
                 PermitEventRecord(
                     event_id=uuid4().hex,
                     event_type="note",
@@ -520,6 +519,7 @@ class WindowTimelineMixin:
             appended_next_action_note = True
         self._selected_property_id = permit.property_id
         self._selected_permit_id = permit.permit_id
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         persisted = self._persist_tracker_data()
         self._timeline_debug(
             "set_next_action_saved",
@@ -593,9 +593,10 @@ class WindowTimelineMixin:
             target_event.detail = updated_detail
             target_event.actor_contact_id = updated_actor
 
-        permit.status = compute_permit_status(permit.events, fallback=permit.status)
+        permit.reposition_event(target_event)
         self._selected_property_id = permit.property_id
         self._selected_permit_id = permit.permit_id
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_permit_list(keep_selected_visible=True)
 
@@ -633,17 +634,11 @@ class WindowTimelineMixin:
         ):
             return
 
-        remaining_events = [
-            row
-            for row in permit.events
-            if str(row.event_id or "").strip() != normalized_event_id
-        ]
-        if len(remaining_events) == len(permit.events):
+        if not permit.remove_event(normalized_event_id):
             return
-        permit.events = remaining_events
-        permit.status = compute_permit_status(permit.events, fallback=permit.status)
         self._selected_property_id = permit.property_id
         self._selected_permit_id = permit.permit_id
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         self._persist_tracker_data()
         self._refresh_permit_list(keep_selected_visible=True)
 
@@ -700,11 +695,10 @@ class WindowTimelineMixin:
             detail=event.detail,
             actor_contact_id=event.actor_contact_id,
         )
-        permit.events.append(event)
-        if event_affects_status(event.event_type):
-            permit.status = compute_permit_status(permit.events, fallback=permit.status)
+        permit.insert_event(event)
         self._selected_property_id = permit.property_id
         self._selected_permit_id = permit.permit_id
+        self._mark_tracker_dirty(ENTITY_PERMITS, permit.permit_id)
         persisted = self._persist_tracker_data()
         self._timeline_debug(
             "add_event_appended",
@@ -6,19 +6,17 @@ from urllib.parse import urlsplit
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QListWidgetItem
 
-from erpermitsys.app.permit_workspace_helpers import parse_iso_date as _parse_iso_date
+from erpermitsys.app.permit_table import PERMIT_TABLE_AVAILABLE
+from erpermitsys.app.search_index import SEARCH_KIND_PERMIT, SEARCH_KIND_PROPERTY
 from erpermitsys.app.tracker_models import (
     JurisdictionRecord,
     PermitRecord,
     PropertyRecord,
-    compute_permit_status,
-    ensure_default_document_structure,
     event_type_label,
     normalize_event_type,
     normalize_permit_type,
-    normalize_slot_status,
-    refresh_slot_status_from_documents,
 )
+from erpermitsys.ui.dialogs import PermitStatisticsDialog
 
 
 def _permit_type_label(permit_type: str) -> str:
@@ -30,6 +28,11 @@ def _permit_type_label(permit_type: str) -> str:
     return "Building"
 
 
+def _due_sort_ordinal(permit: PermitRecord, missing: int) -> int:
+    ordinal = permit.date_ordinal("next_action_due")
+    return missing if ordinal is None else ordinal
+
+
 class WindowWorkspaceListMixin:
     def _refresh_property_filters(self) -> None:
         combo = self._property_filter_combo
@@ -50,35 +53,25 @@ class WindowWorkspaceListMixin:
         combo.blockSignals(False)
 
     def _property_overdue_count(self, property_record: PropertyRecord) -> int:
-        count = 0
-        today = date.today()
-        for permit in self._permits_for_property(property_record.property_id):
-            due_date = _parse_iso_date(permit.next_action_due)
-            if due_date is None:
-                continue
-            if permit.status in {"closed", "canceled", "finaled"}:
-                continue
-            if due_date < today:
-                count += 1
-        return count
+        return self._tracker_index.property_overdue_count(property_record.property_id)
 
     def _permit_missing_required_docs_count(self, permit: PermitRecord) -> int:
-        ensure_default_document_structure(permit)
-        refresh_slot_status_from_documents(permit)
-        count = 0
-        for slot in permit.document_slots:
-            if not slot.required:
-                continue
-            status = normalize_slot_status(slot.status)
-            if status in {"missing", "rejected", "superseded"}:
-                count += 1
-        return count
+        return permit.missing_required_document_count()
 
     def _property_missing_docs_count(self, property_record: PropertyRecord) -> int:
-        count = 0
-        for permit in self._permits_for_property(property_record.property_id):
-            count += self._permit_missing_required_docs_count(permit)
-        return count
+        return self._tracker_index.property_missing_docs_count(property_record.property_id)
+
+    def _open_permit_statistics_dialog(self) -> None:
+        if not PERMIT_TABLE_AVAILABLE:
+            self._show_info_dialog("Permit Statistics", "Permit statistics need NumPy, which is not installed.")
+            return
+        dialog = PermitStatisticsDialog(
+            load_table=self._tracker_index.permit_table,
+            jurisdiction_names=lambda: {row.jurisdiction_id: row.name.strip() for row in self._jurisdictions},
+            parent=self,
+            theme_mode=self._dialog_theme_mode(),
+        )
+        dialog.exec()
 
     def _property_matches_filter(self, property_record: PropertyRecord, filter_mode: str) -> bool:
         if filter_mode == "overdue":
@@ -108,9 +101,13 @@ class WindowWorkspaceListMixin:
                 row.property_id,
             ),
         )
+        ranked_ids = self._search_ranked_ids(SEARCH_KIND_PROPERTY, search)
         filtered: list[PropertyRecord] = []
         for record in candidates:
-            if search:
+            if search and ranked_ids is not None:
+                if record.property_id not in ranked_ids:
+                    continue
+            elif search:
                 haystack = " ".join((
                     record.display_address,
                     record.parcel_id,
@@ -122,6 +119,8 @@ class WindowWorkspaceListMixin:
             if not self._property_matches_filter(record, filter_mode):
                 continue
             filtered.append(record)
+        if ranked_ids:
+            filtered.sort(key=lambda row: ranked_ids[row.property_id])
 
         selected_id = self._selected_property_id
 
@@ -250,10 +249,10 @@ class WindowWorkspaceListMixin:
         if filter_mode == "closed":
             return status in {"closed", "canceled", "finaled"}
         if filter_mode == "overdue":
-            due_date = _parse_iso_date(permit.next_action_due)
-            if due_date is None:
+            due_ordinal = permit.date_ordinal("next_action_due")
+            if due_ordinal is None:
                 return False
-            return due_date < date.today() and status not in {"closed", "canceled", "finaled"}
+            return due_ordinal < date.today().toordinal() and status not in {"closed", "canceled", "finaled"}
         if filter_mode != "all":
             return status == filter_mode
         return True
@@ -320,12 +319,13 @@ class WindowWorkspaceListMixin:
             permits_for_property_count=len(permits_for_property),
         )
 
+        ranked_ids = self._search_ranked_ids(SEARCH_KIND_PERMIT, search)
         filtered: list[PermitRecord] = []
         selected_permit_filter_details: dict[str, object] = {}
         for permit in permits_for_property:
-            ensure_default_document_structure(permit)
-            refresh_slot_status_from_documents(permit)
-            permit.status = compute_permit_status(permit.events, fallback=permit.status)
+            # Summary-loaded permits carry their stored status; detail loads on selection.
+            if permit.detail_loaded:
+                permit.refresh_derived_state(normalize_structure=True)
 
             matches_filters = True
             reasons: list[str] = []
@@ -335,7 +335,11 @@ class WindowWorkspaceListMixin:
             if matches_filters and not self._permit_matches_filter(permit, filter_mode):
                 matches_filters = False
                 reasons.append("status_filter")
-            if search:
+            if search and ranked_ids is not None:
+                if permit.permit_id not in ranked_ids:
+                    matches_filters = False
+                    reasons.append("search")
+            elif search:
                 haystack = " ".join(
                     (
                         permit.permit_number,
@@ -366,9 +370,10 @@ class WindowWorkspaceListMixin:
                     continue
             filtered.append(permit)
 
+        no_due_ordinal = date.max.toordinal()
         filtered.sort(
             key=lambda row: (
-                row.next_action_due or "9999-12-31",
+                _due_sort_ordinal(row, no_due_ordinal),
                 row.permit_number.casefold(),
                 row.permit_id,
             )
@@ -690,7 +695,7 @@ class WindowWorkspaceListMixin:
             )
             return
 
-        permit.status = compute_permit_status(permit.events, fallback=permit.status)
+        permit.refresh_derived_state()
 
         property_record = self._property_by_id(permit.property_id)
         parcel_id = property_record.parcel_id if property_record is not None else ""
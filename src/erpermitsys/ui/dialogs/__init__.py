@@ -6,6 +6,8 @@ from erpermitsys.ui.dialogs.permit_workspace_dialogs import (
     PropertyEditorDialog,
     TimelineEventEditDialog,
 )
+from erpermitsys.ui.dialogs.permit_statistics_dialog import PermitStatisticsDialog
+from erpermitsys.ui.dialogs.revision_history_dialog import RevisionHistoryDialog
 
 __all__ = [
     "PropertyEditorDialog",
@@ -14,4 +16,6 @@ __all__ = [
     "NextActionTimelineEntryDialog",
     "PermitEventDialog",
     "TimelineEventEditDialog",
+    "RevisionHistoryDialog",
+    "PermitStatisticsDialog",
 ]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Callable, Mapping
+
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+)
+
+from erpermitsys.app.permit_table import (
+    COLUMN_JURISDICTION,
+    COLUMN_PERMIT_TYPE,
+    COLUMN_STATUS,
+    PermitTable,
+)
+from erpermitsys.app.tracker_models import event_type_label
+from erpermitsys.ui.window.frameless_dialog import FramelessDialog
+
+
+STUCK_REVIEW_STATUS = "plan_review_started"
+STUCK_REVIEW_DAYS = 30
+
+
+def format_permit_statistics(
+    table: PermitTable,
+    *,
+    jurisdiction_names: Mapping[str, str],
+    today: date | None = None,
+    stuck_days: int = STUCK_REVIEW_DAYS,
+) -> list[tuple[str, list[str]]]:
+    """Sections of (title, lines) for the statistics panel."""
+
+    def _jurisdiction_label(jurisdiction_id: str) -> str:
+        if not jurisdiction_id:
+            return "Unassigned"
+        return jurisdiction_names.get(jurisdiction_id) or "(unnamed jurisdiction)"
+
+    def _ranked(counts: Mapping[str, int], label: Callable[[str], str]) -> list[str]:
+        rows = sorted(counts.items(), key=lambda pair: (-pair[1], label(pair[0]).casefold()))
+        return [f"{label(key)}: {count}" for key, count in rows]
+
+    open_mask = table.open_mask()
+    overdue_mask = table.overdue_mask(today=today)
+    sections: list[tuple[str, list[str]]] = [
+        (
+            "Portfolio",
+            [
+                f"Permits: {len(table)}",
+                f"Open: {int(open_mask.sum())}",
+                f"Overdue next actions: {int(overdue_mask.sum())}",
+                f"Missing required documents: {int(table.missing_documents[open_mask].sum())}",
+            ],
+        ),
+        ("By status", _ranked(table.count_by(COLUMN_STATUS), event_type_label)),
+        (
+            "Overdue by jurisdiction",
+            _ranked(table.count_by(COLUMN_JURISDICTION, overdue_mask), _jurisdiction_label)
+            or ["No overdue next actions."],
+        ),
+    ]
+
+    issued_mask, issued_days = table.days_between("application_date", "issued_date")
+    issued_mask &= issued_days >= 0
+    turnaround: list[str] = []
+    for column, label in (
+        (COLUMN_JURISDICTION, _jurisdiction_label),
+        (COLUMN_PERMIT_TYPE, lambda value: value.title()),
+    ):
+        means = table.mean_by(column, issued_days, issued_mask)
+        for key, mean in sorted(means.items(), key=lambda pair: label(pair[0]).casefold()):
+            turnaround.append(f"{label(key)}: {mean:.1f} days")
+    sections.append(
+        ("Average days from application to issue", turnaround or ["No permits with both dates yet."])
+    )
+
+    stuck_mask = table.mask_in(COLUMN_STATUS, STUCK_REVIEW_STATUS) & table.older_than_mask(
+        "application_date",
+        stuck_days,
+        today=today,
+    )
+    sections.append(
+        (
+            f"In plan review, applied over {stuck_days} days ago",
+            _ranked(table.count_by(COLUMN_JURISDICTION, stuck_mask), _jurisdiction_label)
+            or ["None."],
+        )
+    )
+    return sections
+
+
+class PermitStatisticsDialog(FramelessDialog):
+    def __init__(
+        self,
+        *,
+        load_table: Callable[[], PermitTable],
+        jurisdiction_names: Callable[[], Mapping[str, str]],
+        parent=None,
+        theme_mode: str | None = None,
+    ) -> None:
+        super().__init__(title="Permit Statistics", parent=parent, theme_mode=theme_mode)
+        self.setMinimumSize(520, 460)
+        self.resize(600, 560)
+        self._load_table = load_table
+        self._jurisdiction_names = jurisdiction_names
+
+        self._list = QListWidget(self.body)
+        self._list.setObjectName("CommandPaletteList")
+        self._list.setUniformItemSizes(True)
+        self.body_layout.addWidget(self._list, 1)
+
+        self._status = QLabel("", self.body)
+        self._status.setObjectName("PluginPickerStatus")
+        self._status.setWordWrap(True)
+        self.body_layout.addWidget(self._status)
+
+        footer = QHBoxLayout()
+        footer.setContentsMargins(0, 0, 0, 0)
+        footer.setSpacing(8)
+        footer.addStretch(1)
+
+        refresh_button = QPushButton("Refresh", self.body)
+        refresh_button.setObjectName("PluginPickerButton")
+        refresh_button.clicked.connect(self.reload)
+        footer.addWidget(refresh_button)
+
+        close_button = QPushButton("Close", self.body)
+        close_button.setObjectName("PluginPickerButton")
+        close_button.setProperty("primary", "true")
+        close_button.clicked.connect(self.accept)
+        footer.addWidget(close_button)
+        self.body_layout.addLayout(footer)
+
+        self.reload()
+
+    def reload(self) -> None:
+        self._list.clear()
+        try:
+            sections = format_permit_statistics(
+                self._load_table(),
+                jurisdiction_names=self._jurisdiction_names(),
+            )
+        except Exception as exc:
+            self._status.setText(f"Statistics could not be computed: {exc}")
+            return
+        self._status.setText(f"As of {date.today().isoformat()}.")
+        for title, lines in sections:
+            header = QListWidgetItem(title)
+            font = header.font()
+            font.setBold(True)
+            header.setFont(font)
+            self._list.addItem(header)
+            for line in lines:
+                self._list.addItem(QListWidgetItem(f"    {line}"))
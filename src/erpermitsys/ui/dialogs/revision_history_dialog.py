@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+)
+
+from erpermitsys.app.revision_journal import (
+    REVISION_ACTION_ADDED,
+    REVISION_ACTION_REMOVED,
+    REVISION_ACTION_UPDATED,
+    RevisionDiff,
+    RevisionEntry,
+)
+from erpermitsys.ui.window.frameless_dialog import FramelessDialog
+
+
+_ENTITY_LABELS = {
+    "contacts": "contacts",
+    "jurisdictions": "jurisdictions",
+    "properties": "properties",
+    "permits": "permits",
+    "document_templates": "templates",
+    "active_document_template_ids": "active template mappings",
+}
+_SOURCE_LABELS = {
+    "baseline": "Existing data",
+    "full": "Full save",
+    "changes": "Save",
+    "delta": "Save",
+    "restore": "Restore",
+}
+
+
+def format_revision_entry(entry: RevisionEntry) -> str:
+    saved_at = entry.saved_at_utc.replace("T", " ").replace("+00:00", " UTC")
+    source = _SOURCE_LABELS.get(entry.source, entry.source or "Save")
+    parts = [f"#{entry.revision}", saved_at, source]
+    if entry.rows_upserted or entry.rows_deleted:
+        parts.append(f"{entry.rows_upserted} changed, {entry.rows_deleted} removed")
+    return "  •  ".join(parts)
+
+
+def format_revision_diff(diff: RevisionDiff) -> str:
+    if diff.is_empty:
+        return f"Revision #{diff.from_revision} matches revision #{diff.to_revision}."
+    lines = [f"Restoring #{diff.from_revision} (current is #{diff.to_revision}) would:"]
+    for entity, label in _ENTITY_LABELS.items():
+        added = diff.count(REVISION_ACTION_ADDED, entity=entity)
+        updated = diff.count(REVISION_ACTION_UPDATED, entity=entity)
+        removed = diff.count(REVISION_ACTION_REMOVED, entity=entity)
+        if not (added or updated or removed):
+            continue
+        # The diff runs from the selected revision to current, so restore reverses it.
+        bits = []
+        if removed:
+            bits.append(f"bring back {removed}")
+        if updated:
+            bits.append(f"revert {updated}")
+        if added:
+            bits.append(f"remove {added}")
+        lines.append(f"  {label}: {', '.join(bits)}")
+    return "\n".join(lines)
+
+
+class RevisionHistoryDialog(FramelessDialog):
+    def __init__(
+        self,
+        *,
+        load_revisions: Callable[[], Sequence[RevisionEntry]],
+        diff_against_current: Callable[[int], RevisionDiff],
+        restore_revision: Callable[[int], bool],
+        parent=None,
+        theme_mode: str | None = None,
+    ) -> None:
+        super().__init__(title="History / Restore", parent=parent, theme_mode=theme_mode)
+        self.setMinimumSize(620, 460)
+        self.resize(700, 540)
+        self._load_revisions = load_revisions
+        self._diff_against_current = diff_against_current
+        self._restore_revision = restore_revision
+
+        hint = QLabel(
+            "Each save is kept as a revision. Restoring writes the selected revision as a new save, "
+            "so later history stays available.",
+            self.body,
+        )
+        hint.setObjectName("PluginPickerHint")
+        hint.setWordWrap(True)
+        self.body_layout.addWidget(hint)
+
+        self._list = QListWidget(self.body)
+        self._list.setObjectName("CommandPaletteList")
+        self._list.setUniformItemSizes(True)
+        self._list.itemSelectionChanged.connect(self._sync_details)
+        self.body_layout.addWidget(self._list, 1)
+
+        self._details = QLabel("", self.body)
+        self._details.setObjectName("PluginPickerStatus")
+        self._details.setWordWrap(True)
+        self._details.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.body_layout.addWidget(self._details)
+
+        footer = QHBoxLayout()
+        footer.setContentsMargins(0, 0, 0, 0)
+        footer.setSpacing(8)
+        footer.addStretch(1)
+
+        close_button = QPushButton("Close", self.body)
+        close_button.setObjectName("PluginPickerButton")
+        close_button.clicked.connect(self.reject)
+        footer.addWidget(close_button)
+
+        self._restore_button = QPushButton("Restore", self.body)
+        self._restore_button.setObjectName("PluginPickerButton")
+        self._restore_button.setProperty("primary", "true")
+        self._restore_button.clicked.connect(self._on_restore_clicked)
+        footer.addWidget(self._restore_button)
+        self.body_layout.addLayout(footer)
+
+        self.reload()
+
+    def reload(self) -> None:
+        self._list.clear()
+        try:
+            entries = list(self._load_revisions())
+        except Exception as exc:
+            entries = []
+            self._details.setText(f"History could not be read: {exc}")
+        for index, entry in enumerate(entries):
+            item = QListWidgetItem(format_revision_entry(entry))
+            item.setData(Qt.ItemDataRole.UserRole, entry.revision)
+            if index == 0:
+                item.setText(f"{item.text()}  (current)")
+            self._list.addItem(item)
+        if entries:
+            self._list.setCurrentRow(0)
+        else:
+            self._restore_button.setEnabled(False)
+            if not self._details.text():
+                self._details.setText("No saved revisions yet.")
+
+    def _selected_revision(self) -> int | None:
+        item = self._list.currentItem()
+        if item is None:
+            return None
+        value = item.data(Qt.ItemDataRole.UserRole)
+        return int(value) if isinstance(value, int) else None
+
+    def _sync_details(self) -> None:
+        revision = self._selected_revision()
+        is_current = self._list.currentRow() == 0
+        self._restore_button.setEnabled(revision is not None and not is_current)
+        if revision is None:
+            self._details.setText("")
+            return
+        if is_current:
+            self._details.setText(f"Revision #{revision} is the current data.")
+            return
+        try:
+            self._details.setText(format_revision_diff(self._diff_against_current(revision)))
+        except Exception as exc:
+            self._details.setText(f"Revision #{revision} could not be compared: {exc}")
+
+    def _on_restore_clicked(self) -> None:
+        revision = self._selected_revision()
+        if revision is None:
+            return
+        try:
+            restored = bool(self._restore_revision(revision))
+        except Exception as exc:
+            self._details.setText(f"Restore failed: {exc}")
+            return
+        if restored:
+            self.accept()
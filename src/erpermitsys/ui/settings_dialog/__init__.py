@@ -64,6 +64,7 @@ class SettingsDialog(FramelessDialog):
         on_data_storage_backend_changed: Callable[[str], str] | None = None,
         on_export_json_backup_requested: Callable[[str], str] | None = None,
         on_import_json_backup_requested: Callable[[str], bool] | None = None,
+        on_revision_history_requested: Callable[[], None] | None = None,
         supabase_settings: dict[str, str] | None = None,
         on_supabase_settings_changed: Callable[[dict[str, object]], dict[str, str] | None] | None = None,
         supabase_merge_on_switch: bool = True,
@@ -94,6 +95,7 @@ class SettingsDialog(FramelessDialog):
         self._on_data_storage_backend_changed = on_data_storage_backend_changed
         self._on_export_json_backup_requested = on_export_json_backup_requested
         self._on_import_json_backup_requested = on_import_json_backup_requested
+        self._on_revision_history_requested = on_revision_history_requested
         initial_supabase = supabase_settings if isinstance(supabase_settings, dict) else {}
         self._supabase_url = str(initial_supabase.get("url", "") or "").strip()
         self._supabase_api_key = str(initial_supabase.get("api_key", "") or "").strip()
@@ -278,6 +280,11 @@ class SettingsDialog(FramelessDialog):
         self._import_json_button.clicked.connect(self._on_import_json_clicked)
         json_transfer_row.addWidget(self._import_json_button, 0)
 
+        self._revision_history_button = QPushButton("History / Restore...", general_card)
+        self._revision_history_button.setObjectName("PluginPickerButton")
+        self._revision_history_button.clicked.connect(self._on_revision_history_clicked)
+        json_transfer_row.addWidget(self._revision_history_button, 0)
+
         json_transfer_row.addStretch(1)
         general_layout.addLayout(json_transfer_row)
 
@@ -736,6 +743,8 @@ class SettingsDialog(FramelessDialog):
     def _sync_backend_controls(self) -> None:
         is_supabase = self._data_storage_backend == BACKEND_SUPABASE
         self._supabase_card.setVisible(is_supabase)
+        # Revision history is journaled by the local SQLite store only.
+        self._revision_history_button.setVisible(not is_supabase)
         source = "Supabase" if is_supabase else "Local SQLite"
         self._backend_hint.setText(f"Data backend: {source}")
 
@@ -968,7 +977,7 @@ class SettingsDialog(FramelessDialog):
             self,
             "Export Tracker Data as JSON",
             initial_path,
-            "JSON Files (*.json);;All Files (*)",
+            "JSON Files (*.json);;Compressed JSON (*.json.xz);;All Files (*)",
         )
         requested = selected.strip() if isinstance(selected, str) else ""
         if not requested:
@@ -991,7 +1000,7 @@ class SettingsDialog(FramelessDialog):
             self,
             "Import Tracker Data from JSON",
             start_dir,
-            "JSON Files (*.json);;All Files (*)",
+            "JSON Files (*.json *.json.xz *.json.zz);;All Files (*)",
         )
         requested = selected.strip() if isinstance(selected, str) else ""
         if not requested:
@@ -1009,6 +1018,14 @@ class SettingsDialog(FramelessDialog):
         else:
             self._set_status("JSON import canceled.")
 
+    def _on_revision_history_clicked(self) -> None:
+        if not callable(self._on_revision_history_requested):
+            return
+        try:
+            self._on_revision_history_requested()
+        except Exception as exc:
+            self._set_status(f"History unavailable: {exc}")
+
     def _on_browse_data_folder_clicked(self) -> None:
         start_dir = self._data_storage_folder or ""
         selected = QFileDialog.getExistingDirectory(
@@ -0,0 +1,285 @@
+begin;
+
+-- Every entity row carries the state revision that last wrote it, so clients can pull
+-- the rows (and tombstones) changed after the revision they already hold.
+alter table public.erpermitsys_state
+    add column if not exists delta_floor_revision bigint not null default 0;
+
+-- Rows written before this migration have no revision; clients older than it reload fully.
+update public.erpermitsys_state
+set delta_floor_revision = greatest(delta_floor_revision, coalesce(revision, 0));
+
+create or replace function public.erpermitsys_stamp_row_revision()
+returns trigger
+language plpgsql
+as $$
+begin
+    -- Writers hold the state row lock and bump its revision after writing the rows.
+    select coalesce(revision, 0) + 1
+    into new.revision
+    from public.erpermitsys_state
+    where app_id = new.app_id;
+    new.revision := coalesce(new.revision, 1);
+    return new;
+end;
+$$;
+
+create or replace function public.erpermitsys_raise_delta_floor()
+returns trigger
+language plpgsql
+as $$
+begin
+    -- A hard delete leaves nothing for a delta to report. Pruned tombstones invalidate
+    -- deltas from before their revision; deleting a live row (snapshot rewrite)
+    -- invalidates every delta up to the revision being written.
+    update public.erpermitsys_state state
+    set delta_floor_revision = greatest(
+        state.delta_floor_revision,
+        coalesce(removed_rows.tombstone_revision, 0),
+        case when removed_rows.live_removed then state.revision + 1 else 0 end
+    )
+    from (
+        select
+            app_id,
+            max(revision) filter (where deleted_at is not null) as tombstone_revision,
+            bool_or(deleted_at is null) as live_removed
+        from removed
+        group by app_id
+    ) removed_rows
+    where state.app_id = removed_rows.app_id;
+    return null;
+end;
+$$;
+
+do $$
+declare
+    tbl text;
+begin
+    for tbl in
+        select unnest(
+            array[
+                'erpermitsys_contacts',
+                'erpermitsys_jurisdictions',
+                'erpermitsys_properties',
+                'erpermitsys_permits',
+                'erpermitsys_document_templates',
+                'erpermitsys_active_document_templates'
+            ]
+        )
+    loop
+        execute format(
+            'alter table public.%I add column if not exists revision bigint not null default 0',
+            tbl
+        );
+        execute format(
+            'create index if not exists %I on public.%I (app_id, revision)',
+            tbl || '_revision_idx',
+            tbl
+        );
+
+        execute format('drop trigger if exists erpermitsys_stamp_revision on public.%I', tbl);
+        execute format(
+            'create trigger erpermitsys_stamp_revision before insert or update on public.%I '
+            || 'for each row execute function public.erpermitsys_stamp_row_revision()',
+            tbl
+        );
+
+        execute format('drop trigger if exists erpermitsys_delta_floor on public.%I', tbl);
+        execute format(
+            'create trigger erpermitsys_delta_floor after delete on public.%I '
+            || 'referencing old table as removed '
+            || 'for each statement execute function public.erpermitsys_raise_delta_floor()',
+            tbl
+        );
+    end loop;
+end
+$$;
+
+create or replace function public.erpermitsys_fetch_changes(
+    p_app_id text default 'erpermitsys',
+    p_since_revision bigint default 0
+) returns jsonb
+language plpgsql
+stable
+as $$
+declare
+    v_app_id text := coalesce(nullif(trim(p_app_id), ''), 'erpermitsys');
+    v_since_revision bigint := greatest(0, coalesce(p_since_revision, 0));
+    v_revision bigint := 0;
+    v_floor_revision bigint := 0;
+begin
+    select coalesce(revision, 0), coalesce(delta_floor_revision, 0)
+    into v_revision, v_floor_revision
+    from public.erpermitsys_state
+    where app_id = v_app_id;
+
+    if not found or v_since_revision < v_floor_revision or v_since_revision > v_revision then
+        return jsonb_build_object(
+            'revision', coalesce(v_revision, 0),
+            'full', true,
+            'changes', '{}'::jsonb
+        );
+    end if;
+
+    return jsonb_build_object(
+        'revision', v_revision,
+        'full', false,
+        'changes', jsonb_build_object(
+            'contacts_upserts',
+            coalesce(
+                (
+                    select jsonb_agg(
+                        to_jsonb(t) - 'app_id' - 'updated_at' - 'updated_by' - 'deleted_at' - 'revision'
+                        order by t.contact_id
+                    )
+                    from public.erpermitsys_contacts t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is null
+                ),
+                '[]'::jsonb
+            ),
+            'contacts_deletes',
+            coalesce(
+                (
+                    select jsonb_agg(t.contact_id order by t.contact_id)
+                    from public.erpermitsys_contacts t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is not null
+                ),
+                '[]'::jsonb
+            ),
+            'jurisdictions_upserts',
+            coalesce(
+                (
+                    select jsonb_agg(
+                        to_jsonb(t) - 'app_id' - 'updated_at' - 'updated_by' - 'deleted_at' - 'revision'
+                        order by t.jurisdiction_id
+                    )
+                    from public.erpermitsys_jurisdictions t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is null
+                ),
+                '[]'::jsonb
+            ),
+            'jurisdictions_deletes',
+            coalesce(
+                (
+                    select jsonb_agg(t.jurisdiction_id order by t.jurisdiction_id)
+                    from public.erpermitsys_jurisdictions t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is not null
+                ),
+                '[]'::jsonb
+            ),
+            'properties_upserts',
+            coalesce(
+                (
+                    select jsonb_agg(
+                        to_jsonb(t) - 'app_id' - 'updated_at' - 'updated_by' - 'deleted_at' - 'revision'
+                        order by t.property_id
+                    )
+                    from public.erpermitsys_properties t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is null
+                ),
+                '[]'::jsonb
+            ),
+            'properties_deletes',
+            coalesce(
+                (
+                    select jsonb_agg(t.property_id order by t.property_id)
+                    from public.erpermitsys_properties t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is not null
+                ),
+                '[]'::jsonb
+            ),
+            'permits_upserts',
+            coalesce(
+                (
+                    select jsonb_agg(
+                        to_jsonb(t) - 'app_id' - 'updated_at' - 'updated_by' - 'deleted_at' - 'revision'
+                        order by t.permit_id
+                    )
+                    from public.erpermitsys_permits t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is null
+                ),
+                '[]'::jsonb
+            ),
+            'permits_deletes',
+            coalesce(
+                (
+                    select jsonb_agg(t.permit_id order by t.permit_id)
+                    from public.erpermitsys_permits t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is not null
+                ),
+                '[]'::jsonb
+            ),
+            'document_templates_upserts',
+            coalesce(
+                (
+                    select jsonb_agg(
+                        to_jsonb(t) - 'app_id' - 'updated_at' - 'updated_by' - 'deleted_at' - 'revision'
+                        order by t.template_id
+                    )
+                    from public.erpermitsys_document_templates t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is null
+                ),
+                '[]'::jsonb
+            ),
+            'document_templates_deletes',
+            coalesce(
+                (
+                    select jsonb_agg(t.template_id order by t.template_id)
+                    from public.erpermitsys_document_templates t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is not null
+                ),
+                '[]'::jsonb
+            ),
+            'active_document_template_ids_upserts',
+            coalesce(
+                (
+                    select jsonb_agg(
+                        jsonb_build_object('permit_type', t.permit_type, 'template_id', t.template_id)
+                        order by t.permit_type
+                    )
+                    from public.erpermitsys_active_document_templates t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is null
+                ),
+                '[]'::jsonb
+            ),
+            'active_document_template_ids_deletes',
+            coalesce(
+                (
+                    select jsonb_agg(t.permit_type order by t.permit_type)
+                    from public.erpermitsys_active_document_templates t
+                    where t.app_id = v_app_id
+                      and t.revision > v_since_revision
+                      and t.deleted_at is not null
+                ),
+                '[]'::jsonb
+            )
+        )
+    );
+end;
+$$;
+
+grant execute on function public.erpermitsys_fetch_changes(text, bigint) to public;
+
+commit;